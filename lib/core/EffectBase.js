@@ -17,6 +17,10 @@ export class EffectBase {
     
     // Bind methods for safety
     this._animate = this._animate.bind(this);
+    // Frame-time sampling when the host page loaded lib/runtime/jazer-perf.js
+    if (typeof window !== 'undefined' && window.JAZER_PERF) {
+      this._animate = window.JAZER_PERF.wrap(this._animate);
+    }
     this._handleResize = this._handleResize.bind(this);
     
     this._initResizeObserver();
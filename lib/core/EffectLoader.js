@@ -19,22 +19,23 @@ export class EffectLoader {
    * @returns {Promise<EffectBase>} The loaded effect instance
    */
   async loadEffect(effectName, canvas, config = {}) {
-    // Cleanup previous effect
-    if (this.currentEffect) {
-      this.currentEffect.stop();
-      this.currentEffect.dispose();
-      this.currentEffect = null;
+    // Validate canvas
+    if (!canvas || !(canvas instanceof HTMLCanvasElement)) {
+      throw new Error('Valid canvas element is required');
     }
 
-    // Get effect class from registry
-    const EffectClass = this.registry.get(effectName);
+    // Get effect class from registry (lazy entries import their module here,
+    // while the previous effect keeps running)
+    const EffectClass = await this.registry.resolve(effectName);
     if (!EffectClass) {
       throw new Error(`Effect "${effectName}" not found in registry`);
     }
 
-    // Validate canvas
-    if (!canvas || !(canvas instanceof HTMLCanvasElement)) {
-      throw new Error('Valid canvas element is required');
+    // Cleanup previous effect
+    if (this.currentEffect) {
+      this.currentEffect.stop();
+      this.currentEffect.dispose();
+      this.currentEffect = null;
     }
 
     this.canvas = canvas;
@@ -56,6 +57,14 @@ export class EffectLoader {
     }
   }
 
+  /**
+   * Fetch an effect's module ahead of loadEffect() without instantiating it
+   * @param {string} effectName - The name of the effect to prefetch
+   */
+  prefetch(effectName) {
+    this.registry.prefetch(effectName);
+  }
+
   /**
    * Unload the current effect and clean up resources
    */
@@ -0,0 +1,80 @@
+// EffectRegistry.generated.js
+// AUTO-GENERATED by tools/build_effect_registry.py from docs/effects.manifest.json — do not edit.
+// Each entry carries its metadata and a lazy import thunk; nothing is fetched
+// until EffectRegistry.resolve()/prefetch() (via EffectLoader) asks for it.
+// ============================================================================
+
+import { registry } from './EffectRegistry.js';
+
+export const EFFECT_MODULES = [
+  {
+    name: "Neon Ocean",
+    category: "cyber",
+    description: "Neon wireframe ocean with procedurally animated waves in a cyberpunk aesthetic",
+    tags: ["3d", "ocean", "wireframe", "three.js", "cyber", "neon"],
+    path: "lib/three/NeonOcean.js",
+    load: () => import("../three/NeonOcean.js").then((m) => m.NeonOcean)
+  },
+  {
+    name: "Plasma Storm",
+    category: "plasma",
+    description: "Dynamic plasma energy orbs with electric lightning connections and particle effects",
+    tags: ["2d", "plasma", "lightning", "energy", "particles"],
+    path: "lib/canvas/PlasmaStorm.js",
+    load: () => import("../canvas/PlasmaStorm.js").then((m) => m.PlasmaStorm)
+  },
+  {
+    name: "Quantum Foam",
+    category: "quantum",
+    description: "Abstract quantum physics visualization showing particle foam with fluctuating energy fields",
+    tags: ["3d", "quantum", "particles", "three.js", "physics"],
+    path: "lib/three/QuantumFoam.js",
+    load: () => import("../three/QuantumFoam.js").then((m) => m.QuantumFoam)
+  },
+  {
+    name: "Flower of Life (Volumetric)",
+    category: "sacred-geometry",
+    description: "Sacred geometry pattern featuring the Flower of Life in a mesmerizing 3D vortex tunnel",
+    tags: ["3d", "geometry", "sacred", "mandala", "vortex", "tunnel"],
+    path: "lib/sacred-geometry/FlowerOfLife.js",
+    load: () => import("../sacred-geometry/FlowerOfLife.js").then((m) => m.FlowerOfLife)
+  },
+  {
+    name: "Metatron's Cube (Volumetric)",
+    category: "sacred-geometry",
+    description: "Sacred geometry pattern featuring Metatron's Cube with 4D phased animation and cinematic depth",
+    tags: ["3d", "geometry", "sacred", "three.js", "platonic", "cinematic"],
+    path: "lib/sacred-geometry/MetatronsCube.js",
+    load: () => import("../sacred-geometry/MetatronsCube.js").then((m) => m.MetatronsCube)
+  },
+  {
+    name: "Seed of Life",
+    category: "sacred-geometry",
+    description: "Sacred geometry pattern featuring the Seed of Life in a hypnotic portal effect",
+    tags: ["2d", "geometry", "sacred", "mandala", "portal"],
+    path: "lib/sacred-geometry/SeedOfLife.js",
+    load: () => import("../sacred-geometry/SeedOfLife.js").then((m) => m.SeedOfLife)
+  },
+  {
+    name: "Sri Yantra",
+    category: "sacred-geometry",
+    description: "Sacred geometry pattern featuring the Sri Yantra with interlocking triangles in a vortex",
+    tags: ["2d", "geometry", "sacred", "yantra", "vortex"],
+    path: "lib/sacred-geometry/SriYantra.js",
+    load: () => import("../sacred-geometry/SriYantra.js").then((m) => m.SriYantra)
+  }
+];
+
+/**
+ * Register every generated entry as a lazy effect
+ * @param {EffectRegistry} target - Registry to populate (defaults to the global one)
+ * @returns {EffectRegistry} The populated registry
+ */
+export function registerGeneratedEffects(target = registry) {
+  for (const entry of EFFECT_MODULES) {
+    target.registerLazy(entry.name, entry.load, entry);
+  }
+  return target;
+}
+
+export default EFFECT_MODULES;
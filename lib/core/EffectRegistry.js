@@ -23,22 +23,53 @@ export class EffectRegistry {
     const effectTags = instance.getTags();
 
     // Store the class
-    this.effects.set(name, {
+    this._store(name, {
       class: EffectClass,
+      loader: null,
       name: name,
       category: category,
       description: instance.getDescription(),
       tags: effectTags
     });
+  }
+
+  /**
+   * Register an effect by metadata plus a loader thunk, without importing its module.
+   * Used by the generated registry (EffectRegistry.generated.js); the class is
+   * fetched on the first resolve()/prefetch().
+   * @param {string} name - The effect name
+   * @param {function(): Promise<class>} loader - Resolves to the effect class, e.g. () => import('...').then(m => m.X)
+   * @param {object} metadata - { category, description, tags }
+   */
+  registerLazy(name, loader, { category = 'uncategorized', description = '', tags = [] } = {}) {
+    if (this.effects.has(name)) return;
+    this._store(name, {
+      class: null,
+      loader,
+      name,
+      category,
+      description,
+      tags: [...tags]
+    });
+  }
+
+  _store(name, entry) {
+    // Re-registering (e.g. register() after registerLazy()) replaces the old index entries
+    const previous = this.effects.get(name);
+    if (previous) {
+      this._unindex(this.categories, previous.category, name);
+      previous.tags.forEach(tag => this._unindex(this.tags, tag, name));
+    }
+    this.effects.set(name, entry);
 
     // Update category index
-    if (!this.categories.has(category)) {
-      this.categories.set(category, []);
+    if (!this.categories.has(entry.category)) {
+      this.categories.set(entry.category, []);
     }
-    this.categories.get(category).push(name);
+    this.categories.get(entry.category).push(name);
 
     // Update tag index
-    effectTags.forEach(tag => {
+    entry.tags.forEach(tag => {
       if (!this.tags.has(tag)) {
         this.tags.set(tag, []);
       }
@@ -46,8 +77,45 @@ export class EffectRegistry {
     });
   }
 
+  _unindex(index, key, name) {
+    const names = index.get(key);
+    if (!names) return;
+    const at = names.indexOf(name);
+    if (at !== -1) names.splice(at, 1);
+    if (names.length === 0) index.delete(key);
+  }
+
+  /**
+   * Get effect class by name, importing its module first for lazy entries
+   * @param {string} name - The effect name
+   * @returns {Promise<class|null>} The effect class or null if not found
+   */
+  async resolve(name) {
+    const entry = this.effects.get(name);
+    if (!entry) return null;
+    if (entry.class) return entry.class;
+    if (!entry._pending) {
+      entry._pending = Promise.resolve(entry.loader()).then((EffectClass) => {
+        entry.class = EffectClass;
+        return EffectClass;
+      }, (error) => {
+        entry._pending = null;
+        throw error;
+      });
+    }
+    return entry._pending;
+  }
+
+  /**
+   * Start fetching an effect's module in the background (e.g. on hover)
+   * @param {string} name - The effect name
+   */
+  prefetch(name) {
+    this.resolve(name).catch(() => {});
+  }
+
   /**
-   * Get effect class by name
+   * Get effect class by name (null for lazy entries that have not been resolved yet)
    * @param {string} name - The effect name
    * @returns {class|null} The effect class or null if not found
    */
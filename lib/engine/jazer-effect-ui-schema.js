@@ -1,4 +1,5 @@
 import { createJazerUI } from './jazer-effect-ui.js';
+import '../runtime/jazer-lifecycle.js';
 
 function isPlainObject(v) {
   return v && typeof v === 'object' && (v.constructor === Object || Object.getPrototypeOf(v) === null);
@@ -61,8 +62,139 @@ function normalizeOptions(options) {
   }).filter(Boolean);
 }
 
+/**
+ * Read a schema embedded in the page as
+ * <script type="application/json" id="jazer-ui-schema">…</script>
+ * (production builds inline it; see tools/build_effects_dist.py).
+ * @param {string} id
+ * @returns {object|null}
+ */
+function readInlineSchema(id) {
+  if (!id || typeof document === 'undefined') return null;
+  const el = document.getElementById(id);
+  if (!el || el.type !== 'application/json') return null;
+  try {
+    const schema = JSON.parse(el.textContent || 'null');
+    return isPlainObject(schema) ? schema : null;
+  } catch (e) {
+    console.warn('[JaZeR UI] Inline schema is not valid JSON:', e);
+    return null;
+  }
+}
+
+const packCache = new Map();   // pointer/pack URL -> Promise<SchemaPack>
+
+/**
+ * Expand a schema pack built by tools/build_schema_pack.py: "#n" references a
+ * shared node, "@n" a shared string; everything else is literal.
+ * @param {object} pack
+ * @returns {{hash: string|null, names: string[], get: (name: string) => object|null}}
+ */
+export function decodeSchemaPack(pack, hash = null) {
+  if (!isPlainObject(pack) || pack.format !== 'jazer-schema-pack') {
+    throw new Error('Not a JaZeR schema pack');
+  }
+  const strings = Array.isArray(pack.strings) ? pack.strings : [];
+  const nodes = Array.isArray(pack.nodes) ? pack.nodes : [];
+  const schemas = isPlainObject(pack.schemas) ? pack.schemas : {};
+
+  const decode = (v) => {
+    if (typeof v === 'string') {
+      if (v[0] === '#') return decode(nodes[Number(v.slice(1))]);
+      if (v[0] === '@') return strings[Number(v.slice(1))];
+      return v;
+    }
+    if (Array.isArray(v)) return v.map(decode);
+    if (isPlainObject(v)) {
+      const out = {};
+      for (const k of Object.keys(v)) out[k] = decode(v[k]);
+      return out;
+    }
+    return v;
+  };
+
+  return {
+    hash,
+    names: Object.keys(schemas),
+    // Decoded fresh per call so callers can't mutate shared nodes.
+    get: (name) => (name in schemas ? decode(schemas[name]) : null)
+  };
+}
+
+/**
+ * Load a schema pack once per URL. Accepts the pointer (schemas.pack.json),
+ * which names the content-hashed pack, or a pack URL directly.
+ * @param {string|URL} url
+ * @returns {Promise<ReturnType<typeof decodeSchemaPack>>}
+ */
+export function loadSchemaPack(url) {
+  const key = String(url);
+  if (!packCache.has(key)) {
+    const promise = (async () => {
+      const res = await fetch(url, { cache: 'no-cache' });
+      if (!res.ok) throw new Error(`Schema pack ${key}: HTTP ${res.status}`);
+      const data = await res.json();
+      if (data?.format === 'jazer-schema-pack') return decodeSchemaPack(data);
+      if (typeof data?.pack !== 'string') throw new Error(`Schema pack pointer ${key} has no "pack"`);
+      // The hashed pack is immutable, so the default (cacheable) fetch is fine.
+      const packRes = await fetch(new URL(data.pack, res.url || new URL(key, location.href)));
+      if (!packRes.ok) throw new Error(`Schema pack ${data.pack}: HTTP ${packRes.status}`);
+      return decodeSchemaPack(await packRes.json(), data.hash ?? null);
+    })();
+    promise.catch(() => packCache.delete(key));
+    packCache.set(key, promise);
+  }
+  return packCache.get(key);
+}
+
+/**
+ * Operator cap for a particle count (Performance section, `params.particleBudget`;
+ * 0 or unset = no cap). Counts are read when the effect builds its geometry, so a
+ * new budget applies on the next load.
+ * @param {number} count - The effect's own count
+ * @param {object} [params]
+ * @returns {number}
+ */
+export function particleBudget(count, params = window.JAZER_UI?.params) {
+  const budget = Number(params?.particleBudget);
+  return budget > 0 ? Math.max(1, Math.min(count, Math.floor(budget))) : count;
+}
+
+/**
+ * Keep a WebGLRenderer at min(devicePixelRatio, maxPixelRatio) scaled by the operator's
+ * `params.resolutionScale` (capped at 1), re-applied whenever the UI params change.
+ * @param {object} renderer - THREE.WebGLRenderer
+ * @param {{maxPixelRatio?: number, ui?: object}} [options]
+ * @returns {function(): void} Unbind
+ */
+export function bindRendererQuality(renderer, { maxPixelRatio = 2, ui = window.JAZER_UI } = {}) {
+  const apply = () => {
+    const scale = Number(ui?.params?.resolutionScale);
+    const cap = Number.isFinite(scale) && scale > 0 ? Math.min(scale, 1) : 1;
+    const ratio = Math.min(window.devicePixelRatio || 1, maxPixelRatio) * cap;
+    if (renderer.getPixelRatio() !== ratio) renderer.setPixelRatio(ratio);
+  };
+  apply();
+  // Schema defaults land when the schema has loaded.
+  window.JAZER_UI_READY?.then?.(apply, () => {});
+  return ui?.onChange ? ui.onChange(apply) : () => {};
+}
+
+function markReady(source) {
+  if (typeof performance === 'undefined' || typeof performance.mark !== 'function') return;
+  try {
+    performance.mark('jazer-ui:ready', { detail: { source } });
+  } catch {
+    performance.mark('jazer-ui:ready');
+  }
+}
+
 export function attachEffectUI({
   title = document.title,
+  schema: schemaOption,
+  schemaElementId = 'jazer-ui-schema',
+  schemaPack,
+  schemaName,
   schemaUrl,
   schemaBaseUrl,
   namespace = '__JAZER_EFFECT__',
@@ -336,12 +468,52 @@ export function attachEffectUI({
     }
   };
 
+  const applySchema = (schema) => {
+    ensureDefaults(schema?.defaults);
+    installDefaultActions(schema?.defaults);
+    const controls = Array.isArray(schema?.controls) ? schema.controls : [];
+    for (const ctl of controls) applyControl(ctl);
+    if (Array.isArray(schema?.hotkeys)) {
+      const hud = isPlainObject(schema?.hud) ? schema.hud : {};
+      createHud({
+        title: hud.title ?? schema.title ?? title,
+        toggleKey: hud.toggleKey ?? 'h',
+        visible: Boolean(hud.visible),
+        items: schema.hotkeys
+      });
+    }
+    if (schema?.hint) ui.hint(String(schema.hint));
+  };
+
   const loadSchema = async () => {
+    // An explicit or inlined schema skips the network round trip entirely.
+    const inline = isPlainObject(schemaOption) ? schemaOption : readInlineSchema(schemaElementId);
+    if (inline) {
+      applySchema(inline);
+      markReady('inline');
+      return;
+    }
+
+    const effectFile = location.pathname.split('/').pop() || 'effect.html';
+    const name = schemaName ?? effectFile.replace(/\.html$/i, '');
+
+    if (schemaPack) {
+      try {
+        const pack = typeof schemaPack.get === 'function' ? schemaPack : await loadSchemaPack(schemaPack);
+        const packed = pack.get(name);
+        if (packed) {
+          applySchema(packed);
+          markReady('pack');
+          return;
+        }
+      } catch (e) {
+        console.warn('[JaZeR UI] Schema pack unavailable, falling back to schemaUrl:', e);
+      }
+    }
+
     let url = schemaUrl;
     if (!url && schemaBaseUrl) {
       const base = String(schemaBaseUrl);
-      const effectFile = location.pathname.split('/').pop() || 'effect.html';
-      const name = effectFile.replace(/\.html$/i, '');
       url = new URL(`${base.replace(/\/?$/, '/')}${name}.ui.json`, location.href);
     }
 
@@ -356,21 +528,8 @@ export function attachEffectUI({
         ui.hint(`No schema: ${String(url).split('/').pop()}`);
         return;
       }
-      const schema = await res.json();
-      ensureDefaults(schema?.defaults);
-      installDefaultActions(schema?.defaults);
-      const controls = Array.isArray(schema?.controls) ? schema.controls : [];
-      for (const ctl of controls) applyControl(ctl);
-      if (Array.isArray(schema?.hotkeys)) {
-        const hud = isPlainObject(schema?.hud) ? schema.hud : {};
-        createHud({
-          title: hud.title ?? schema.title ?? title,
-          toggleKey: hud.toggleKey ?? 'h',
-          visible: Boolean(hud.visible),
-          items: schema.hotkeys
-        });
-      }
-      if (schema?.hint) ui.hint(String(schema.hint));
+      applySchema(await res.json());
+      markReady('fetch');
     } catch (e) {
       ui.hint('Schema load failed (check console).');
       console.warn('[JaZeR UI] Schema load failed:', e);
@@ -60,10 +60,19 @@ export function createJazerUI({
   const stored = safeParse(localStorage.getItem(storageKey));
   if (stored && typeof stored === 'object') Object.assign(params, stored);
 
+  const listeners = new Set();
+
   const persist = () => {
     try {
       localStorage.setItem(storageKey, JSON.stringify(params));
     } catch { }
+    listeners.forEach((fn) => fn(params));
+  };
+
+  // Called after every control change / reset (persist); returns an unsubscribe function.
+  const onChange = (fn) => {
+    listeners.add(fn);
+    return () => listeners.delete(fn);
   };
 
   const setOpen = (open) => {
@@ -224,6 +233,7 @@ export function createJazerUI({
     root,
     params,
     persist,
+    onChange,
     slider,
     checkbox,
     color,
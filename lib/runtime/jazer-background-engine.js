@@ -3,24 +3,28 @@
 // The central hub for visual effects, aggregating specialized modules.
 // ============================================================================
 
-import { PALETTES, Palette, Gradient, hexToRgb, rgbToHex, hslToRgb, rgbToHsl, lerpColor, cycleColor } from '../systems/palette/jazer-palette.js';
-import { MouseTracker, mouse, CinematicCamera, Shot } from '../systems/motion/jazer-motion.js';
+import { PALETTES, Palette, Gradient, PaletteLUT, hexToRgb, rgbToHex, hslToRgb, rgbToHsl, lerpColor, cycleColor } from '../systems/palette/jazer-palette.js';
+import { MouseTracker, mouse, CinematicCamera, Shot, CameraPath, loadCameraPath } from '../systems/motion/jazer-motion.js';
 import { LoopClock, breathe, pulse, drift, wave, stagger, periodic } from '../systems/timing/jazer-timing.js';
 import { Easing } from '../systems/timing/jazer-easing.js';
 import { TemporalField, SpatialDistribution } from '../systems/math/jazer-spatial.js';
 import { default as Volumetric } from '../fx/three/jazer-volumetric.js';
 import SacredGeometry3D from '../sacred-geometry/SacredGeometry3D.js';
 import { EngineRuntime, AdaptiveResolution } from './jazer-engine-runtime.js';
+import { setLifecycleState, getLifecycleState } from './jazer-lifecycle.js';
 
 // Re-export for backward compatibility and convenience
 export { 
   PALETTES as ColorPalettes, 
   Palette, 
   Gradient,
+  PaletteLUT,
   MouseTracker, 
   mouse, 
   CinematicCamera, 
   Shot,
+  CameraPath,
+  loadCameraPath,
   LoopClock,
   breathe, pulse, drift, wave, stagger, periodic,
   Easing,
@@ -30,7 +34,9 @@ export {
   Volumetric,
   SacredGeometry3D,
   EngineRuntime,
-  AdaptiveResolution
+  AdaptiveResolution,
+  setLifecycleState,
+  getLifecycleState
 };
 
 // ---------------------------------------------------------
@@ -92,6 +98,60 @@ export const CONFIG = {
   downgradeStreakRequired: 1
 };
 
+// ---------------------------------------------------------
+// Operator overrides: the schema "Performance" section
+// (tools/enhance_ui_schemas.py) binds these params; the UI
+// persists them per display, so a kiosk can cap its own cost.
+// ---------------------------------------------------------
+export const QUALITY_OVERRIDE_PARAMS = ['qualityTier', 'resolutionScale', 'particleBudget', 'postfx'];
+
+/**
+ * Read operator caps from window.JAZER_UI.params (or the given params).
+ * @param {object} [params]
+ * @returns {{maxLevel?: string, resolutionScale?: number, particleBudget?: number, postfx?: boolean}}
+ */
+export function getQualityOverrides(params = (typeof window !== 'undefined' ? window.JAZER_UI?.params : null)) {
+  if (!params) return {};
+  const out = {};
+  // 'auto' (or anything unknown) leaves the tuner uncapped.
+  if (typeof params.qualityTier === 'string' && params.qualityTier in CONFIG.qualityLevels) {
+    out.maxLevel = params.qualityTier;
+  }
+  const scale = Number(params.resolutionScale);
+  if (params.resolutionScale != null && Number.isFinite(scale) && scale > 0) out.resolutionScale = scale;
+  // 0 / unset = no cap.
+  const budget = Number(params.particleBudget);
+  if (params.particleBudget != null && Number.isFinite(budget) && budget > 0) out.particleBudget = Math.floor(budget);
+  if (typeof params.postfx === 'boolean') out.postfx = params.postfx;
+  return out;
+}
+
+/**
+ * Apply operator caps to tier settings. Overrides only ever lower cost.
+ * @param {object} settings - { resolutionScale, features, budgets, ... }
+ * @param {object} [overrides] - From getQualityOverrides()
+ * @returns {object} New settings object
+ */
+export function applyQualityOverrides(settings, overrides = getQualityOverrides()) {
+  const out = {
+    ...settings,
+    features: { ...(settings.features || {}) },
+    budgets: { ...(settings.budgets || {}) }
+  };
+  if (overrides.resolutionScale != null) {
+    out.resolutionScale = Math.min(out.resolutionScale ?? 1, overrides.resolutionScale);
+  }
+  // Particles only: instance budgets (meshes, not sprites) keep their tier value.
+  if (overrides.particleBudget != null && out.budgets.particles != null) {
+    out.budgets.particles = Math.min(out.budgets.particles, overrides.particleBudget);
+  }
+  if (overrides.postfx === false) {
+    out.features.post = false;
+    out.budgets.postPasses = 0;
+  }
+  return out;
+}
+
 // ---------------------------------------------------------
 // QualityAutoTuner: Reusable adaptive quality controller
 // ---------------------------------------------------------
@@ -108,6 +168,9 @@ export class QualityAutoTuner {
     this._visible = true;
     this._upgradeStreak = 0;
     this._downgradeStreak = 0;
+    // getSettings() cache, keyed by [currentLevel, params object, ...QUALITY_OVERRIDE_PARAMS values]
+    this._settings = null;
+    this._settingsKey = new Array(QUALITY_OVERRIDE_PARAMS.length + 2);
 
     // Bind methods
     this._onVisibilityChange = this._onVisibilityChange.bind(this);
@@ -213,12 +276,45 @@ export class QualityAutoTuner {
     this._downgradeStreak = 0;
   }
 
+  _settingsStale(params) {
+    const key = this._settingsKey;
+    if (this._settings === null || key[0] !== this.currentLevel || key[1] !== params) return true;
+    if (!params) return false;
+    for (let i = 0; i < QUALITY_OVERRIDE_PARAMS.length; i++) {
+      if (key[i + 2] !== params[QUALITY_OVERRIDE_PARAMS[i]]) return true;
+    }
+    return false;
+  }
+
+  /**
+   * Current tier settings with operator caps applied. Called per frame, so the result is
+   * cached and only rebuilt when the level or an override param changes; treat it as read-only.
+   */
   getSettings() {
-    const levelConfig = this.qualityLevels[this.currentLevel] || this.qualityLevels.high;
-    return {
-      level: this.currentLevel,
+    const params = typeof window !== 'undefined' ? (window.JAZER_UI?.params ?? null) : null;
+    if (!this._settingsStale(params)) return this._settings;
+    const key = this._settingsKey;
+    key[0] = this.currentLevel;
+    key[1] = params;
+    for (let i = 0; i < QUALITY_OVERRIDE_PARAMS.length; i++) {
+      key[i + 2] = params ? params[QUALITY_OVERRIDE_PARAMS[i]] : undefined;
+    }
+
+    const overrides = getQualityOverrides(params);
+    const order = ['low', 'medium', 'high'];
+    let level = this.currentLevel;
+    if (overrides.maxLevel && order.indexOf(level) > order.indexOf(overrides.maxLevel)) {
+      level = overrides.maxLevel;
+    }
+    const levelConfig = this.qualityLevels[level] || this.qualityLevels.high;
+    // Label frame-timing samples with the tier actually in use (jazer-perf.js, when loaded).
+    if (typeof window !== 'undefined') window.JAZER_PERF?.setTier(level);
+    this._settings = applyQualityOverrides({
+      level,
+      autoLevel: this.currentLevel,
       ...levelConfig
-    };
+    }, overrides);
+    return this._settings;
   }
 
   destroy() {
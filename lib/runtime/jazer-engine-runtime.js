@@ -32,6 +32,8 @@ export class AdaptiveResolution {
     this.baseResolutionScale = baseResolutionScale;
     this.minResolutionScale = minResolutionScale;
     this.maxResolutionScale = maxResolutionScale;
+    this._tunerSettings = null;
+    this._settings = null;
   }
 
   beginFrame() {
@@ -44,21 +46,27 @@ export class AdaptiveResolution {
 
   getSettings() {
     const settings = this.tuner.getSettings();
+    const dpr = (typeof window !== 'undefined' ? (window.devicePixelRatio || 1) : 1);
+    // The tuner returns the same object until its level or overrides change: reuse ours too.
+    if (this._settings && this._tunerSettings === settings && this._settings.devicePixelRatio === dpr) {
+      return this._settings;
+    }
     const resolutionScale = clamp(
       (settings.resolutionScale ?? 1) * this.baseResolutionScale,
       this.minResolutionScale,
       this.maxResolutionScale
     );
 
-    const dpr = (typeof window !== 'undefined' ? (window.devicePixelRatio || 1) : 1);
     const pixelRatio = clamp(dpr * resolutionScale, 1 * resolutionScale, this.maxPixelRatio);
 
-    return {
+    this._tunerSettings = settings;
+    this._settings = {
       ...settings,
       resolutionScale,
       pixelRatio,
       devicePixelRatio: dpr
     };
+    return this._settings;
   }
 
   /**
@@ -0,0 +1,176 @@
+// jazer-lifecycle.js
+// JaZeR Lifecycle Bridge
+// Lets a host page (index app, kiosk shell) pause or throttle an embedded effect
+// over postMessage, without touching the effect's own render loop.
+// ============================================================================
+//
+// Protocol (all messages carry `type: 'jazer:lifecycle'`):
+//   host   -> effect: { action: 'pause' | 'resume' | 'throttle', fps? }
+//   effect -> host:   { event: 'ready' }                 (module loaded)
+//                     { event: 'state', state, fps }     (ack after a change)
+//                     { event: 'activity' }              (user input inside the frame)
+//
+// Effects schedule frames with the global requestAnimationFrame. The first
+// lifecycle message installs a gate in front of it: while paused, callbacks are
+// held until resume; while throttled, queued callbacks are flushed at `fps`.
+// Standalone pages never receive a message, so they keep the native rAF.
+
+export const LIFECYCLE_MESSAGE = 'jazer:lifecycle';
+
+const DEFAULT_THROTTLE_FPS = 10;
+const ACTIVITY_INTERVAL_MS = 1000;
+
+function nowMs() {
+  return (typeof performance !== 'undefined' && performance.now) ? performance.now() : Date.now();
+}
+
+const state = {
+  mode: 'running',   // 'running' | 'throttled' | 'paused'
+  fps: DEFAULT_THROTTLE_FPS,
+  installed: false
+};
+
+let nativeRAF = null;
+let nativeCancelRAF = null;
+let nextId = 1;
+const queue = new Map();   // id -> callback
+let flushRafId = 0;
+let flushTimer = 0;
+let lastFlushMs = 0;
+
+function flush(ts) {
+  flushRafId = 0;
+  lastFlushMs = nowMs();
+  const batch = Array.from(queue.values());
+  queue.clear();
+  for (const cb of batch) {
+    try {
+      cb(ts);
+    } catch (e) {
+      console.error('[JaZeR Lifecycle] frame callback failed:', e);
+    }
+  }
+}
+
+function scheduleFlush() {
+  if (flushRafId || flushTimer || !queue.size) return;
+  if (state.mode === 'paused') return;
+
+  if (state.mode === 'throttled') {
+    const interval = 1000 / Math.max(1, state.fps);
+    const wait = Math.max(0, lastFlushMs + interval - nowMs());
+    flushTimer = setTimeout(() => {
+      flushTimer = 0;
+      flushRafId = nativeRAF(flush);
+    }, wait);
+    return;
+  }
+
+  flushRafId = nativeRAF(flush);
+}
+
+function cancelFlush() {
+  if (flushRafId) {
+    nativeCancelRAF(flushRafId);
+    flushRafId = 0;
+  }
+  if (flushTimer) {
+    clearTimeout(flushTimer);
+    flushTimer = 0;
+  }
+}
+
+function gatedRequestAnimationFrame(cb) {
+  const id = nextId++;
+  queue.set(id, cb);
+  scheduleFlush();
+  return id;
+}
+
+function gatedCancelAnimationFrame(id) {
+  queue.delete(id);
+}
+
+function installGate() {
+  if (state.installed || typeof window === 'undefined') return;
+  nativeRAF = window.requestAnimationFrame.bind(window);
+  nativeCancelRAF = window.cancelAnimationFrame.bind(window);
+  window.requestAnimationFrame = gatedRequestAnimationFrame;
+  window.cancelAnimationFrame = gatedCancelAnimationFrame;
+  state.installed = true;
+}
+
+function notifyHost(payload) {
+  if (typeof window === 'undefined' || window.parent === window) return;
+  try {
+    window.parent.postMessage({ type: LIFECYCLE_MESSAGE, ...payload }, '*');
+  } catch {
+    // Detached or sandboxed parent: nothing to report to.
+  }
+}
+
+/**
+ * Switch the frame gate to 'running', 'throttled' or 'paused'.
+ * @param {string} mode
+ * @param {number} [fps] - Target rate while throttled
+ */
+export function setLifecycleState(mode, fps = state.fps) {
+  if (!['running', 'throttled', 'paused'].includes(mode)) return;
+  installGate();
+
+  state.mode = mode;
+  state.fps = Number.isFinite(Number(fps)) && Number(fps) > 0 ? Number(fps) : DEFAULT_THROTTLE_FPS;
+
+  cancelFlush();
+  scheduleFlush();
+  notifyHost({ event: 'state', state: state.mode, fps: state.fps });
+}
+
+/**
+ * @returns {{mode: string, fps: number, installed: boolean}}
+ */
+export function getLifecycleState() {
+  return { ...state };
+}
+
+/**
+ * Allocation-free check for per-frame callers.
+ * @returns {boolean} true unless the host paused or throttled the page
+ */
+export function isLifecycleRunning() {
+  return state.mode === 'running';
+}
+
+function onMessage(e) {
+  const msg = e.data;
+  if (!msg || msg.type !== LIFECYCLE_MESSAGE || typeof msg.action !== 'string') return;
+  if (msg.action === 'pause') setLifecycleState('paused');
+  else if (msg.action === 'resume') setLifecycleState('running');
+  else if (msg.action === 'throttle') setLifecycleState('throttled', msg.fps);
+}
+
+let lastActivityMs = -Infinity;
+function onActivity() {
+  const t = nowMs();
+  if (t - lastActivityMs < ACTIVITY_INTERVAL_MS) return;
+  lastActivityMs = t;
+  notifyHost({ event: 'activity' });
+}
+
+if (typeof window !== 'undefined' && !window.__JAZER_LIFECYCLE__) {
+  window.__JAZER_LIFECYCLE__ = true;
+  window.addEventListener('message', onMessage);
+  if (window.parent !== window) {
+    for (const type of ['pointermove', 'pointerdown', 'keydown', 'wheel', 'touchstart']) {
+      window.addEventListener(type, onActivity, { passive: true });
+    }
+    notifyHost({ event: 'ready' });
+  }
+}
+
+export default {
+  LIFECYCLE_MESSAGE,
+  setLifecycleState,
+  getLifecycleState,
+  isLifecycleRunning
+};
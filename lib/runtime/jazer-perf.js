@@ -0,0 +1,312 @@
+// jazer-perf.js
+// JaZeR Frame Timing
+// Lightweight per-effect frame-time sampling, injected into effect pages by
+// tools/inject_perf_timing.py and stripped again for release builds.
+// ============================================================================
+//
+// The injected page schedules `requestAnimationFrame(__jazerPerfFrame(animate))`.
+// wrapFrame() returns one cached wrapper per callback, so the hot path allocates
+// nothing: each frame writes into fixed-size typed arrays.
+//
+//   frame - interval between consecutive callbacks (rAF timestamps)
+//   work  - time spent inside the callback (performance.now() around it)
+//
+// window.JAZER_PERF exposes the window of recent samples:
+//   JAZER_PERF.p50 / .p95 / .p99   frame-time percentiles (ms)
+//   JAZER_PERF.longFrames          frames slower than longFrameMs since reset()
+//   JAZER_PERF.stats()             { frames, fps, frame: {p50,p95,p99,max}, work: {...}, longFrames }
+//   JAZER_PERF.reset()
+//   JAZER_PERF.wrap(fn)            wrapFrame(), for loops outside effect pages (EffectBase)
+//   JAZER_PERF.context             { effect, tier, device, build } attached to beacons
+//   JAZER_PERF.setContext({...}) / .setTier(level)
+//   JAZER_PERF.startBeacon({ url, intervalMs }) / .flush()
+//
+// Beacons (tools/perf_collector.py) batch every frame interval since the last
+// send, grouped by effect + quality tier. They start automatically when the
+// page URL has ?perfBeacon=<collector url> (plus optional &build=&device=).
+//
+// Intervals are not sampled while the lifecycle bridge pauses or throttles the
+// page, and gaps longer than MAX_GAP_MS (hidden tab) restart the interval.
+
+import { isLifecycleRunning } from './jazer-lifecycle.js';
+
+const RING_SIZE = 600;           // ~10 s at 60 fps
+const LONG_FRAME_MS = 50;
+const MAX_GAP_MS = 1000;
+const PENDING_MAX = 8192;        // frames buffered between beacons
+const BEACON_INTERVAL_MS = 15000;
+const BEACON_VERSION = 1;
+
+function nowMs() {
+  return (typeof performance !== 'undefined' && performance.now) ? performance.now() : Date.now();
+}
+
+const frameRing = new Float32Array(RING_SIZE);
+const workRing = new Float32Array(RING_SIZE);
+const sortScratch = new Float32Array(RING_SIZE);
+const pendingFrame = new Float32Array(PENDING_MAX);
+const pendingKey = new Uint16Array(PENDING_MAX);
+
+const perf = {
+  size: RING_SIZE,
+  count: 0,            // samples written since reset (ring holds the last RING_SIZE)
+  longFrames: 0,
+  longFrameMs: LONG_FRAME_MS,
+  startedAt: nowMs(),
+  dropped: 0,          // frames not sent because the beacon buffer was full
+  context: { effect: '', tier: 'unknown', device: '', build: '' }
+};
+
+let head = 0;
+let epoch = 0;             // bumped by reset(); wrappers drop intervals that span it
+let pendingCount = 0;
+let currentKey = 0;
+const keys = [];           // [{ effect, tier }] indexed by pendingKey
+const keyIndex = new Map();
+const wrappers = new WeakMap();
+
+function record(frameMs, workMs) {
+  frameRing[head] = frameMs;
+  workRing[head] = workMs;
+  head = (head + 1) % RING_SIZE;
+  perf.count++;
+  if (frameMs > perf.longFrameMs) perf.longFrames++;
+
+  if (pendingCount < PENDING_MAX) {
+    pendingFrame[pendingCount] = frameMs;
+    pendingKey[pendingCount] = currentKey;
+    pendingCount++;
+  } else {
+    perf.dropped++;
+  }
+}
+
+function percentiles(ring) {
+  const n = Math.min(perf.count, RING_SIZE);
+  if (!n) return { p50: 0, p95: 0, p99: 0, max: 0 };
+  const sorted = sortScratch.subarray(0, n);
+  sorted.set(ring.subarray(0, n));
+  sorted.sort();
+  const at = (q) => sorted[Math.min(n - 1, Math.floor(q * n))];
+  return { p50: at(0.5), p95: at(0.95), p99: at(0.99), max: sorted[n - 1] };
+}
+
+/**
+ * Wrap a rAF callback with frame-time sampling. Returns the same wrapper for
+ * the same callback, so it is safe to call once per frame.
+ * @param {FrameRequestCallback} fn
+ * @returns {FrameRequestCallback}
+ */
+export function wrapFrame(fn) {
+  let wrapped = wrappers.get(fn);
+  if (wrapped) return wrapped;
+
+  // Per-callback clock, so two loops on one page never interleave intervals.
+  let lastTs = -1;
+  let lastEpoch = epoch;
+  wrapped = function jazerTimedFrame(ts) {
+    const t0 = nowMs();
+    try {
+      return fn(ts);
+    } finally {
+      const work = nowMs() - t0;
+      const frame = lastTs >= 0 && lastEpoch === epoch ? ts - lastTs : -1;
+      const running = isLifecycleRunning();
+      lastTs = running && ts >= 0 ? ts : -1;   // direct (non-rAF) calls carry no timestamp
+      lastEpoch = epoch;
+      if (running && frame >= 0 && frame < MAX_GAP_MS) record(frame, work);
+    }
+  };
+  wrappers.set(fn, wrapped);
+  return wrapped;
+}
+
+/**
+ * @returns {{frames: number, fps: number, frame: object, work: object, longFrames: number, longFrameMs: number}}
+ */
+export function getFrameStats() {
+  const frame = percentiles(frameRing);
+  return {
+    frames: perf.count,
+    fps: frame.p50 > 0 ? 1000 / frame.p50 : 0,
+    frame,
+    work: percentiles(workRing),
+    longFrames: perf.longFrames,
+    longFrameMs: perf.longFrameMs
+  };
+}
+
+export function resetFrameStats() {
+  head = 0;
+  epoch++;
+  perf.count = 0;
+  perf.longFrames = 0;
+  perf.startedAt = nowMs();
+}
+
+// ---------------------------------------------------------
+// Context + beacons
+// ---------------------------------------------------------
+
+function updateKey() {
+  const { effect, tier } = perf.context;
+  const id = `${effect}\u0000${tier}`;
+  let idx = keyIndex.get(id);
+  if (idx === undefined) {
+    idx = keys.length;
+    keys.push({ effect, tier });
+    keyIndex.set(id, idx);
+  }
+  currentKey = idx;
+}
+
+/**
+ * Update the labels attached to subsequent frames (effect, tier, device, build).
+ * @param {object} patch
+ */
+export function setPerfContext(patch = {}) {
+  for (const k of ['effect', 'tier', 'device', 'build']) {
+    if (patch[k] != null) perf.context[k] = String(patch[k]);
+  }
+  updateKey();
+}
+
+/**
+ * Cheap tier update for per-frame callers (QualityAutoTuner.getSettings).
+ * @param {string} level
+ */
+export function setPerfTier(level) {
+  if (level && level !== perf.context.tier) {
+    perf.context.tier = level;
+    updateKey();
+  }
+}
+
+function defaultDeviceClass() {
+  if (typeof navigator === 'undefined') return 'unknown';
+  const cores = navigator.hardwareConcurrency || 0;
+  const mem = navigator.deviceMemory || 0;
+  const mobile = /Mobi|Android|iPad|iPhone/i.test(navigator.userAgent || '');
+  const dpr = (typeof window !== 'undefined' && window.devicePixelRatio) || 1;
+  const tier = cores >= 8 && (mem === 0 || mem >= 8) ? 'high' : (cores >= 4 ? 'mid' : 'low');
+  return `${mobile ? 'mobile' : 'desktop'}-${tier}-dpr${Math.round(dpr)}`;
+}
+
+function defaultEffectName() {
+  if (typeof location === 'undefined') return '';
+  return (location.pathname.split('/').pop() || '').replace(/\.html$/i, '');
+}
+
+/**
+ * Build the beacon payload for all frames since the last call and clear them.
+ * @returns {object|null}
+ */
+export function takePerfBatch() {
+  if (!pendingCount) return null;
+  const groups = new Map();
+  for (let i = 0; i < pendingCount; i++) {
+    let list = groups.get(pendingKey[i]);
+    if (!list) groups.set(pendingKey[i], (list = []));
+    list.push(Math.round(pendingFrame[i] * 100) / 100);
+  }
+  pendingCount = 0;
+  const dropped = perf.dropped;
+  perf.dropped = 0;
+  return {
+    v: BEACON_VERSION,
+    build: perf.context.build || 'dev',
+    device: perf.context.device || defaultDeviceClass(),
+    longFrameMs: perf.longFrameMs,
+    dropped,
+    batches: Array.from(groups, ([k, frameMs]) => ({
+      effect: keys[k].effect || 'unknown',
+      tier: keys[k].tier || 'unknown',
+      frameMs
+    }))
+  };
+}
+
+let beacon = null;
+
+function send(url, payload) {
+  const body = JSON.stringify(payload);
+  // text/plain keeps sendBeacon/fetch a "simple" request (no CORS preflight).
+  if (typeof navigator !== 'undefined' && navigator.sendBeacon) {
+    if (navigator.sendBeacon(url, new Blob([body], { type: 'text/plain' }))) return;
+  }
+  if (typeof fetch === 'function') {
+    fetch(url, { method: 'POST', body, keepalive: true, headers: { 'Content-Type': 'text/plain' } }).catch(() => {});
+  }
+}
+
+/**
+ * Send pending frames now (also runs on pagehide / when the page is hidden).
+ */
+export function flushPerfBeacon() {
+  if (!beacon) return;
+  const payload = takePerfBatch();
+  if (payload) send(beacon.url, payload);
+}
+
+function onVisibility() {
+  if (document.visibilityState === 'hidden') flushPerfBeacon();
+}
+
+/**
+ * Start batched beacons to a collector (tools/perf_collector.py serve).
+ * @param {{url: string, intervalMs?: number}} options
+ */
+export function startPerfBeacon({ url, intervalMs = BEACON_INTERVAL_MS } = {}) {
+  if (!url || typeof window === 'undefined') return;
+  stopPerfBeacon();
+  beacon = { url, timer: setInterval(flushPerfBeacon, Math.max(1000, intervalMs)) };
+  window.addEventListener('pagehide', flushPerfBeacon);
+  document.addEventListener('visibilitychange', onVisibility);
+}
+
+export function stopPerfBeacon() {
+  if (!beacon) return;
+  clearInterval(beacon.timer);
+  window.removeEventListener('pagehide', flushPerfBeacon);
+  document.removeEventListener('visibilitychange', onVisibility);
+  beacon = null;
+}
+
+if (typeof window !== 'undefined' && !window.JAZER_PERF) {
+  const query = new URLSearchParams(typeof location !== 'undefined' ? location.search : '');
+  const buildMeta = typeof document !== 'undefined' ? document.querySelector?.('meta[name="jazer-build"]') : null;
+  setPerfContext({
+    effect: defaultEffectName(),
+    device: query.get('device') || defaultDeviceClass(),
+    build: query.get('build') || buildMeta?.content || 'dev'
+  });
+
+  window.JAZER_PERF = Object.defineProperties(perf, {
+    p50: { get: () => percentiles(frameRing).p50, enumerable: true },
+    p95: { get: () => percentiles(frameRing).p95, enumerable: true },
+    p99: { get: () => percentiles(frameRing).p99, enumerable: true },
+    stats: { value: getFrameStats },
+    reset: { value: resetFrameStats },
+    wrap: { value: wrapFrame },
+    setContext: { value: setPerfContext },
+    setTier: { value: setPerfTier },
+    startBeacon: { value: startPerfBeacon },
+    stopBeacon: { value: stopPerfBeacon },
+    flush: { value: flushPerfBeacon }
+  });
+
+  const beaconUrl = query.get('perfBeacon') || window.JAZER_PERF_BEACON;
+  if (beaconUrl) startPerfBeacon({ url: beaconUrl });
+}
+
+export default {
+  wrapFrame,
+  getFrameStats,
+  resetFrameStats,
+  setPerfContext,
+  setPerfTier,
+  takePerfBatch,
+  startPerfBeacon,
+  stopPerfBeacon,
+  flushPerfBeacon
+};
@@ -69,10 +69,10 @@ export class FlowerOfLife extends ThreeEffectBase {
     this.renderer.setClearColor(this.config.backgroundColor);
 
     // 4. Create The Flower Tunnel
-    this.createFlowerTunnel(palette);
+    await this.createFlowerTunnel(palette);
   }
 
-  createFlowerTunnel(palette) {
+  async createFlowerTunnel(palette) {
     this.tunnelGroup = new THREE.Group();
     
     // Generate points for multiple layers
@@ -85,8 +85,11 @@ export class FlowerOfLife extends ThreeEffectBase {
     const pointsPerLayer = SacredGeometry3D.FlowerOfLifePoints(3, 1.5, 0).length;
     const totalCount = pointsPerLayer * layers;
     
-    // Geometry: Torus for the circles
-    const geometry = new THREE.TorusGeometry(1.5, 0.03, 8, 32);
+    // Geometry: Torus for the circles (baked by tools/bake_sacred_geometry.py, built here as a fallback)
+    const ring = { radius: 1.5, tube: 0.03, radialSegments: 8, tubularSegments: 32 };
+    const geometry = await SacredGeometry3D.BakedOr('flower-of-life-ring', ring, () =>
+      new THREE.TorusGeometry(ring.radius, ring.tube, ring.radialSegments, ring.tubularSegments)
+    );
     const material = new THREE.MeshBasicMaterial({
       color: 0xffffff,
       transparent: true,
@@ -75,7 +75,7 @@ export class MetatronsCube extends ThreeEffectBase {
     // For this effect, we stick to standard fog for performance stability in this refactor.
 
     // 4. Create Metatron's Geometry
-    this.createSacredStructure(palette);
+    await this.createSacredStructure(palette);
 
     // 5. Create Floating Platonic Solids
     this.createPlatonicSolids(palette);
@@ -84,7 +84,7 @@ export class MetatronsCube extends ThreeEffectBase {
     this.createParticles();
   }
 
-  createSacredStructure(palette) {
+  async createSacredStructure(palette) {
     this.structureGroup = new THREE.Group();
     const scale = 8;
     
@@ -124,13 +124,17 @@ export class MetatronsCube extends ThreeEffectBase {
     this.lines = new THREE.LineSegments(lineGeom, lineMat);
     this.structureGroup.add(this.lines);
 
-    // C. The Rings (Fruit of Life)
+    // C. The Rings (Fruit of Life) - one shared torus, baked by tools/bake_sacred_geometry.py
+    const ringParams = { radius: scale * 1.5, tube: 0.1, radialSegments: 8, tubularSegments: 64 };
+    const ringGeom = await SacredGeometry3D.BakedOr('metatron-ring', ringParams, () =>
+      new THREE.TorusGeometry(ringParams.radius, ringParams.tube, ringParams.radialSegments, ringParams.tubularSegments)
+    );
     centers.forEach(center => {
       // Don't put a ring on the center
       if (center.lengthSq() < 0.1) return;
       
       const ring = new THREE.Mesh(
-        new THREE.TorusGeometry(scale * 1.5, 0.1, 8, 64),
+        ringGeom,
         new THREE.MeshBasicMaterial({ color: palette[2], transparent: true, opacity: 0.4 })
       );
       ring.position.copy(center);
@@ -158,6 +158,77 @@ export class SacredGeometry3D {
 
         return [...t1, ...t2];
     }
+
+    // ========================================================================
+    // BAKED LAYOUTS (tools/bake_sacred_geometry.py)
+    // ========================================================================
+
+    /**
+     * Wraps one baked buffer in a BufferGeometry without copying.
+     * Position and normal share one InterleavedBuffer over the file's bytes; the
+     * index is a typed-array view of the same ArrayBuffer. Bounds come from the
+     * header, so Three.js never has to scan the vertices.
+     * `geometry.userData.mode` is 'triangles' (Mesh) or 'lines' (LineSegments).
+     * @param {Object} entry - Manifest entry (sacred-geometry.json -> geometries[name])
+     * @param {ArrayBuffer} buffer - Contents of entry.file
+     */
+    static FromBaked(entry, buffer) {
+        const vertices = new Float32Array(buffer, 0, entry.vertexCount * entry.stride);
+        const IndexArray = entry.indexType === 'u32' ? Uint32Array : Uint16Array;
+        const indices = new IndexArray(buffer, entry.indexOffset, entry.indexCount);
+
+        const interleaved = new THREE.InterleavedBuffer(vertices, entry.stride);
+        const geometry = new THREE.BufferGeometry();
+        geometry.setAttribute('position', new THREE.InterleavedBufferAttribute(interleaved, 3, entry.attributes.position));
+        geometry.setAttribute('normal', new THREE.InterleavedBufferAttribute(interleaved, 3, entry.attributes.normal));
+        geometry.setIndex(new THREE.BufferAttribute(indices, 1));
+
+        const { boundingBox: box, boundingSphere: sphere } = entry;
+        geometry.boundingBox = new THREE.Box3(new THREE.Vector3(...box.min), new THREE.Vector3(...box.max));
+        geometry.boundingSphere = new THREE.Sphere(new THREE.Vector3(...sphere.center), sphere.radius);
+        geometry.name = entry.name;
+        geometry.userData = { mode: entry.mode, params: entry.params };
+        return geometry;
+    }
+
+    /**
+     * Loads baked layouts listed in the manifest (all, or only `names`).
+     * @param {string|URL} manifestUrl - Defaults to ./baked/sacred-geometry.json
+     * @param {string[]|null} names - e.g. ['flower-of-life-ring', 'metatron-lines']
+     * @returns {Promise<Object<string, THREE.BufferGeometry>>}
+     */
+    static async LoadBaked(manifestUrl = new URL('./baked/sacred-geometry.json', import.meta.url), names = null) {
+        const base = new URL(manifestUrl, typeof location !== 'undefined' ? location.href : undefined);
+        const manifest = await (await fetch(base)).json();
+        const entries = Object.values(manifest.geometries).filter((e) => !names || names.includes(e.name));
+        const loaded = await Promise.all(entries.map(async (entry) => {
+            const response = await fetch(new URL(entry.file, base));
+            return this.FromBaked(entry, await response.arrayBuffer());
+        }));
+        return Object.fromEntries(loaded.map((geometry) => [geometry.name, geometry]));
+    }
+
+    /**
+     * One baked geometry, or `build()` when it cannot be used: the fetch fails (e.g.
+     * file:// pages), the layout is missing, or it was baked with other parameters.
+     * @param {string} name - Manifest name, e.g. 'flower-of-life-ring'
+     * @param {Object} params - Parameters the caller would build with; must match the bake
+     * @param {function(): THREE.BufferGeometry} build - Procedural fallback
+     * @param {string|URL} [manifestUrl] - Defaults to ./baked/sacred-geometry.json
+     * @returns {Promise<THREE.BufferGeometry>}
+     */
+    static async BakedOr(name, params, build, manifestUrl = undefined) {
+        try {
+            const baked = (await this.LoadBaked(manifestUrl, [name]))[name];
+            const bakedParams = baked ? baked.userData.params : null;
+            if (bakedParams && Object.keys(params).every((key) => bakedParams[key] === params[key])) {
+                return baked;
+            }
+        } catch (error) {
+            // fall through to the procedural geometry
+        }
+        return build();
+    }
 }
 
 export default SacredGeometry3D;
@@ -349,6 +349,177 @@ class BeatDetector {
   }
 }
 
+// ---------------------------------------------------------
+// BAKED AUDIO TRACKS (playback mode)
+// ---------------------------------------------------------
+
+// Layout written by tools/bake_audio_features.py (little-endian).
+const TRACK_MAGIC = 0x46415a4a; // 'JZAF'
+const TRACK_HEADER_BYTES = 32;
+const TRACK_CHANNELS = [
+  'sub', 'bass', 'lowMid', 'mid', 'highMid', 'presence', 'brilliance',
+  'volume', 'volumeSmooth', 'beatStrength'
+];
+const TRACK_FLAG_BEAT = 1;
+const TRACK_FLAG_KICK = 2;
+const TRACK_FLAG_SNARE = 4;
+const TRACK_MAX_CATCHUP = 120; // frames scanned for beats between two updates
+
+/**
+ * Drop-in AudioAnalyzer replacement that reads precomputed features from a
+ * baked track instead of running an AnalyserNode FFT every frame.
+ * Typed arrays are views over the loaded buffer (no copies, no per-frame allocation).
+ */
+export class AudioTrackAnalyzer {
+  constructor(buffer, options = {}) {
+    const view = new DataView(buffer);
+    if (buffer.byteLength < TRACK_HEADER_BYTES || view.getUint32(0, true) !== TRACK_MAGIC) {
+      throw new Error('[JaZeR Audio] Not a baked audio track (JZAF)');
+    }
+    const channels = view.getUint16(6, true);
+    const frames = view.getUint32(8, true);
+    this.version = view.getUint16(4, true);
+    this.fps = view.getFloat32(12, true);
+    this.sampleRate = view.getUint32(16, true);
+    this.fftSize = view.getUint32(20, true);
+    this.smoothingTimeConstant = view.getFloat32(24, true);
+    this.barCount = view.getUint16(28, true);
+    this.frameCount = frames;
+    this.duration = frames / this.fps;
+
+    const floats = new Float32Array(buffer, TRACK_HEADER_BYTES, channels * frames);
+    this.channels = {};
+    TRACK_CHANNELS.forEach((name, i) => {
+      this.channels[name] = floats.subarray(i * frames, (i + 1) * frames);
+    });
+    const spectrumOffset = TRACK_HEADER_BYTES + floats.byteLength;
+    this.spectrum = new Uint8Array(buffer, spectrumOffset, frames * this.barCount);
+    this.flags = new Uint8Array(buffer, spectrumOffset + this.spectrum.byteLength, frames);
+
+    // Same shape as AudioAnalyzer so getBand() / AudioVisualizer keep working.
+    this.bands = {};
+    for (const name of TRACK_CHANNELS.slice(0, 7)) this.bands[name] = { value: 0 };
+    this.frequencyData = this.spectrum.subarray(0, this.barCount);
+    this.timeDomainData = null;
+
+    this.media = options.media || null;
+    this.loop = options.loop ?? !this.media;
+    this.startTime = performance.now();
+    this.frame = 0;
+    this.lastFrame = -1;
+    this.flagsNow = 0;
+
+    this.volume = 0;
+    this.volumeSmoothed = 0;
+    this.isPlaying = true;
+    this.isInitialized = true;
+  }
+
+  /**
+   * Fetch and parse a baked track
+   */
+  static async load(url, options = {}) {
+    const response = await fetch(url);
+    if (!response.ok) throw new Error(`[JaZeR Audio] ${url}: HTTP ${response.status}`);
+    return new AudioTrackAnalyzer(await response.arrayBuffer(), options);
+  }
+
+  /**
+   * Follow an <audio>/<video> element's currentTime (pass null for the wall clock)
+   */
+  attach(media) {
+    this.media = media;
+    this.lastFrame = -1;
+  }
+
+  /**
+   * Advance to a time in seconds (defaults to the attached media or the wall clock)
+   */
+  update(time) {
+    if (time === undefined) {
+      time = this.media ? this.media.currentTime : (performance.now() - this.startTime) / 1000;
+      this.isPlaying = this.media ? !this.media.paused : true;
+    }
+    if (this.loop && this.duration > 0) time %= this.duration;
+    const frame = Math.max(0, Math.min(this.frameCount - 1, Math.floor(time * this.fps)));
+
+    // Keep beats that fell between two render frames (30 fps render of a 60 fps track, hitches).
+    let flags = this.flags[frame];
+    if (frame > this.lastFrame && this.lastFrame >= 0) {
+      const from = Math.max(this.lastFrame + 1, frame - TRACK_MAX_CATCHUP);
+      for (let i = from; i < frame; i++) flags |= this.flags[i];
+    } else if (frame === this.lastFrame) {
+      flags = 0; // a beat fires once, like BeatDetector
+    }
+    this.flagsNow = flags;
+    this.lastFrame = this.frame = frame;
+
+    for (const name in this.bands) this.bands[name].value = this.channels[name][frame];
+    this.volume = this.channels.volume[frame];
+    this.volumeSmoothed = this.channels.volumeSmooth[frame];
+    if (this.barCount) {
+      this.frequencyData = this.spectrum.subarray(frame * this.barCount, (frame + 1) * this.barCount);
+    }
+  }
+
+  getFrequencyArray() {
+    return Array.from(this.frequencyData).map(v => v / 255);
+  }
+
+  getWaveform() {
+    return [];
+  }
+
+  getBand(bandName) {
+    return this.bands[bandName]?.value || 0;
+  }
+
+  getBass() {
+    return (this.bands.sub.value + this.bands.bass.value) / 2;
+  }
+
+  getMids() {
+    return (this.bands.lowMid.value + this.bands.mid.value + this.bands.highMid.value) / 3;
+  }
+
+  getHighs() {
+    return (this.bands.presence.value + this.bands.brilliance.value) / 2;
+  }
+
+  getVolume() {
+    return this.volume;
+  }
+
+  getVolumeSmooth() {
+    return this.volumeSmoothed;
+  }
+
+  isBeat() {
+    return (this.flagsNow & TRACK_FLAG_BEAT) !== 0;
+  }
+
+  isKick() {
+    return (this.flagsNow & TRACK_FLAG_KICK) !== 0;
+  }
+
+  isSnare() {
+    return (this.flagsNow & TRACK_FLAG_SNARE) !== 0;
+  }
+
+  getBeatStrength() {
+    return this.channels.beatStrength[this.frame];
+  }
+
+  setVolume(value) {
+    if (this.media) this.media.volume = Math.max(0, Math.min(1, value));
+  }
+
+  dispose() {
+    this.media = null;
+    this.isInitialized = false;
+  }
+}
+
 // ---------------------------------------------------------
 // AUDIO REACTIVE HELPERS
 // ---------------------------------------------------------
@@ -506,6 +677,13 @@ export async function setupAudio(audioElement, preset = 'balanced') {
   return analyzer;
 }
 
+/**
+ * Quick setup with a baked track (tools/bake_audio_features.py), optionally synced to media
+ */
+export function loadAudioTrack(url, media = null) {
+  return AudioTrackAnalyzer.load(url, { media });
+}
+
 /**
  * Quick setup with microphone
  */
@@ -522,9 +700,11 @@ export async function setupMicrophone(preset = 'microphone') {
 export default {
   AudioAnalyzer,
   AudioVisualizer,
+  AudioTrackAnalyzer,
   BeatDetector,
   createAudioAnalyzer,
   setupAudio,
+  loadAudioTrack,
   setupMicrophone,
   mapAudio,
   easeAudio,
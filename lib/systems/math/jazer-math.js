@@ -335,6 +335,91 @@ export function fbm3D(x, y, z, octaves = 6, persistence = 0.5, lacunarity = 2.0)
   return value / maxValue;
 }
 
+// ---------------------------------------------------------
+// BAKED NOISE: tileable fbm textures from tools/bake_noise_textures.py
+// One bilinear/trilinear lookup instead of `octaves` noise evaluations.
+// Coordinates are in the same units as fbm2D/fbm3D and wrap every `period`.
+// ---------------------------------------------------------
+export class BakedNoise {
+  constructor(entry, buffer) {
+    this.name = entry.name;
+    this.dims = entry.dims;
+    this.size = entry.size;
+    this.period = entry.period;
+    this.octaves = entry.octaves;
+    this.format = entry.format;
+    this.data = entry.format === 'f32' ? new Float32Array(buffer) : new Uint8Array(buffer);
+    this._scale = this.size / this.period;
+    this._texture = null;
+  }
+
+  _texel(i) {
+    const v = this.data[i];
+    return this.format === 'f32' ? v : v / 127.5 - 1;
+  }
+
+  sample2D(x, y) {
+    return this._slice(x, y, 0);
+  }
+
+  sample3D(x, y, z) {
+    const n = this.size;
+    const fz = z * this._scale;
+    const z0 = Math.floor(fz);
+    const tz = fz - z0;
+    const az = ((z0 % n) + n) % n, bz = (az + 1) % n;
+    return lerp(this._slice(x, y, az), this._slice(x, y, bz), tz);
+  }
+
+  _slice(x, y, z) {
+    const n = this.size, base = z * n * n;
+    const fx = x * this._scale, fy = y * this._scale;
+    const x0 = Math.floor(fx), y0 = Math.floor(fy);
+    const tx = fx - x0, ty = fy - y0;
+    const ax = ((x0 % n) + n) % n, ay = ((y0 % n) + n) % n;
+    const bx = (ax + 1) % n, by = (ay + 1) % n;
+    const a = lerp(this._texel(base + ay * n + ax), this._texel(base + ay * n + bx), tx);
+    const b = lerp(this._texel(base + by * n + ax), this._texel(base + by * n + bx), tx);
+    return lerp(a, b, ty);
+  }
+
+  /**
+   * DataTexture (2D) or Data3DTexture (3D), RepeatWrapping + linear filtering.
+   * u8 texels read back as 0-1 in shaders (value * 2 - 1 restores -1..1).
+   */
+  texture(THREE) {
+    if (this._texture) return this._texture;
+    const type = this.format === 'f32' ? THREE.FloatType : THREE.UnsignedByteType;
+    const tex = this.dims === 3
+      ? new THREE.Data3DTexture(this.data, this.size, this.size, this.size)
+      : new THREE.DataTexture(this.data, this.size, this.size, THREE.RedFormat, type);
+    tex.format = THREE.RedFormat;
+    tex.type = type;
+    tex.wrapS = tex.wrapT = THREE.RepeatWrapping;
+    if (this.dims === 3) tex.wrapR = THREE.RepeatWrapping;
+    tex.magFilter = tex.minFilter = THREE.LinearFilter;
+    tex.unpackAlignment = 1;
+    tex.needsUpdate = true;
+    this._texture = tex;
+    return tex;
+  }
+}
+
+/**
+ * Load baked noise textures listed in the manifest (all, or only `names`).
+ * @returns {Promise<Object<string, BakedNoise>>}
+ */
+export async function loadNoiseTextures(manifestUrl = new URL('./noise/noise-textures.json', import.meta.url), names = null) {
+  const base = new URL(manifestUrl, typeof location !== 'undefined' ? location.href : undefined);
+  const manifest = await (await fetch(base)).json();
+  const entries = Object.values(manifest.textures).filter((e) => !names || names.includes(e.name));
+  const loaded = await Promise.all(entries.map(async (entry) => {
+    const response = await fetch(new URL(entry.file, base));
+    return new BakedNoise(entry, await response.arrayBuffer());
+  }));
+  return Object.fromEntries(loaded.map((noise) => [noise.name, noise]));
+}
+
 // Math utils
 export function map(value, inMin, inMax, outMin, outMax) {
   return outMin + (value - inMin) * (outMax - outMin) / (inMax - inMin);
@@ -388,5 +473,6 @@ export default {
     Math4D,
     noise2D, noise3D, noise4D,
     fbm2D, fbm3D,
+    BakedNoise, loadNoiseTextures,
     map, clamp, smoothstep, lerp, inverseLerp, remap
 };
@@ -298,6 +298,9 @@ export class CinematicCamera {
             case 'orbitSubtle':
                 return this._orbitSubtle(shot, t);
 
+            case 'bakedPath':
+                return this._bakedPath(shot, t);
+
             default:
                 return this._lockedHero(shot, t);
         }
@@ -423,6 +426,33 @@ export class CinematicCamera {
         return { position, lookAt };
     }
 
+    /**
+     * Baked Path - Constant-speed travel along a CameraPath table
+     * One table lookup per frame; reuses cached vectors (no allocation).
+     * @private
+     */
+    _bakedPath(shot, t) {
+        if (!this._pathPosition) {
+            this._pathPosition = new this.THREE.Vector3();
+            this._pathTangent = new this.THREE.Vector3();
+            this._pathLookAt = new this.THREE.Vector3();
+        }
+        const position = this._pathPosition;
+        const lookAt = this._pathLookAt;
+        const u = shot.ease ? this._easeInOutSine(t) : t;
+
+        shot.path.sample(u, position, this._pathTangent);
+
+        if (shot.lookAt) {
+            lookAt.set(shot.lookAt[0], shot.lookAt[1], shot.lookAt[2]);
+        } else {
+            // Chase camera: look down the path
+            lookAt.copy(position).addScaledVector(this._pathTangent, shot.lookAhead);
+        }
+
+        return { position, lookAt };
+    }
+
     /**
      * Apply micro-drift for organic feel
      * @private
@@ -584,6 +614,26 @@ export const Shot = {
             arcSpan: options.arcSpan || Math.PI / 8,  // Only 22.5 degrees!
             duration: options.duration || 3
         };
+    },
+
+    /**
+     * Baked Path - Constant-speed flight along a baked camera path
+     * @param {Object} options
+     * @param {CameraPath} options.path - Table from loadCameraPath() (tools/bake_camera_paths.py)
+     * @param {Array<number>|null} options.lookAt - Fixed target; null looks along the path
+     * @param {number} options.lookAhead - Distance ahead on the tangent to look at (chase mode)
+     * @param {boolean} options.ease - Ease in/out instead of constant speed
+     * @param {number} options.duration - Shot duration
+     */
+    bakedPath(options = {}) {
+        return {
+            type: 'bakedPath',
+            path: options.path,
+            lookAt: options.lookAt || null,
+            lookAhead: options.lookAhead || 5,
+            ease: options.ease || false,
+            duration: options.duration || 2
+        };
     }
 };
 
@@ -649,6 +699,95 @@ export function loopPath(waypoints, t) {
 }
 
 
+// ============================================================================
+// BAKED CAMERA PATHS
+// ============================================================================
+
+const PATH_MAGIC = 0x50435a4a; // 'JZCP'
+const PATH_HEADER_BYTES = 16;
+const PATH_FLAG_CLOSED = 1;
+const PATH_STRIDE = 6;
+
+/**
+ * CameraPath - Arc-length table baked by tools/bake_camera_paths.py
+ *
+ * Rows are equally spaced in distance along the same curve catmullRom() /
+ * loopPath() trace, so sampling at u moves at constant speed. Each sample is
+ * one index computation and a lerp between two rows (O(1)), read zero-copy
+ * from the file's bytes.
+ */
+export class CameraPath {
+    /**
+     * @param {ArrayBuffer} buffer - Contents of a .jzcp file
+     */
+    constructor(buffer) {
+        const view = new DataView(buffer);
+        if (buffer.byteLength < PATH_HEADER_BYTES || view.getUint32(0, true) !== PATH_MAGIC) {
+            throw new Error('[JaZeR Motion] Not a baked camera path (JZCP)');
+        }
+        this.version = view.getUint16(4, true);
+        this.closed = (view.getUint16(6, true) & PATH_FLAG_CLOSED) !== 0;
+        this.count = view.getUint32(8, true);
+        this.length = view.getFloat32(12, true);
+        this.data = new Float32Array(buffer, PATH_HEADER_BYTES, this.count * PATH_STRIDE);
+    }
+
+    static async load(url) {
+        const response = await fetch(url);
+        if (!response.ok) throw new Error(`[JaZeR Motion] ${url}: HTTP ${response.status}`);
+        return new CameraPath(await response.arrayBuffer());
+    }
+
+    /**
+     * Position (and unit tangent) at fraction u of the path length
+     * Closed paths wrap u; open paths clamp it to [0, 1].
+     * @param {number} u - Arc-length fraction
+     * @param {THREE.Vector3} position - Receives the position
+     * @param {THREE.Vector3} [tangent] - Receives the direction of travel
+     * @returns {THREE.Vector3} position
+     */
+    sample(u, position, tangent = null) {
+        u = this.closed ? u - Math.floor(u) : Math.min(Math.max(u, 0), 1);
+        const f = u * (this.count - 1);
+        const i = Math.min(Math.floor(f), this.count - 2);
+        const k = f - i;
+        const d = this.data;
+        const a = i * PATH_STRIDE;
+        const b = a + PATH_STRIDE;
+
+        position.set(
+            d[a] + (d[b] - d[a]) * k,
+            d[a + 1] + (d[b + 1] - d[a + 1]) * k,
+            d[a + 2] + (d[b + 2] - d[a + 2]) * k
+        );
+        if (tangent) {
+            tangent.set(
+                d[a + 3] + (d[b + 3] - d[a + 3]) * k,
+                d[a + 4] + (d[b + 4] - d[a + 4]) * k,
+                d[a + 5] + (d[b + 5] - d[a + 5]) * k
+            ).normalize();
+        }
+        return position;
+    }
+
+    /**
+     * Same as sample(), addressed by distance along the path (world units)
+     */
+    atDistance(distance, position, tangent = null) {
+        return this.sample(distance / this.length, position, tangent);
+    }
+}
+
+/**
+ * Load a baked camera path for Shot.bakedPath()
+ * @param {string|URL} url - .jzcp file
+ * @returns {Promise<CameraPath>}
+ */
+export function loadCameraPath(url) {
+    return CameraPath.load(url);
+}
+
+
 // ============================================================================
 // EXPORTS
 // ============================================================================
@@ -659,5 +798,7 @@ export default {
     CinematicCamera,
     Shot,
     catmullRom,
-    loopPath
+    loopPath,
+    CameraPath,
+    loadCameraPath
 };
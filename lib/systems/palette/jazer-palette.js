@@ -543,6 +543,130 @@ export function glowColor(hex, intensity = 0.5) {
 }
 
 
+// ============================================================================
+// BAKED LOOKUP TABLES
+// ============================================================================
+
+/**
+ * PaletteLUT - Samples the RGBA atlas baked by tools/bake_palette_luts.py
+ *
+ * Texel i of a palette's `cycle` row equals cycleColor(name, i / width) and
+ * texel i of its `gradient` row equals new Palette(name).gradientColors(width)[i],
+ * so hot loops can read bytes (or a DataTexture) instead of lerping hex strings.
+ */
+export class PaletteLUT {
+    /**
+     * @param {Object} manifest - palette-lut.json
+     * @param {ArrayBuffer|Uint8Array} data - palette-lut.bin (RGBA8)
+     */
+    constructor(manifest, data) {
+        this.manifest = manifest;
+        this.width = manifest.width;
+        this.height = manifest.height;
+        this.rows = manifest.rows;
+        this.data = data instanceof Uint8Array ? data : new Uint8Array(data);
+        this._hex = new Map(); // row -> hex strings, built on first use
+        this._texture = null;
+    }
+
+    /**
+     * Fetch the manifest and atlas (defaults to the copy next to this module)
+     * @param {string|URL} manifestUrl
+     * @returns {Promise<PaletteLUT>}
+     */
+    static async load(manifestUrl = new URL('./palette-lut.json', import.meta.url)) {
+        const manifest = await (await fetch(manifestUrl)).json();
+        const response = await fetch(new URL(manifest.data, new URL(manifestUrl, location.href)));
+        return new PaletteLUT(manifest, await response.arrayBuffer());
+    }
+
+    /**
+     * Atlas row for a palette (unknown names fall back to jazer, like cycleColor)
+     * @param {string} name - Palette name
+     * @param {string} kind - 'cycle' or 'gradient'
+     * @returns {number}
+     */
+    row(name, kind = 'cycle') {
+        return (this.rows[name] || this.rows.jazer)[kind];
+    }
+
+    /**
+     * Texel column for t: cycle rows wrap, gradient rows clamp to 0-1
+     * @returns {number}
+     */
+    column(t, kind = 'cycle') {
+        if (kind === 'cycle') {
+            return Math.floor((((t % 1) + 1) % 1) * this.width) % this.width;
+        }
+        return Math.round(Math.max(0, Math.min(1, t)) * (this.width - 1));
+    }
+
+    /**
+     * Byte offset of the sampled texel in `data`
+     * @returns {number}
+     */
+    offset(name, t, kind = 'cycle') {
+        return (this.row(name, kind) * this.width + this.column(t, kind)) * 4;
+    }
+
+    /**
+     * Sample as 0-255 channels (writes into `out` to avoid allocation)
+     * @returns {{r: number, g: number, b: number}}
+     */
+    rgb(name, t, out = { r: 0, g: 0, b: 0 }, kind = 'cycle') {
+        const o = this.offset(name, t, kind);
+        out.r = this.data[o];
+        out.g = this.data[o + 1];
+        out.b = this.data[o + 2];
+        return out;
+    }
+
+    /**
+     * Sample as a hex string (cached per texel, so repeated calls allocate nothing)
+     * @returns {string}
+     */
+    hex(name, t, kind = 'cycle') {
+        const row = this.row(name, kind);
+        let strings = this._hex.get(row);
+        if (!strings) {
+            strings = new Array(this.width);
+            for (let i = 0; i < this.width; i++) {
+                const o = (row * this.width + i) * 4;
+                strings[i] = rgbToHex(this.data[o], this.data[o + 1], this.data[o + 2]);
+            }
+            this._hex.set(row, strings);
+        }
+        return strings[this.column(t, kind)];
+    }
+
+    /**
+     * Texture v coordinate of a palette row (center of the texel row)
+     * @returns {number}
+     */
+    v(name, kind = 'cycle') {
+        return (this.row(name, kind) + 0.5) / this.height;
+    }
+
+    /**
+     * Shared DataTexture of the whole atlas (u = t, v = lut.v(name, kind))
+     * @param {Object} THREE - Three.js namespace
+     * @returns {THREE.DataTexture}
+     */
+    texture(THREE) {
+        if (!this._texture) {
+            const tex = new THREE.DataTexture(this.data, this.width, this.height, THREE.RGBAFormat);
+            tex.wrapS = THREE.RepeatWrapping;
+            tex.wrapT = THREE.ClampToEdgeWrapping;
+            tex.magFilter = THREE.LinearFilter;
+            tex.minFilter = THREE.LinearFilter;
+            tex.needsUpdate = true;
+            this._texture = tex;
+        }
+        return this._texture;
+    }
+}
+
+
 // ============================================================================
 // EXPORTS
 // ============================================================================
@@ -551,6 +675,7 @@ export default {
     PALETTES,
     Palette,
     Gradient,
+    PaletteLUT,
     hexToRgb,
     hexToRgba,
     rgbToHex,
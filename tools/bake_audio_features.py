@@ -0,0 +1,262 @@
+#!/usr/bin/env python3
+"""
+JaZeR Visual Effects Library — Audio Feature Baker
+
+Decodes a WAV file (stdlib `wave`) and precomputes, per video frame, the signals
+that AudioAnalyzer (lib/systems/audio/jazer-audio.js) derives from a live
+AnalyserNode: the seven frequency bands behind getBass()/getMids()/getHighs(),
+volume, getVolumeSmooth(), isBeat()/isKick()/isSnare() and getBeatStrength().
+AudioTrackAnalyzer plays the result back with no FFT, mic or <audio> graph.
+
+The analysis mirrors the browser pipeline for the chosen AUDIO_PRESETS entry:
+- fftSize-sample Blackman window ending at each frame time (vectorized rfft)
+- magnitude smoothing with the preset's smoothingTimeConstant
+- dB -> byte mapping over [minDecibels, maxDecibels] (-90..-10)
+- band averages over floor(min/binWidth)..ceil(max/binWidth) like _updateBands()
+- BeatDetector: 43-frame energy history, 1.3x threshold, 100 ms cooldown, 0.98 decay
+  (AudioAnalyzer builds its BeatDetector with defaults, so the presets'
+  beatThreshold is not used live either; pass --beat-threshold to override)
+
+Requires NumPy.
+
+Track format (little-endian, read zero-copy by AudioTrackAnalyzer):
+  header  32 bytes  'JZAF', u16 version, u16 channels, u32 frames, f32 fps,
+                    u32 sampleRate, u32 fftSize, f32 smoothing, u16 bars, u16 reserved
+  float32 channels x frames (planar, CHANNELS order)
+  uint8   frames x bars     spectrum bars (0-255, AudioVisualizer input)
+  uint8   frames            flags (1 beat, 2 kick, 4 snare)
+
+Usage:
+  python tools/bake_audio_features.py music/track.wav --preset electronic
+  python tools/bake_audio_features.py music/track.wav --fps 30 --bars 64 --out effects/audio/track.jzaf
+"""
+
+
+from __future__ import annotations
+
+import argparse
+import re
+import struct
+import wave
+from pathlib import Path
+
+import numpy as np
+
+
+AUDIO_JS = Path(__file__).resolve().parents[1] / "lib" / "systems" / "audio" / "jazer-audio.js"
+
+MAGIC = b"JZAF"
+VERSION = 1
+HEADER = struct.Struct("<4sHHIfIIfHH")   # 32 bytes
+
+# Float32 channel order (AudioTrackAnalyzer reads the same list).
+BANDS = {
+    "sub": (20, 60),
+    "bass": (60, 250),
+    "lowMid": (250, 500),
+    "mid": (500, 2000),
+    "highMid": (2000, 4000),
+    "presence": (4000, 6000),
+    "brilliance": (6000, 20000),
+}
+CHANNELS = (*BANDS, "volume", "volumeSmooth", "beatStrength")
+
+FLAG_BEAT, FLAG_KICK, FLAG_SNARE = 1, 2, 4
+
+# AudioAnalyzer / BeatDetector defaults.
+MIN_DECIBELS = -90.0
+MAX_DECIBELS = -10.0
+BEAT_THRESHOLD = 1.3
+BEAT_DECAY = 0.98
+BEAT_COOLDOWN_MS = 100.0
+BEAT_HISTORY = 43
+KICK_STRENGTH = 0.7
+VOLUME_SMOOTHING = 0.9
+
+# Fallback if AUDIO_PRESETS can't be parsed (mirrors jazer-audio.js).
+DEFAULT_PRESETS = {
+    "electronic": {"fftSize": 2048, "smoothing": 0.8},
+    "live": {"fftSize": 4096, "smoothing": 0.85},
+    "microphone": {"fftSize": 2048, "smoothing": 0.75},
+    "balanced": {"fftSize": 2048, "smoothing": 0.8},
+}
+
+CHUNK_FRAMES = 1024   # STFT frames per batch (bounds memory for long files)
+
+
+def load_presets() -> dict[str, dict[str, float]]:
+    """Read AUDIO_PRESETS from the JS module."""
+    try:
+        source = AUDIO_JS.read_text(encoding="utf-8")
+    except OSError:
+        return DEFAULT_PRESETS
+    block = re.search(r"export const AUDIO_PRESETS = \{(.*?)\n\};", source, re.S)
+    if not block:
+        return DEFAULT_PRESETS
+    presets = {}
+    for name, body in re.findall(r"(\w+):\s*\{([^}]*)\}", block.group(1)):
+        values = {k: float(v) for k, v in re.findall(r"(\w+)\s*:\s*([\d.]+)", body)}
+        if "fftSize" in values:
+            presets[name] = values
+    return presets or DEFAULT_PRESETS
+
+
+def read_wav(path: Path) -> tuple[np.ndarray, int]:
+    """Mono float64 samples in [-1, 1] and the sample rate."""
+    try:
+        with wave.open(str(path), "rb") as w:
+            if w.getcomptype() != "NONE":
+                raise SystemExit(f"{path}: compressed WAV ({w.getcomptype()}) is not supported")
+            channels, width, rate, n = w.getnchannels(), w.getsampwidth(), w.getframerate(), w.getnframes()
+            raw = w.readframes(n)
+    except (wave.Error, EOFError) as e:
+        raise SystemExit(f"{path}: not a readable WAV file ({str(e) or 'truncated header'})")
+    except OSError as e:
+        raise SystemExit(f"{path}: {e.strerror or e}")
+    # A truncated data chunk can end mid-frame; keep the whole frames.
+    raw = raw[: len(raw) // (width * channels) * (width * channels)]
+
+    if width == 1:
+        data = (np.frombuffer(raw, dtype=np.uint8).astype(np.float64) - 128.0) / 128.0
+    elif width == 2:
+        data = np.frombuffer(raw, dtype="<i2") / 32768.0
+    elif width == 3:
+        b = np.frombuffer(raw, dtype=np.uint8).reshape(-1, 3).astype(np.int32)
+        v = b[:, 0] | (b[:, 1] << 8) | (b[:, 2] << 16)
+        data = np.where(v >= 1 << 23, v - (1 << 24), v) / float(1 << 23)
+    elif width == 4:
+        data = np.frombuffer(raw, dtype="<i4") / 2147483648.0
+    else:
+        raise SystemExit(f"{path}: unsupported sample width {width * 8} bits")
+    return data.reshape(-1, channels).mean(axis=1), rate
+
+
+def analyser_bytes(samples: np.ndarray, rate: int, fps: float, fft_size: int, smoothing: float) -> np.ndarray:
+    """AnalyserNode.getByteFrequencyData() for each frame: (frames, fftSize / 2) uint8."""
+    n_frames = int(np.ceil(len(samples) / rate * fps))
+    bins = fft_size // 2
+    # The analyser looks at the fftSize samples *before* the current time.
+    padded = np.concatenate([np.zeros(fft_size), samples, np.zeros(fft_size)])
+    ends = fft_size + np.floor(np.arange(n_frames) * rate / fps).astype(np.int64)
+    window = np.blackman(fft_size)
+    offsets = np.arange(-fft_size, 0)
+
+    out = np.empty((n_frames, bins), dtype=np.uint8)
+    scale = 255.0 / (MAX_DECIBELS - MIN_DECIBELS)
+    prev = np.zeros(bins + 1)
+    for start in range(0, n_frames, CHUNK_FRAMES):
+        idx = ends[start:start + CHUNK_FRAMES, None] + offsets
+        mag = np.abs(np.fft.rfft(padded[idx] * window, axis=1)) / fft_size
+        # Temporal smoothing is recursive in time; each step is a whole-row vector op.
+        for i in range(mag.shape[0]):
+            prev = smoothing * prev + (1.0 - smoothing) * mag[i]
+            mag[i] = prev
+        with np.errstate(divide="ignore"):
+            db = 20.0 * np.log10(mag[:, :bins])
+        out[start:start + mag.shape[0]] = np.clip(np.floor(scale * (db - MIN_DECIBELS)), 0, 255).astype(np.uint8)
+    return out
+
+
+def band_values(freq: np.ndarray, rate: int) -> dict[str, np.ndarray]:
+    bins = freq.shape[1]
+    bin_width = (rate / 2) / bins
+    out = {}
+    for name, (lo, hi) in BANDS.items():
+        a, b = int(np.floor(lo / bin_width)), min(int(np.ceil(hi / bin_width)), bins)
+        out[name] = freq[:, a:b].mean(axis=1) / 255.0 if b > a else np.zeros(freq.shape[0])
+    return out
+
+
+def detect_beats(volume: np.ndarray, fps: float, threshold: float) -> tuple[np.ndarray, np.ndarray]:
+    """BeatDetector.update() over the whole track: (strength per frame, flags per frame)."""
+    n = len(volume)
+    csum = np.concatenate([[0.0], np.cumsum(volume)])
+    t = np.arange(n)
+    lo = np.maximum(t + 1 - BEAT_HISTORY, 0)
+    avg = (csum[t + 1] - csum[lo]) / (t + 1 - lo)   # history includes the current frame
+
+    with np.errstate(divide="ignore", invalid="ignore"):
+        ratio = np.where(avg > 0, volume / avg, np.inf)
+    candidates = np.flatnonzero(volume > avg * threshold)
+
+    # The cooldown depends on the previous accepted beat; only candidates are visited.
+    frame_ms = 1000.0 / fps
+    beats: list[int] = []
+    for i in candidates:
+        if not beats or (i - beats[-1]) * frame_ms > BEAT_COOLDOWN_MS:
+            beats.append(int(i))
+    beat_idx = np.asarray(beats, dtype=np.int64)
+
+    flags = np.zeros(n, dtype=np.uint8)
+    strength = np.zeros(n)
+    if beat_idx.size:
+        hit = np.minimum((ratio[beat_idx] - threshold) / threshold, 1.0)
+        flags[beat_idx] = FLAG_BEAT | np.where(hit > KICK_STRENGTH, FLAG_KICK, FLAG_SNARE)
+        # strength = hit on the beat frame, then *= decay every frame (including that one).
+        last = np.maximum.accumulate(np.where(flags > 0, t, -1))
+        have = last >= 0
+        strength[have] = hit[np.searchsorted(beat_idx, last[have])] * BEAT_DECAY ** (t[have] - last[have] + 1)
+    return strength, flags
+
+
+def spectrum_bars(freq: np.ndarray, bars: int) -> np.ndarray:
+    """AudioVisualizer binning (before its own smoothing): (frames, bars) uint8."""
+    size = freq.shape[1] // bars
+    return freq[:, : size * bars].reshape(freq.shape[0], bars, size).mean(axis=2).round().astype(np.uint8)
+
+
+def ema(values: np.ndarray, keep: float) -> np.ndarray:
+    out = np.empty_like(values)
+    acc = 0.0
+    for i, v in enumerate(values):
+        acc = acc * keep + v * (1.0 - keep)
+        out[i] = acc
+    return out
+
+
+def bake(samples: np.ndarray, rate: int, fps: float, fft_size: int, smoothing: float, bars: int, threshold: float) -> bytes:
+    freq = analyser_bytes(samples, rate, fps, fft_size, smoothing)
+    bands = band_values(freq, rate)
+    volume = freq.mean(axis=1) / 255.0
+    strength, flags = detect_beats(volume, fps, threshold)
+
+    planar = np.stack([*bands.values(), volume, ema(volume, VOLUME_SMOOTHING), strength]).astype("<f4")
+    spectrum = spectrum_bars(freq, bars) if bars else np.zeros((len(volume), 0), dtype=np.uint8)
+    header = HEADER.pack(MAGIC, VERSION, len(CHANNELS), len(volume), fps, rate, fft_size, smoothing, bars, 0)
+    return header + planar.tobytes() + spectrum.tobytes() + flags.tobytes()
+
+
+def main() -> int:
+    presets = load_presets()
+    ap = argparse.ArgumentParser(description="Bake AudioAnalyzer features from a WAV file into a JZAF track.")
+    ap.add_argument("wav", help="Input .wav (PCM 8/16/24/32-bit, any channel count)")
+    ap.add_argument("--out", default="", help="Output track (default: <wav>.<preset>.jzaf)")
+    ap.add_argument("--preset", default="balanced", choices=sorted(presets), help="AUDIO_PRESETS entry")
+    ap.add_argument("--fps", type=float, default=60.0, help="Frame grid (AudioAnalyzer.update() rate)")
+    ap.add_argument("--bars", type=int, default=64, help="Spectrum bars for AudioVisualizer (0 = none)")
+    ap.add_argument("--beat-threshold", type=float, default=BEAT_THRESHOLD)
+    args = ap.parse_args()
+
+    wav = Path(args.wav)
+    preset = presets[args.preset]
+    fft_size = int(preset["fftSize"])
+    smoothing = float(preset.get("smoothing", 0.8))
+    if args.bars < 0 or args.bars > fft_size // 2:
+        raise SystemExit(f"--bars must be between 0 and {fft_size // 2}")
+
+    samples, rate = read_wav(wav)
+    data = bake(samples, rate, args.fps, fft_size, smoothing, args.bars, args.beat_threshold)
+
+    out = Path(args.out) if args.out else wav.with_name(f"{wav.stem}.{args.preset}.jzaf")
+    out.parent.mkdir(parents=True, exist_ok=True)
+    out.write_bytes(data)
+
+    frames = HEADER.unpack_from(data)[3]
+    beats = int(np.count_nonzero(np.frombuffer(data, dtype=np.uint8, offset=len(data) - frames) & FLAG_BEAT))
+    print(f"Baked {frames} frame(s) @ {args.fps:g} fps ({len(samples) / rate:.1f} s, {args.preset}: fft {fft_size}, "
+          f"smoothing {smoothing:g}) -> {out} ({len(data) / 1024:.1f} KiB, {beats} beat(s))")
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,253 @@
+#!/usr/bin/env python3
+"""
+JaZeR Visual Effects Library — Camera Path Baker
+
+Bakes Catmull-Rom camera paths (catmullRom() / loopPath() in
+lib/systems/motion/jazer-motion.js) into arc-length tables so CinematicCamera can
+move at constant speed with one table lookup per frame (Shot.bakedPath /
+CameraPath in jazer-motion.js).
+
+catmullRom(points, t) maps t linearly onto segments, so the camera speeds up on
+long segments and slows down on short ones, and every frame re-evaluates the
+cubic. The baker samples the same curve densely (float64, operation for
+operation), integrates chord length, inverts it, and stores `samples` rows
+equally spaced in distance: position.xyz and the unit tangent.xyz.
+
+Waypoints come from a JSON spec (--paths) or the built-in PRESETS, either as
+explicit points or as a list of Shot presets, which are turned into waypoints
+from the positions each shot passes through (see shot_waypoints()).
+
+Requires NumPy.
+
+Path format (little-endian, read zero-copy by CameraPath):
+  header  16 bytes  'JZCP', u16 version, u16 flags (1 = closed), u32 samples, f32 length
+  float32 samples x 6   (x, y, z, tx, ty, tz) per row, row i at distance i / (samples - 1) * length
+
+Spec (--paths paths.json):
+  {"tour": {"closed": true, "samples": 512, "waypoints": [[0, 2, 8], [6, 3, 0], ...]},
+   "intro": {"shots": [{"type": "dollyGlide", "from": [0, 0, 20], "to": [0, 0, 8]}, ...]}}
+
+Usage:
+  python tools/bake_camera_paths.py --verify
+  python tools/bake_camera_paths.py --paths my-paths.json --out-dir effects/paths
+"""
+
+
+from __future__ import annotations
+
+import argparse
+import json
+import math
+import shutil
+import struct
+import subprocess
+from pathlib import Path
+
+import numpy as np
+
+
+ROOT = Path(__file__).resolve().parents[1]
+MOTION_JS = ROOT / "lib" / "systems" / "motion" / "jazer-motion.js"
+DEFAULT_OUT = "lib/systems/motion/paths"
+
+MAGIC = b"JZCP"
+VERSION = 1
+FLAG_CLOSED = 1
+HEADER = struct.Struct("<4sHHIf")   # 16 bytes
+FLOATS_PER_SAMPLE = 6
+DEFAULT_SAMPLES = 512
+DENSITY = 256    # curve evaluations per segment when integrating length
+
+# Shot factory defaults (jazer-motion.js `Shot`).
+SHOT_DEFAULTS = {
+    "dollyGlide": {"from": [0, 0, 15], "to": [0, 0, 5]},
+    "arcPush": {"center": [0, 0, 0], "radius": 8, "startAngle": 0, "arc": math.pi / 4,
+                "height": 2, "heightVariation": 0.3},
+    "parallaxWeave": {"position": [0, 0, 10], "weaveAmount": 1.5},
+    "lockedHero": {"position": [0, 2, 8]},
+    "orbitSubtle": {"center": [0, 0, 0], "radius": 10, "height": 3, "startAngle": 0, "arcSpan": math.pi / 8},
+}
+
+PRESETS = {
+    # lib/sacred-geometry/MetatronsCube.js shot list, as one closed tour
+    "metatron-tour": {"closed": True, "shots": [
+        {"type": "lockedHero", "position": [0, 0, 40]},
+        {"type": "orbitSubtle", "center": [0, 0, 0], "radius": 35, "startAngle": 0, "arcSpan": 0.5},
+        {"type": "dollyGlide", "from": [0, 10, 30], "to": [0, 0, 20]},
+    ]},
+    # tests/lib-modules-test.html CinematicCamera demo
+    "modules-demo-tour": {"closed": True, "shots": [
+        {"type": "dollyGlide", "from": [0, 5, 20], "to": [0, 3, 8]},
+        {"type": "arcPush", "center": [0, 0, 0], "radius": 12, "arc": math.pi / 3, "height": 4},
+        {"type": "parallaxWeave", "position": [8, 4, 8], "weaveAmount": 2},
+        {"type": "lockedHero", "position": [0, 6, 12]},
+    ]},
+}
+
+
+def shot_waypoints(shot: dict) -> list[list[float]]:
+    """Positions a Shot passes through (un-eased), from the CinematicCamera evaluators."""
+    kind = shot.get("type", "lockedHero")
+    s = {**SHOT_DEFAULTS.get(kind, SHOT_DEFAULTS["lockedHero"]), **shot}
+    if kind == "dollyGlide":
+        return [s["from"], s["to"]]
+    if kind == "arcPush":
+        cx, cy, cz = s["center"]
+        out = []
+        for t in np.linspace(0, 1, 5):
+            a = s["startAngle"] + s["arc"] * t
+            out.append([cx + math.sin(a) * s["radius"], cy + s["height"] + math.sin(t * math.pi) * s["heightVariation"],
+                        cz + math.cos(a) * s["radius"]])
+        return out
+    if kind == "parallaxWeave":
+        x, y, z = s["position"]
+        w = s["weaveAmount"]
+        return [[x + math.sin(t * math.pi * 2) * w, y + math.sin(t * math.pi * 2 * 0.7) * w * 0.3, z]
+                for t in np.linspace(0, 1, 5)[:-1]]
+    if kind == "orbitSubtle":
+        cx, cy, cz = s["center"]
+        out = []
+        for t in np.linspace(0, 1, 5):
+            # _orbitSubtle(): `shot.startAngle || 0 + arcSpan * (t - 0.5)` only sweeps when startAngle is 0
+            a = s["startAngle"] or s["arcSpan"] * (t - 0.5)
+            out.append([cx + math.sin(a) * s["radius"], cy + s["height"], cz + math.cos(a) * s["radius"]])
+        return out
+    return [s["position"]]
+
+
+def spec_waypoints(spec: dict) -> np.ndarray:
+    points = spec.get("waypoints") or [p for shot in spec.get("shots", []) for p in shot_waypoints(shot)]
+    pts = np.asarray(points, dtype=float).reshape(-1, 3)
+    keep = np.ones(len(pts), dtype=bool)
+    keep[1:] = np.any(np.abs(np.diff(pts, axis=0)) > 1e-9, axis=1)   # drop repeated points
+    pts = pts[keep]
+    if spec.get("closed") and len(pts) > 1 and np.allclose(pts[0], pts[-1]):
+        pts = pts[:-1]
+    if len(pts) < 2:
+        raise SystemExit("A camera path needs at least two distinct waypoints")
+    return pts
+
+
+def catmull_rom(points: np.ndarray, t: np.ndarray, derivative: bool = False) -> np.ndarray:
+    """catmullRom(points, t) for many t (and d/dt with derivative=True), clamped end segments like the JS."""
+    n = len(points)
+    if n == 2:
+        if derivative:
+            return np.broadcast_to(points[1] - points[0], (len(t), 3)).copy()
+        return points[0] + (points[1] - points[0]) * t[:, None]
+    p = t * (n - 1)
+    i = np.floor(p).astype(np.int64)
+    f = (p - i)[:, None]
+    a = points[np.maximum(0, i - 1)]
+    b = points[i]
+    c = points[np.minimum(n - 1, i + 1)]
+    d = points[np.minimum(n - 1, i + 2)]
+    c1 = -a + c
+    c2 = 2 * a - 5 * b + 4 * c - d
+    c3 = -a + 3 * b - 3 * c + d
+    if derivative:
+        return 0.5 * (c1 + 2 * c2 * f + 3 * c3 * f * f) * (n - 1)
+    return 0.5 * ((2 * b) + c1 * f + c2 * f * f + c3 * f * f * f)
+
+
+def curve_points(waypoints: np.ndarray, closed: bool) -> np.ndarray:
+    """loopPath() appends the first waypoint; catmullRom() uses the list as is."""
+    return np.concatenate([waypoints, waypoints[:1]]) if closed else waypoints
+
+
+def bake_path(waypoints: np.ndarray, closed: bool, samples: int) -> tuple[np.ndarray, np.ndarray, float, float]:
+    """Arc-length table: (params, rows[samples, 6], length, raw speed ratio max/min)."""
+    points = curve_points(waypoints, closed)
+    segments = len(points) - 1
+    u = np.linspace(0, 1, segments * DENSITY + 1)
+    dense = catmull_rom(points, u)
+    s = np.concatenate([[0.0], np.cumsum(np.linalg.norm(np.diff(dense, axis=0), axis=1))])
+    length = float(s[-1])
+
+    params = np.interp(np.linspace(0, length, samples), s, u)
+    params[0], params[-1] = 0.0, 1.0
+    pos = catmull_rom(points, params)
+    tan = catmull_rom(points, params, derivative=True)
+    norm = np.linalg.norm(tan, axis=1, keepdims=True)
+    flat = norm[:, 0] < 1e-9
+    if flat.any():  # zero-velocity points (repeated control points): use the chord instead
+        chord = np.gradient(pos, axis=0)
+        tan[flat] = chord[flat]
+        norm[flat] = np.linalg.norm(chord[flat], axis=1, keepdims=True)
+    tan /= np.maximum(norm, 1e-12)
+
+    step = np.diff(s)
+    speed = step[step > 0]
+    ratio = float(speed.max() / speed.min()) if speed.size else 1.0
+    return params, np.concatenate([pos, tan], axis=1), length, ratio
+
+
+def encode(rows: np.ndarray, length: float, closed: bool) -> bytes:
+    header = HEADER.pack(MAGIC, VERSION, FLAG_CLOSED if closed else 0, len(rows), length)
+    return header + rows.astype("<f4").tobytes()
+
+
+VERIFY_JS = """
+import { catmullRom, loopPath } from %s;
+const points = %s, closed = %s, params = %s;
+const out = params.map((t) => closed ? loopPath(points, t) : catmullRom(points, t));
+process.stdout.write(JSON.stringify(out.flat()));
+"""
+
+
+def verify_with_node(waypoints: np.ndarray, closed: bool, params: np.ndarray, rows: np.ndarray) -> float:
+    """Max |baked position - catmullRom()/loopPath()| at the baked parameters."""
+    node = shutil.which("node")
+    if not node:
+        raise SystemExit("--verify needs node on PATH")
+    script = VERIFY_JS % (json.dumps(MOTION_JS.as_uri()), json.dumps(waypoints.tolist()),
+                          json.dumps(closed), json.dumps(params.tolist()))
+    proc = subprocess.run([node, "--input-type=module"], input=script, capture_output=True, text=True)
+    if proc.returncode != 0:
+        raise SystemExit(f"node failed:\n{proc.stderr}")
+    js = np.asarray(json.loads(proc.stdout)).reshape(-1, 3)
+    return float(np.abs(js - rows[:, :3]).max())
+
+
+def main() -> int:
+    ap = argparse.ArgumentParser(description="Bake arc-length camera path tables (JZCP).")
+    ap.add_argument("--paths", help="JSON spec of paths (default: built-in presets)")
+    ap.add_argument("--only", action="append", default=[], help="Path name(s) to bake; can repeat")
+    ap.add_argument("--samples", type=int, help="Rows per path (overrides the spec; default 512)")
+    ap.add_argument("--out-dir", default=DEFAULT_OUT, help="Output directory (repo-relative)")
+    ap.add_argument("--verify", action="store_true", help="Compare positions with jazer-motion.js (needs node)")
+    args = ap.parse_args()
+
+    specs = json.loads(Path(args.paths).read_text(encoding="utf-8")) if args.paths else PRESETS
+    unknown = [n for n in args.only if n not in specs]
+    if unknown:
+        raise SystemExit(f"Unknown path(s): {', '.join(unknown)}; available: {', '.join(specs)}")
+
+    out_dir = ROOT / args.out_dir
+    out_dir.mkdir(parents=True, exist_ok=True)
+    failed = 0
+    print(f"{'name':<20} {'points':>6} {'closed':>6} {'samples':>7} {'length':>9} {'bytes':>8}  raw speed max/min")
+    for name in args.only or specs:
+        spec = specs[name]
+        samples = args.samples or int(spec.get("samples", DEFAULT_SAMPLES))
+        if samples < 2:
+            raise SystemExit(f"{name}: samples must be at least 2")
+        closed = bool(spec.get("closed", False))
+        waypoints = spec_waypoints(spec)
+        params, rows, length, ratio = bake_path(waypoints, closed, samples)
+        data = encode(rows, length, closed)
+        (out_dir / f"{name}.jzcp").write_bytes(data)
+        print(f"{name:<20} {len(waypoints):>6} {str(closed).lower():>6} {samples:>7} {length:>9.3f} "
+              f"{len(data):>8,}  {ratio:.2f}x -> 1.00x")
+        if args.verify:
+            err = verify_with_node(waypoints, closed, params, rows)
+            ok = err <= 1e-4 * max(1.0, length)
+            failed += not ok
+            print(f"  verify: max |baked - jazer-motion.js| = {err:.3g} ({'ok' if ok else 'MISMATCH'})")
+
+    print(f"Wrote {out_dir}")
+    return 1 if failed else 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
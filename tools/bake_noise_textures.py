@@ -0,0 +1,329 @@
+#!/usr/bin/env python3
+"""
+JaZeR Visual Effects Library — Noise Texture Baker
+
+Bakes SimplexNoise / fbm2D / fbm3D (lib/systems/math/jazer-math.js) into
+tileable 2D and 3D textures so effects can trade per-sample octave loops for a
+texture fetch (BakedNoise / loadNoiseTextures in jazer-math.js).
+
+The noise is a vectorized NumPy port of the JS, operation for operation, including
+how the constructor builds its tables from the seed. As written, those tables
+index `p[i & 255 * 256]` (i.e. `i & 0xff00`) and store `perm % 12 * 256` in a
+Uint8Array, so permMod12 is all zeros: every corner uses gradient (1, 1, 0) and
+the output does not depend on the seed. The port reproduces that, so baked values
+match what effects render today (--verify checks this against node).
+
+Tiling: simplex noise is not periodic, so by default each texel cross-fades the
+samples at x, x - period (and y, z) with linear weights. This is seamless but
+lowers contrast toward the tile center. --tile none keeps the exact fbm values
+(not seamless).
+
+Requires NumPy.
+
+Outputs (default lib/systems/math/noise/):
+  <name>.bin            float32 or uint8 texels (x fastest, then y, then z)
+  noise-textures.json   manifest: size, format, octaves, period, value range per asset
+
+Usage:
+  python tools/bake_noise_textures.py                    # default set (see PRESETS)
+  python tools/bake_noise_textures.py --only fbm3d --verify
+  python tools/bake_noise_textures.py --name clouds --dims 2 --size 512 --octaves 8 --period 6 --format f32
+"""
+
+
+from __future__ import annotations
+
+import argparse
+import json
+import re
+import shutil
+import subprocess
+from dataclasses import asdict, dataclass
+from pathlib import Path
+
+import numpy as np
+
+
+ROOT = Path(__file__).resolve().parents[1]
+MATH_JS = ROOT / "lib" / "systems" / "math" / "jazer-math.js"
+DEFAULT_OUT = "lib/systems/math/noise"
+MANIFEST = "noise-textures.json"
+
+F2 = 0.5 * (np.sqrt(3.0) - 1.0)
+G2 = (3.0 - np.sqrt(3.0)) / 6.0
+F3 = 1.0 / 3.0
+G3 = 1.0 / 6.0
+
+GRAD3_RE = re.compile(r"this\.grad3 = new Float32Array\(\[(.*?)\]\);", re.S)
+
+
+@dataclass
+class NoiseSpec:
+    name: str
+    dims: int
+    size: int
+    octaves: int = 6
+    persistence: float = 0.5
+    lacunarity: float = 2.0
+    period: float = 4.0       # noise-space units covered by one tile
+    format: str = "u8"        # u8 (maps [-1, 1] to 0..255) or f32
+    tile: str = "blend"       # blend | none
+
+
+PRESETS = {
+    "noise2d": NoiseSpec("noise2d", 2, 256, octaves=1, period=8.0),
+    "fbm2d": NoiseSpec("fbm2d", 2, 256, octaves=6, period=4.0),
+    "fbm3d": NoiseSpec("fbm3d", 3, 32, octaves=4, period=4.0),
+}
+
+BYTES_PER_TEXEL = {"u8": 1, "f32": 4}
+SLAB_TEXELS = 1 << 16
+
+
+# ---------------------------------------------------------------------------
+# SimplexNoise port
+# ---------------------------------------------------------------------------
+
+def load_grad3() -> np.ndarray:
+    """SimplexNoise.grad3 as (n, 3) rows, read from the JS source."""
+    m = GRAD3_RE.search(MATH_JS.read_text(encoding="utf-8"))
+    if not m:
+        raise SystemExit(f"grad3 table not found in {MATH_JS}")
+    flat = np.array([float(v) for v in m.group(1).replace("\n", " ").split(",") if v.strip()], dtype=np.float32)
+    return flat[: len(flat) // 3 * 3].astype(np.float64).reshape(-1, 3)
+
+
+GRAD3 = load_grad3()
+
+
+def build_tables(seed: int) -> tuple[np.ndarray, np.ndarray]:
+    """SimplexNoise constructor tables (perm, permMod12), replicated literally."""
+    p = np.zeros(256 * 256, dtype=np.uint8)
+    p[:256] = np.arange(256)
+    s = seed
+    for i in range(255, 0, -1):
+        s = (s * 16807) % 2147483647
+        j = s % (i + 1)
+        p[i], p[j] = p[j], p[i]
+    idx = np.arange(512 * 256)
+    perm = p[idx & (255 * 256)]
+    perm_mod12 = ((perm.astype(np.int64) % 12) * 256).astype(np.uint8)   # Uint8Array store wraps
+    return perm, perm_mod12
+
+
+def _corner(t: np.ndarray, gi: np.ndarray, *deltas: np.ndarray) -> np.ndarray:
+    t = np.where(t < 0, 0.0, t)
+    t = t * t
+    dot = GRAD3[gi, 0] * deltas[0]
+    for axis in range(1, len(deltas)):
+        dot = dot + GRAD3[gi, axis] * deltas[axis]
+    return t * t * dot
+
+
+def noise2d(x: np.ndarray, y: np.ndarray, perm: np.ndarray, pm12: np.ndarray) -> np.ndarray:
+    s = (x + y) * F2
+    i = np.floor(x + s)
+    j = np.floor(y + s)
+    t = (i + j) * G2
+    x0 = x - (i - t)
+    y0 = y - (j - t)
+    i1 = (x0 > y0).astype(np.int64)
+    j1 = 1 - i1
+    x1 = x0 - i1 + G2
+    y1 = y0 - j1 + G2
+    x2 = x0 - 1 + 2 * G2
+    y2 = y0 - 1 + 2 * G2
+    ii = i.astype(np.int64) & 255
+    jj = j.astype(np.int64) & 255
+
+    n0 = _corner(0.5 - x0 * x0 - y0 * y0, pm12[ii + perm[jj]], x0, y0)
+    n1 = _corner(0.5 - x1 * x1 - y1 * y1, pm12[ii + i1 + perm[jj + j1]], x1, y1)
+    n2 = _corner(0.5 - x2 * x2 - y2 * y2, pm12[ii + 1 + perm[jj + 1]], x2, y2)
+    return 70 * (n0 + n1 + n2)
+
+
+def noise3d(x: np.ndarray, y: np.ndarray, z: np.ndarray, perm: np.ndarray, pm12: np.ndarray) -> np.ndarray:
+    s = (x + y + z) * F3
+    i = np.floor(x + s)
+    j = np.floor(y + s)
+    k = np.floor(z + s)
+    t = (i + j + k) * G3
+    x0 = x - (i - t)
+    y0 = y - (j - t)
+    z0 = z - (k - t)
+
+    # Simplex traversal order: the JS if/else ladder as masks over its six cases.
+    a, b, c = x0 >= y0, y0 >= z0, x0 >= z0
+    i1 = (a & (b | c)).astype(np.int64)
+    j1 = (~a & b).astype(np.int64)
+    k1 = (~b & (~a | ~c)).astype(np.int64)
+    i2 = (a | (b & c)).astype(np.int64)
+    j2 = (~a | b).astype(np.int64)
+    k2 = (~b | (~a & ~c)).astype(np.int64)
+
+    x1, y1, z1 = x0 - i1 + G3, y0 - j1 + G3, z0 - k1 + G3
+    x2, y2, z2 = x0 - i2 + 2 * G3, y0 - j2 + 2 * G3, z0 - k2 + 2 * G3
+    x3, y3, z3 = x0 - 1 + 3 * G3, y0 - 1 + 3 * G3, z0 - 1 + 3 * G3
+    ii = i.astype(np.int64) & 255
+    jj = j.astype(np.int64) & 255
+    kk = k.astype(np.int64) & 255
+
+    n0 = _corner(0.6 - x0 * x0 - y0 * y0 - z0 * z0, pm12[ii + perm[jj + perm[kk]]], x0, y0, z0)
+    n1 = _corner(0.6 - x1 * x1 - y1 * y1 - z1 * z1, pm12[ii + i1 + perm[jj + j1 + perm[kk + k1]]], x1, y1, z1)
+    n2 = _corner(0.6 - x2 * x2 - y2 * y2 - z2 * z2, pm12[ii + i2 + perm[jj + j2 + perm[kk + k2]]], x2, y2, z2)
+    n3 = _corner(0.6 - x3 * x3 - y3 * y3 - z3 * z3, pm12[ii + 1 + perm[jj + 1 + perm[kk + 1]]], x3, y3, z3)
+    return 32 * (n0 + n1 + n2 + n3)
+
+
+def fbm(coords: tuple[np.ndarray, ...], spec: NoiseSpec, perm: np.ndarray, pm12: np.ndarray) -> np.ndarray:
+    """fbm2D / fbm3D (noise2D / noise3D for one octave), same accumulation order."""
+    noise = noise2d if len(coords) == 2 else noise3d
+    value = np.zeros_like(coords[0])
+    amplitude, frequency, max_value = 1.0, 1.0, 0.0
+    for _ in range(spec.octaves):
+        value = value + amplitude * noise(*(c * frequency for c in coords), perm, pm12)
+        max_value += amplitude
+        amplitude *= spec.persistence
+        frequency *= spec.lacunarity
+    return value / max_value
+
+
+def bake(spec: NoiseSpec, perm: np.ndarray, pm12: np.ndarray) -> np.ndarray:
+    """(size,) * dims float64 texels, indexed [z][y][x]."""
+    axis = np.arange(spec.size) / spec.size * spec.period
+    weight = axis / spec.period
+    shifts = (0.0, spec.period) if spec.tile == "blend" else (0.0,)
+    out = np.empty((spec.size,) * spec.dims)
+
+    # Rows (2D) or z slices (3D) in blocks of ~64k texels bound peak memory.
+    step = max(1, SLAB_TEXELS // spec.size ** (spec.dims - 1))
+    for start in range(0, spec.size, step):
+        outer = np.arange(start, min(start + step, spec.size))
+        index = np.meshgrid(outer, *([np.arange(spec.size)] * (spec.dims - 1)), indexing="ij")
+        grid = tuple(axis[ix] for ix in reversed(index))        # x, y(, z)
+        weights = tuple(weight[ix] for ix in reversed(index))
+        total = np.zeros(grid[0].shape)
+        for offsets in np.ndindex(*(len(shifts),) * spec.dims):
+            w = 1.0
+            if spec.tile == "blend":
+                for wa, o in zip(weights, offsets):
+                    w = w * (wa if o else 1.0 - wa)
+            total += w * fbm(tuple(g - shifts[o] for g, o in zip(grid, offsets)), spec, perm, pm12)
+        out[outer] = total
+    return out
+
+
+def encode(values: np.ndarray, fmt: str) -> bytes:
+    if fmt == "f32":
+        return values.astype("<f4").tobytes()
+    return np.floor((np.clip(values, -1.0, 1.0) + 1.0) * 127.5 + 0.5).astype(np.uint8).tobytes()
+
+
+VERIFY_JS = """
+import { SimplexNoise } from %s;
+const noise = new SimplexNoise(%d);
+const pts = %s;
+const [octaves, persistence, lacunarity] = %s;
+// Same loop as fbm2D / fbm3D, on a seeded instance instead of the module's random one.
+const out = pts.map((p) => {
+  let value = 0, amplitude = 1, frequency = 1, maxValue = 0;
+  for (let i = 0; i < octaves; i++) {
+    value += amplitude * (p.length === 2
+      ? noise.noise2D(p[0] * frequency, p[1] * frequency)
+      : noise.noise3D(p[0] * frequency, p[1] * frequency, p[2] * frequency));
+    maxValue += amplitude;
+    amplitude *= persistence;
+    frequency *= lacunarity;
+  }
+  return value / maxValue;
+});
+process.stdout.write(JSON.stringify(out));
+"""
+
+
+def verify_with_node(spec: NoiseSpec, seed: int, perm: np.ndarray, pm12: np.ndarray, samples: int = 4096) -> float:
+    """Max |python - js| over random points (including negative coordinates)."""
+    node = shutil.which("node")
+    if not node:
+        raise SystemExit("--verify needs node on PATH")
+    rng = np.random.default_rng(0)
+    pts = rng.uniform(-4 * spec.period, 4 * spec.period, size=(samples, spec.dims))
+    script = VERIFY_JS % (json.dumps(MATH_JS.as_uri()), seed, json.dumps(pts.tolist()),
+                          json.dumps([spec.octaves, spec.persistence, spec.lacunarity]))
+    proc = subprocess.run([node, "--input-type=module"], input=script, capture_output=True, text=True)
+    if proc.returncode != 0:
+        raise SystemExit(f"node failed:\n{proc.stderr}")
+    js = np.asarray(json.loads(proc.stdout))
+    ours = fbm(tuple(pts[:, d] for d in range(spec.dims)), spec, perm, pm12)
+    return float(np.max(np.abs(ours - js)))
+
+
+def footprint(spec: NoiseSpec) -> tuple[int, int]:
+    """(bytes, bytes with a full mip chain)."""
+    size = spec.size ** spec.dims * BYTES_PER_TEXEL[spec.format]
+    return size, int(size * (4 / 3 if spec.dims == 2 else 8 / 7))
+
+
+def main() -> int:
+    ap = argparse.ArgumentParser(description="Bake tileable simplex noise / fbm textures.")
+    ap.add_argument("--out-dir", default=DEFAULT_OUT, help="Output directory (repo-relative)")
+    ap.add_argument("--only", action="append", default=[], help="Preset name(s) to bake; can repeat")
+    ap.add_argument("--name", help="Bake a custom texture with this name instead of the presets")
+    ap.add_argument("--dims", type=int, choices=(2, 3), default=2)
+    ap.add_argument("--size", type=int, default=256, help="Texels per axis")
+    ap.add_argument("--octaves", type=int, default=6)
+    ap.add_argument("--persistence", type=float, default=0.5)
+    ap.add_argument("--lacunarity", type=float, default=2.0)
+    ap.add_argument("--period", type=float, default=4.0, help="Noise-space units per tile")
+    ap.add_argument("--format", choices=sorted(BYTES_PER_TEXEL), default="u8")
+    ap.add_argument("--tile", choices=("blend", "none"), default="blend")
+    ap.add_argument("--seed", type=int, default=0, help="SimplexNoise seed (integer)")
+    ap.add_argument("--verify", action="store_true", help="Check the noise port against jazer-math.js with node")
+    args = ap.parse_args()
+
+    if args.name:
+        specs = [NoiseSpec(args.name, args.dims, args.size, args.octaves, args.persistence,
+                           args.lacunarity, args.period, args.format, args.tile)]
+    else:
+        unknown = [n for n in args.only if n not in PRESETS]
+        if unknown:
+            raise SystemExit(f"Unknown preset(s): {', '.join(unknown)}; available: {', '.join(PRESETS)}")
+        specs = [PRESETS[n] for n in (args.only or PRESETS)]
+
+    out_dir = ROOT / args.out_dir
+    out_dir.mkdir(parents=True, exist_ok=True)
+    manifest_path = out_dir / MANIFEST
+    manifest = json.loads(manifest_path.read_text(encoding="utf-8")) if manifest_path.exists() else {"version": 1, "textures": {}}
+    perm, pm12 = build_tables(args.seed)
+
+    failed = 0
+    print(f"{'name':<12} {'dims':>4} {'size':>10} {'fmt':>4} {'bytes':>10} {'+mips':>10}  evals/sample -> fetch")
+    for spec in specs:
+        values = bake(spec, perm, pm12)
+        data = encode(values, spec.format)
+        (out_dir / f"{spec.name}.bin").write_bytes(data)
+        size_bytes, mip_bytes = footprint(spec)
+        manifest["textures"][spec.name] = {
+            **asdict(spec),
+            "file": f"{spec.name}.bin",
+            "seed": args.seed,
+            "range": [round(float(values.min()), 6), round(float(values.max()), 6)],
+            "bytes": size_bytes,
+        }
+        dims = "x".join([str(spec.size)] * spec.dims)
+        print(f"{spec.name:<12} {spec.dims:>3}D {dims:>10} {spec.format:>4} {size_bytes:>10,} {mip_bytes:>10,}  "
+              f"{spec.octaves} noise{spec.dims}D call(s) -> 1 {'bi' if spec.dims == 2 else 'tri'}linear fetch")
+        if args.verify:
+            err = verify_with_node(spec, args.seed, perm, pm12)
+            ok = err <= 1e-9
+            failed += not ok
+            print(f"  verify: max |numpy - jazer-math.js| = {err:.3g} ({'ok' if ok else 'MISMATCH'})")
+
+    manifest_path.write_text(json.dumps(manifest, indent=2) + "\n", encoding="utf-8")
+    total = sum(t["bytes"] for t in manifest["textures"].values())
+    print(f"Manifest: {manifest_path} ({len(manifest['textures'])} texture(s), {total:,} bytes)")
+    return 1 if failed else 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
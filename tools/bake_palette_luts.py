@@ -0,0 +1,219 @@
+#!/usr/bin/env python3
+"""
+JaZeR Visual Effects Library — Palette LUT Baker
+
+Bakes every entry of PALETTES (lib/systems/palette/jazer-palette.js) into a
+fixed-width RGBA8 lookup table so effects can sample colors from a typed array
+or DataTexture (PaletteLUT) instead of parsing hex, lerping and formatting
+strings per particle per frame.
+
+Each palette gets two rows in one atlas:
+- cycle:    texel i = cycleColor(name, i / width)                  (wraps)
+- gradient: texel i = new Palette(name).gradientColors(width)[i]   (clamps)
+
+The math replicates the JS exactly (float64 lerp, Math.round rounding), and
+--verify evaluates the real module with node and compares every byte.
+
+Requires NumPy.
+
+Outputs (next to jazer-palette.js by default):
+  palette-lut.bin    raw RGBA8, rows x width x 4
+  palette-lut.json   manifest: size, row index per palette/kind, source colors, hashes
+  palette-lut.png    with --png (for THREE.TextureLoader)
+
+Usage:
+  python tools/bake_palette_luts.py
+  python tools/bake_palette_luts.py --width 512 --png --verify
+"""
+
+
+from __future__ import annotations
+
+import argparse
+import hashlib
+import json
+import re
+import shutil
+import struct
+import subprocess
+import zlib
+from pathlib import Path
+
+import numpy as np
+
+
+ROOT = Path(__file__).resolve().parents[1]
+PALETTE_JS = ROOT / "lib" / "systems" / "palette" / "jazer-palette.js"
+KINDS = ("cycle", "gradient")
+
+# Palette.gradientColors(): primary -> secondary until 0.6, then 40% of the way to the accent.
+GRADIENT_SPLIT = 0.6
+GRADIENT_ACCENT_MIX = 0.4
+
+HEX_RE = re.compile(r"#?([0-9a-fA-F]{2})([0-9a-fA-F]{2})([0-9a-fA-F]{2})$")
+
+
+def load_palettes(source: str) -> dict[str, list[str]]:
+    block = re.search(r"export const PALETTES = \{(.*?)\n\};", source, re.S)
+    if not block:
+        raise SystemExit(f"PALETTES not found in {PALETTE_JS}")
+    return {
+        name: re.findall(r"'([^']*)'", colors)
+        for name, colors in re.findall(r"(\w+)\s*:\s*\[([^\]]*)\]", block.group(1))
+    }
+
+
+def hex_to_rgb(colors: list[str]) -> np.ndarray:
+    """hexToRgb() for a list: (n, 3) float64; unparseable colors become black like the JS."""
+    out = np.zeros((len(colors), 3))
+    for i, c in enumerate(colors):
+        m = HEX_RE.match(c)
+        if m:
+            out[i] = [int(g, 16) for g in m.groups()]
+    return out
+
+
+def to_bytes(rgb: np.ndarray) -> np.ndarray:
+    """rgbToHex() channel rounding: Math.round(clamp(x, 0, 255))."""
+    return np.floor(np.clip(rgb, 0, 255) + 0.5).astype(np.uint8)
+
+
+def lerp_rows(c1: np.ndarray, c2: np.ndarray, t: np.ndarray) -> np.ndarray:
+    return c1 + (c2 - c1) * t[:, None]
+
+
+def bake_cycle(colors: np.ndarray, width: int) -> np.ndarray:
+    """cycleColor(colors, i / width) for i in [0, width)."""
+    n = len(colors)
+    t = np.arange(width) / width
+    tt = np.fmod(np.fmod(t, 1) + 1, 1)
+    scaled = tt * n
+    i0 = np.floor(scaled).astype(np.int64) % n
+    local = scaled - np.floor(scaled)
+    return to_bytes(lerp_rows(colors[i0], colors[(i0 + 1) % n], local))
+
+
+def bake_gradient(colors: np.ndarray, width: int) -> np.ndarray:
+    """Palette.gradientColors(width) with the default roles (primary 0, secondary 1, accent last)."""
+    primary, secondary, accent = colors[0], colors[1 % len(colors)], colors[-1]
+    t = np.arange(width) / (width - 1)
+    first = t < GRADIENT_SPLIT
+    out = np.empty((width, 3))
+    out[first] = lerp_rows(primary[None], secondary[None], t[first] / GRADIENT_SPLIT)
+    local = (t[~first] - GRADIENT_SPLIT) / (1 - GRADIENT_SPLIT)
+    out[~first] = lerp_rows(secondary[None], accent[None], local * GRADIENT_ACCENT_MIX)
+    return to_bytes(out)
+
+
+def bake_atlas(palettes: dict[str, list[str]], width: int) -> tuple[np.ndarray, dict[str, dict[str, int]]]:
+    rows: dict[str, dict[str, int]] = {}
+    atlas = np.full((len(palettes) * len(KINDS), width, 4), 255, dtype=np.uint8)
+    for p, (name, colors) in enumerate(palettes.items()):
+        rgb = hex_to_rgb(colors)
+        rows[name] = {}
+        for k, (kind, bake) in enumerate(zip(KINDS, (bake_cycle, bake_gradient))):
+            row = p * len(KINDS) + k
+            atlas[row, :, :3] = bake(rgb, width)
+            rows[name][kind] = row
+    return atlas, rows
+
+
+def write_png(path: Path, atlas: np.ndarray) -> None:
+    """Minimal RGBA8 PNG (stdlib zlib)."""
+    height, width = atlas.shape[:2]
+    raw = b"".join(b"\x00" + atlas[y].tobytes() for y in range(height))
+
+    def chunk(tag: bytes, data: bytes) -> bytes:
+        return struct.pack(">I", len(data)) + tag + data + struct.pack(">I", zlib.crc32(tag + data) & 0xFFFFFFFF)
+
+    ihdr = struct.pack(">IIBBBBB", width, height, 8, 6, 0, 0, 0)
+    path.write_bytes(b"\x89PNG\r\n\x1a\n" + chunk(b"IHDR", ihdr) + chunk(b"IDAT", zlib.compress(raw, 9)) + chunk(b"IEND", b""))
+
+
+VERIFY_JS = """
+import { PALETTES, Palette, cycleColor, hexToRgb } from %s;
+const width = %d;
+const out = {};
+for (const name of Object.keys(PALETTES)) {
+  const cycle = [];
+  for (let i = 0; i < width; i++) cycle.push(cycleColor(name, i / width));
+  out[name] = { cycle, gradient: new Palette(name).gradientColors(width) };
+}
+const rgb = (list) => list.flatMap((hex) => { const c = hexToRgb(hex); return [c.r, c.g, c.b]; });
+for (const name in out) for (const kind in out[name]) out[name][kind] = rgb(out[name][kind]);
+process.stdout.write(JSON.stringify(out));
+"""
+
+
+def verify_with_node(atlas: np.ndarray, rows: dict[str, dict[str, int]], width: int) -> int:
+    """Evaluate the JS module with node and compare every texel. Returns the mismatch count."""
+    node = shutil.which("node")
+    if not node:
+        raise SystemExit("--verify needs node on PATH")
+    script = VERIFY_JS % (json.dumps(PALETTE_JS.as_uri()), width)
+    proc = subprocess.run([node, "--input-type=module", "-e", script], capture_output=True, text=True)
+    if proc.returncode != 0:
+        raise SystemExit(f"node failed:\n{proc.stderr}")
+    expected = json.loads(proc.stdout)
+
+    mismatches = 0
+    for name, kinds in rows.items():
+        for kind, row in kinds.items():
+            js = np.asarray(expected[name][kind], dtype=np.uint8).reshape(width, 3)
+            bad = np.flatnonzero(np.any(js != atlas[row, :, :3], axis=1))
+            if bad.size:
+                i = int(bad[0])
+                print(f"[MISMATCH] {name}.{kind}: {bad.size} texel(s), first at {i}: "
+                      f"baked {atlas[row, i, :3].tolist()} vs js {js[i].tolist()}")
+            mismatches += int(bad.size)
+    return mismatches
+
+
+def main() -> int:
+    ap = argparse.ArgumentParser(description="Bake PALETTES into an RGBA lookup-table atlas.")
+    ap.add_argument("--width", type=int, default=256, help="Texels per row")
+    ap.add_argument("--out-dir", default=str(PALETTE_JS.parent.relative_to(ROOT)), help="Output directory (repo-relative)")
+    ap.add_argument("--name", default="palette-lut", help="Output file stem")
+    ap.add_argument("--png", action="store_true", help="Also write a PNG of the atlas")
+    ap.add_argument("--verify", action="store_true", help="Compare every texel with the JS functions (needs node)")
+    args = ap.parse_args()
+    if args.width < 2:
+        raise SystemExit("--width must be at least 2")
+
+    source = PALETTE_JS.read_text(encoding="utf-8")
+    palettes = load_palettes(source)
+    atlas, rows = bake_atlas(palettes, args.width)
+    data = atlas.tobytes()
+
+    out_dir = ROOT / args.out_dir
+    out_dir.mkdir(parents=True, exist_ok=True)
+    manifest = {
+        "version": 1,
+        "format": "rgba8",
+        "width": args.width,
+        "height": atlas.shape[0],
+        "data": f"{args.name}.bin",
+        "sha256": hashlib.sha256(data).hexdigest(),
+        "palettes_sha256": hashlib.sha256(json.dumps(palettes, sort_keys=True).encode("utf-8")).hexdigest(),
+        "kinds": {"cycle": "cycleColor(name, u), wraps", "gradient": "Palette(name).gradientColors, clamps"},
+        "rows": rows,
+        "palettes": palettes,
+    }
+    (out_dir / f"{args.name}.bin").write_bytes(data)
+    (out_dir / f"{args.name}.json").write_text(json.dumps(manifest, indent=2) + "\n", encoding="utf-8")
+    if args.png:
+        write_png(out_dir / f"{args.name}.png", atlas)
+
+    print(f"Baked {len(palettes)} palette(s) x {len(KINDS)} rows @ {args.width} texels "
+          f"-> {out_dir / args.name}.bin ({len(data) / 1024:.1f} KiB)")
+
+    if args.verify:
+        mismatches = verify_with_node(atlas, rows, args.width)
+        total = atlas.shape[0] * args.width
+        print(f"Verify against jazer-palette.js: {total - mismatches}/{total} texel(s) identical.")
+        return 1 if mismatches else 0
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,359 @@
+#!/usr/bin/env python3
+"""
+JaZeR Visual Effects Library — Sacred Geometry Baker
+
+Computes the circle, line and triangle layouts of the sacred-geometry effects
+(lib/sacred-geometry/) with NumPy and writes them as ready-to-upload vertex
+buffers, so effects can skip rebuilding tori, connection lines and triangles on
+every startup (SacredGeometry3D.LoadBaked / BakedOr / FromBaked).
+
+The ring presets are the single base geometries the effects draw: FlowerOfLife.js
+instances its ring once per lattice point and MetatronsCube.js places one shared
+ring per center, so the per-copy transforms stay in the effects (they animate
+them) and only the tessellation is baked.
+
+Layouts (see PRESETS; override parameters with --set NAME.KEY=VALUE):
+- flower-of-life-ring  FlowerOfLife.js TorusGeometry ring, instanced per lattice point (triangles)
+- metatron-ring        MetatronsCube.js TorusGeometry ring, shared by the 12 outer centers (triangles)
+- metatron-lines       every center connected to every other center (lines, 13 shared vertices)
+- merkaba              MerkabaVertices() as two flat-shaded tetrahedra (triangles)
+- seed-of-life         SeedOfLife.js circles + vesica highlights as line loops (lines)
+- sri-yantra           SriYantra.js outer circle + triangle outlines (lines)
+- sri-yantra-fill      SriYantra.js triangles (triangles)
+
+Three.js-based layouts replicate TorusGeometry in float64 and --verify builds the same geometry with node + lib/Three.js and compares.
+Canvas layouts (seed-of-life, sri-yantra) use the effects' unit-radius shapes in
+the XY plane with y up (canvas y is flipped), normal +Z.
+
+Requires NumPy.
+
+Binary layout (<name>.bin, little-endian):
+  vertices   float32 x vertexCount x 6   (position.xyz, normal.xyz interleaved)
+  indices    uint16 (or uint32 above 65535 vertices) x indexCount
+The JSON header for each buffer (counts, byte offsets, draw mode, bounds, params)
+lives in sacred-geometry.json next to them.
+
+Usage:
+  python tools/bake_sacred_geometry.py --verify
+  python tools/bake_sacred_geometry.py --only metatron-ring --set metatron-ring.tubularSegments=96
+"""
+
+
+from __future__ import annotations
+
+import argparse
+import json
+import re
+import shutil
+import subprocess
+from pathlib import Path
+
+import numpy as np
+
+
+ROOT = Path(__file__).resolve().parents[1]
+SACRED_DIR = ROOT / "lib" / "sacred-geometry"
+THREE_JS = ROOT / "lib" / "Three.js"
+DEFAULT_OUT = "lib/sacred-geometry/baked"
+MANIFEST = "sacred-geometry.json"
+FLOATS_PER_VERTEX = 6
+
+# SriYantra.js: `const triangleSizes = [...]` (fallback if the source changes shape).
+DEFAULT_TRIANGLE_SIZES = [0.95, 0.8, 0.65, 0.5, 0.35, 0.22, 0.12]
+TRIANGLE_SIZES_RE = re.compile(r"const triangleSizes = \[([^\]]*)\]")
+
+PRESETS = {
+    # FlowerOfLife.js: TorusGeometry(1.5, 0.03, 8, 32), one InstancedMesh over FlowerOfLifePoints(3, 1.5, z)
+    "flower-of-life-ring": ("ring", {"radius": 1.5, "tube": 0.03, "radialSegments": 8, "tubularSegments": 32}),
+    # MetatronsCube.js: scale 8, TorusGeometry(scale * 1.5, 0.1, 8, 64) shared by every ring mesh
+    "metatron-ring": ("ring", {"radius": 12, "tube": 0.1, "radialSegments": 8, "tubularSegments": 64}),
+    "metatron-lines": ("metatron_lines", {"scale": 8}),
+    "merkaba": ("merkaba", {"radius": 10}),
+    # SeedOfLife.js: 7 circles of radius r, 6 highlights of 0.2 r at 0.5 r
+    "seed-of-life": ("seed_of_life", {"radius": 1, "segments": 64}),
+    # SriYantra.js: outer circle + alternating up/down triangles
+    "sri-yantra": ("sri_yantra", {"radius": 1, "segments": 64}),
+    "sri-yantra-fill": ("sri_yantra_fill", {"radius": 1}),
+}
+
+
+# ---------------------------------------------------------------------------
+# Three.js replicas
+# ---------------------------------------------------------------------------
+
+def torus(radius: float, tube: float, radial: int, tubular: int) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """TorusGeometry(radius, tube, radial, tubular): positions, normals, triangle indices."""
+    v = np.arange(radial + 1)[:, None] / radial * np.pi * 2
+    u = np.arange(tubular + 1)[None, :] / tubular * np.pi * 2
+    ring = radius + tube * np.cos(v)
+    pos = np.stack(np.broadcast_arrays(ring * np.cos(u), ring * np.sin(u), tube * np.sin(v)), -1).reshape(-1, 3)
+    center = np.stack(np.broadcast_arrays(radius * np.cos(u), radius * np.sin(u), 0 * v), -1).reshape(-1, 3)
+    nrm = pos - center
+    nrm /= np.linalg.norm(nrm, axis=1, keepdims=True)
+
+    j, i = np.meshgrid(np.arange(1, radial + 1), np.arange(1, tubular + 1), indexing="ij")
+    a = (tubular + 1) * j + i - 1
+    b = (tubular + 1) * (j - 1) + i - 1
+    c = (tubular + 1) * (j - 1) + i
+    d = (tubular + 1) * j + i
+    idx = np.stack([a, b, d, b, c, d], -1).reshape(-1)
+    return pos, nrm, idx
+
+
+def metatrons_cube_centers(scale: float) -> np.ndarray:
+    """SacredGeometry3D.MetatronsCubeCenters(): center, inner 6 at 2 * scale, outer 6 at 4 * scale."""
+    angle = np.arange(6) / 6 * np.pi * 2
+    ring = np.stack([np.cos(angle), np.sin(angle), np.zeros(6)], -1)
+    return np.concatenate([np.zeros((1, 3)), ring * scale * 2, ring * scale * 4])
+
+
+def merkaba_vertices(radius: float) -> np.ndarray:
+    """SacredGeometry3D.MerkabaVertices(): base vertices rotated about +Y, then the inverted copy."""
+    t1 = [(0.0, radius, 0.0)]
+    for k in range(3):
+        a = k * 2 * np.pi / 3
+        x, y = radius * 0.94, -radius * 0.33
+        t1.append((x * np.cos(a), y, -x * np.sin(a)))
+    t1 = np.asarray(t1)
+    return np.concatenate([t1, -t1])
+
+
+# ---------------------------------------------------------------------------
+# Layout builders: each returns (mode, positions, normals, indices)
+# ---------------------------------------------------------------------------
+
+def ring(p: dict):
+    return ("triangles", *torus(p["radius"], p["tube"], int(p["radialSegments"]), int(p["tubularSegments"])))
+
+
+def metatron_lines(p: dict):
+    centers = metatrons_cube_centers(p["scale"])
+    i, j = np.triu_indices(len(centers), k=1)
+    idx = np.stack([i, j], -1).reshape(-1)
+    return "lines", centers, plane_normals(len(centers)), idx
+
+
+def merkaba(p: dict):
+    verts = merkaba_vertices(p["radius"])
+    faces = []
+    for base in (0, 4):
+        for tri in ((0, 1, 2), (0, 2, 3), (0, 3, 1), (1, 3, 2)):
+            a, b, c = (verts[base + k] for k in tri)
+            n = np.cross(b - a, c - a)
+            if np.dot(n, a + b + c) < 0:    # wind outward
+                b, c = c, b
+            faces.append((a, b, c))
+    pos = np.asarray(faces).reshape(-1, 3)
+    nrm = np.repeat([np.cross(f[1] - f[0], f[2] - f[0]) for f in faces], 3, axis=0)
+    nrm /= np.linalg.norm(nrm, axis=1, keepdims=True)
+    return "triangles", pos, nrm, np.arange(len(pos))
+
+
+def plane_normals(n: int) -> np.ndarray:
+    return np.tile([0.0, 0.0, 1.0], (n, 1))
+
+
+def circle_loops(centers: np.ndarray, radii: np.ndarray, segments: int) -> tuple[np.ndarray, np.ndarray]:
+    """Closed polylines as line-segment pairs (k, k + 1 mod segments) per circle."""
+    a = np.arange(segments) / segments * np.pi * 2
+    ring = np.stack([np.cos(a), np.sin(a), np.zeros(segments)], -1)
+    pos = np.concatenate([c + ring * r for c, r in zip(centers, radii)])
+    k = np.arange(segments)
+    loop = np.stack([k, (k + 1) % segments], -1).reshape(-1)
+    idx = np.concatenate([loop + n * segments for n in range(len(centers))])
+    return pos, idx
+
+
+def canvas_to_xy(points: np.ndarray) -> np.ndarray:
+    return points * np.array([1.0, -1.0, 1.0])
+
+
+def seed_of_life(p: dict):
+    r = p["radius"]
+    a = np.arange(6) / 6 * np.pi * 2
+    mid = a + np.pi / 6
+    centers = np.concatenate([
+        np.zeros((1, 3)),
+        np.stack([np.cos(a) * r, np.sin(a) * r, np.zeros(6)], -1),
+        np.stack([np.cos(mid) * r * 0.5, np.sin(mid) * r * 0.5, np.zeros(6)], -1),
+    ])
+    radii = np.array([r] * 7 + [r * 0.2] * 6)
+    pos, idx = circle_loops(canvas_to_xy(centers), radii, int(p["segments"]))
+    return "lines", pos, plane_normals(len(pos)), idx
+
+
+def triangle_sizes() -> list[float]:
+    m = TRIANGLE_SIZES_RE.search((SACRED_DIR / "SriYantra.js").read_text(encoding="utf-8"))
+    return [float(s) for s in m.group(1).split(",")] if m else DEFAULT_TRIANGLE_SIZES
+
+
+def sri_yantra_triangles(radius: float) -> np.ndarray:
+    tris = []
+    for i, size in enumerate(triangle_sizes()):
+        offset = -np.pi / 2 if i % 2 == 0 else np.pi / 2
+        a = np.arange(3) / 3 * np.pi * 2 + offset
+        tris.append(np.stack([np.cos(a), np.sin(a), np.zeros(3)], -1) * radius * size)
+    return canvas_to_xy(np.concatenate(tris))
+
+
+def sri_yantra(p: dict):
+    circle, circle_idx = circle_loops(np.zeros((1, 3)), np.array([p["radius"]]), int(p["segments"]))
+    tris = sri_yantra_triangles(p["radius"])
+    base = np.arange(0, len(tris), 3)[:, None] + len(circle)
+    edges = (base + np.array([0, 1, 1, 2, 2, 0])).reshape(-1)
+    pos = np.concatenate([circle, tris])
+    return "lines", pos, plane_normals(len(pos)), np.concatenate([circle_idx, edges])
+
+
+def sri_yantra_fill(p: dict):
+    tris = sri_yantra_triangles(p["radius"])
+    # canvas -> xy flips handedness; reverse winding so faces point at +Z
+    idx = (np.arange(0, len(tris), 3)[:, None] + np.array([0, 2, 1])).reshape(-1)
+    return "triangles", tris, plane_normals(len(tris)), idx
+
+
+BUILDERS = {name: globals()[fn] for name, (fn, _) in PRESETS.items()}
+# Names dropped from PRESETS; their stale .bin and manifest entries are removed on the next bake.
+RETIRED = ("flower-of-life", "metatron-rings")
+
+
+# ---------------------------------------------------------------------------
+# Encoding
+# ---------------------------------------------------------------------------
+
+def encode(mode: str, pos: np.ndarray, nrm: np.ndarray, idx: np.ndarray) -> tuple[bytes, dict]:
+    vertices = np.concatenate([pos, nrm], axis=1).astype("<f4")
+    index_type = "u16" if len(pos) <= 0xFFFF else "u32"
+    indices = idx.astype("<u2" if index_type == "u16" else "<u4")
+
+    # Same bounds Three.js would compute (box center, max distance), so the loader can skip the pass.
+    lo, hi = pos.min(axis=0), pos.max(axis=0)
+    center = (lo + hi) / 2
+    radius = float(np.sqrt(((pos - center) ** 2).sum(axis=1).max()))
+    header = {
+        "mode": mode,
+        "vertexCount": len(pos),
+        "indexCount": len(indices),
+        "indexType": index_type,
+        "stride": FLOATS_PER_VERTEX,
+        "attributes": {"position": 0, "normal": 3},
+        "indexOffset": vertices.nbytes,
+        "bytes": vertices.nbytes + indices.nbytes,
+        "boundingBox": {"min": [round(float(v), 6) for v in lo], "max": [round(float(v), 6) for v in hi]},
+        "boundingSphere": {"center": [round(float(v), 6) for v in center], "radius": np.ceil(radius * 1e6) / 1e6},
+    }
+    return vertices.tobytes() + indices.tobytes(), header
+
+
+def parse_overrides(items: list[str]) -> dict[str, dict]:
+    overrides: dict[str, dict] = {}
+    for item in items:
+        key, sep, value = item.partition("=")
+        name, dot, param = key.partition(".")
+        if not sep or not dot or name not in PRESETS or param not in PRESETS[name][1]:
+            raise SystemExit(f"--set expects NAME.KEY=VALUE with a known preset and key, got {item!r}")
+        overrides.setdefault(name, {})[param] = json.loads(value)
+    return overrides
+
+
+# ---------------------------------------------------------------------------
+# Verification (node + lib/Three.js)
+# ---------------------------------------------------------------------------
+
+VERIFY_JS = """
+import * as THREE from %(three)s;
+import { SacredGeometry3D } from %(sg)s;
+const name = %(name)s, p = %(params)s;
+let out;
+if (name === 'flower-of-life-ring' || name === 'metatron-ring') {
+  const g = new THREE.TorusGeometry(p.radius, p.tube, p.radialSegments, p.tubularSegments);
+  out = { pos: [...g.attributes.position.array], nrm: [...g.attributes.normal.array], idx: [...g.index.array] };
+} else if (name === 'metatron-lines') {
+  const pts = SacredGeometry3D.MetatronsCubeLines(SacredGeometry3D.MetatronsCubeCenters(p.scale));
+  out = { segments: pts.flatMap((v) => [v.x, v.y, v.z]) };
+} else if (name === 'merkaba') {
+  out = { points: SacredGeometry3D.MerkabaVertices(p.radius).flatMap((v) => [v.x, v.y, v.z]) };
+}
+process.stdout.write(JSON.stringify(out ?? null));
+"""
+
+
+def verify_with_node(name: str, params: dict, pos: np.ndarray, nrm: np.ndarray, idx: np.ndarray) -> float | None:
+    """Max abs difference against the JS construction, or None for canvas-only layouts."""
+    node = shutil.which("node")
+    if not node:
+        raise SystemExit("--verify needs node on PATH")
+    script = VERIFY_JS % {
+        "three": json.dumps(THREE_JS.as_uri()),
+        "sg": json.dumps((SACRED_DIR / "SacredGeometry3D.js").as_uri()),
+        "name": json.dumps(name),
+        "params": json.dumps(params),
+    }
+    proc = subprocess.run([node, "--input-type=module"], input=script, capture_output=True, text=True)
+    if proc.returncode != 0:
+        raise SystemExit(f"node failed:\n{proc.stderr}")
+    js = json.loads(proc.stdout)
+    if js is None:
+        return None
+    if "segments" in js:
+        return float(np.abs(np.asarray(js["segments"]).reshape(-1, 3) - pos[idx]).max())
+    if "points" in js:
+        # every baked corner is one of the JS vertices
+        pts = np.asarray(js["points"]).reshape(-1, 3)
+        return float(np.min(np.abs(pos[:, None, :] - pts[None]).max(axis=2), axis=1).max())
+    if not np.array_equal(np.asarray(js["idx"]), idx):
+        return float("inf")
+    return float(max(np.abs(np.asarray(js["pos"]).reshape(-1, 3) - pos).max(),
+                     np.abs(np.asarray(js["nrm"]).reshape(-1, 3) - nrm).max()))
+
+
+def main() -> int:
+    ap = argparse.ArgumentParser(description="Bake sacred-geometry layouts into interleaved vertex buffers.")
+    ap.add_argument("--out-dir", default=DEFAULT_OUT, help="Output directory (repo-relative)")
+    ap.add_argument("--only", action="append", default=[], help="Preset name(s) to bake; can repeat")
+    ap.add_argument("--set", action="append", default=[], metavar="NAME.KEY=VALUE", help="Override a preset parameter")
+    ap.add_argument("--verify", action="store_true", help="Compare Three.js-based layouts with the JS (needs node)")
+    args = ap.parse_args()
+
+    unknown = [n for n in args.only if n not in PRESETS]
+    if unknown:
+        raise SystemExit(f"Unknown preset(s): {', '.join(unknown)}; available: {', '.join(PRESETS)}")
+    overrides = parse_overrides(args.set)
+
+    out_dir = ROOT / args.out_dir
+    out_dir.mkdir(parents=True, exist_ok=True)
+    manifest_path = out_dir / MANIFEST
+    manifest = json.loads(manifest_path.read_text(encoding="utf-8")) if manifest_path.exists() else {"version": 1, "geometries": {}}
+    manifest["layout"] = "float32 [px, py, pz, nx, ny, nz] per vertex, then indices at indexOffset"
+    for name in RETIRED:
+        if manifest["geometries"].pop(name, None) is not None:
+            (out_dir / f"{name}.bin").unlink(missing_ok=True)
+            print(f"Removed retired layout {name}")
+
+    failed = 0
+    print(f"{'name':<20} {'mode':<9} {'vertices':>9} {'indices':>9} {'idx':>4} {'bytes':>10}")
+    for name in args.only or PRESETS:
+        params = {**PRESETS[name][1], **overrides.get(name, {})}
+        mode, pos, nrm, idx = BUILDERS[name](params)
+        data, header = encode(mode, pos, nrm, idx)
+        (out_dir / f"{name}.bin").write_bytes(data)
+        manifest["geometries"][name] = {"name": name, "file": f"{name}.bin", **header, "params": params}
+        print(f"{name:<20} {mode:<9} {header['vertexCount']:>9,} {header['indexCount']:>9,} "
+              f"{header['indexType']:>4} {header['bytes']:>10,}")
+        if args.verify:
+            err = verify_with_node(name, params, pos, nrm, idx)
+            if err is None:
+                print("  verify: canvas layout, no Three.js counterpart")
+                continue
+            ok = err <= 1e-5
+            failed += not ok
+            print(f"  verify: max |numpy - three.js| = {err:.3g} ({'ok' if ok else 'MISMATCH'})")
+
+    manifest_path.write_text(json.dumps(manifest, indent=2) + "\n", encoding="utf-8")
+    total = sum(g["bytes"] for g in manifest["geometries"].values())
+    print(f"Manifest: {manifest_path} ({len(manifest['geometries'])} geometr{'y' if len(manifest['geometries']) == 1 else 'ies'}, {total:,} bytes)")
+    return 1 if failed else 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
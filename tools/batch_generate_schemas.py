@@ -1,12 +1,13 @@
 import json
 from pathlib import Path
 
-def generate_schema(effect_path):
+def generate_schema(effect_path, content=None):
     name = effect_path.stem
-    try:
-        content = effect_path.read_text(encoding="utf-8", errors="replace")
-    except Exception:
-        content = ""
+    if content is None:
+        try:
+            content = effect_path.read_text(encoding="utf-8", errors="replace")
+        except Exception:
+            content = ""
 
     has_mouse = "mouse" in content and ("from '../lib/engine/jazer-background-engine.js'" in content or "uMouse" in content)
 
@@ -0,0 +1,143 @@
+"""
+Benchmark lint_ui_schemas on a synthetic corpus.
+
+Builds N schema/effect pairs in a temp dir (default 10,000): effect HTML is
+hard-linked from the real effects (no extra disk), schemas are real schemas
+padded with extra params.* controls so each one binds --params keys. Then times:
+
+- legacy: the previous per-key approach (5 regex searches per param, one per
+  exposed root, substring scans per action) on a --legacy-sample subset,
+  extrapolated to N
+- index:  lint_paths() with one tokenizing pass per effect, --jobs 1
+- index:  lint_paths() across a process pool (--jobs, default CPU count)
+
+Usage:
+  python tools/bench_lint_ui_schemas.py
+  python tools/bench_lint_ui_schemas.py --count 2000 --params 32 --jobs 4
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import os
+import re
+import shutil
+import tempfile
+import time
+from pathlib import Path
+
+from lint_ui_schemas import lint_paths, load_json, read_text
+from effect_facts import schema_action_names, schema_effect_roots, schema_param_keys
+
+
+def parse_args() -> argparse.Namespace:
+  p = argparse.ArgumentParser(description="Benchmark the UI schema linter on a synthetic corpus")
+  p.add_argument("--count", type=int, default=10_000, help="Schema/effect pairs to generate")
+  p.add_argument("--params", type=int, default=24, help="params.* keys bound per schema")
+  p.add_argument("--jobs", type=int, default=0, help="Workers for the parallel run (0 = CPU count)")
+  p.add_argument("--legacy-sample", type=int, default=200, help="Pairs timed with the legacy checks (extrapolated)")
+  return p.parse_args()
+
+
+def build_corpus(root: Path, out: Path, count: int, n_params: int) -> list[Path]:
+  effects = root / "effects"
+  schema_dir = out / "ui-schema"
+  schema_dir.mkdir(parents=True)
+
+  seeds = []
+  for path in sorted((effects / "ui-schema").glob("*.ui.json")):
+    html = effects / f"{path.name[: -len('.ui.json')]}.html"
+    if html.exists():
+      seeds.append((json.loads(path.read_text(encoding="utf-8")), html))
+
+  paths: list[Path] = []
+  for i in range(count):
+    schema, html = seeds[i % len(seeds)]
+    schema = json.loads(json.dumps(schema))
+    controls = schema.setdefault("controls", [])
+    for k in range(n_params):
+      # Mix of keys the effects really read and keys they don't (dead controls).
+      key = ["timeScale", "mouseEnabled", "speed", "intensity"][k % 4] if k < 4 else f"p{k}_{i % 97}"
+      controls.append({"type": "slider", "label": key, "bind": f"params.{key}", "min": 0, "max": 1})
+    name = f"fx-{i:05d}"
+    schema_path = schema_dir / f"{name}.ui.json"
+    schema_path.write_text(json.dumps(schema), encoding="utf-8")
+    try:
+      os.link(html, out / f"{name}.html")
+    except OSError:
+      shutil.copyfile(html, out / f"{name}.html")
+    paths.append(schema_path)
+  return paths
+
+
+# --- previous implementation, kept here only as the baseline -----------------
+
+def legacy_reads_param(effect_html: str, key: str) -> bool:
+  patterns = [
+    rf"(?:window\.)?JAZER_UI\s*\?\.\s*params\s*\?\.\s*{re.escape(key)}\b",
+    rf"(?:window\.)?JAZER_UI\s*\.\s*params\s*\.\s*{re.escape(key)}\b",
+    rf"\bui\s*\.\s*params\s*\.\s*{re.escape(key)}\b",
+    rf"\bui\s*\?\.\s*params\s*\?\.\s*{re.escape(key)}\b",
+    rf"\bui\s*\.\s*params\s*\?\.\s*{re.escape(key)}\b",
+  ]
+  return any(re.search(p, effect_html) for p in patterns)
+
+
+def legacy_exposes_root(effect_html: str, root: str) -> bool:
+  patterns = [
+    rf"expose\(\s*['\"]{re.escape(root)}['\"]\s*,",
+    rf"(?:window\.)?JAZER_EXPOSE\?\.\(\s*['\"]{re.escape(root)}['\"]\s*,",
+  ]
+  return any(re.search(p, effect_html) for p in patterns)
+
+
+def legacy_lint(schema_path: Path, effects_dir: Path) -> int:
+  schema = load_json(schema_path)
+  html = read_text(effects_dir / f"{schema_path.name[: -len('.ui.json')]}.html")
+  misses = 0
+  for key in sorted(schema_param_keys(schema)):
+    misses += not legacy_reads_param(html, key)
+  for root in sorted(schema_effect_roots(schema)):
+    misses += not legacy_exposes_root(html, root)
+  for action in sorted(schema_action_names(schema)):
+    misses += not any(f"{p}{q}{action}{q}" in html for p in ("expose(", "JAZER_EXPOSE?.(") for q in "'\"")
+  return misses
+
+
+def main() -> int:
+  args = parse_args()
+  root = Path(__file__).resolve().parents[1]
+
+  with tempfile.TemporaryDirectory(prefix="jazer-lint-bench-") as tmp:
+    out = Path(tmp)
+    t0 = time.perf_counter()
+    paths = build_corpus(root, out, args.count, args.params)
+    print(f"Corpus: {len(paths)} schemas x {args.params} params ({time.perf_counter() - t0:.1f}s to build)")
+
+    sample = paths[: max(1, min(args.legacy_sample, len(paths)))]
+    t0 = time.perf_counter()
+    for p in sample:
+      legacy_lint(p, out)
+    legacy = (time.perf_counter() - t0) * len(paths) / len(sample)
+
+    t0 = time.perf_counter()
+    serial_issues = lint_paths(paths, out, jobs=1)
+    serial = time.perf_counter() - t0
+
+    jobs = args.jobs if args.jobs > 0 else (os.cpu_count() or 1)
+    t0 = time.perf_counter()
+    parallel_issues = lint_paths(paths, out, jobs=jobs)
+    parallel = time.perf_counter() - t0
+
+  assert serial_issues == parallel_issues, "parallel lint disagrees with serial lint"
+  note = "" if len(sample) == len(paths) else f" (extrapolated from {len(sample)})"
+  print(f"legacy per-key regex : {legacy:8.2f}s{note}")
+  print(f"index, jobs=1        : {serial:8.2f}s  ({legacy / serial:.1f}x)")
+  print(f"index, jobs={jobs:<9}: {parallel:8.2f}s  ({legacy / parallel:.1f}x)")
+  print(f"issues: {len(serial_issues)}")
+  return 0
+
+
+if __name__ == "__main__":
+  raise SystemExit(main())
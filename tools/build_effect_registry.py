@@ -0,0 +1,111 @@
+#!/usr/bin/env python3
+"""
+JaZeR Visual Effects Library — Generated Effect Registry
+
+Turns the `modules` section of docs/effects.manifest.json into
+lib/core/EffectRegistry.generated.js: one entry per effect class with its
+metadata and a lazy `() => import(...)` thunk, so EffectLoader only downloads
+and compiles the effect being switched to.
+
+generate_effect_manifest.py calls write_registry() after every manifest build,
+so the registry never drifts from the manifest. Run this script directly only
+to regenerate from an existing manifest:
+
+  python tools/build_effect_registry.py --manifest docs/effects.manifest.json
+"""
+
+
+from __future__ import annotations
+
+import argparse
+import json
+import os
+from pathlib import Path
+
+
+HEADER = """// EffectRegistry.generated.js
+// AUTO-GENERATED by tools/build_effect_registry.py from {source} — do not edit.
+// Each entry carries its metadata and a lazy import thunk; nothing is fetched
+// until EffectRegistry.resolve()/prefetch() (via EffectLoader) asks for it.
+// ============================================================================
+
+import {{ registry }} from './EffectRegistry.js';
+"""
+
+FOOTER = """
+/**
+ * Register every generated entry as a lazy effect
+ * @param {EffectRegistry} target - Registry to populate (defaults to the global one)
+ * @returns {EffectRegistry} The populated registry
+ */
+export function registerGeneratedEffects(target = registry) {
+  for (const entry of EFFECT_MODULES) {
+    target.registerLazy(entry.name, entry.load, entry);
+  }
+  return target;
+}
+
+export default EFFECT_MODULES;
+"""
+
+
+def js_string(s: str) -> str:
+    # JSON string literals are valid JS string literals.
+    return json.dumps(s, ensure_ascii=False)
+
+
+def import_specifier(module_path: Path, out_dir: Path) -> str:
+    rel = os.path.relpath(module_path, out_dir).replace("\\", "/")
+    return rel if rel.startswith(".") else f"./{rel}"
+
+
+def render_registry(root: Path, modules: list[dict], out_path: Path, source: str) -> str:
+    lines = [HEADER.format(source=source), "export const EFFECT_MODULES = ["]
+    entries = []
+    for m in sorted(modules, key=lambda x: (x.get("category", ""), x.get("name", ""))):
+        spec = import_specifier(root / m["path"], out_path.parent)
+        tags = ", ".join(js_string(t) for t in m.get("tags", []))
+        entries.append("\n".join([
+            "  {",
+            f"    name: {js_string(m['name'])},",
+            f"    category: {js_string(m.get('category', 'uncategorized'))},",
+            f"    description: {js_string(m.get('description', ''))},",
+            f"    tags: [{tags}],",
+            f"    path: {js_string(m['path'])},",
+            f"    load: () => import({js_string(spec)}).then((m) => m.{m['export']})",
+            "  }",
+        ]))
+    lines.append(",\n".join(entries))
+    lines.append("];")
+    return "\n".join(lines) + "\n" + FOOTER
+
+
+def write_registry(root: Path, modules: list[dict], out_path: Path, source: str) -> bool:
+    """Write the registry module; returns False when it was already up to date."""
+    text = render_registry(root, modules, out_path, source)
+    if out_path.exists() and out_path.read_text(encoding="utf-8") == text:
+        return False
+    out_path.parent.mkdir(parents=True, exist_ok=True)
+    out_path.write_text(text, encoding="utf-8", newline="\n")
+    return True
+
+
+def main() -> int:
+    ap = argparse.ArgumentParser(description="Generate the lazy EffectRegistry module from the effects manifest.")
+    ap.add_argument("--root", default=".", help="Repo root")
+    ap.add_argument("--manifest", default="docs/effects.manifest.json", help="Manifest JSON (relative to root)")
+    ap.add_argument("--out", default="lib/core/EffectRegistry.generated.js", help="Output module (relative to root)")
+    args = ap.parse_args()
+
+    root = Path(args.root).expanduser().resolve()
+    payload = json.loads((root / args.manifest).read_text(encoding="utf-8"))
+    modules = payload.get("modules", []) if isinstance(payload, dict) else []
+    out_path = root / args.out
+
+    changed = write_registry(root, modules, out_path, source=args.manifest.replace("\\", "/"))
+    print(f"{'Wrote' if changed else 'Up to date'}: {out_path} ({len(modules)} effect modules)")
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,184 @@
+#!/usr/bin/env python3
+"""
+JaZeR Visual Effects Library — Production Effects Build
+
+Writes a deployable copy of effects/ + lib/ to dist/ (including the non-page
+contents of effects/: ui-schema/ with the gallery's schema pack, and asset files)
+with each effect's normalized UI schema embedded in the page:
+
+  <script type="application/json" id="jazer-ui-schema">{...}</script>
+
+attachEffectUI() reads that block before falling back to `schemaUrl`, so the
+production page never fetches effects/ui-schema/<name>.ui.json. The source tree
+is untouched and keeps fetching schemas in dev.
+
+--strip-perf removes the JAZER_PERF frame-timing instrumentation
+(inject_perf_timing.py) from the copy, for release builds that should not
+sample frame times.
+
+The fetch being removed is serial: it only starts once the module graph has
+evaluated, and the controls/defaults (JAZER_UI_READY) wait for it. The report
+estimates the saving as one round trip plus transfer per effect; measure the
+real number in the browser with performance.getEntriesByName('jazer-ui:ready').
+
+After writing, every relative URL in the dist pages (src / href attributes, static
+imports, new URL(..., import.meta.url), fetch('...')) is resolved against dist/;
+unresolved ones are listed and the build exits with status 1.
+
+Usage:
+  python tools/build_effects_dist.py
+  python tools/build_effects_dist.py --out dist --rtt-ms 120 --bandwidth-mbps 5
+  python tools/build_effects_dist.py --strip-perf
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import re
+import shutil
+from pathlib import Path
+
+from effect_facts import load_facts, restore_newlines
+from inject_perf_timing import strip_text
+from normalize_ui_schemas import normalize_schema
+
+
+INLINE_ID = "jazer-ui-schema"
+INLINE_RE = re.compile(
+    r'[ \t]*<script type="application/json" id="' + INLINE_ID + r'">.*?</script>\n?',
+    re.DOTALL,
+)
+MODULE_SCRIPT_RE = re.compile(r'^([ \t]*)<script\b[^>]*type="module"', re.MULTILINE)
+URL_RES = (
+    re.compile(r'\b(?:src|href)\s*=\s*["\']([^"\'<>]+)["\']', re.IGNORECASE),
+    re.compile(r'\bnew\s+URL\(\s*["\']([^"\']+)["\']\s*,\s*import\.meta\.url'),
+    re.compile(r'\bfetch\(\s*["\']([^"\']+)["\']'),
+)
+# Module specifiers are only URLs when they start with ./ ../ or / (others go through the import map).
+IMPORT_RES = (
+    re.compile(r'\bimport\s*(?:[\w*{}\s,$]+?\s*from\s*)?["\'](\.{1,2}/[^"\']*)["\']'),
+    re.compile(r'\bimport\(\s*["\'](\.{1,2}/[^"\']*)["\']\s*\)'),
+)
+EXTERNAL_URL_RE = re.compile(r"^(?:[a-z][a-z0-9+.-]*:|//|#)", re.IGNORECASE)
+
+
+def inline_json(schema: dict) -> str:
+    # "<" only occurs inside JSON strings, where < is equivalent; this keeps
+    # "</script>" and "<!--" in labels from closing the block early.
+    return json.dumps(schema, ensure_ascii=False, separators=(",", ":")).replace("<", "\\u003c")
+
+
+def embed_schema(html: str, schema: dict) -> str | None:
+    """Insert (or replace) the inline schema block before the first module script."""
+    html = INLINE_RE.sub("", html)
+    m = MODULE_SCRIPT_RE.search(html)
+    if m is None:
+        return None
+    block = f'{m.group(1)}<script type="application/json" id="{INLINE_ID}">{inline_json(schema)}</script>\n'
+    return html[: m.start()] + block + html[m.start():]
+
+
+def is_page(path: Path) -> bool:
+    """effects/*.html, plus extensionless copies of pages (e.g. jazer-radiant-4d-jello)."""
+    if path.suffix.lower() == ".html":
+        return True
+    if path.suffix or not path.is_file():
+        return False
+    with path.open("rb") as f:
+        return f.read(64).lstrip().lower().startswith(b"<!doctype html")
+
+
+def unresolved_urls(out: Path, pages: list[Path]) -> list[tuple[str, str]]:
+    """(page, url) for relative URLs in dist pages that do not resolve to a file in dist/."""
+    missing: list[tuple[str, str]] = []
+    for page in pages:
+        text = page.read_text(encoding="utf-8", errors="replace")
+        urls = {m.group(1).strip() for rx in URL_RES + IMPORT_RES for m in rx.finditer(text)}
+        for url in sorted(urls):
+            if not url or EXTERNAL_URL_RE.match(url) or "${" in url or url.startswith("/"):
+                continue
+            target = (page.parent / url.split("#", 1)[0].split("?", 1)[0]).resolve()
+            if out not in target.parents or not target.exists():
+                missing.append((page.relative_to(out).as_posix(), url))
+    return missing
+
+
+def main() -> int:
+    ap = argparse.ArgumentParser(description="Build a production copy of the effects with UI schemas inlined.")
+    ap.add_argument("--root", default=".", help="Repo root")
+    ap.add_argument("--out", default="dist", help="Output directory (relative to root)")
+    ap.add_argument("--clean", action="store_true", help="Delete the output directory first")
+    ap.add_argument("--strip-perf", action="store_true", help="Remove JAZER_PERF frame-timing instrumentation (release build)")
+    ap.add_argument("--rtt-ms", type=float, default=80.0, help="Round-trip time used for the time-to-ready estimate")
+    ap.add_argument("--bandwidth-mbps", type=float, default=10.0, help="Bandwidth used for the time-to-ready estimate")
+    args = ap.parse_args()
+
+    root = Path(args.root).expanduser().resolve()
+    effects_dir = root / "effects"
+    schema_dir = effects_dir / "ui-schema"
+    out = (root / args.out).resolve()
+    if out == root or root not in out.parents:
+        raise SystemExit(f"Refusing to build into {out} (must be a subdirectory of the repo root)")
+
+    if args.clean and out.exists():
+        shutil.rmtree(out)
+    (out / "effects").mkdir(parents=True, exist_ok=True)
+    shutil.copytree(root / "lib", out / "lib", dirs_exist_ok=True)
+    # Everything in effects/ that is not rewritten below: ui-schema/ (the gallery loads
+    # schemas.pack.json from it), asset directories and files.
+    shutil.copytree(
+        effects_dir, out / "effects", dirs_exist_ok=True,
+        ignore=lambda d, names: [n for n in names if Path(d) == effects_dir and n.endswith(".html")],
+    )
+
+    inlined: list[tuple[str, int]] = []
+    fetching: list[str] = []
+    stripped = stripped_calls = 0
+    for path in sorted(effects_dir.glob("*.html")):
+        facts = load_facts(path.stem, effects_dir, schema_dir)
+        html = facts.html
+        if "attachEffectUI(" in html and facts.schema is not None:
+            schema = normalize_schema(facts.schema)
+            embedded = embed_schema(html, schema)
+            if embedded is not None:
+                html = embedded
+                inlined.append((path.stem, len(inline_json(schema).encode("utf-8"))))
+            else:
+                fetching.append(path.stem)
+        elif "attachEffectUI(" in html:
+            fetching.append(path.stem)
+        if args.strip_perf:
+            html, n, changed = strip_text(html)
+            stripped += changed
+            stripped_calls += n
+        (out / "effects" / path.name).write_text(restore_newlines(facts.html_raw, html), encoding="utf-8", newline="")
+
+    saved_ms = [args.rtt_ms + size * 8 / (args.bandwidth_mbps * 1000) for _, size in inlined]
+    total_bytes = sum(size for _, size in inlined)
+    print(f"Wrote: {out}")
+    print(f"Inlined UI schemas: {len(inlined)} effect(s), {total_bytes / 1024:.1f} KiB embedded")
+    print(f"Requests saved: {len(inlined)} (one schema fetch per effect load)")
+    if saved_ms:
+        print(
+            f"Estimated time-to-ready saving per effect (RTT {args.rtt_ms:g} ms, {args.bandwidth_mbps:g} Mbps): "
+            f"avg {sum(saved_ms) / len(saved_ms):.1f} ms, max {max(saved_ms):.1f} ms"
+        )
+    if args.strip_perf:
+        print(f"Stripped frame-timing instrumentation: {stripped} page(s), {stripped_calls} rAF call(s) unwrapped")
+    if fetching:
+        print(f"Still fetching (no schema or no module script): {', '.join(fetching)}")
+
+    pages = [p for p in sorted((out / "effects").iterdir()) if is_page(p)]
+    missing = unresolved_urls(out, pages)
+    if missing:
+        print(f"Unresolved relative URLs in dist pages: {len(missing)}")
+        for page, url in missing:
+            print(f"  {page}: {url}")
+        return 1
+    print(f"Relative URLs checked: {len(pages)} page(s), all resolve")
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -133,13 +133,20 @@ HTML_TEMPLATE = """<!doctype html>
     }}
     .item {{
       display: grid;
-      grid-template-columns: 1fr auto;
+      grid-template-columns: 56px 1fr auto;
       gap: 10px;
       padding: 12px 14px;
       border-bottom: 1px solid rgba(140,160,240,0.14);
       cursor: pointer;
     }}
     .item:hover {{ background: rgba(255,255,255,0.03); }}
+    .item .swatch {{
+      width: 56px;
+      height: 36px;
+      border-radius: 8px;
+      border: 1px solid rgba(140,160,240,0.18);
+      background-color: #05030a;
+    }}
     .item .name {{ font-size: 13px; }}
     .item .meta {{ font-size: 11px; color: var(--muted); margin-top: 4px; }}
     .item .badge {{
@@ -166,6 +173,7 @@ HTML_TEMPLATE = """<!doctype html>
       display: grid;
       grid-template-rows: auto 1fr;
       min-height: 0;
+      position: relative;
     }}
     .topbar {{
       padding: 12px 14px;
@@ -180,6 +188,13 @@ HTML_TEMPLATE = """<!doctype html>
       font-size: 12px;
       color: var(--muted);
     }}
+    .similar {{
+      display: flex;
+      flex-wrap: wrap;
+      gap: 6px;
+      margin-top: 8px;
+    }}
+    .similar .chip {{ padding: 4px 8px; font-size: 11px; }}
     .actions {{
       display: flex;
       gap: 8px;
@@ -206,6 +221,18 @@ HTML_TEMPLATE = """<!doctype html>
       border: 0;
       background: #000;
     }}
+    .idle {{
+      position: absolute;
+      inset: 58px 0 0 0;
+      display: none;
+      align-items: center;
+      justify-content: center;
+      font-size: 12px;
+      color: var(--muted);
+      background: rgba(0,0,0,0.72);
+      cursor: pointer;
+    }}
+    .idle[data-on="1"] {{ display: flex; }}
     @media (max-width: 980px) {{
       body {{ overflow: auto; }}
       .app {{ grid-template-columns: 1fr; height: auto; }}
@@ -231,6 +258,7 @@ HTML_TEMPLATE = """<!doctype html>
             <option value="all">Group: All</option>
             <option value="folder">Group: Folder</option>
             <option value="type">Group: Type (three/canvas)</option>
+            <option value="category">Group: Category</option>
           </select>
           <select id="sort">
             <option value="name">Sort: Name</option>
@@ -257,6 +285,7 @@ HTML_TEMPLATE = """<!doctype html>
         <div>
           <div style="font-size:13px" id="activeName">Select an effect</div>
           <div class="now" id="activePath">—</div>
+          <div class="similar" id="similar"></div>
         </div>
         <div class="actions">
           <button id="btn-random">Random</button>
@@ -266,6 +295,7 @@ HTML_TEMPLATE = """<!doctype html>
         </div>
       </div>
       <iframe id="frame" title="Effect preview"></iframe>
+      <div class="idle" id="idle" data-on="0">Preview unloaded while idle — click to resume</div>
     </section>
   </div>
 
@@ -273,6 +303,22 @@ HTML_TEMPLATE = """<!doctype html>
     // Embedded manifest (no fetch required)
     const MANIFEST = {manifest_json};
 
+    // Preview lifecycle (see lib/runtime/jazer-lifecycle.js for the effect side).
+    // URL params override the build defaults: ?idleThrottle=60&idleFps=10&idleUnload=600 (seconds, 0 = never)
+    const LIFECYCLE = (() => {{
+      const cfg = {lifecycle_json};
+      const qs = new URLSearchParams(location.search);
+      const num = (k, fallback) => {{
+        const v = Number(qs.get(k));
+        return qs.has(k) && Number.isFinite(v) && v >= 0 ? v : fallback;
+      }};
+      return {{
+        throttleMs: num("idleThrottle", cfg.idleThrottleSec) * 1000,
+        fps: num("idleFps", cfg.idleFps) || 10,
+        unloadMs: num("idleUnload", cfg.idleUnloadSec) * 1000
+      }};
+    }})();
+
     const LS_KEY = "jazer:indexapp:v1";
     const state = (() => {{
       try {{
@@ -305,6 +351,9 @@ HTML_TEMPLATE = """<!doctype html>
     const $frame = el("frame");
     const $activeName = el("activeName");
     const $activePath = el("activePath");
+    const $idle = el("idle");
+    const $similar = el("similar");
+    const BY_ID = new Map(MANIFEST.filter(x => x.id).map(x => [x.id, x]));
 
     const chipThree = el("chip-three");
     const chipCanvas = el("chip-canvas");
@@ -325,6 +374,7 @@ HTML_TEMPLATE = """<!doctype html>
     }}
 
     function classify(item) {{
+      if (item.type === "canvas" || item.type === "three") return item.type;
       const p = (item.path || item.file || "").toLowerCase();
       if (p.includes("/effects/")) {{
         if (p.includes("/effects/canvas/")) return "canvas";
@@ -342,6 +392,7 @@ HTML_TEMPLATE = """<!doctype html>
         return parts[0] || "root";
       }}
       if (state.group === "type") return classify(item);
+      if (state.group === "category") return item.category || "uncategorized";
       return "all";
     }}
 
@@ -358,7 +409,7 @@ HTML_TEMPLATE = """<!doctype html>
           if (!state.showCanvas && x._type === "canvas") return false;
           if (state.favOnly && !state.favs.has(x.path || x.file)) return false;
           if (!q) return true;
-          const hay = normalize((x.name || "") + " " + (x.path || x.file || ""));
+          const hay = normalize((x.name || "") + " " + (x.path || x.file || "") + " " + (x.category || ""));
           return hay.includes(q);
         }})
         .sort((a,b) => {{
@@ -403,6 +454,7 @@ HTML_TEMPLATE = """<!doctype html>
           const badge = it._type === "canvas" ? "Canvas" : "Three.js";
 
           row.innerHTML = `
+            <div class="swatch" style="background-image:${{it.preview || "none"}}"></div>
             <div>
               <div class="name">${{escapeHtml(it.name || key)}}</div>
               <div class="meta">${{escapeHtml(key)}}</div>
@@ -433,10 +485,110 @@ HTML_TEMPLATE = """<!doctype html>
 
       $activeName.textContent = it.name || url;
       $activePath.textContent = url;
+      preview.unloaded = false;
+      preview.state = "running";
+      $idle.dataset.on = "0";
       $frame.src = url;
       syncFavButton();
+      renderSimilar(it);
+    }}
+
+    // "More like this": neighbor ids are precomputed at build time (TF-IDF, see effect_similarity.py)
+    function renderSimilar(it) {{
+      $similar.innerHTML = "";
+      for (const id of it.similar || []) {{
+        const other = BY_ID.get(id);
+        if (!other) continue;
+        const chip = document.createElement("div");
+        chip.className = "chip";
+        chip.textContent = other.name || id;
+        chip.title = "More like this";
+        chip.addEventListener("click", () => selectEffect(other));
+        $similar.appendChild(chip);
+      }}
+    }}
+
+    // --- Preview lifecycle: pause when not visible, throttle when idle, unload after a timeout ---
+    const preview = {{
+      state: "running",       // what the iframe was last told: running | throttled | paused
+      unloaded: false,
+      frameVisible: true,
+      detached: false,        // effect opened in another tab; preview yields until focus returns
+      lastActivity: performance.now()
+    }};
+
+    function postLifecycle(action, extra = {{}}) {{
+      try {{
+        $frame.contentWindow?.postMessage({{ type: "jazer:lifecycle", action, ...extra }}, "*");
+      }} catch {{}}
+    }}
+
+    function desiredPreviewState() {{
+      if (document.hidden || !preview.frameVisible || preview.detached) return "paused";
+      const idleMs = performance.now() - preview.lastActivity;
+      if (LIFECYCLE.throttleMs > 0 && idleMs >= LIFECYCLE.throttleMs) return "throttled";
+      return "running";
     }}
 
+    function sendPreviewState(next) {{
+      preview.state = next;
+      if (next === "paused") postLifecycle("pause");
+      else if (next === "throttled") postLifecycle("throttle", {{ fps: LIFECYCLE.fps }});
+      else postLifecycle("resume");
+    }}
+
+    function syncPreview() {{
+      if (preview.unloaded || !state.active) return;
+      const idleMs = performance.now() - preview.lastActivity;
+      if (LIFECYCLE.unloadMs > 0 && idleMs >= LIFECYCLE.unloadMs) {{
+        unloadPreview();
+        return;
+      }}
+      const next = desiredPreviewState();
+      if (next !== preview.state) sendPreviewState(next);
+    }}
+
+    function unloadPreview() {{
+      preview.unloaded = true;
+      $frame.src = "about:blank";
+      $idle.dataset.on = "1";
+    }}
+
+    function restorePreview() {{
+      if (!preview.unloaded || !state.active) return;
+      const found = MANIFEST.find(x => (x.path||x.file) === state.active);
+      if (found) selectEffect(found);
+    }}
+
+    function markActivity() {{
+      preview.lastActivity = performance.now();
+      if (preview.unloaded) return;
+      syncPreview();
+    }}
+
+    for (const type of ["pointermove", "pointerdown", "keydown", "wheel", "touchstart"]) {{
+      window.addEventListener(type, markActivity, {{ passive: true }});
+    }}
+    window.addEventListener("message", (e) => {{
+      const msg = e.data;
+      if (!msg || msg.type !== "jazer:lifecycle" || e.source !== $frame.contentWindow) return;
+      if (msg.event === "ready") sendPreviewState(desiredPreviewState());
+      else if (msg.event === "activity") markActivity();
+    }});
+    document.addEventListener("visibilitychange", syncPreview);
+    window.addEventListener("focus", () => {{
+      preview.detached = false;
+      markActivity();
+    }});
+    if ("IntersectionObserver" in window) {{
+      new IntersectionObserver((entries) => {{
+        preview.frameVisible = entries.some(x => x.isIntersecting);
+        syncPreview();
+      }}).observe($frame);
+    }}
+    $idle.addEventListener("click", restorePreview);
+    setInterval(syncPreview, 1000);
+
     function syncChips() {{
       chipThree.dataset.on = state.showThree ? "1" : "0";
       chipCanvas.dataset.on = state.showCanvas ? "1" : "0";
@@ -498,10 +650,14 @@ HTML_TEMPLATE = """<!doctype html>
 
     el("btn-random").addEventListener("click", randomPick);
     el("btn-reload").addEventListener("click", () => {{
-      if ($frame.src) $frame.src = $frame.src;
+      if (preview.unloaded) restorePreview();
+      else if ($frame.src) $frame.src = $frame.src;
     }});
     el("btn-open").addEventListener("click", () => {{
-      if (state.active) window.open(state.active, "_blank");
+      if (!state.active) return;
+      window.open(state.active, "_blank");
+      preview.detached = true;
+      syncPreview();
     }});
     el("btn-fav").addEventListener("click", () => {{
       if (!state.active) return;
@@ -523,12 +679,44 @@ HTML_TEMPLATE = """<!doctype html>
 </html>
 """
 
+# Preview card fallback when an effect exposes no colors of its own.
+CATEGORY_COLORS = {
+    "sacred": ["#ffd86b", "#b37cff", "#00f5ff"],
+    "tunnel": ["#00f5ff", "#ff2aff", "#0c1230"],
+    "cosmic": ["#7b2cbf", "#4361ee", "#f72585"],
+    "cyberpunk": ["#ff0055", "#00ffff", "#ff00ff"],
+    "plasma": ["#f72585", "#7209b7", "#4cc9f0"],
+    "ocean": ["#0077be", "#00d4ff", "#89cff0"],
+    "ambient": ["#48cae4", "#90e0ef", "#1a1a2e"],
+    "particles": ["#a78bfa", "#f472b6", "#0f3460"],
+}
+DEFAULT_COLORS = ["#00f5ff", "#ff2aff", "#b37cff"]
+
+
+def is_hex_color(c: object) -> bool:
+    return isinstance(c, str) and len(c) == 7 and c.startswith("#") and all(ch in "0123456789abcdefABCDEF" for ch in c[1:])
+
+
+def preview_css(colors: list[str], category: str) -> str:
+    """CSS background-image for a static preview card (no iframe, no GPU)."""
+    cols = [c.lower() for c in colors if is_hex_color(c)] or CATEGORY_COLORS.get(category, DEFAULT_COLORS)
+    if len(cols) == 1:
+        cols = cols * 2
+    glow = f"radial-gradient(circle at 28% 30%, {cols[0]}cc 0, transparent 55%)"
+    rim = f"radial-gradient(circle at 78% 75%, {cols[-1]}99 0, transparent 50%)"
+    wash = f"linear-gradient(135deg, {', '.join(c + '66' for c in cols)})"
+    return f"{glow}, {rim}, {wash}"
+
+
 def main() -> int:
     ap = argparse.ArgumentParser(description="Build JaZeR index app HTML from manifest JSON.")
     ap.add_argument("--root", default=".", help="Repo root (where effects/ lives).")
     ap.add_argument("--manifest", default="effects.manifest.json", help="Manifest JSON file path (relative to root).")
     ap.add_argument("--out", default="docs/index.html", help="Output HTML path (relative to root).")
     ap.add_argument("--url-prefix", default="", help="String to prepend to effect paths (e.g. '../').")
+    ap.add_argument("--idle-throttle-sec", type=float, default=60, help="Idle seconds before the preview drops to --idle-fps (0 = never).")
+    ap.add_argument("--idle-fps", type=float, default=10, help="Preview frame rate while idle.")
+    ap.add_argument("--idle-unload-sec", type=float, default=600, help="Idle seconds before the preview iframe is unloaded (0 = never).")
     args = ap.parse_args()
 
     root = Path(args.root).expanduser().resolve()
@@ -565,13 +753,30 @@ def main() -> int:
         # ensure web-ish slashes and prepend relative prefix
         p = str(p).replace("\\", "/")
         full_path = f"{rel_to_root}{p}"
-        normalized.append({"name": name, "path": full_path})
+        categories = it.get("categories") or []
+        category = it.get("category") or (categories[0] if categories else "")
+        colors = it.get("colors") or []
+        normalized.append({
+            "id": it.get("id") or "",
+            "name": name,
+            "path": full_path,
+            "type": it.get("type") or "",
+            "category": category,
+            "colors": colors,
+            "preview": preview_css(colors, category),
+            "similar": [n["id"] for n in it.get("similar") or [] if isinstance(n, dict) and n.get("id")],
+        })
 
     out_path.parent.mkdir(parents=True, exist_ok=True)
 
     html = HTML_TEMPLATE.format(
         build_stamp=datetime.now().strftime("%Y-%m-%d %H:%M"),
-        manifest_json=json.dumps(normalized, ensure_ascii=False)
+        manifest_json=json.dumps(normalized, ensure_ascii=False),
+        lifecycle_json=json.dumps({
+            "idleThrottleSec": max(0.0, args.idle_throttle_sec),
+            "idleFps": max(1.0, args.idle_fps),
+            "idleUnloadSec": max(0.0, args.idle_unload_sec),
+        })
     )
     out_path.write_text(html, encoding="utf-8")
     print(f"Wrote: {out_path}")
@@ -0,0 +1,202 @@
+#!/usr/bin/env python3
+"""
+JaZeR Visual Effects Library — UI Schema Pack
+
+Compiles every effects/ui-schema/*.ui.json (normalized) into one compact,
+content-hashed pack so pages that switch between effects (the gallery) load
+all schemas with a single cacheable request:
+
+  effects/ui-schema/schemas.pack.<hash>.json   immutable, cache forever
+  effects/ui-schema/schemas.pack.json          tiny pointer: {"pack": "...", "hash": ...}
+
+The hotkey/control blocks repeat across almost every schema, so the pack
+deduplicates them:
+- nodes:   an object/array that occurs more than once is stored once in `nodes`
+           and referenced as "#<index>"
+- strings: a string of 4+ chars that occurs more than once is stored once in
+           `strings` and referenced as "@<index>" (strings that would look like a
+           reference are always interned, so literals are never ambiguous)
+
+jazer-effect-ui-schema.js (loadSchemaPack / attachEffectUI({ schemaPack }))
+decodes it. Object keys stay literal; gzip handles those well.
+
+Usage:
+  python tools/build_schema_pack.py
+  python tools/build_schema_pack.py --check   # exit 1 if the pack is stale
+"""
+
+from __future__ import annotations
+
+import argparse
+import hashlib
+import json
+from collections import Counter
+from pathlib import Path
+
+from effect_facts import load_facts
+from normalize_ui_schemas import normalize_schema
+
+
+PACK_FORMAT = "jazer-schema-pack"
+PACK_VERSION = 1
+POINTER_NAME = "schemas.pack.json"
+PACK_GLOB = "schemas.pack.*.json"
+MIN_INTERN_LEN = 4
+
+
+def canonical(v: object) -> str:
+    return json.dumps(v, ensure_ascii=False, sort_keys=True, separators=(",", ":"))
+
+
+def is_ref_like(s: str) -> bool:
+    return s[:1] in ("#", "@")
+
+
+class PackEncoder:
+    """Two passes: count repeats, then emit with shared nodes/strings."""
+
+    def __init__(self) -> None:
+        self.node_counts: Counter[str] = Counter()
+        self.string_counts: Counter[str] = Counter()
+        self.nodes: list[object] = []
+        self.node_index: dict[str, int] = {}
+        self.strings: list[str] = []
+        self.string_index: dict[str, int] = {}
+
+    def count(self, v: object) -> None:
+        if isinstance(v, dict):
+            self.node_counts[canonical(v)] += 1
+            for x in v.values():
+                self.count(x)
+        elif isinstance(v, list):
+            self.node_counts[canonical(v)] += 1
+            for x in v:
+                self.count(x)
+        elif isinstance(v, str):
+            self.string_counts[v] += 1
+
+    def _string(self, s: str) -> str:
+        if not is_ref_like(s) and (len(s) < MIN_INTERN_LEN or self.string_counts[s] < 2):
+            return s
+        idx = self.string_index.get(s)
+        if idx is None:
+            idx = self.string_index[s] = len(self.strings)
+            self.strings.append(s)
+        return f"@{idx}"
+
+    def encode(self, v: object, top: bool = False) -> object:
+        if isinstance(v, str):
+            return self._string(v)
+        if not isinstance(v, (dict, list)):
+            return v
+
+        key = canonical(v)
+        if not top and self.node_counts[key] >= 2:
+            idx = self.node_index.get(key)
+            if idx is None:
+                # Children are stored before their parent, so nodes only reference lower indices.
+                body = self._encode_body(v)
+                idx = self.node_index[key] = len(self.nodes)
+                self.nodes.append(body)
+            return f"#{idx}"
+        return self._encode_body(v)
+
+    def _encode_body(self, v: dict | list) -> object:
+        if isinstance(v, dict):
+            return {k: self.encode(x) for k, x in v.items()}
+        return [self.encode(x) for x in v]
+
+
+def build_pack(schemas: dict[str, dict]) -> dict:
+    enc = PackEncoder()
+    for schema in schemas.values():
+        enc.count(schema)
+    encoded = {name: enc.encode(schema, top=True) for name, schema in sorted(schemas.items())}
+    return {
+        "format": PACK_FORMAT,
+        "version": PACK_VERSION,
+        "strings": enc.strings,
+        "nodes": enc.nodes,
+        "schemas": encoded,
+    }
+
+
+def decode_pack(pack: dict) -> dict[str, object]:
+    """Reference decoder (mirrors decodeSchemaPack in jazer-effect-ui-schema.js)."""
+    strings, nodes = pack["strings"], pack["nodes"]
+
+    def dec(v: object) -> object:
+        if isinstance(v, str):
+            if v.startswith("#"):
+                return dec(nodes[int(v[1:])])
+            if v.startswith("@"):
+                return strings[int(v[1:])]
+            return v
+        if isinstance(v, dict):
+            return {k: dec(x) for k, x in v.items()}
+        if isinstance(v, list):
+            return [dec(x) for x in v]
+        return v
+
+    return {name: dec(v) for name, v in pack["schemas"].items()}
+
+
+def load_schemas(schema_dir: Path) -> dict[str, dict]:
+    effects_dir = schema_dir.parent
+    out: dict[str, dict] = {}
+    for path in sorted(schema_dir.glob("*.ui.json")):
+        name = path.name[: -len(".ui.json")]
+        facts = load_facts(name, effects_dir, schema_dir)
+        if facts.schema is None:
+            print(f"Skipping {path.name}: {facts.schema_error}")
+            continue
+        out[name] = normalize_schema(facts.schema)
+    return out
+
+
+def main() -> int:
+    ap = argparse.ArgumentParser(description="Compile effects/ui-schema/*.ui.json into one content-hashed schema pack.")
+    ap.add_argument("--root", default=".", help="Repo root")
+    ap.add_argument("--schema-dir", default="effects/ui-schema", help="Schema directory (relative to root)")
+    ap.add_argument("--check", action="store_true", help="Do not write; exit 1 if the pack is missing or stale")
+    args = ap.parse_args()
+
+    root = Path(args.root).expanduser().resolve()
+    schema_dir = root / args.schema_dir
+    schemas = load_schemas(schema_dir)
+    pack = build_pack(schemas)
+    if decode_pack(pack) != schemas:
+        raise SystemExit("Schema pack round-trip mismatch (encoder bug)")
+
+    text = json.dumps(pack, ensure_ascii=False, separators=(",", ":"))
+    data = text.encode("utf-8")
+    digest = hashlib.sha256(data).hexdigest()[:12]
+    pack_name = f"schemas.pack.{digest}.json"
+    pointer = {"pack": pack_name, "hash": digest, "count": len(schemas), "bytes": len(data)}
+    pointer_text = json.dumps(pointer, indent=2) + "\n"
+
+    pointer_path = schema_dir / POINTER_NAME
+    pack_path = schema_dir / pack_name
+    current = pointer_path.exists() and pointer_path.read_text(encoding="utf-8") == pointer_text and pack_path.exists()
+    if args.check:
+        print(f"{'Up to date' if current else 'Stale'}: {pointer_path}")
+        return 0 if current else 1
+
+    if not current:
+        pack_path.write_bytes(data)
+        pointer_path.write_text(pointer_text, encoding="utf-8", newline="\n")
+    for old in schema_dir.glob(PACK_GLOB):
+        if old.name not in (pack_name, POINTER_NAME):
+            old.unlink()
+
+    source_bytes = sum(len((schema_dir / f"{n}.ui.json").read_bytes()) for n in schemas)
+    print(f"{'Wrote' if not current else 'Up to date'}: {pack_path.relative_to(root).as_posix()}")
+    print(
+        f"{len(schemas)} schemas: {source_bytes / 1024:.1f} KiB in {len(schemas)} files -> {len(data) / 1024:.1f} KiB in 1 "
+        f"({len(pack['nodes'])} shared nodes, {len(pack['strings'])} shared strings)"
+    )
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -6,7 +6,8 @@ This script orchestrates the generation of all documentation and index files.
 It ensures that:
 1. The project tree is scanned and saved to docs/tree.txt
 2. The effect manifest is generated in docs/effects.manifest.json
-3. The visual index application is built to docs/index.html
+3. The UI schema pack is compiled for the gallery
+4. The visual index application is built to docs/index.html
 
 Usage:
   python tools/build_site.py
@@ -54,6 +55,12 @@ def main():
         "Generating Effect Manifest (docs/effects.manifest.json)"
     )
 
+    # 2b. Compile the UI schema pack used by effects/gallery.html
+    run_command(
+        f'{sys.executable} tools/build_schema_pack.py --root .',
+        "Compiling UI Schema Pack (effects/ui-schema/schemas.pack.json)"
+    )
+
     # Cleanup old docs/index.html if it exists to avoid confusion
     old_index = docs_dir / "index.html"
     if old_index.exists():
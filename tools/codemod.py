@@ -0,0 +1,320 @@
+"""
+Codemod runner for effects/*.html.
+
+Registered rules (see RULES / `--list`) are applied in ONE pass per file:
+each file is read once, every selected rule rewrites the text in order, and the
+result is written once. Rules are plain `text -> (text, edits)` functions that
+see LF-only text; the runner restores each file's CRLF/LF style and trailing
+newline on write.
+
+Runs are transactional:
+1. transform every file across a process pool (no writes)
+2. journal the run under .cache/codemod/<run-id>/ (original bytes + hashes)
+3. replace files atomically (temp file in the same dir + os.replace), skipping
+   any file that changed on disk since it was read
+4. `--undo` restores a run from its journal (files edited since are left alone)
+
+Usage:
+  python tools/codemod.py --list
+  python tools/codemod.py --rules time-scale,inject-ui --dry-run
+  python tools/codemod.py --rules time-scale --only jazer-neon-ocean
+  python tools/codemod.py --undo latest
+"""
+
+from __future__ import annotations
+
+import argparse
+import difflib
+import hashlib
+import json
+import os
+import shutil
+import tempfile
+import time
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Callable
+
+from effect_facts import restore_newlines
+
+
+@dataclass(frozen=True)
+class Rule:
+  name: str
+  description: str
+  apply: Callable[[str], tuple[str, int]]  # LF text -> (new text, edit count)
+
+
+RULES: dict[str, Rule] = {}
+
+
+def rule(name: str, description: str) -> Callable[[Callable[[str], tuple[str, int]]], Callable[[str], tuple[str, int]]]:
+  def register(fn: Callable[[str], tuple[str, int]]) -> Callable[[str], tuple[str, int]]:
+    RULES[name] = Rule(name, description, fn)
+    return fn
+  return register
+
+
+# --- built-in rules -----------------------------------------------------------
+# Thin adapters over the standalone scripts, which remain usable on their own.
+
+@rule("time-scale", "Scale fixed 1/60 time steps by JAZER_UI.params.timeScale (patch_effects_time_scale.py)")
+def _rule_time_scale(text: str) -> tuple[str, int]:
+  from patch_effects_time_scale import patch_text
+  return patch_text(text)
+
+
+@rule("inject-ui", "Inject the attachEffectUI schema loader (inject_effect_ui_schema.py)")
+def _rule_inject_ui(text: str) -> tuple[str, int]:
+  from inject_effect_ui_schema import inject_into_html
+  updated = inject_into_html(text)
+  return (text, 0) if updated is None else (updated, 1)
+
+
+@rule("hoist-allocations", "Reuse scratch THREE objects instead of allocating in rAF callbacks (hoist_frame_allocations.py)")
+def _rule_hoist_allocations(text: str) -> tuple[str, int]:
+  from hoist_frame_allocations import hoist_text
+  text, report = hoist_text(text)
+  return text, len(report.hoisted)
+
+
+@rule("perf-timing", "Wrap rAF callbacks with JAZER_PERF frame-time sampling (inject_perf_timing.py)")
+def _rule_perf_timing(text: str) -> tuple[str, int]:
+  from inject_perf_timing import inject_text
+  return inject_text(text)
+
+
+@rule("strip-perf-timing", "Remove JAZER_PERF frame-time sampling for release builds (inject_perf_timing.py)")
+def _rule_strip_perf_timing(text: str) -> tuple[str, int]:
+  from inject_perf_timing import strip_text
+  text, n, _ = strip_text(text)
+  return text, n
+
+
+# --- runner -------------------------------------------------------------------
+
+@dataclass
+class FileResult:
+  path: Path
+  before_sha: str
+  edits: dict[str, int] = field(default_factory=dict)
+  data: bytes | None = None   # new file bytes when changed
+  diff: str = ""
+  error: str | None = None
+
+  @property
+  def changed(self) -> bool:
+    return self.data is not None
+
+
+def sha256(data: bytes) -> str:
+  return hashlib.sha256(data).hexdigest()
+
+
+def split_text(raw: bytes) -> str:
+  text = raw.decode("utf-8", errors="replace").replace("\r\n", "\n")
+  return text[:-1] if text.endswith("\n") else text
+
+
+def transform_file(path: Path, rule_names: tuple[str, ...], root: Path) -> FileResult:
+  raw = path.read_bytes()
+  result = FileResult(path, sha256(raw))
+  try:
+    before = split_text(raw)
+    text = before
+    for name in rule_names:
+      text, n = RULES[name].apply(text)
+      if n:
+        result.edits[name] = n
+    if text != before:
+      result.data = restore_newlines(raw, text).encode("utf-8")
+      rel = path.relative_to(root).as_posix()
+      result.diff = "".join(difflib.unified_diff(
+        (before + "\n").splitlines(keepends=True),
+        (text + "\n").splitlines(keepends=True),
+        fromfile=f"a/{rel}",
+        tofile=f"b/{rel}",
+      ))
+  except Exception as e:
+    result.error = f"{type(e).__name__}: {e}"
+    result.data = None
+  return result
+
+
+def transform_all(paths: list[Path], rule_names: tuple[str, ...], root: Path, jobs: int) -> list[FileResult]:
+  jobs = jobs if jobs > 0 else (os.cpu_count() or 1)
+  if jobs == 1 or len(paths) < 2:
+    return [transform_file(p, rule_names, root) for p in paths]
+  with ProcessPoolExecutor(max_workers=min(jobs, len(paths))) as pool:
+    return list(pool.map(transform_file, paths, [rule_names] * len(paths), [root] * len(paths)))
+
+
+def atomic_write(path: Path, data: bytes) -> None:
+  fd, tmp = tempfile.mkstemp(dir=path.parent, prefix=f".{path.name}.", suffix=".tmp")
+  try:
+    with os.fdopen(fd, "wb") as f:
+      f.write(data)
+      f.flush()
+      os.fsync(f.fileno())
+    if path.exists():
+      shutil.copymode(path, tmp)
+    os.replace(tmp, path)
+  except BaseException:
+    Path(tmp).unlink(missing_ok=True)
+    raise
+
+
+def write_journal(journal_dir: Path, entries: list[dict], meta: dict) -> None:
+  atomic_write(journal_dir / "journal.json", json.dumps({**meta, "files": entries}, indent=2).encode("utf-8"))
+
+
+def apply_results(results: list[FileResult], root: Path, journal_root: Path, rule_names: tuple[str, ...]) -> tuple[Path, int, list[str]]:
+  run_id = time.strftime("%Y%m%d-%H%M%S") + f"-{os.getpid()}"
+  journal_dir = journal_root / run_id
+  (journal_dir / "orig").mkdir(parents=True)
+
+  changed = [r for r in results if r.changed]
+  entries: list[dict] = []
+  for n, r in enumerate(changed):
+    backup = journal_dir / "orig" / f"{n:05d}-{r.path.name}"
+    shutil.copy2(r.path, backup)
+    entries.append({
+      "path": r.path.relative_to(root).as_posix(),
+      "backup": backup.relative_to(journal_dir).as_posix(),
+      "before_sha256": r.before_sha,
+      "after_sha256": sha256(r.data),
+      "edits": r.edits,
+      "applied": False,
+    })
+  meta = {"run_id": run_id, "created": time.strftime("%Y-%m-%dT%H:%M:%S"), "rules": list(rule_names), "status": "pending"}
+  write_journal(journal_dir, entries, meta)
+
+  conflicts: list[str] = []
+  applied = 0
+  for r, entry in zip(changed, entries):
+    if sha256(r.path.read_bytes()) != r.before_sha:
+      conflicts.append(entry["path"])
+      continue
+    atomic_write(r.path, r.data)
+    entry["applied"] = True
+    applied += 1
+
+  meta["status"] = "complete"
+  write_journal(journal_dir, entries, meta)
+  return journal_dir, applied, conflicts
+
+
+def undo(journal_root: Path, root: Path, run: str) -> int:
+  runs = sorted(p for p in journal_root.glob("*") if (p / "journal.json").exists()) if journal_root.exists() else []
+  if not runs:
+    print(f"No codemod journals in {journal_root}")
+    return 2
+  journal_dir = runs[-1] if run == "latest" else journal_root / run
+  journal_path = journal_dir / "journal.json"
+  if not journal_path.exists():
+    print(f"No journal: {journal_path}")
+    return 2
+
+  journal = json.loads(journal_path.read_text(encoding="utf-8"))
+  restored = skipped = 0
+  for entry in journal["files"]:
+    path = root / entry["path"]
+    current = sha256(path.read_bytes()) if path.exists() else None
+    if current == entry["before_sha256"]:
+      continue  # never applied (or already undone)
+    if current != entry["after_sha256"]:
+      print(f"[SKIP] {entry['path']}: modified since run {journal['run_id']}")
+      skipped += 1
+      continue
+    atomic_write(path, (journal_dir / entry["backup"]).read_bytes())
+    restored += 1
+
+  journal["status"] = "undone"
+  write_journal(journal_dir, journal["files"], {k: v for k, v in journal.items() if k != "files"})
+  print(f"Undo {journal['run_id']}: restored {restored} file(s), skipped {skipped}.")
+  return 1 if skipped else 0
+
+
+def parse_args() -> argparse.Namespace:
+  p = argparse.ArgumentParser(description="Apply registered codemod rules to effects/*.html in one transactional pass")
+  p.add_argument("--rules", default="", help="Comma-separated rule names, applied in this order (see --list)")
+  p.add_argument("--list", action="store_true", help="List registered rules")
+  p.add_argument("--only", action="append", default=[], help="Only target effect stems; can repeat")
+  p.add_argument("--dry-run", action="store_true", help="Print a unified diff instead of writing")
+  p.add_argument("--quiet", action="store_true", help="With --dry-run: summary only, no diff")
+  p.add_argument("--jobs", type=int, default=0, help="Worker processes (0 = CPU count, 1 = in-process)")
+  p.add_argument("--journal-dir", default=".cache/codemod", help="Undo journal location (relative to repo root)")
+  p.add_argument("--undo", metavar="RUN_ID", help="Restore a previous run ('latest' for the most recent)")
+  return p.parse_args()
+
+
+def normalize_only(values: list[str]) -> set[str]:
+  out: set[str] = set()
+  for v in values:
+    v = v.strip()
+    if not v:
+      continue
+    if v.lower().endswith(".html"):
+      v = v[:-5]
+    out.add(v)
+  return out
+
+
+def main() -> int:
+  args = parse_args()
+  root = Path(__file__).resolve().parents[1]
+  journal_root = root / args.journal_dir
+
+  if args.list:
+    for r in RULES.values():
+      print(f"{r.name:<20} {r.description}")
+    return 0
+  if args.undo:
+    return undo(journal_root, root, args.undo)
+
+  rule_names = tuple(n.strip() for n in args.rules.split(",") if n.strip())
+  unknown = [n for n in rule_names if n not in RULES]
+  if not rule_names or unknown:
+    print(f"Unknown or missing rule(s): {', '.join(unknown) or '(none given)'}; available: {', '.join(RULES)}")
+    return 2
+
+  only = normalize_only(args.only)
+  paths = sorted(p for p in (root / "effects").glob("*.html") if p.name.lower() != "gallery.html")
+  if only:
+    paths = [p for p in paths if p.stem in only]
+
+  results = transform_all(paths, rule_names, root, args.jobs)
+  for r in results:
+    if r.error:
+      print(f"[FAIL] {r.path.name}: {r.error}")
+
+  changed = [r for r in results if r.changed]
+  totals: dict[str, int] = {}
+  for r in changed:
+    for name, n in r.edits.items():
+      totals[name] = totals.get(name, 0) + n
+  summary = ", ".join(f"{name}={totals.get(name, 0)}" for name in rule_names)
+
+  if args.dry_run:
+    for r in changed:
+      if not args.quiet:
+        print(r.diff, end="")
+      print(f"[DRY] {r.path.name}: {', '.join(f'{k}={v}' for k, v in r.edits.items())}")
+    print(f"Dry-run: would update {len(changed)} file(s) ({summary}).")
+    return 1 if any(r.error for r in results) else 0
+
+  if not changed:
+    print(f"Nothing to change ({len(results)} file(s) checked).")
+    return 1 if any(r.error for r in results) else 0
+
+  journal_dir, applied, conflicts = apply_results(results, root, journal_root, rule_names)
+  for c in conflicts:
+    print(f"[SKIP] {c}: changed on disk during the run")
+  print(f"Updated {applied} file(s) ({summary}).")
+  print(f"Undo with: python tools/codemod.py --undo {journal_dir.name}")
+  return 1 if conflicts or any(r.error for r in results) else 0
+
+
+if __name__ == "__main__":
+  raise SystemExit(main())
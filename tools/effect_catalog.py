@@ -0,0 +1,694 @@
+#!/usr/bin/env python3
+"""
+JaZeR Visual Effects Library — Effect Catalog (SQLite)
+
+Indexes docs/effects.manifest.json into one SQLite file so that questions like "all
+high-tier postfx tunnel effects modified this week" are an indexed lookup instead of
+a re-parse of the manifest.
+
+  sync      create or incrementally update the catalog from the manifest
+  query     faceted search (type, tier, feature, tag, category, full text, modified since)
+  serve     threaded local HTTP service over the same queries, for kiosks and the gallery
+
+Layout:
+- effects: one row per manifest record (the record itself is kept as JSON) plus a
+  content hash; indexes on (gpu_tier, type), type and modified_utc
+- tags / features / categories: normalized names, with effect_tags / effect_features /
+  effect_categories link tables indexed both ways
+- effects_fts: FTS5 over titles and identifiers extracted from the effect source
+  (THREE classes, functions, classes, uniforms; camelCase split into words)
+
+Updates are incremental: only records whose hash changed are rewritten, and ids that
+left the manifest are deleted. generate_effect_manifest.py --catalog calls sync()
+after every scan. Every added / updated / removed record is also appended to a
+`changes` log whose last row number is the catalog version. Versions restart when the
+file is rebuilt, so each catalog file also gets a random epoch (meta 'epoch') when it is
+created, and clients see versions as "<epoch>.<N>".
+
+HTTP service (serve):
+  GET /effects?type=&tier=&feature=&tag=&category=&q=&since=&sort=&limit=&offset=&facets=1
+                          one page of records plus total and next_offset (limit <= 500)
+  GET /effects/<id>       one record
+  GET /facets?...         facet counts for the same filters
+  GET /changes?since=EPOCH.N&wait=S
+                          latest change per effect after version N; blocks up to S seconds
+                          (max 60) until there is one. "reset": true means the epoch differs
+                          (the catalog was rebuilt) and the client should refetch /effects
+  GET /health
+Listings carry ETag = "<epoch>.<N>" + request hash, so If-None-Match revalidation
+is answered with 304 without a query; bodies over 1 KB are gzipped when accepted.
+The manifest is re-synced when its mtime changes (--watch), which wakes long-polls.
+
+Usage:
+  python tools/effect_catalog.py sync
+  python tools/effect_catalog.py query --tier high --feature postfx --category tunnel --since 7d
+  python tools/effect_catalog.py query --text "bloom galaxy" --facets
+  python tools/effect_catalog.py query --type canvas --json --limit 10 --offset 10
+  python tools/effect_catalog.py serve --port 8766
+  curl "http://127.0.0.1:8766/effects?tier=high&tier=med&q=tunnel&limit=20"
+  curl "http://127.0.0.1:8766/changes?since=3f9a1c2e.105&wait=30"
+"""
+
+from __future__ import annotations
+
+import argparse
+import gzip
+import hashlib
+import json
+import re
+import secrets
+import sqlite3
+import threading
+import time
+from collections import OrderedDict
+from datetime import datetime, timedelta, timezone
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+from urllib.parse import parse_qs, unquote, urlsplit
+
+
+ROOT = Path(__file__).resolve().parents[1]
+SCHEMA_VERSION = 2
+DEFAULT_DB = ".cache/effects.sqlite"
+DEFAULT_MANIFEST = "docs/effects.manifest.json"
+DEFAULT_PAGE = 50
+MAX_PAGE = 500
+MAX_WAIT_S = 60.0
+GZIP_MIN_BYTES = 1024
+CACHE_ENTRIES = 256
+
+# facet -> (name table, link table, id column, manifest field)
+FACETS = {
+    "tag": ("tags", "effect_tags", "tag_id", "tags"),
+    "feature": ("features", "effect_features", "feature_id", "features"),
+    "category": ("categories", "effect_categories", "category_id", "categories"),
+}
+SORTS = {
+    "id": "e.id",
+    "name": "e.name COLLATE NOCASE, e.id",
+    "modified": "e.modified_utc DESC, e.id",
+    "size": "e.size_bytes DESC, e.id",
+    "tier": "CASE e.gpu_tier WHEN 'high' THEN 0 WHEN 'med' THEN 1 ELSE 2 END, e.id",
+}
+
+DDL = """
+CREATE TABLE IF NOT EXISTS meta (key TEXT PRIMARY KEY, value TEXT NOT NULL);
+CREATE TABLE IF NOT EXISTS effects (
+    id           TEXT PRIMARY KEY,
+    name         TEXT NOT NULL,
+    title        TEXT NOT NULL,
+    type         TEXT NOT NULL,
+    path         TEXT NOT NULL,
+    size_bytes   INTEGER NOT NULL,
+    modified_utc TEXT NOT NULL,
+    category     TEXT NOT NULL,
+    gpu_tier     TEXT NOT NULL,
+    record_hash  TEXT NOT NULL,     -- record_hash() of the manifest entry
+    record       TEXT NOT NULL      -- the manifest entry (JSON)
+);
+CREATE INDEX IF NOT EXISTS effects_tier_type ON effects (gpu_tier, type);
+CREATE INDEX IF NOT EXISTS effects_type ON effects (type);
+CREATE INDEX IF NOT EXISTS effects_modified ON effects (modified_utc);
+""" + "".join(f"""
+CREATE TABLE IF NOT EXISTS {names} ({col} INTEGER PRIMARY KEY, name TEXT NOT NULL UNIQUE);
+CREATE TABLE IF NOT EXISTS {links} (
+    effect_id TEXT NOT NULL REFERENCES effects (id) ON DELETE CASCADE,
+    {col} INTEGER NOT NULL REFERENCES {names} ({col}),
+    PRIMARY KEY (effect_id, {col})
+) WITHOUT ROWID;
+CREATE INDEX IF NOT EXISTS {links}_by_name ON {links} ({col}, effect_id);
+""" for names, links, col, _ in FACETS.values()) + """
+CREATE TABLE IF NOT EXISTS changes (
+    version    INTEGER PRIMARY KEY AUTOINCREMENT,   -- catalog version after this change
+    effect_id  TEXT NOT NULL,
+    op         TEXT NOT NULL,                        -- 'added' | 'updated' | 'removed'
+    changed_utc TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS changes_by_effect ON changes (effect_id, version);
+CREATE VIRTUAL TABLE IF NOT EXISTS effects_fts USING fts5(
+    id UNINDEXED, title, identifiers, tokenize = 'unicode61 remove_diacritics 2'
+);
+"""
+
+IDENTIFIER_RES = (
+    re.compile(r"\bnew\s+THREE\.(\w+)"),
+    re.compile(r"\bclass\s+(\w+)"),
+    re.compile(r"\bfunction\s+(\w+)"),
+    re.compile(r"\buniform\s+\w+\s+(\w+)"),
+    re.compile(r"\bimport\s*\{([^}]*)\}"),
+)
+CAMEL_RE = re.compile(r"[A-Z]+(?=[A-Z][a-z])|[A-Z]?[a-z]+|[A-Z]+|\d+")
+
+
+# ---------------------------------------------------------------------------
+# Storage
+# ---------------------------------------------------------------------------
+
+def connect(db_path: Path) -> sqlite3.Connection:
+    db_path.parent.mkdir(parents=True, exist_ok=True)
+    conn = sqlite3.connect(db_path, check_same_thread=False)
+    conn.execute("PRAGMA journal_mode=WAL")
+    conn.execute("PRAGMA synchronous=NORMAL")
+    conn.execute("PRAGMA foreign_keys=ON")
+    row = None
+    try:
+        row = conn.execute("SELECT value FROM meta WHERE key = 'schema'").fetchone()
+    except sqlite3.OperationalError:
+        pass
+    if row is not None and row[0] != str(SCHEMA_VERSION):
+        # The catalog is derived data: rebuild it rather than migrate.
+        conn.close()
+        db_path.unlink()
+        return connect(db_path)
+    conn.executescript(DDL)
+    conn.execute("INSERT OR IGNORE INTO meta (key, value) VALUES ('schema', ?)", (str(SCHEMA_VERSION),))
+    # New file -> new epoch, so versions from a previous file are never mistaken for current ones.
+    conn.execute("INSERT OR IGNORE INTO meta (key, value) VALUES ('epoch', ?)", (secrets.token_hex(4),))
+    conn.commit()
+    return conn
+
+
+def record_hash(record: dict) -> str:
+    """Stable content hash of a manifest record (key order and whitespace do not matter)."""
+    blob = json.dumps(record, sort_keys=True, separators=(",", ":"), ensure_ascii=False)
+    return hashlib.sha1(blob.encode("utf-8")).hexdigest()[:16]
+
+
+def extract_identifiers(text: str) -> str:
+    """Space-separated identifiers from an effect's source, plus their camelCase words."""
+    names: set[str] = set()
+    for rx in IDENTIFIER_RES:
+        for m in rx.finditer(text):
+            names.update(n.strip().split(" as ")[0] for n in m.group(1).split(",") if n.strip())
+    words = {w.lower() for n in names for w in CAMEL_RE.findall(n) if len(w) >= 3}
+    return " ".join(sorted(names | words))
+
+
+def _facet_id(conn: sqlite3.Connection, names: str, col: str, value: str) -> int:
+    conn.execute(f"INSERT OR IGNORE INTO {names} (name) VALUES (?)", (value,))
+    return conn.execute(f"SELECT {col} FROM {names} WHERE name = ?", (value,)).fetchone()[0]
+
+
+def sync(conn: sqlite3.Connection, effects: list[dict], texts: dict[str, str] | None = None,
+         root: Path = ROOT, generated_utc: str = "") -> dict[str, int]:
+    """
+    Bring the catalog in line with `effects` (manifest records). `texts` maps id -> source
+    text for identifier extraction; missing entries are read from root / record["path"].
+    Returns counts of added / updated / removed / unchanged records.
+    """
+    texts = texts or {}
+    existing = dict(conn.execute("SELECT id, record_hash FROM effects"))
+    stats = {"added": 0, "updated": 0, "removed": 0, "unchanged": 0}
+    seen: set[str] = set()
+    now = datetime.now(tz=timezone.utc).isoformat()
+    with conn:
+        for rec in effects:
+            eid = rec["id"]
+            seen.add(eid)
+            digest = rec.get("content_hash") or record_hash(rec)
+            if existing.get(eid) == digest:
+                stats["unchanged"] += 1
+                continue
+            op = "updated" if eid in existing else "added"
+            stats[op] += 1
+            conn.execute("INSERT INTO changes (effect_id, op, changed_utc) VALUES (?, ?, ?)", (eid, op, now))
+            conn.execute(
+                """INSERT INTO effects (id, name, title, type, path, size_bytes, modified_utc, category, gpu_tier,
+                                        record_hash, record)
+                   VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+                   ON CONFLICT (id) DO UPDATE SET
+                       name = excluded.name, title = excluded.title, type = excluded.type, path = excluded.path,
+                       size_bytes = excluded.size_bytes, modified_utc = excluded.modified_utc,
+                       category = excluded.category, gpu_tier = excluded.gpu_tier,
+                       record_hash = excluded.record_hash, record = excluded.record""",
+                (eid, rec.get("name", ""), rec.get("title", ""), rec.get("type", "unknown"), rec.get("path", ""),
+                 int(rec.get("size_bytes") or 0), rec.get("modified_utc", ""), rec.get("category", ""),
+                 rec.get("gpu_tier", ""), digest, json.dumps(rec, ensure_ascii=False)),
+            )
+            for names, links, col, field in FACETS.values():
+                conn.execute(f"DELETE FROM {links} WHERE effect_id = ?", (eid,))
+                conn.executemany(f"INSERT OR IGNORE INTO {links} (effect_id, {col}) VALUES (?, ?)",
+                                 [(eid, _facet_id(conn, names, col, v)) for v in rec.get(field) or []])
+            text = texts.get(eid)
+            if text is None:
+                try:
+                    text = (root / rec.get("path", "")).read_text(encoding="utf-8", errors="replace")
+                except OSError:
+                    text = ""
+            conn.execute("DELETE FROM effects_fts WHERE id = ?", (eid,))
+            conn.execute("INSERT INTO effects_fts (id, title, identifiers) VALUES (?, ?, ?)",
+                         (eid, f"{rec.get('title', '')} {rec.get('name', '')} {eid.replace('-', ' ')}",
+                          extract_identifiers(text)))
+
+        gone = sorted(set(existing) - seen)
+        stats["removed"] = len(gone)
+        for eid in gone:
+            conn.execute("DELETE FROM effects WHERE id = ?", (eid,))
+            conn.execute("INSERT INTO changes (effect_id, op, changed_utc) VALUES (?, 'removed', ?)", (eid, now))
+            conn.execute("DELETE FROM effects_fts WHERE id = ?", (eid,))
+        if gone or stats["updated"]:
+            for names, links, col, _ in FACETS.values():
+                conn.execute(f"DELETE FROM {names} WHERE {col} NOT IN (SELECT {col} FROM {links})")
+        conn.execute("INSERT OR REPLACE INTO meta (key, value) VALUES ('synced_utc', ?)", (now,))
+        if generated_utc:
+            conn.execute("INSERT OR REPLACE INTO meta (key, value) VALUES ('manifest_generated_utc', ?)",
+                         (generated_utc,))
+    return stats
+
+
+# ---------------------------------------------------------------------------
+# Queries
+# ---------------------------------------------------------------------------
+
+def parse_since(value: str) -> str:
+    """'7d' / '12h' / '2w' or an ISO date -> ISO timestamp (UTC) for modified_utc comparisons."""
+    m = re.fullmatch(r"(\d+(?:\.\d+)?)([hdw])", value.strip())
+    if m:
+        n = float(m.group(1))
+        delta = {"h": timedelta(hours=n), "d": timedelta(days=n), "w": timedelta(weeks=n)}[m.group(2)]
+        return (datetime.now(tz=timezone.utc) - delta).isoformat()
+    try:
+        parsed = datetime.fromisoformat(value)
+    except ValueError:
+        raise ValueError(f"bad --since {value!r} (use 7d, 12h, 2w or YYYY-MM-DD)") from None
+    if parsed.tzinfo is None:
+        parsed = parsed.replace(tzinfo=timezone.utc)
+    return parsed.astimezone(timezone.utc).isoformat()
+
+
+def fts_query(text: str) -> str:
+    """User text -> FTS5 query: every word must match, as a prefix."""
+    words = re.findall(r"\w+", text)
+    return " ".join(f'"{w}"*' for w in words)
+
+
+def build_filter(filters: dict) -> tuple[str, list]:
+    """
+    WHERE clause over `effects e` for a filter dict:
+      types / tiers: any of; tags / features / categories: all of;
+      text: full-text words (prefix match); since: ISO timestamp (see parse_since).
+    """
+    clauses, params = [], []
+    for key, column in (("types", "e.type"), ("tiers", "e.gpu_tier")):
+        values = [v for v in filters.get(key) or [] if v]
+        if values:
+            clauses.append(f"{column} IN ({', '.join('?' * len(values))})")
+            params.extend(values)
+    for facet, (names, links, col, field) in FACETS.items():
+        for value in filters.get(field) or []:
+            clauses.append(f"EXISTS (SELECT 1 FROM {links} l JOIN {names} n USING ({col}) "
+                           f"WHERE l.effect_id = e.id AND n.name = ?)")
+            params.append(value)
+    text = fts_query(filters.get("text") or "")
+    if text:
+        clauses.append("e.id IN (SELECT id FROM effects_fts WHERE effects_fts MATCH ?)")
+        params.append(text)
+    if filters.get("since"):
+        clauses.append("e.modified_utc >= ?")
+        params.append(filters["since"])
+    return (" WHERE " + " AND ".join(clauses)) if clauses else "", params
+
+
+def query_effects(conn: sqlite3.Connection, filters: dict, sort: str = "id", limit: int = 50,
+                  offset: int = 0) -> tuple[list[dict], int]:
+    """Matching manifest records (one page) and the total match count."""
+    where, params = build_filter(filters)
+    total = conn.execute(f"SELECT COUNT(*) FROM effects e{where}", params).fetchone()[0]
+    rows = conn.execute(f"SELECT e.record FROM effects e{where} ORDER BY {SORTS[sort]} LIMIT ? OFFSET ?",
+                        [*params, limit, offset]).fetchall()
+    return [json.loads(r[0]) for r in rows], total
+
+
+def facet_counts(conn: sqlite3.Connection, filters: dict) -> dict[str, dict[str, int]]:
+    """Counts per type, tier, tag, feature and category among the matches."""
+    where, params = build_filter(filters)
+    matched = f"SELECT e.id FROM effects e{where}"
+    out = {}
+    for name, column in (("type", "type"), ("gpu_tier", "gpu_tier")):
+        out[name] = dict(conn.execute(
+            f"SELECT {column}, COUNT(*) FROM effects WHERE id IN ({matched}) GROUP BY {column} ORDER BY 2 DESC, 1",
+            params))
+    for facet, (names, links, col, field) in FACETS.items():
+        out[field] = dict(conn.execute(
+            f"SELECT n.name, COUNT(*) FROM {links} l JOIN {names} n USING ({col}) "
+            f"WHERE l.effect_id IN ({matched}) GROUP BY n.name ORDER BY 2 DESC, 1", params))
+    return out
+
+
+def catalog_version(conn: sqlite3.Connection) -> int:
+    """Monotonic catalog version: the number of the last recorded change (0 when empty)."""
+    return conn.execute("SELECT COALESCE(MAX(version), 0) FROM changes").fetchone()[0]
+
+
+def catalog_epoch(conn: sqlite3.Connection) -> str:
+    """Random id of this catalog file; changes whenever the file is rebuilt and versions restart."""
+    return conn.execute("SELECT value FROM meta WHERE key = 'epoch'").fetchone()[0]
+
+
+def version_token(state: dict) -> str:
+    """Client-facing version "<epoch>.<N>" (also the ETag prefix)."""
+    return f"{state['epoch']}.{state['version']}"
+
+
+def parse_version_token(value: str) -> tuple[str | None, int]:
+    """'<epoch>.<N>' -> (epoch, N); a bare N (no epoch to check) -> (None, N); '' -> (None, 0)."""
+    epoch, _, number = value.strip().rpartition(".")
+    if not number.isdigit() and number != "":
+        raise ValueError(f"bad version {value!r} (expected '<epoch>.<version>')")
+    return epoch or None, int(number or 0)
+
+
+def changes_since(conn: sqlite3.Connection, since: int) -> list[dict]:
+    """Latest change per effect after version `since`, oldest first; records are current (None if removed)."""
+    rows = conn.execute(
+        """SELECT c.version, c.effect_id, c.op, e.record FROM changes c
+           LEFT JOIN effects e ON e.id = c.effect_id
+           WHERE c.version = (SELECT MAX(version) FROM changes WHERE effect_id = c.effect_id AND version > ?)
+           ORDER BY c.version""", (since,)).fetchall()
+    return [{"version": v, "id": eid, "op": op, "record": json.loads(rec) if rec and op != "removed" else None}
+            for v, eid, op, rec in rows]
+
+
+# ---------------------------------------------------------------------------
+# HTTP service
+# ---------------------------------------------------------------------------
+
+def request_filters(params: dict[str, list[str]]) -> dict:
+    """Query-string parameters (repeated or comma-separated) -> build_filter() dict."""
+    def many(key: str) -> list[str]:
+        return [v.strip() for raw in params.get(key, []) for v in raw.split(",") if v.strip()]
+
+    since = (params.get("since") or [""])[-1]
+    # Relative windows are rounded to the minute so equal requests share an ETag.
+    return {"types": many("type"), "tiers": many("tier"), "features": many("feature"), "tags": many("tag"),
+            "categories": many("category"), "text": " ".join(params.get("q", [])),
+            "since": parse_since(since)[:16] if since else None}
+
+
+def accepts_gzip(header: str | None) -> bool:
+    for part in (header or "").split(","):
+        coding, _, q = part.strip().partition(";")
+        if coding.strip().lower() in ("gzip", "*"):
+            return q.strip().replace(" ", "") not in ("q=0", "q=0.0", "q=0.00", "q=0.000")
+    return False
+
+
+class CatalogHandler(BaseHTTPRequestHandler):
+    server_version = "JaZeREffectCatalog/1"
+    conn: sqlite3.Connection
+    changed: threading.Condition     # guards conn, state and cache; notified when the version moves
+    state: dict                      # {"epoch": str, "version": int}
+    cache: OrderedDict               # etag -> (body, gzipped body | None)
+    quiet = False
+
+    def _cors(self) -> None:
+        self.send_header("Access-Control-Allow-Origin", "*")
+        self.send_header("Access-Control-Allow-Methods", "GET, OPTIONS")
+        self.send_header("Access-Control-Allow-Headers", "If-None-Match")
+        self.send_header("Access-Control-Expose-Headers", "ETag")
+
+    def _reply(self, status: int, body: dict | bytes | None = None, etag: str | None = None,
+               gz: bytes | None = None) -> None:
+        data = body if isinstance(body, bytes) else json.dumps(body).encode("utf-8") if body is not None else b""
+        use_gz = gz is not None and accepts_gzip(self.headers.get("Accept-Encoding"))
+        if use_gz:
+            data = gz
+        self.send_response(status)
+        self._cors()
+        if data:
+            self.send_header("Content-Type", "application/json")
+        if etag:
+            self.send_header("ETag", etag[:-1] + '-gz"' if use_gz else etag)
+            self.send_header("Cache-Control", "no-cache")
+        if etag or gz is not None:
+            self.send_header("Vary", "Accept-Encoding")
+        if use_gz:
+            self.send_header("Content-Encoding", "gzip")
+        self.send_header("Content-Length", str(len(data)))
+        self.end_headers()
+        if data:
+            self.wfile.write(data)
+
+    def _etag_matches(self, etag: str) -> bool:
+        header = self.headers.get("If-None-Match")
+        if not header:
+            return False
+        tags = {t.strip().removeprefix("W/").replace('-gz"', '"') for t in header.split(",")}
+        return "*" in tags or etag in tags
+
+    def _not_modified(self, etag: str) -> bool:
+        if not self._etag_matches(etag):
+            return False
+        self.send_response(304)
+        self._cors()
+        self.send_header("ETag", etag)
+        self.send_header("Cache-Control", "no-cache")
+        self.send_header("Vary", "Accept-Encoding")
+        self.end_headers()
+        return True
+
+    def do_OPTIONS(self) -> None:
+        self._reply(204)
+
+    def do_GET(self) -> None:
+        url = urlsplit(self.path)
+        route = url.path.rstrip("/") or "/"
+        params = parse_qs(url.query)
+        try:
+            if route == "/health":
+                with self.changed:
+                    version = version_token(self.state)
+                self._reply(200, {"ok": True, "version": version})
+            elif route == "/changes":
+                self._changes(params)
+            elif route in ("/effects", "/facets") or route.startswith("/effects/"):
+                self._listing(route, params)
+            else:
+                self._reply(404, {"error": "not found"})
+        except ValueError as e:
+            self._reply(400, {"error": str(e)})
+
+    def _listing(self, route: str, params: dict[str, list[str]]) -> None:
+        filters = request_filters(params)
+        sort = (params.get("sort") or ["id"])[-1]
+        if sort not in SORTS:
+            raise ValueError(f"bad sort {sort!r} (one of {', '.join(sorted(SORTS))})")
+        limit = min(int((params.get("limit") or [DEFAULT_PAGE])[-1]), MAX_PAGE)
+        offset = int((params.get("offset") or [0])[-1])
+        if limit < 1 or offset < 0:
+            raise ValueError("limit must be >= 1 and offset >= 0")
+        want_facets = (params.get("facets") or ["0"])[-1] not in ("0", "false", "")
+        key = json.dumps([route, filters, sort, limit, offset, want_facets], sort_keys=True)
+        digest = hashlib.sha1(key.encode("utf-8")).hexdigest()[:12]
+        status, body = 200, None
+        # Version, ETag, cache and query are read under the lock that sync holds, so the ETag
+        # always names the data returned. A revalidation or cache hit skips the database.
+        with self.changed:
+            version = version_token(self.state)
+            etag = f'"{version}-{digest}"'
+            cached = self.cache.get(etag)
+            if cached is not None:
+                self.cache.move_to_end(etag)
+            elif not self._etag_matches(etag):
+                status, body = self._query(route, filters, sort, limit, offset, want_facets, version)
+        if self._not_modified(etag):
+            return
+        if status != 200:
+            self._reply(status, body)
+            return
+        if cached is None:
+            data = json.dumps(body, ensure_ascii=False, separators=(",", ":")).encode("utf-8")
+            cached = (data, gzip.compress(data, 6) if len(data) >= GZIP_MIN_BYTES else None)
+            with self.changed:
+                self.cache[etag] = cached
+                while len(self.cache) > CACHE_ENTRIES:
+                    self.cache.popitem(last=False)
+        self._reply(200, cached[0], etag, cached[1])
+
+    def _query(self, route: str, filters: dict, sort: str, limit: int, offset: int, want_facets: bool,
+               version: str) -> tuple[int, dict]:
+        """Listing body for one request; the caller holds self.changed."""
+        if route == "/facets":
+            return 200, {"version": version, "facets": facet_counts(self.conn, filters)}
+        if route.startswith("/effects/"):
+            row = self.conn.execute("SELECT record FROM effects WHERE id = ?",
+                                    (unquote(route[len("/effects/"):]),)).fetchone()
+            if row is None:
+                return 404, {"error": "no such effect", "version": version}
+            return 200, {"version": version, "effect": json.loads(row[0])}
+        rows, total = query_effects(self.conn, filters, sort, limit, offset)
+        body = {"version": version, "total": total, "offset": offset, "limit": limit,
+                "next_offset": offset + limit if offset + limit < total else None, "effects": rows}
+        if want_facets:
+            body["facets"] = facet_counts(self.conn, filters)
+        return 200, body
+
+    def _changes(self, params: dict[str, list[str]]) -> None:
+        epoch, since = parse_version_token((params.get("since") or [""])[-1])
+        wait = min(max(float((params.get("wait") or [0])[-1]), 0.0), MAX_WAIT_S)
+        with self.changed:
+            if epoch is None and since == 0:
+                epoch = self.state["epoch"]     # first poll: everything in the current catalog
+            self.changed.wait_for(lambda: (self.state["epoch"], self.state["version"]) != (epoch, since),
+                                  timeout=wait)
+            version = version_token(self.state)
+            if epoch != self.state["epoch"] or since > self.state["version"]:
+                # The catalog was rebuilt (schema change, deleted file): versions restarted.
+                body = {"version": version, "reset": True, "changes": []}
+            else:
+                body = {"version": version, "changes": changes_since(self.conn, since)}
+        data = json.dumps(body, ensure_ascii=False, separators=(",", ":")).encode("utf-8")
+        self._reply(200, data, gz=gzip.compress(data, 6) if len(data) >= GZIP_MIN_BYTES else None)
+
+    def log_message(self, fmt: str, *args: object) -> None:
+        if not self.quiet:
+            super().log_message(fmt, *args)
+
+
+def watch(handler: type[CatalogHandler], manifest_path: Path, interval: float, stop: threading.Event) -> None:
+    """Re-sync when the manifest changes on disk and wake long-polls when the version moves."""
+    mtime = manifest_path.stat().st_mtime_ns if manifest_path.exists() else 0
+    while not stop.wait(interval):
+        try:
+            current = manifest_path.stat().st_mtime_ns
+        except OSError:
+            continue
+        with handler.changed:
+            if current != mtime:
+                mtime = current
+                try:
+                    payload = json.loads(manifest_path.read_text(encoding="utf-8"))
+                except ValueError:
+                    continue    # half-written; retry on the next tick
+                stats = sync(handler.conn, payload.get("effects", []), generated_utc=payload.get("generated_utc", ""))
+                if not handler.quiet and (stats["added"] or stats["updated"] or stats["removed"]):
+                    print("Manifest changed: " + ", ".join(f"{v} {k}" for k, v in stats.items() if k != "unchanged"))
+            # Also catches syncs made by another process (generate_effect_manifest.py --catalog).
+            latest = {"epoch": catalog_epoch(handler.conn), "version": catalog_version(handler.conn)}
+            if latest != handler.state:
+                handler.state.update(latest)
+                handler.changed.notify_all()
+
+
+def serve(db_path: Path, manifest_path: Path, host: str, port: int, interval: float, quiet: bool) -> int:
+    conn = connect(db_path)
+    if manifest_path.exists():
+        cmd_sync(conn, manifest_path)
+    handler = type("Handler", (CatalogHandler,), {
+        "conn": conn, "changed": threading.Condition(threading.Lock()), "quiet": quiet,
+        "state": {"epoch": catalog_epoch(conn), "version": catalog_version(conn)}, "cache": OrderedDict(),
+    })
+    stop = threading.Event()
+    if interval > 0:
+        threading.Thread(target=watch, args=(handler, manifest_path, interval, stop), daemon=True).start()
+    httpd = ThreadingHTTPServer((host, port), handler)
+    print(f"Serving the effect catalog (version {version_token(handler.state)}) at http://{host}:{port}/effects")
+    try:
+        httpd.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        stop.set()
+        httpd.server_close()
+        with handler.changed:
+            conn.close()
+    return 0
+
+
+# ---------------------------------------------------------------------------
+# CLI
+# ---------------------------------------------------------------------------
+
+def print_table(rows: list[list[str]], header: list[str]) -> None:
+    widths = [max(len(str(r[i])) for r in rows + [header]) for i in range(len(header))]
+    print("  ".join(h.ljust(w) for h, w in zip(header, widths)))
+    print("  ".join("-" * w for w in widths))
+    for r in rows:
+        print("  ".join(str(c).ljust(w) for c, w in zip(r, widths)))
+
+
+def cmd_sync(conn: sqlite3.Connection, manifest_path: Path) -> int:
+    payload = json.loads(manifest_path.read_text(encoding="utf-8"))
+    started = time.perf_counter()
+    stats = sync(conn, payload.get("effects", []), generated_utc=payload.get("generated_utc", ""))
+    print(f"Catalog synced in {(time.perf_counter() - started) * 1000:.0f} ms: "
+          + ", ".join(f"{v} {k}" for k, v in stats.items()))
+    return 0
+
+
+def cmd_query(conn: sqlite3.Connection, args: argparse.Namespace) -> int:
+    filters = {
+        "types": args.type, "tiers": args.tier, "features": args.feature, "tags": args.tag,
+        "categories": args.category, "text": args.text,
+        "since": parse_since(args.since) if args.since else None,
+    }
+    started = time.perf_counter()
+    rows, total = query_effects(conn, filters, args.sort, args.limit, args.offset)
+    facets = facet_counts(conn, filters) if args.facets else None
+    elapsed = (time.perf_counter() - started) * 1000
+    if args.json:
+        print(json.dumps({"total": total, "offset": args.offset, "effects": rows,
+                          **({"facets": facets} if facets is not None else {})}, indent=2, ensure_ascii=False))
+        return 0
+    if rows:
+        print_table([[r["id"], r["type"], r["gpu_tier"], r["modified_utc"][:10], r["title"]] for r in rows],
+                    ["id", "type", "tier", "modified", "title"])
+    shown = f"{args.offset + 1}-{args.offset + len(rows)} of " if rows and (total > len(rows) or args.offset) else ""
+    print(f"{shown}{total} match(es) in {elapsed:.1f} ms")
+    if facets:
+        for name, counts in facets.items():
+            if counts:
+                print(f"  {name}: " + ", ".join(f"{k} {v}" for k, v in counts.items()))
+    return 0
+
+
+def main() -> int:
+    ap = argparse.ArgumentParser(description="SQLite catalog of the effects manifest with faceted search.")
+    ap.add_argument("--db", default=DEFAULT_DB, help="SQLite file (relative to the repo root)")
+    sub = ap.add_subparsers(dest="cmd", required=True)
+
+    sp = sub.add_parser("sync", help="Create or incrementally update the catalog from the manifest")
+    sp.add_argument("--manifest", default=DEFAULT_MANIFEST, help="Manifest JSON (relative to the repo root)")
+
+    qp = sub.add_parser("query", help="Faceted search")
+    qp.add_argument("--type", action="append", help="three / canvas / ... (repeat for any of)")
+    qp.add_argument("--tier", action="append", choices=("low", "med", "high"), help="GPU tier (repeat for any of)")
+    qp.add_argument("--feature", action="append", help="Required feature (repeat for all of)")
+    qp.add_argument("--tag", action="append", help="Required tag (repeat for all of)")
+    qp.add_argument("--category", action="append", help="Required category (repeat for all of)")
+    qp.add_argument("--text", help="Full-text words over titles and source identifiers (prefix match)")
+    qp.add_argument("--since", help="Modified since: 7d, 12h, 2w or YYYY-MM-DD")
+    qp.add_argument("--sort", choices=sorted(SORTS), default="id")
+    qp.add_argument("--limit", type=int, default=50)
+    qp.add_argument("--offset", type=int, default=0)
+    qp.add_argument("--facets", action="store_true", help="Also count type / tier / feature / tag / category")
+    qp.add_argument("--json", action="store_true")
+
+    vp = sub.add_parser("serve", help="Threaded HTTP service: filtered listings, ETags, gzip, long-poll changes")
+    vp.add_argument("--manifest", default=DEFAULT_MANIFEST, help="Manifest JSON to sync from and watch")
+    vp.add_argument("--host", default="127.0.0.1")
+    vp.add_argument("--port", type=int, default=8766)
+    vp.add_argument("--watch", type=float, default=2.0, metavar="SECONDS",
+                    help="Manifest / catalog poll interval (0 = never re-sync)")
+    vp.add_argument("--quiet", action="store_true", help="Do not log requests")
+
+    args = ap.parse_args()
+    db_path = (ROOT / args.db).resolve()
+    if args.cmd == "query" and not db_path.exists():
+        raise SystemExit(f"No catalog at {db_path} (run `sync` or generate_effect_manifest.py --catalog)")
+    if args.cmd == "serve":
+        return serve(db_path, (ROOT / args.manifest).resolve(), args.host, args.port, args.watch, args.quiet)
+    conn = connect(db_path)
+    try:
+        if args.cmd == "sync":
+            return cmd_sync(conn, (ROOT / args.manifest).resolve())
+        try:
+            return cmd_query(conn, args)
+        except ValueError as e:
+            raise SystemExit(str(e))
+    finally:
+        conn.close()
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,197 @@
+"""
+Shared "effect facts" model for the UI schema tools.
+
+One EffectFacts holds everything the schema stages need to know about an effect,
+read from disk exactly once: the effect HTML (raw bytes + decoded text), its
+`effects/ui-schema/<name>.ui.json` (raw text + parsed object), and the helpers
+that several tools used to duplicate (bind parsing, newline handling).
+"""
+
+from __future__ import annotations
+
+import json
+import re
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any
+
+
+def is_obj(v: Any) -> bool:
+  return isinstance(v, dict)
+
+
+def is_arr(v: Any) -> bool:
+  return isinstance(v, list)
+
+
+def _bind_roots(schema: dict, prefix: str, sections: tuple[str, ...] = ("controls", "hotkeys")) -> set[str]:
+  out: set[str] = set()
+  for section in sections:
+    for item in schema.get(section, []) if is_arr(schema.get(section)) else []:
+      if not is_obj(item):
+        continue
+      bind = item.get("bind")
+      if not isinstance(bind, str) or not bind.startswith(prefix):
+        continue
+      key = bind[len(prefix) :].split(".", 1)[0].split("[", 1)[0]
+      if key:
+        out.add(key)
+  return out
+
+
+def schema_param_keys(schema: dict) -> set[str]:
+  """Keys bound as `params.<key>` by controls or hotkeys."""
+  return _bind_roots(schema, "params.")
+
+
+def schema_effect_roots(schema: dict) -> set[str]:
+  """Roots bound as `effect.<root>...` by controls or hotkeys."""
+  return _bind_roots(schema, "effect.")
+
+
+def schema_action_names(schema: dict) -> set[str]:
+  out: set[str] = set()
+  for hk in schema.get("hotkeys", []) if is_arr(schema.get("hotkeys")) else []:
+    if is_obj(hk) and isinstance(hk.get("action"), str):
+      out.add(hk["action"])
+  return out
+
+
+# Params the runtime quality system reads itself (lib/runtime/jazer-background-engine.js
+# QUALITY_OVERRIDE_PARAMS); an effect that drives the tuner never reads them directly.
+PERFORMANCE_PARAMS = ("qualityTier", "resolutionScale", "particleBudget", "postfx")
+QUALITY_SYSTEM_RE = re.compile(r"\b(?:QualityAutoTuner|AdaptiveResolution|CanvasEffectBase|ThreeEffectBase|getQualitySettings)\b")
+
+
+def uses_quality_system(effect_html: str) -> bool:
+  return QUALITY_SYSTEM_RE.search(effect_html) is not None
+
+
+# Standalone effects honor a subset once wired by inject_effect_ui_schema.wire_quality_overrides():
+# bindRendererQuality() reads resolutionScale, particleBudget(n) reads particleBudget.
+QUALITY_WIRING = (
+  ("resolutionScale", re.compile(r"\bbindRendererQuality\(")),
+  ("particleBudget", re.compile(r"\bparticleBudget\(\s*\d")),
+)
+# Particle-like `const <name>Count = N;` constants (meshes/instances such as buildings or
+# shards are left alone); values under PARTICLE_COUNT_MIN are layer/ring counts, not budgets.
+PARTICLE_COUNT_NAME = r"\w*(?:[Pp]article|[Ss]tar|[Ss]park|[Dd]ust|[Dd]ebris|[Ss]treak|[Tt]rail)\w*Count"
+PARTICLE_COUNT_MIN = 100
+PARTICLE_COUNT_DECL_RE = re.compile(r"\bconst\s+(" + PARTICLE_COUNT_NAME + r")\s*=\s*(\d+)\s*;")
+PARTICLE_COUNT_RE = re.compile(r"\bconst\s+(" + PARTICLE_COUNT_NAME + r")\s*=\s*(?:particleBudget\(\s*)?(\d+)")
+
+
+def performance_params(effect_html: str) -> tuple[str, ...]:
+  """PERFORMANCE_PARAMS the effect actually honors (all of them through the quality system)."""
+  if uses_quality_system(effect_html):
+    return PERFORMANCE_PARAMS
+  return tuple(key for key, rx in QUALITY_WIRING if rx.search(effect_html))
+
+
+def particle_counts(effect_html: str) -> list[int]:
+  """Particle-scale `*Count` constants, including ones already wrapped in particleBudget()."""
+  return [int(v) for _, v in PARTICLE_COUNT_RE.findall(effect_html) if int(v) >= PARTICLE_COUNT_MIN]
+
+
+def detect_newline(raw: bytes) -> str:
+  return "\r\n" if b"\r\n" in raw else "\n"
+
+
+def lf_text(raw: bytes) -> str:
+  """Decoded file text in LF form without the trailing newline (restore_newlines() undoes both)."""
+  text = raw.decode("utf-8", errors="replace").replace("\r\n", "\n")
+  return text[:-1] if text.endswith("\n") else text
+
+
+def restore_newlines(raw: bytes, text: str) -> str:
+  """Re-apply the original file's newline style and trailing newline to LF-joined text."""
+  nl = detect_newline(raw)
+  out = nl.join(text.split("\n"))
+  if raw.endswith(b"\r\n"):
+    out += "\r\n"
+  elif raw.endswith(b"\n"):
+    out += "\n"
+  return out
+
+
+def dump_schema(schema: dict) -> str:
+  return json.dumps(schema, indent=2, ensure_ascii=False) + "\n"
+
+
+@dataclass
+class EffectFacts:
+  name: str
+  html_path: Path
+  schema_path: Path
+  html_raw: bytes = b""
+  html: str = ""                      # decoded; stages edit this in LF form
+  html_exists: bool = False           # False: no effect HTML on disk (html stays "")
+  schema_raw: str | None = None       # None: no schema file on disk
+  schema: dict | None = None          # None: missing or unparseable
+  schema_error: str | None = None
+  html_changed: bool = False
+  schema_changed: bool = False
+
+  @property
+  def has_mouse(self) -> bool:
+    c = self.html
+    return "mouse" in c and ("from '../lib/engine/jazer-background-engine.js'" in c or "uMouse" in c)
+
+  def set_html(self, text: str) -> None:
+    if text != self.html:
+      self.html = text
+      self.html_changed = True
+
+  def set_schema(self, schema: dict) -> None:
+    self.schema = schema
+    self.schema_changed = True
+
+  def schema_text(self) -> str:
+    """The schema as it would be written (empty when there is none)."""
+    return dump_schema(self.schema) if self.schema is not None else ""
+
+  def disk_schema_text(self) -> str:
+    return (self.schema_raw or "").replace("\r\n", "\n")
+
+
+def load_facts(name: str, effects_dir: Path, schema_dir: Path) -> EffectFacts:
+  """Read an effect and its schema once."""
+  facts = EffectFacts(name=name, html_path=effects_dir / f"{name}.html", schema_path=schema_dir / f"{name}.ui.json")
+
+  try:
+    facts.html_raw = facts.html_path.read_bytes()
+    facts.html_exists = True
+  except OSError:
+    facts.html_raw = b""
+  facts.html = lf_text(facts.html_raw)
+
+  try:
+    facts.schema_raw = facts.schema_path.read_text(encoding="utf-8", errors="replace")
+  except OSError:
+    facts.schema_raw = None
+  if facts.schema_raw is not None:
+    try:
+      parsed = json.loads(facts.schema_raw)
+    except Exception as e:
+      facts.schema_error = f"Invalid JSON: {e}"
+    else:
+      if is_obj(parsed):
+        facts.schema = parsed
+      else:
+        facts.schema_error = "Schema root must be an object"
+  return facts
+
+
+def save_facts(facts: EffectFacts) -> list[Path]:
+  """Write back whatever the stages changed; returns the paths written."""
+  written: list[Path] = []
+  if facts.schema_changed and facts.schema is not None:
+    text = facts.schema_text()
+    if text != facts.disk_schema_text():
+      facts.schema_path.parent.mkdir(parents=True, exist_ok=True)
+      facts.schema_path.write_text(text, encoding="utf-8", newline="\n")
+      written.append(facts.schema_path)
+  if facts.html_changed:
+    facts.html_path.write_text(restore_newlines(facts.html_raw, facts.html), encoding="utf-8", newline="")
+    written.append(facts.html_path)
+  return written
@@ -0,0 +1,172 @@
+#!/usr/bin/env python3
+"""
+JaZeR Visual Effects Library — Effect Similarity (TF-IDF neighbors)
+
+Builds one TF-IDF vector per effect from:
+- identifiers used in its inline scripts
+- THREE.* symbols (weighted up; they describe what the effect is built from)
+- detected features, tags and categories from the manifest record
+
+and computes the top-k cosine neighbors for every effect with a single
+batched matrix product. Used by generate_effect_manifest.py (--neighbors);
+the index app reads the resulting `similar` lists for "more like this".
+
+Requires NumPy.
+
+Usage:
+  python tools/effect_similarity.py --manifest docs/effects.manifest.json --k 6
+"""
+
+
+from __future__ import annotations
+
+import argparse
+import json
+import re
+from pathlib import Path
+from typing import Iterable
+
+import numpy as np
+
+
+SCRIPT_RE = re.compile(r"<script\b[^>]*>(.*?)</script>", re.IGNORECASE | re.DOTALL)
+IDENT_RE = re.compile(r"[A-Za-z_$][\w$]{2,}")
+THREE_RE = re.compile(r"\bTHREE\.(\w+)")
+COMMENT_RE = re.compile(r"/\*.*?\*/|//[^\n]*", re.DOTALL)
+STRING_RE = re.compile(r"'(?:\\.|[^'\\\n])*'|\"(?:\\.|[^\"\\\n])*\"")
+
+# Tokens that say nothing about what an effect looks like.
+STOP_WORDS = frozenset("""
+    abstract arguments async await break case catch class const continue debugger default delete
+    else export extends false finally for from function get import instanceof let new null return
+    set static super switch this throw true try typeof undefined var void while with yield
+    math window document console length push prototype constructor value values keys index
+    width height const let var min max floor ceil abs sqrt random time delta now performance
+    addEventListener requestAnimationFrame innerWidth innerHeight devicePixelRatio getElementById
+    THREE JAZER_UI JAZER_EXPOSE params
+""".split())
+
+# Repeat structured tokens so they outweigh incidental identifiers.
+THREE_WEIGHT = 2
+META_WEIGHT = 4
+
+
+def tokenize_effect(text: str, record: dict) -> list[str]:
+    """Turn one effect's HTML + manifest record into a bag of tokens."""
+    tokens: list[str] = []
+    for script in SCRIPT_RE.findall(text):
+        code = STRING_RE.sub(" ", COMMENT_RE.sub(" ", script))
+        for sym in THREE_RE.findall(code):
+            tokens.extend([f"three:{sym}"] * THREE_WEIGHT)
+        for ident in IDENT_RE.findall(code):
+            if ident in STOP_WORDS or ident.lower() in STOP_WORDS:
+                continue
+            tokens.append(ident.lower())
+    for key, prefix in (("features", "feat"), ("tags", "tag"), ("categories", "cat")):
+        for v in record.get(key) or []:
+            tokens.extend([f"{prefix}:{v}"] * META_WEIGHT)
+    return tokens
+
+
+def tfidf_matrix(docs: list[list[str]]) -> np.ndarray:
+    """
+    Row-normalized TF-IDF matrix (n_docs x n_terms), float32.
+    TF is sublinear (1 + log count); IDF is smoothed (log((1+n)/(1+df)) + 1).
+    """
+    vocab: dict[str, int] = {}
+    rows: list[int] = []
+    cols: list[int] = []
+    for i, doc in enumerate(docs):
+        for tok in doc:
+            rows.append(i)
+            cols.append(vocab.setdefault(tok, len(vocab)))
+
+    n = len(docs)
+    counts = np.zeros((n, max(1, len(vocab))), dtype=np.float32)
+    if rows:
+        np.add.at(counts, (np.asarray(rows), np.asarray(cols)), 1.0)
+
+    present = counts > 0
+    tf = np.zeros_like(counts)
+    np.log(counts, out=tf, where=present)
+    tf[present] += 1.0
+
+    df = present.sum(axis=0).astype(np.float32)
+    idf = np.log((1.0 + n) / (1.0 + df)) + 1.0
+    x = tf * idf
+
+    norms = np.linalg.norm(x, axis=1, keepdims=True)
+    np.divide(x, norms, out=x, where=norms > 0)
+    return x
+
+
+def top_k_neighbors(x: np.ndarray, k: int) -> tuple[np.ndarray, np.ndarray]:
+    """
+    Cosine top-k for every row of an L2-normalized matrix in one batch.
+    Returns (indices, scores), both shaped (n, k'), best first; k' = min(k, n-1).
+    """
+    n = x.shape[0]
+    k = max(0, min(k, n - 1))
+    if k == 0:
+        return np.zeros((n, 0), dtype=np.int64), np.zeros((n, 0), dtype=np.float32)
+
+    sims = x @ x.T
+    np.fill_diagonal(sims, -np.inf)
+
+    part = np.argpartition(-sims, k - 1, axis=1)[:, :k]
+    part_scores = np.take_along_axis(sims, part, axis=1)
+    order = np.argsort(-part_scores, axis=1, kind="stable")
+    idx = np.take_along_axis(part, order, axis=1)
+    return idx, np.take_along_axis(part_scores, order, axis=1)
+
+
+def compute_neighbors(ids: list[str], docs: list[list[str]], k: int, min_score: float = 0.0) -> dict[str, list[dict]]:
+    """Map each id to its neighbor list [{"id": ..., "score": ...}, ...]."""
+    if not ids:
+        return {}
+    idx, scores = top_k_neighbors(tfidf_matrix(docs), k)
+    out: dict[str, list[dict]] = {}
+    for i, eff_id in enumerate(ids):
+        out[eff_id] = [
+            {"id": ids[j], "score": round(float(s), 4)}
+            for j, s in zip(idx[i].tolist(), scores[i].tolist())
+            if s > min_score
+        ]
+    return out
+
+
+def attach_neighbors(effects: list[dict], texts: Iterable[str], k: int) -> None:
+    """Fill the `similar` field of manifest records in place."""
+    docs = [tokenize_effect(t, e) for e, t in zip(effects, texts)]
+    neighbors = compute_neighbors([e["id"] for e in effects], docs, k)
+    for e in effects:
+        e["similar"] = neighbors.get(e["id"], [])
+
+
+def main() -> int:
+    ap = argparse.ArgumentParser(description="Add TF-IDF `similar` neighbor lists to an effects manifest.")
+    ap.add_argument("--root", default=".", help="Repo root (effect paths are relative to it)")
+    ap.add_argument("--manifest", default="docs/effects.manifest.json", help="Manifest JSON (relative to root)")
+    ap.add_argument("--k", type=int, default=6, help="Neighbors per effect")
+    args = ap.parse_args()
+
+    root = Path(args.root).expanduser()
+    manifest_path = root / args.manifest
+    payload = json.loads(manifest_path.read_text(encoding="utf-8"))
+    effects = payload.get("effects", [])
+
+    texts = []
+    for e in effects:
+        try:
+            texts.append((root / e["path"]).read_text(encoding="utf-8", errors="replace"))
+        except OSError:
+            texts.append("")
+
+    attach_neighbors(effects, texts, args.k)
+    manifest_path.write_text(json.dumps(payload, indent=2, ensure_ascii=False) + "\n", encoding="utf-8")
+    print(f"OK: {len(effects)} effects, k={args.k} -> {manifest_path}")
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
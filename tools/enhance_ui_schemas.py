@@ -10,28 +10,162 @@ This script analyzes each effect file and generates enhanced UI schemas with:
 - Color controls for materials and palettes
 """
 
+import argparse
 import json
 import re
+from functools import lru_cache
 from pathlib import Path
 from typing import Dict, List, Any, Optional
 
+from effect_facts import PERFORMANCE_PARAMS, particle_counts, performance_params
+
 # Paths
 PROJECT_ROOT = Path(__file__).parent.parent
 EFFECTS_DIR = PROJECT_ROOT / "effects"
 SCHEMAS_DIR = EFFECTS_DIR / "ui-schema"
+ENGINE_FILE = PROJECT_ROOT / "lib" / "runtime" / "jazer-background-engine.js"
+
+# Fallback if CONFIG can't be parsed (mirrors jazer-background-engine.js)
+DEFAULT_QUALITY = {
+    "minResolutionScale": 0.55,
+    "maxResolutionScale": 1.0,
+    "levels": {
+        "low": {"resolutionScale": 0.65, "budgets": {"particles": 2000}},
+        "medium": {"resolutionScale": 0.8, "budgets": {"particles": 8000}},
+        "high": {"resolutionScale": 1.0, "budgets": {"particles": 25000}},
+    },
+}
+
+
+def _js_number_map(block: str) -> Dict[str, Any]:
+    """Parse `key: value` pairs of a flat JS object literal (numbers/booleans)."""
+    out: Dict[str, Any] = {}
+    for key, value in re.findall(r'(\w+)\s*:\s*(true|false|[\d.]+)', block):
+        out[key] = value == "true" if value in ("true", "false") else float(value)
+    return out
+
+
+@lru_cache(maxsize=1)
+def load_quality_config() -> Dict[str, Any]:
+    """Read CONFIG.qualityLevels and the resolution-scale range from the engine source."""
+    try:
+        source = ENGINE_FILE.read_text(encoding='utf-8')
+    except OSError:
+        return DEFAULT_QUALITY
+
+    config = {"minResolutionScale": DEFAULT_QUALITY["minResolutionScale"],
+              "maxResolutionScale": DEFAULT_QUALITY["maxResolutionScale"],
+              "levels": {}}
+    for key in ("minResolutionScale", "maxResolutionScale"):
+        m = re.search(rf'\b{key}:\s*([\d.]+)', source)
+        if m:
+            config[key] = float(m.group(1))
+
+    level_re = re.compile(
+        r'(\w+):\s*\{\s*resolutionScale:\s*([\d.]+),\s*maxEntities:\s*(\d+),'
+        r'\s*features:\s*\{([^}]*)\},\s*budgets:\s*\{([^}]*)\}'
+    )
+    for name, scale, entities, features, budgets in level_re.findall(source):
+        config["levels"][name] = {
+            "resolutionScale": float(scale),
+            "maxEntities": int(entities),
+            "features": _js_number_map(features),
+            "budgets": {k: int(v) for k, v in _js_number_map(budgets).items()},
+        }
+    return config if config["levels"] else DEFAULT_QUALITY
+
+
+def performance_controls(params: tuple, counts: List[int]) -> tuple:
+    """
+    Defaults and controls for the given PERFORMANCE_PARAMS, ranges derived from
+    CONFIG.qualityLevels and the effect's particle counts.
+    """
+    quality = load_quality_config()
+    levels = quality["levels"]
+    particle_budgets = [lvl["budgets"].get("particles", 0) for lvl in levels.values() if lvl["budgets"].get("particles")]
+    # The effect's own particle counts size the budget slider when present.
+    budget_max = max(counts) if counts else (max(particle_budgets) if particle_budgets else 25000)
+
+    # 0 = no cap: an untouched slider must not lower anything.
+    defaults = {
+        "qualityTier": "auto",
+        "resolutionScale": quality["maxResolutionScale"],
+        "particleBudget": 0,
+        "postfx": True,
+    }
+    controls = {
+        "qualityTier": {
+            "type": "select",
+            "label": "Quality Tier (max)",
+            "bind": "params.qualityTier",
+            "options": [{"label": "Auto", "value": "auto"}]
+            + [{"label": name.title(), "value": name} for name in levels],
+        },
+        "resolutionScale": {
+            "type": "slider",
+            "label": "Resolution Scale (max)",
+            "bind": "params.resolutionScale",
+            "min": quality["minResolutionScale"],
+            "max": quality["maxResolutionScale"],
+            "step": 0.05,
+        },
+        "particleBudget": {
+            "type": "slider",
+            "label": "Particle Budget (0 = no cap)",
+            "bind": "params.particleBudget",
+            "min": 0,
+            "max": budget_max,
+            "step": max(1, round(budget_max / 100)),
+        },
+        "postfx": {
+            "type": "checkbox",
+            "label": "Post FX",
+            "bind": "params.postfx",
+        },
+    }
+    return {k: defaults[k] for k in params}, [controls[k] for k in params]
+
+
+def apply_performance_section(schema: Dict, effect_html: str) -> bool:
+    """
+    (Re)build the Performance controls in place: one per param the effect honors
+    (effect_facts.performance_params), none for the rest. Returns True if the schema changed.
+    """
+    before = json.dumps(schema, sort_keys=True)
+    params = performance_params(effect_html)
+    perf_binds = {f"params.{k}" for k in PERFORMANCE_PARAMS}
+    controls = schema.get("controls") if isinstance(schema.get("controls"), list) else []
+    kept = [c for c in controls if not (isinstance(c, dict) and c.get("bind") in perf_binds)]
+    defaults = schema.setdefault("defaults", {})
+    for key in PERFORMANCE_PARAMS:
+        if key not in params:
+            defaults.pop(key, None)
+    if params:
+        perf_defaults, perf_controls = performance_controls(params, particle_counts(effect_html))
+        for key, value in perf_defaults.items():
+            defaults.setdefault(key, value)
+        kept.extend(perf_controls)
+    schema["controls"] = kept
+    return json.dumps(schema, sort_keys=True) != before
 
 
 class SchemaEnhancer:
     """Analyzes effect files and generates enhanced UI schemas"""
 
-    def __init__(self, effect_file: Path):
+    def __init__(self, effect_file: Path, content: Optional[str] = None, existing: Optional[Dict] = None,
+                 performance: str = "auto"):
         self.effect_file = effect_file
+        self.performance = performance  # "auto" | "never"
         self.effect_name = effect_file.stem
-        self.content = effect_file.read_text(encoding='utf-8')
+        # Callers that already hold the file (tools/schema_pipeline.py) pass it in.
+        self.content = content if content is not None else effect_file.read_text(encoding='utf-8')
+        self.existing = existing
         self.schema_file = SCHEMAS_DIR / f"{self.effect_name}.ui.json"
 
     def extract_existing_schema(self) -> Dict:
         """Load existing schema if it exists"""
+        if self.existing is not None:
+            return self.existing
         if self.schema_file.exists():
             try:
                 return json.loads(self.schema_file.read_text(encoding='utf-8'))
@@ -271,6 +405,10 @@ class SchemaEnhancer:
 
         schema["controls"] = controls
 
+        # Performance section: operator caps for the params this effect honors
+        if self.performance != "never":
+            apply_performance_section(schema, self.content)
+
         # Add helpful hint
         if effect_type == 'threejs':
             schema["hint"] = "Press H for help. Use JAZER_EXPOSE to expose materials and uniforms."
@@ -288,7 +426,7 @@ class SchemaEnhancer:
         return schema
 
 
-def enhance_all_schemas():
+def enhance_all_schemas(performance: str = "auto"):
     """Process all effect files and enhance their schemas"""
     effect_files = sorted(EFFECTS_DIR.glob("jazer-*.html"))
 
@@ -298,7 +436,7 @@ def enhance_all_schemas():
     enhanced_count = 0
     for effect_file in effect_files:
         try:
-            enhancer = SchemaEnhancer(effect_file)
+            enhancer = SchemaEnhancer(effect_file, performance=performance)
             enhancer.save_enhanced_schema()
             enhanced_count += 1
         except Exception as e:
@@ -308,4 +446,7 @@ def enhance_all_schemas():
 
 
 if __name__ == "__main__":
-    enhance_all_schemas()
+    parser = argparse.ArgumentParser(description="Regenerate enhanced UI schemas for effects/jazer-*.html")
+    parser.add_argument("--performance", choices=("auto", "never"), default="auto",
+                        help="Performance section: auto = the controls each effect honors (quality system or wired params)")
+    enhance_all_schemas(parser.parse_args().performance)
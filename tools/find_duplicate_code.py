@@ -0,0 +1,269 @@
+"""
+Find code blocks duplicated across effect inline scripts and lib/**/*.js.
+
+Two passes over line shingles (k consecutive normalized lines):
+- blocks: every shingle is indexed by the set of sources containing it; maximal
+  runs of shingles that at least one other source also contains form one
+  duplicated block, owned by the sources sharing the whole run.
+  Blocks above --min-bytes are reported with the sources that ship them and the
+  bytes saved by hoisting each into one shared, cacheable lib/ module. Runs nest
+  (a preamble shared by 30 sources is also the head of longer runs shared by
+  fewer), so every source line is credited to one block only, longest first.
+- pairs: a bottom-k MinHash sketch per source estimates Jaccard similarity so
+  near-duplicate files (e.g. an effect and its "-enhanced" copy) stand out even
+  when edits break the shared code into many small blocks.
+
+Usage:
+  python tools/find_duplicate_code.py
+  python tools/find_duplicate_code.py --min-bytes 2048 --json > dupes.json
+"""
+
+from __future__ import annotations
+
+import argparse
+import hashlib
+import heapq
+import json
+import re
+from dataclasses import dataclass, field
+from pathlib import Path
+
+
+SCRIPT_RE = re.compile(r"<script\b([^>]*)>(.*?)</script>", re.IGNORECASE | re.DOTALL)
+TRIVIAL_LINE_RE = re.compile(r"^[\s{}()\[\];,]*$")
+
+# Vendored or generated code that is not ours to hoist.
+DEFAULT_EXCLUDE = {"Three.js"}
+
+
+@dataclass
+class Source:
+  name: str                       # repo-relative path (+ "#script<N>" for inline blocks)
+  lines: list[str]                # normalized lines that take part in shingling
+  sizes: list[int]                # original byte size of each kept line (incl. newline)
+  shingles: list[int] = field(default_factory=list)
+
+
+@dataclass
+class Block:
+  sources: list[str]
+  lines: int
+  bytes: int
+  preview: str
+  savings: int = 0                # bytes saved by hoisting, excluding lines a longer block claimed
+  spans: list[tuple[int, int]] = field(default_factory=list, repr=False)   # (source index, first line) per copy
+
+
+def parse_args() -> argparse.Namespace:
+  p = argparse.ArgumentParser(description="Report code duplicated across effects/*.html inline scripts and lib/**/*.js")
+  p.add_argument("--min-bytes", type=int, default=1024, help="Only report blocks at least this large")
+  p.add_argument("--shingle-lines", type=int, default=6, help="Lines per shingle (k)")
+  p.add_argument("--sketch-size", type=int, default=128, help="MinHash bottom-k sketch size")
+  p.add_argument("--min-similarity", type=float, default=0.5, help="Report source pairs with estimated Jaccard >= this")
+  p.add_argument("--no-lib", action="store_true", help="Only scan effect inline scripts")
+  p.add_argument("--exclude", action="append", default=[], help="File name to skip (repeatable; Three.js is always skipped)")
+  p.add_argument("--top", type=int, default=40, help="Max blocks to print (text mode)")
+  p.add_argument("--json", action="store_true", help="Emit JSON instead of text")
+  return p.parse_args()
+
+
+def normalize_lines(code: str) -> tuple[list[str], list[int]]:
+  lines: list[str] = []
+  sizes: list[int] = []
+  in_block_comment = False
+  for raw in code.splitlines():
+    size = len(raw.encode("utf-8")) + 1
+    s = raw.strip()
+    if in_block_comment:
+      if "*/" in s:
+        in_block_comment = False
+      continue
+    if s.startswith("/*") and "*/" not in s:
+      in_block_comment = True
+      continue
+    if not s or s.startswith("//") or TRIVIAL_LINE_RE.match(s):
+      # Kept out of the shingle stream, but still counted toward the block it sits in.
+      if sizes:
+        sizes[-1] += size
+      continue
+    lines.append(re.sub(r"\s+", " ", s))
+    sizes.append(size)
+  return lines, sizes
+
+
+def collect_sources(root: Path, include_lib: bool, exclude: set[str]) -> list[Source]:
+  sources: list[Source] = []
+  effects_dir = root / "effects"
+  for path in sorted(effects_dir.glob("*.html")):
+    if path.name.lower() == "gallery.html" or path.name in exclude:
+      continue
+    text = path.read_text(encoding="utf-8", errors="replace")
+    inline = [body for attrs, body in SCRIPT_RE.findall(text) if "src=" not in attrs.lower()]
+    for n, body in enumerate(inline):
+      lines, sizes = normalize_lines(body)
+      name = path.relative_to(root).as_posix() + (f"#script{n}" if len(inline) > 1 else "")
+      sources.append(Source(name, lines, sizes))
+
+  if include_lib:
+    for path in sorted((root / "lib").rglob("*.js")):
+      if path.name in exclude:
+        continue
+      lines, sizes = normalize_lines(path.read_text(encoding="utf-8", errors="replace"))
+      sources.append(Source(path.relative_to(root).as_posix(), lines, sizes))
+  return sources
+
+
+def hash64(s: str) -> int:
+  return int.from_bytes(hashlib.blake2b(s.encode("utf-8"), digest_size=8).digest(), "big")
+
+
+def shingle(sources: list[Source], k: int) -> None:
+  for src in sources:
+    src.shingles = [hash64("\n".join(src.lines[i:i + k])) for i in range(len(src.lines) - k + 1)]
+
+
+def find_blocks(sources: list[Source], k: int, min_bytes: int) -> list[Block]:
+  owners: dict[int, set[int]] = {}
+  for si, src in enumerate(sources):
+    for h in src.shingles:
+      owners.setdefault(h, set()).add(si)
+
+  positions: list[dict[int, list[int]]] = []
+  for src in sources:
+    index: dict[int, list[int]] = {}
+    for p, h in enumerate(src.shingles):
+      index.setdefault(h, []).append(p)
+    positions.append(index)
+
+  def locate(x: int, run: list[int]) -> int:
+    shingles = sources[x].shingles
+    return next(p for p in positions[x][run[0]] if shingles[p:p + len(run)] == run)
+
+  groups: dict[tuple, Block] = {}
+  for si, src in enumerate(sources):
+    n = len(src.shingles)
+    i = 0
+    while i < n:
+      share = owners[src.shingles[i]]
+      if len(share) < 2:
+        i += 1
+        continue
+      # Extend while at least one other source still shares every shingle so far;
+      # the sharing set only narrows, so the block ends up owned by `share`.
+      j = i
+      while j + 1 < n:
+        narrowed = share & owners[src.shingles[j + 1]]
+        if len(narrowed) < 2:
+          break
+        share = narrowed
+        j += 1
+      run_ends = j + 1 >= n or len(owners[src.shingles[j + 1]]) < 2
+      last_line = j + k - 1 if run_ends else j
+      key = (frozenset(share), hash64(",".join(map(str, src.shingles[i:j + 1]))))
+      size = sum(src.sizes[i:last_line + 1])
+      block = groups.get(key)
+      if block is None:
+        run = src.shingles[i:j + 1]
+        groups[key] = Block(
+          sources=sorted(sources[x].name for x in share),
+          lines=last_line - i + 1,
+          bytes=size,
+          preview=src.lines[i][:120],
+          spans=[(x, i if x == si else locate(x, run)) for x in sorted(share)],
+        )
+      elif size > block.bytes:
+        block.bytes = size
+        block.lines = last_line - i + 1
+      i = j + 1
+
+  blocks = [b for b in groups.values() if b.bytes >= min_bytes]
+  attribute_savings(sources, blocks)
+  blocks = [b for b in blocks if b.savings > 0]
+  blocks.sort(key=lambda b: (-b.savings, b.sources))
+  return blocks
+
+
+def attribute_savings(sources: list[Source], blocks: list[Block]) -> None:
+  """Credit each (source, line) to at most one block, longest blocks first, so totals add up."""
+  claimed = [bytearray(len(s.lines)) for s in sources]
+  for b in sorted(blocks, key=lambda b: (-b.lines, -len(b.sources), b.sources)):
+    fresh: list[int] = []
+    for si, start in b.spans:
+      end = min(start + b.lines, len(sources[si].lines))
+      mask = claimed[si]
+      fresh.append(sum(size for size, taken in zip(sources[si].sizes[start:end], mask[start:end]) if not taken))
+      mask[start:end] = b"\x01" * (end - start)
+    # One copy of the unclaimed lines moves into the shared module; the other copies are saved.
+    b.savings = sum(fresh) - max(fresh, default=0)
+
+
+def sketch(src: Source, size: int) -> set[int]:
+  # Bottom-k MinHash: the k smallest shingle hashes stand in for k permutations.
+  return set(heapq.nsmallest(size, set(src.shingles)))
+
+
+def similar_pairs(sources: list[Source], size: int, threshold: float) -> list[tuple[str, str, float]]:
+  sketches = [sketch(s, size) for s in sources]
+  out: list[tuple[str, str, float]] = []
+  for a in range(len(sources)):
+    if not sketches[a]:
+      continue
+    for b in range(a + 1, len(sources)):
+      if not sketches[b]:
+        continue
+      union_k = set(heapq.nsmallest(size, sketches[a] | sketches[b]))
+      est = len(union_k & sketches[a] & sketches[b]) / len(union_k)
+      if est >= threshold:
+        out.append((sources[a].name, sources[b].name, round(est, 3)))
+  out.sort(key=lambda t: -t[2])
+  return out
+
+
+def format_bytes(n: int) -> str:
+  return f"{n / 1024:.1f} KiB" if n >= 1024 else f"{n} B"
+
+
+def main() -> int:
+  args = parse_args()
+  root = Path(__file__).resolve().parents[1]
+  k = max(1, args.shingle_lines)
+
+  sources = collect_sources(root, include_lib=not args.no_lib, exclude=DEFAULT_EXCLUDE | set(args.exclude))
+  shingle(sources, k)
+  blocks = find_blocks(sources, k, args.min_bytes)
+  pairs = similar_pairs(sources, args.sketch_size, args.min_similarity)
+  total = sum(b.savings for b in blocks)
+
+  if args.json:
+    print(json.dumps({
+      "sources": len(sources),
+      "shingle_lines": k,
+      "min_bytes": args.min_bytes,
+      "total_savings_bytes": total,
+      "blocks": [
+        {"sources": b.sources, "lines": b.lines, "bytes": b.bytes, "savings_bytes": b.savings, "preview": b.preview}
+        for b in blocks
+      ],
+      "similar_pairs": [{"a": a, "b": b, "jaccard": j} for a, b, j in pairs],
+    }, indent=2))
+    return 0
+
+  print(f"Scanned {len(sources)} source(s); {len(blocks)} duplicated block(s) >= {format_bytes(args.min_bytes)}.\n")
+  for b in blocks[: args.top]:
+    print(f"{format_bytes(b.bytes):>10}  x{len(b.sources)}  save {format_bytes(b.savings):>10}  ({b.lines} lines)  {b.preview}")
+    for name in b.sources:
+      print(f"{'':14}- {name}")
+  if len(blocks) > args.top:
+    print(f"... {len(blocks) - args.top} more (use --top or --json)")
+
+  if pairs:
+    print(f"\nNear-duplicate sources (estimated Jaccard >= {args.min_similarity}):")
+    for a, b, j in pairs:
+      print(f"  {j:.2f}  {a}  <->  {b}")
+
+  print(f"\nTotal hoistable: {format_bytes(total)} across {len(blocks)} block(s).")
+  return 0
+
+
+if __name__ == "__main__":
+  raise SystemExit(main())
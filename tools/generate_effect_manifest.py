@@ -2,9 +2,10 @@
 r"""
 JaZeR Visual Effects Library — Effect Manifest Generator
 
-Scans a repo directory for effect HTML files and produces:
-- docs/effects.manifest.json (machine-readable)
-- docs/effects.manifest.md   (optional human-readable summary)
+Scans a repo directory for effect HTML files (and effect class modules under lib/) and produces:
+- docs/effects.manifest.json          (machine-readable)
+- docs/effects.manifest.md            (optional human-readable summary)
+- lib/core/EffectRegistry.generated.js (lazy-import registry, see build_effect_registry.py)
 
 Usage (PowerShell):
   cd "C:\Users\JaZeR\ACTIVE PROJECTS\Three JS Custom JaZeR Visuals"
@@ -13,17 +14,32 @@ Usage (PowerShell):
 Optional:
   python generate_effect_manifest.py --root "C:\path\to\repo" --out-json "docs\effects.manifest.json" --out-md "docs\effects.manifest.md"
   python generate_effect_manifest.py --include templates --max-bytes 600000
+  python generate_effect_manifest.py --neighbors 0        # skip TF-IDF "similar" lists (no NumPy needed)
+  python generate_effect_manifest.py --catalog            # also update the SQLite catalog (effect_catalog.py)
+  python generate_effect_manifest.py --force              # rewrite even if nothing changed
+
+Output is content-stable: every effect record carries a `content_hash`, and the manifest a
+`content_hash` over everything except VOLATILE_KEYS (generated_utc, file mtimes, the scan
+root), so a fresh clone or a `touch` hashes the same; file content enters through each
+record's `source_sha`, and `similar` only as neighbor ids (TF-IDF scores move whenever any
+effect is added). When that hash matches the previous manifest, nothing is rewritten
+(generated_utc included). Otherwise the manifest is rewritten, with records keeping their
+previous modified_utc while their source_sha is the same, and a compact delta against
+the previous manifest is written next to it (effects.manifest.delta.json: added records,
+removed ids, and changed fields per record) so consumers can patch instead of refetching.
 """
 
 
 from __future__ import annotations
 
 import argparse
+import hashlib
 import json
 import os
 import re
 import sys
-from dataclasses import dataclass, asdict
+from collections import Counter
+from dataclasses import dataclass, asdict, field
 from datetime import datetime, timezone
 from pathlib import Path
 from typing import Iterable, Optional
@@ -43,6 +59,26 @@ DEFAULT_EFFECT_DIR_HINTS = ("effects", "effect", "visuals", "demos")
 # Maximum bytes to read from any single HTML file (safety + speed).
 DEFAULT_MAX_BYTES = 450_000
 
+# Shared palette definitions (PALETTES in the palette system), relative to root.
+PALETTE_MODULE = Path("lib") / "systems" / "palette" / "jazer-palette.js"
+
+# Number of dominant colors kept per effect (used for static preview cards).
+MAX_DOMINANT_COLORS = 4
+
+# "More like this" neighbors per effect (see effect_similarity.py).
+DEFAULT_NEIGHBORS = 6
+
+# Effect class modules (EffectBase subclasses) live under lib/; the registry is generated next to EffectRegistry.js.
+DEFAULT_MODULE_DIR = "lib"
+DEFAULT_REGISTRY_OUT = "lib/core/EffectRegistry.generated.js"
+
+# Optional SQLite catalog for faceted queries (see effect_catalog.py).
+DEFAULT_CATALOG = ".cache/effects.sqlite"
+
+# Keys left out of content hashes: per-run values and ones that depend on the checkout rather
+# than on content (file mtimes, the scan root). Content is covered by each record's source_sha.
+VOLATILE_KEYS = ("generated_utc", "content_hash", "modified_utc", "root")
+
 
 @dataclass
 class EffectRecord:
@@ -52,12 +88,29 @@ class EffectRecord:
     type: str                 # "three" | "canvas" | "unknown"
     path: str                 # repo-relative path
     size_bytes: int
-    modified_utc: str         # ISO8601
+    source_sha: str           # sha1 of the file bytes (16 hex digits)
+    modified_utc: str         # ISO8601; carried over from the previous manifest while content is unchanged
     categories: list[str]
+    category: str             # primary category (first CATEGORY_HINTS match), "" if none
     tags: list[str]
     features: list[str]
     gpu_tier: str             # "low" | "med" | "high"
+    colors: list[str]         # dominant "#rrggbb" colors, most prominent first
+    palettes: list[str]       # named PALETTES entries referenced by the effect
     notes: list[str]
+    similar: list[dict] = field(default_factory=list)   # [{"id", "score"}], best first
+    content_hash: str = ""    # content_hash() of the record, set once the record is complete
+
+
+@dataclass
+class ModuleRecord:
+    export: str               # exported class name
+    base: str                 # "ThreeEffectBase" | "CanvasEffectBase" | "EffectBase"
+    path: str                 # repo-relative path
+    name: str                 # getName()
+    category: str             # getCategory()
+    description: str          # getDescription()
+    tags: list[str]           # getTags()
 
 
 TITLE_RE = re.compile(r"<title>(.*?)</title>", re.IGNORECASE | re.DOTALL)
@@ -75,6 +128,21 @@ HAS_PARTICLES_RE = re.compile(r"PointsMaterial|THREE\.Points|BufferGeometry|part
 HAS_NOISE_RE = re.compile(r"simplex|perlin|fbm|fractal\s*brownian|noise\(", re.IGNORECASE)
 HAS_AUDIO_RE = re.compile(r"AudioContext|AnalyserNode|getByteFrequencyData|getByteTimeDomainData|microphone|getUserMedia", re.IGNORECASE)
 
+# Effect class modules
+EFFECT_BASE_CLASSES = {"EffectBase", "ThreeEffectBase", "CanvasEffectBase"}
+EFFECT_CLASS_RE = re.compile(r"export\s+class\s+(\w+)\s+extends\s+(ThreeEffectBase|CanvasEffectBase|EffectBase)\b")
+STRING_LITERAL_RE = re.compile(r"'((?:\\.|[^'\\])*)'|\"((?:\\.|[^\"\\])*)\"")
+
+# Color extraction
+PALETTE_DEF_RE = re.compile(r"^\s*(\w+)\s*:\s*\[([^\]]*)\]", re.MULTILINE)
+PALETTE_REF_RE = re.compile(
+    r"\b(?:ColorPalettes|PALETTES)\s*(?:\.\s*(\w+)|\[\s*['\"](\w+)['\"]\s*\])"
+    r"|\bnew\s+(?:Palette|Gradient)\(\s*['\"](\w+)['\"]"
+)
+# Same shape SchemaEnhancer.find_color_arrays() looks for: const colors = ['#hex', ...]
+COLOR_ARRAY_RE = re.compile(r"(?:const|let|var)\s+\w*[Cc]olor\w*\s*=\s*\[([^\]]+)\]")
+HEX_COLOR_RE = re.compile(r"#([0-9a-fA-F]{6})\b|\b0x([0-9a-fA-F]{6})\b")
+
 # Category/tag hints
 CATEGORY_HINTS = [
     ("sacred", re.compile(r"flower\s*of\s*life|metatron|sri\s*yantra|sacred\s*geometry|merkaba|seed\s*of\s*life", re.IGNORECASE)),
@@ -210,6 +278,110 @@ def infer_categories_and_tags(text: str) -> tuple[list[str], list[str]]:
     return sorted(cats), sorted(tags)
 
 
+def load_palettes(root: Path) -> dict[str, list[str]]:
+    """Parse the PALETTES table from the palette module (empty if it is missing)."""
+    try:
+        text = (root / PALETTE_MODULE).read_text(encoding="utf-8", errors="replace")
+    except OSError:
+        return {}
+    start = text.find("PALETTES")
+    end = text.find("};", start)
+    if start < 0 or end < 0:
+        return {}
+    palettes: dict[str, list[str]] = {}
+    for name, body in PALETTE_DEF_RE.findall(text[start:end]):
+        colors = [f"#{h.lower()}" for h in re.findall(r"#([0-9a-fA-F]{6})", body)]
+        if colors:
+            palettes[name] = colors
+    return palettes
+
+
+def is_chromatic(hex_color: str) -> bool:
+    r, g, b = (int(hex_color[i:i + 2], 16) for i in (1, 3, 5))
+    return max(r, g, b) - min(r, g, b) >= 24 and max(r, g, b) >= 48
+
+
+def extract_colors(text: str, palettes: dict[str, list[str]], limit: int = MAX_DOMINANT_COLORS) -> tuple[list[str], list[str]]:
+    """
+    Rank an effect's colors: referenced palettes first, then hex color arrays,
+    then the most frequent remaining hex literals. Greys/blacks only fill in
+    when nothing chromatic is found.
+    """
+    used: list[str] = []
+    for m in PALETTE_REF_RE.finditer(text):
+        name = m.group(1) or m.group(2) or m.group(3)
+        if name in palettes and name not in used:
+            used.append(name)
+
+    ranked: list[str] = []
+    for name in used:
+        ranked.extend(palettes[name])
+    for body in COLOR_ARRAY_RE.findall(text):
+        ranked.extend(f"#{h.lower()}" for h in re.findall(r"#([0-9a-fA-F]{6})", body))
+    literals = Counter(f"#{(a or b).lower()}" for a, b in HEX_COLOR_RE.findall(text))
+    ranked.extend(c for c, _ in sorted(literals.items(), key=lambda kv: -kv[1]))
+
+    seen: list[str] = []
+    for c in ranked:
+        if c not in seen:
+            seen.append(c)
+    colors = [c for c in seen if is_chromatic(c)][:limit]
+    if not colors:
+        colors = seen[:limit]
+    return colors, used
+
+
+def primary_category(categories: list[str]) -> str:
+    for name, _ in CATEGORY_HINTS:
+        if name in categories:
+            return name
+    return ""
+
+
+def method_return(body: str, method: str) -> Optional[str]:
+    m = re.search(rf"\b{method}\s*\(\s*\)\s*\{{\s*return\s+(.+?);?\s*\}}", body, re.DOTALL)
+    return m.group(1).strip() if m else None
+
+
+def string_literals(expr: Optional[str]) -> list[str]:
+    if not expr:
+        return []
+    return [a or b for a, b in STRING_LITERAL_RE.findall(expr)]
+
+
+def find_effect_modules(root: Path, module_dir: str, ignore_dirs: set[str], max_bytes: int) -> list[ModuleRecord]:
+    """Find exported EffectBase subclasses and read their literal metadata getters."""
+    base_dir = root / module_dir
+    modules: list[ModuleRecord] = []
+    if not base_dir.is_dir():
+        return modules
+    for dirpath, dirnames, filenames in os.walk(base_dir):
+        dirnames[:] = [dn for dn in dirnames if dn not in ignore_dirs]
+        for fn in sorted(filenames):
+            path = Path(dirpath) / fn
+            if path.suffix != ".js" or path.stat().st_size > max_bytes:
+                continue
+            text, _, _ = read_text_limited(path, max_bytes=max_bytes)
+            matches = list(EFFECT_CLASS_RE.finditer(text))
+            for i, m in enumerate(matches):
+                if m.group(1) in EFFECT_BASE_CLASSES:
+                    continue
+                body = text[m.end():matches[i + 1].start() if i + 1 < len(matches) else len(text)]
+                name = string_literals(method_return(body, "getName"))
+                category = string_literals(method_return(body, "getCategory"))
+                description = string_literals(method_return(body, "getDescription"))
+                modules.append(ModuleRecord(
+                    export=m.group(1),
+                    base=m.group(2),
+                    path=relpath_str(root, path),
+                    name=name[0] if name else m.group(1),
+                    category=category[0] if category else "uncategorized",
+                    description=description[0] if description else "",
+                    tags=string_literals(method_return(body, "getTags")),
+                ))
+    return sorted(modules, key=lambda r: r.path)
+
+
 def is_effect_html(path: Path) -> bool:
     if path.suffix.lower() != ".html":
         return False
@@ -245,12 +417,18 @@ def relpath_str(root: Path, path: Path) -> str:
         return str(path).replace("\\", "/")
 
 
-def build_record(root: Path, html_path: Path, max_bytes: int) -> EffectRecord:
+def build_record(root: Path, html_path: Path, max_bytes: int, palettes: Optional[dict[str, list[str]]] = None) -> EffectRecord:
+    return scan_effect(root, html_path, max_bytes, palettes)[0]
+
+
+def scan_effect(root: Path, html_path: Path, max_bytes: int, palettes: Optional[dict[str, list[str]]] = None) -> tuple[EffectRecord, str]:
+    """Build the record and also hand back the text that was read, for follow-up passes."""
     text, size_bytes, notes = read_text_limited(html_path, max_bytes=max_bytes)
     title = extract_title(text) or html_path.stem
     eff_type = detect_type(text)
     features = detect_features(text)
     categories, tags = infer_categories_and_tags(text)
+    colors, palettes_used = extract_colors(text, palettes if palettes is not None else load_palettes(root))
 
     # If it includes both canvas and three hints, add note
     if HAS_THREE_RE.search(text) and HAS_CANVAS_RE.search(text):
@@ -264,23 +442,107 @@ def build_record(root: Path, html_path: Path, max_bytes: int) -> EffectRecord:
     eff_id = slugify(f"jazer-{base_name}")
 
     mtime = datetime.fromtimestamp(html_path.stat().st_mtime, tz=timezone.utc).isoformat()
+    source_sha = hashlib.sha1(html_path.read_bytes()).hexdigest()[:16]
 
     gpu_tier = infer_gpu_tier(eff_type, features, size_bytes)
 
-    return EffectRecord(
+    rec = EffectRecord(
         id=eff_id,
         name=strip_html(nice_name),
         title=strip_html(title) if title else strip_html(nice_name),
         type=eff_type,
         path=relpath_str(root, html_path),
         size_bytes=size_bytes,
+        source_sha=source_sha,
         modified_utc=mtime,
         categories=categories,
+        category=primary_category(categories),
         tags=tags,
         features=sorted(set(features)),
         gpu_tier=gpu_tier,
+        colors=colors,
+        palettes=palettes_used,
         notes=notes,
     )
+    return rec, text
+
+
+def add_neighbors(effects: list[dict], texts: list[str], k: int) -> bool:
+    """Attach TF-IDF `similar` lists; returns False (and leaves records as-is) without NumPy."""
+    try:
+        from effect_similarity import attach_neighbors
+    except ImportError as e:
+        print(f"WARN: skipping similar-effect neighbors ({e})", file=sys.stderr)
+        return False
+    attach_neighbors(effects, texts, k)
+    return True
+
+
+def content_hash(value: dict) -> str:
+    """
+    Stable hash of a record or payload, ignoring key order and VOLATILE_KEYS. A record's
+    `similar` list enters as its neighbor ids only: TF-IDF scores (and ranks) shift for every
+    record whenever any effect is added or removed.
+    """
+    body = {k: v for k, v in value.items() if k not in VOLATILE_KEYS}
+    if "similar" in body:
+        body["similar"] = sorted(n["id"] for n in body["similar"])
+    blob = json.dumps(body, sort_keys=True, separators=(",", ":"), ensure_ascii=False)
+    return hashlib.sha1(blob.encode("utf-8")).hexdigest()[:16]
+
+
+def manifest_hash(payload: dict) -> str:
+    """Hash of a whole manifest; also works on manifests written before records had hashes."""
+    body = {k: v for k, v in payload.items() if k not in VOLATILE_KEYS}
+    body["effects"] = [content_hash(e) for e in payload.get("effects", [])]
+    return content_hash(body)
+
+
+def load_previous(path: Path) -> Optional[dict]:
+    try:
+        payload = json.loads(path.read_text(encoding="utf-8"))
+    except (OSError, ValueError):
+        return None
+    return payload if isinstance(payload, dict) else None
+
+
+def manifest_delta(prev: dict, payload: dict) -> dict:
+    """
+    Patch from `prev` to `payload`: full records for added effects, ids for removed ones, and
+    for changed ones only the fields that differ (`set` new values, `unset` dropped keys).
+    A record counts as changed only when its content_hash differs; its new modified_utc then
+    rides along in `set`.
+    `order` is included when applying the patch would not reproduce the new effect order, and
+    top-level `set` when a non-effect key (modules, ignore_dirs, ...) changed.
+    """
+    old = {e["id"]: e for e in prev.get("effects", [])}
+    new = {e["id"]: e for e in payload.get("effects", [])}
+    delta: dict = {
+        "schema_version": 1,
+        "base": {"generated_utc": prev.get("generated_utc", ""), "content_hash": manifest_hash(prev)},
+        "target": {"generated_utc": payload["generated_utc"], "content_hash": payload["content_hash"]},
+        "added": [e for eid, e in new.items() if eid not in old],
+        "removed": [eid for eid in old if eid not in new],
+        "changed": [],
+    }
+    for eid, rec in new.items():
+        before = old.get(eid)
+        if before is None or content_hash(before) == rec["content_hash"]:
+            continue
+        changes = {"id": eid, "content_hash": rec["content_hash"],
+                   "set": {k: v for k, v in rec.items() if k != "content_hash" and before.get(k) != v}}
+        unset = sorted(k for k in before if k not in rec and k != "content_hash")
+        if unset:
+            changes["unset"] = unset
+        delta["changed"].append(changes)
+    patched_order = [eid for eid in old if eid in new] + [e["id"] for e in delta["added"]]
+    if patched_order != list(new):
+        delta["order"] = list(new)
+    top = {k: v for k, v in payload.items()
+           if k not in VOLATILE_KEYS and k != "effects" and prev.get(k) != v}
+    if top:
+        delta["set"] = top
+    return delta
 
 
 def write_json(out_path: Path, payload: dict) -> None:
@@ -324,6 +586,14 @@ def main() -> int:
     ap.add_argument("--no-md", action="store_true", help="Do not emit markdown summary")
     ap.add_argument("--max-bytes", type=int, default=DEFAULT_MAX_BYTES, help="Max bytes to read per HTML file")
     ap.add_argument("--ignore", nargs="*", default=sorted(DEFAULT_IGNORE_DIRS), help="Directory names to ignore")
+    ap.add_argument("--neighbors", type=int, default=DEFAULT_NEIGHBORS, help="TF-IDF similar effects per record (0 = off; needs NumPy)")
+    ap.add_argument("--module-dir", default=DEFAULT_MODULE_DIR, help="Directory (relative to root) scanned for effect class modules")
+    ap.add_argument("--out-registry", default=DEFAULT_REGISTRY_OUT, help="Generated lazy EffectRegistry module (relative to root if not absolute)")
+    ap.add_argument("--no-registry", action="store_true", help="Do not regenerate the EffectRegistry module")
+    ap.add_argument("--catalog", nargs="?", const=DEFAULT_CATALOG, help=f"Also update the SQLite catalog (default path: {DEFAULT_CATALOG}, relative to root)")
+    ap.add_argument("--out-delta", help="Delta against the previous manifest (default: <out-json stem>.delta.json next to it)")
+    ap.add_argument("--no-delta", action="store_true", help="Do not write the delta file")
+    ap.add_argument("--force", action="store_true", help="Rewrite outputs even when the content hash is unchanged")
     args = ap.parse_args()
 
     root = Path(args.root).expanduser()
@@ -334,37 +604,109 @@ def main() -> int:
     ignore_dirs = set(args.ignore)
 
     html_files = find_candidate_html_files(root, ignore_dirs=ignore_dirs)
+    palettes = load_palettes(root)
 
     effects: list[dict] = []
+    texts: list[str] = []
     for p in html_files:
-        rec = build_record(root, p, max_bytes=args.max_bytes)
+        rec, text = scan_effect(root, p, max_bytes=args.max_bytes, palettes=palettes)
         effects.append(asdict(rec))
+        texts.append(text)
+
+    if args.neighbors > 0:
+        add_neighbors(effects, texts, args.neighbors)
+
+    for e in effects:
+        e["content_hash"] = content_hash(e)
+
+    modules = find_effect_modules(root, args.module_dir, ignore_dirs, max_bytes=args.max_bytes)
 
     payload = {
         "schema_version": 1,
         "generated_utc": datetime.now(tz=timezone.utc).isoformat(),
+        "content_hash": "",
         "root": str(root),
         "ignore_dirs": sorted(ignore_dirs),
         "max_bytes_per_file": args.max_bytes,
         "effects": effects,
+        "modules": [asdict(m) for m in modules],
     }
+    payload["content_hash"] = manifest_hash(payload)
 
     out_json = Path(args.out_json)
     if not out_json.is_absolute():
         out_json = root / out_json
-
-    write_json(out_json, payload)
-
-    if not args.no_md:
-        out_md = Path(args.out_md)
-        if not out_md.is_absolute():
-            out_md = root / out_md
-        write_md(out_md, payload)
-
-    print(f"OK: wrote {len(effects)} effects to:")
-    print(f" - {out_json}")
-    if not args.no_md:
-        print(f" - {out_md}")
+    out_delta = Path(args.out_delta) if args.out_delta else out_json.with_name(out_json.stem + ".delta.json")
+    if not out_delta.is_absolute():
+        out_delta = root / out_delta
+    out_md = Path(args.out_md)
+    if not out_md.is_absolute():
+        out_md = root / out_md
+
+    # Unchanged content keeps the previous bytes (and generated_utc), so caches stay valid.
+    prev = load_previous(out_json)
+    if prev is not None:
+        # mtimes are per checkout: keep the previous modified_utc while the file bytes are the
+        # same, and the previous `similar` scores while the neighbor set is, so a rewrite only
+        # touches the records that actually changed (and matches what the delta patches).
+        before = {e.get("id"): e for e in prev.get("effects", [])}
+        for e in effects:
+            old = before.get(e["id"])
+            if old is None:
+                continue
+            if "modified_utc" in old and old.get("source_sha") == e["source_sha"]:
+                e["modified_utc"] = old["modified_utc"]
+            if "similar" in e and "similar" in old and content_hash(old) == e["content_hash"]:
+                e["similar"] = old["similar"]
+    unchanged = prev is not None and manifest_hash(prev) == payload["content_hash"] and not args.force
+    delta = None
+    if unchanged:
+        payload["generated_utc"] = prev.get("generated_utc", payload["generated_utc"])
+    else:
+        if prev is not None and not args.no_delta:
+            delta = manifest_delta(prev, payload)
+            write_json(out_delta, delta)
+        write_json(out_json, payload)
+        if not args.no_md:
+            write_md(out_md, payload)
+
+    # Keep the lazy registry in lockstep with the manifest it is derived from.
+    write_reg = not args.no_registry and not unchanged
+    if write_reg:
+        from build_effect_registry import write_registry
+        out_registry = Path(args.out_registry)
+        if not out_registry.is_absolute():
+            out_registry = root / out_registry
+        write_registry(root, payload["modules"], out_registry, source=relpath_str(root, out_json))
+
+    catalog_stats = None
+    if args.catalog:
+        from effect_catalog import connect, sync
+        out_catalog = Path(args.catalog)
+        if not out_catalog.is_absolute():
+            out_catalog = root / out_catalog
+        conn = connect(out_catalog)
+        try:
+            catalog_stats = sync(conn, effects, {e["id"]: t for e, t in zip(effects, texts)}, root=root,
+                                 generated_utc=payload["generated_utc"])
+        finally:
+            conn.close()
+
+    if unchanged:
+        print(f"OK: {len(effects)} effects, {len(modules)} effect modules unchanged "
+              f"(content_hash {payload['content_hash']}); manifest not rewritten")
+    else:
+        print(f"OK: wrote {len(effects)} effects, {len(modules)} effect modules to:")
+        print(f" - {out_json}")
+        if not args.no_md:
+            print(f" - {out_md}")
+        if delta is not None:
+            print(f" - {out_delta} ({len(delta['added'])} added, {len(delta['removed'])} removed, "
+                  f"{len(delta['changed'])} changed)")
+    if write_reg:
+        print(f" - {out_registry}")
+    if catalog_stats is not None:
+        print(f" - {out_catalog} (" + ", ".join(f"{v} {k}" for k, v in catalog_stats.items()) + ")")
     return 0
 
 
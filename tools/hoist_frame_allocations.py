@@ -0,0 +1,426 @@
+"""
+Hoist per-frame THREE allocations out of effect render loops.
+
+Inside each requestAnimationFrame callback (`animate`, `render`, ...), a call such
+as `new THREE.Vector3(...)` allocates on every frame (and on every iteration
+when it sits in a loop). Sites that provably do not outlive the frame are
+rewritten to a preallocated module-scope scratch instance reset with `.set(...)`:
+
+  const dir = new THREE.Vector3(x, y, z).normalize();    // temporary that never escapes
+  m.scale(new THREE.Vector3(1, h, 1));                   // argument THREE only reads
+  mat.color = new THREE.Color(c);                        // -> mat.color.set(c)
+
+Anything else (stored, returned, pushed, passed to unknown code) is left alone
+and reported as skipped. The scratch declarations go after the module's imports
+under MARKER, so re-running only picks up new sites.
+
+This module reports; tools/codemod.py applies (rule `hoist-allocations`):
+  python tools/hoist_frame_allocations.py
+  python tools/codemod.py --rules hoist-allocations --dry-run
+  python tools/codemod.py --rules hoist-allocations
+"""
+
+from __future__ import annotations
+
+import argparse
+import re
+from dataclasses import dataclass, field
+from pathlib import Path
+
+
+MARKER = "// --- JaZeR frame scratch (hoisted) ---"
+
+# class -> (reset method, constructor defaults used to pad missing args)
+HOISTABLE: dict[str, tuple[str, tuple[str, ...]]] = {
+  "Vector2": ("set", ("0", "0")),
+  "Vector3": ("set", ("0", "0", "0")),
+  "Vector4": ("set", ("0", "0", "0", "1")),
+  "Quaternion": ("set", ("0", "0", "0", "1")),
+  "Euler": ("set", ("0", "0", "0")),
+  "Color": ("set", ()),        # special-cased in reset_call()
+  "Matrix4": ("set", ()),      # special-cased in reset_call()
+}
+
+# THREE methods that read (copy from) their arguments and never keep a reference.
+READS_ARGS = frozenset({
+  "add", "addScaledVector", "addVectors", "angleTo", "applyEuler", "applyMatrix3", "applyMatrix4",
+  "applyQuaternion", "clamp", "compose", "copy", "cross", "crossVectors", "distanceTo",
+  "distanceToSquared", "dot", "equals", "lerp", "lerpColors", "lerpVectors", "lookAt",
+  "makeRotationAxis", "makeRotationFromEuler", "makeRotationFromQuaternion", "max", "min", "multiply",
+  "multiplyMatrices", "multiplyQuaternions", "multiplyVectors", "premultiply", "projectOnPlane", "projectOnVector", "reflect", "scale",
+  "setFromAxisAngle", "setFromEuler", "setFromMatrixPosition", "setFromQuaternion",
+  "setFromRotationMatrix", "setFromUnitVectors", "setPosition", "setRotationFromEuler",
+  "setRotationFromMatrix", "setRotationFromQuaternion", "slerp", "sub", "subVectors",
+})
+# Methods that overwrite every component, so a no-arg allocation chained into
+# one of them needs no reset.
+OVERWRITES = frozenset({
+  "addVectors", "copy", "crossVectors", "lerpColors", "lerpVectors", "makeRotationAxis",
+  "makeRotationFromEuler", "makeRotationFromQuaternion", "makeRotationX", "makeRotationY",
+  "makeRotationZ", "makeScale", "makeTranslation", "multiplyMatrices", "multiplyQuaternions",
+  "set", "setFromAxisAngle", "setFromEuler", "setFromQuaternion", "setFromRotationMatrix",
+  "setFromUnitVectors", "setHSL", "setRGB", "setScalar", "subVectors",
+})
+COLOR_PROPS = ("color", "emissive", "specular")
+
+RAF_RE = re.compile(r"requestAnimationFrame\(\s*(?:__jazerPerfFrame\()?(\w+)\s*\)")
+ALLOC_RE = re.compile(r"\bnew\s+THREE\.(" + "|".join(HOISTABLE) + r")\s*\(")
+LOOP_RE = re.compile(r"\bfor\s*\(|\bwhile\s*\(|\.(?:forEach|map)\s*\(")
+FOR_BOUND_RE = re.compile(r"\bfor\s*\(\s*let\s+\w+\s*=\s*0\s*;\s*\w+\s*<\s*(\w+)\s*;")
+SCRATCH_DECL_RE = re.compile(r"^\s*const scratch\w+ = new THREE\.\w+\(\);$")
+
+
+@dataclass
+class Site:
+  cls: str
+  line: int
+  kind: str                    # "temp" | "arg" | "assign" | "skip"
+  reason: str = ""
+  loop_bound: int | None = None
+  in_loop: bool = False
+
+
+@dataclass
+class Report:
+  sites: list[Site] = field(default_factory=list)
+
+  @property
+  def hoisted(self) -> list[Site]:
+    return [s for s in self.sites if s.kind != "skip"]
+
+  @property
+  def skipped(self) -> list[Site]:
+    return [s for s in self.sites if s.kind == "skip"]
+
+  def per_frame(self) -> tuple[int, bool]:
+    """(allocations removed per frame, exact?) - loops with an unknown bound count once."""
+    total, exact = 0, True
+    for s in self.hoisted:
+      if s.in_loop and s.loop_bound is None:
+        exact = False
+      total += s.loop_bound if s.in_loop and s.loop_bound is not None else 1
+    return total, exact
+
+
+# --- minimal JS scanning ------------------------------------------------------
+
+def skip_literal(text: str, i: int) -> int:
+  """If text[i] starts a string or comment, return the index after it; else i."""
+  c = text[i]
+  if c in "'\"`":
+    j = i + 1
+    while j < len(text) and text[j] != c:
+      j += 2 if text[j] == "\\" else 1
+    return j + 1
+  if text.startswith("//", i):
+    j = text.find("\n", i)
+    return len(text) if j < 0 else j
+  if text.startswith("/*", i):
+    j = text.find("*/", i + 2)
+    return len(text) if j < 0 else j + 2
+  return i
+
+
+def match_close(text: str, i: int) -> int:
+  """text[i] is an opening bracket; return the index just after its partner."""
+  depth = 0
+  while i < len(text):
+    j = skip_literal(text, i)
+    if j != i:
+      i = j
+      continue
+    c = text[i]
+    if c in "([{":
+      depth += 1
+    elif c in ")]}":
+      depth -= 1
+      if depth == 0:
+        return i + 1
+    i += 1
+  return len(text)
+
+
+def split_args(s: str) -> list[str]:
+  args, depth, start, i = [], 0, 0, 0
+  while i < len(s):
+    j = skip_literal(s, i)
+    if j != i:
+      i = j
+      continue
+    if s[i] in "([{":
+      depth += 1
+    elif s[i] in ")]}":
+      depth -= 1
+    elif s[i] == "," and depth == 0:
+      args.append(s[start:i].strip())
+      start = i + 1
+    i += 1
+  tail = s[start:].strip()
+  return args + [tail] if tail or args else args
+
+
+def function_body(text: str, name: str) -> tuple[int, int] | None:
+  n = re.escape(name)
+  m = re.search(rf"\bfunction\s+{n}\s*\([^)]*\)\s*\{{", text) or re.search(
+    rf"\b(?:const|let|var)\s+{n}\s*=\s*(?:function\s*)?\([^)]*\)\s*(?:=>\s*)?\{{", text
+  )
+  if m is None:
+    return None
+  return m.end(), match_close(text, m.end() - 1) - 1
+
+
+def enclosing_call(text: str, lo: int, pos: int) -> tuple[int, str] | None:
+  """Innermost unclosed '(' between lo and pos, and the `.method` name before it."""
+  depth = 0
+  i = pos - 1
+  while i >= lo:
+    c = text[i]
+    if c in ")]}":
+      depth += 1
+    elif c in "([{":
+      if depth == 0:
+        if c != "(":
+          return None
+        m = re.search(r"\.\s*(\w+)\s*$", text[max(lo, i - 64):i])
+        return (i, m.group(1)) if m else (i, "")
+      depth -= 1
+    i -= 1
+  return None
+
+
+def chain_end(text: str, i: int) -> int:
+  """Extend past `.method(...)` chains starting at i."""
+  while True:
+    m = re.match(r"\s*\.\s*\w+\s*\(", text[i:])
+    if not m:
+      return i
+    i = match_close(text, i + m.end() - 1)
+
+
+def is_read_only_arg(text: str, lo: int, start: int, end: int) -> bool:
+  """text[start:end] is a whole argument of a READS_ARGS method call."""
+  before = text[lo:start].rstrip()
+  after = text[end:].lstrip()
+  if not before or before[-1] not in "(," or not after or after[0] not in "),":
+    return False
+  call = enclosing_call(text, lo, start)
+  return call is not None and call[1] in READS_ARGS
+
+
+def name_escapes(text: str, name: str, lo: int, hi: int) -> bool:
+  for m in re.finditer(rf"(?<![\w.$]){re.escape(name)}\b", text[lo:hi]):
+    s, e = lo + m.start(), lo + m.end()
+    if re.match(r"\s*\.(?!\.)", text[e:]):
+      continue  # member access / method call on the scratch itself
+    if is_read_only_arg(text, lo, s, e):
+      continue
+    return True
+  return False
+
+
+def loop_extents(text: str, lo: int, hi: int) -> list[tuple[int, int, int | None]]:
+  out = []
+  for m in LOOP_RE.finditer(text, lo, hi):
+    head_end = match_close(text, m.end() - 1)
+    bound = None
+    fm = FOR_BOUND_RE.match(text, m.start())
+    if fm:
+      bound = resolve_int(text, fm.group(1))
+    if m.group(0).startswith("."):
+      out.append((m.start(), head_end, bound))
+      continue
+    body = re.match(r"\s*\{", text[head_end:])
+    end = match_close(text, head_end + body.end() - 1) if body else text.find(";", head_end) + 1
+    out.append((m.start(), end, bound))
+  return out
+
+
+def resolve_int(text: str, token: str) -> int | None:
+  if token.isdigit():
+    return int(token)
+  m = re.search(rf"\b(?:const|let|var)\s+{re.escape(token)}\s*=\s*(\d+)\s*;", text)
+  return int(m.group(1)) if m else None
+
+
+# --- rewriting ------------------------------------------------------------------
+
+def reset_call(cls: str, raw_args: str) -> str:
+  """Equivalent of `new THREE.<cls>(raw_args)` on an existing instance (argument text kept as written)."""
+  args = split_args(raw_args)
+  if cls == "Color":
+    if not args:
+      return "setRGB(1, 1, 1)"
+    return f"{'set' if len(args) == 1 else 'setRGB'}({raw_args})"
+  if cls == "Matrix4":
+    return f"set({raw_args})" if args else "identity()"
+  method, defaults = HOISTABLE[cls]
+  if len(args) >= len(defaults):
+    return f"{method}({raw_args})"
+  return f"{method}({', '.join(args + list(defaults[len(args):]))})"
+
+
+def next_scratch_name(text: str, cls: str, taken: set[str]) -> str:
+  n = 0
+  while True:
+    suffix = chr(ord("A") + n % 26) + (str(n // 26) if n >= 26 else "")
+    name = f"scratch{cls}{suffix}"
+    if name not in taken and not re.search(rf"\b{name}\b", text):
+      taken.add(name)
+      return name
+    n += 1
+
+
+def insert_declarations(text: str, decls: list[str]) -> str:
+  lines = text.split("\n")
+  if MARKER in text:
+    i = next(i for i, l in enumerate(lines) if l.strip() == MARKER)
+    indent = lines[i][: len(lines[i]) - len(lines[i].lstrip())]
+    j = i + 1
+    while j < len(lines) and SCRATCH_DECL_RE.match(lines[j]):
+      j += 1
+    lines[j:j] = [indent + d for d in decls]
+    return "\n".join(lines)
+
+  script_idx = next((i for i, l in enumerate(lines) if "<script" in l and 'type="module"' in l), None)
+  if script_idx is None:
+    return text
+  i = script_idx + 1
+  while i < len(lines) and lines[i].strip() == "":
+    i += 1
+  indent = lines[i][: len(lines[i]) - len(lines[i].lstrip())] if i < len(lines) else ""
+  j = i
+  while j < len(lines) and lines[j].lstrip().startswith("import "):
+    j += 1
+  block = ["", indent + MARKER] + [indent + d for d in decls]
+  if j < len(lines) and lines[j].strip() != "":
+    block.append("")
+  lines[j:j] = block
+  return "\n".join(lines)
+
+
+def hoist_text(text: str) -> tuple[str, Report]:
+  report = Report()
+  if "THREE" not in text or not re.search(r'<script[^>]*type="module"', text):
+    return text, report
+
+  edits: list[tuple[int, int, str]] = []
+  decls: list[str] = []
+  taken: set[str] = set()
+  seen: set[tuple[int, int]] = set()
+
+  for name in dict.fromkeys(RAF_RE.findall(text)):
+    span = function_body(text, name)
+    if span is None or span in seen:
+      continue
+    seen.add(span)
+    lo, hi = span
+    loops = loop_extents(text, lo, hi)
+
+    for m in ALLOC_RE.finditer(text, lo, hi):
+      cls = m.group(1)
+      open_paren = m.end() - 1
+      close = match_close(text, open_paren)
+      raw_args = text[open_paren + 1: close - 1]
+      site = Site(cls, text.count("\n", 0, m.start()) + 1, "skip")
+      enclosing = [l for l in loops if l[0] < m.start() < l[1]]
+      site.in_loop = bool(enclosing)
+      site.loop_bound = enclosing[-1][2] if enclosing else None
+      report.sites.append(site)
+
+      if any(s < m.start() < e for s, e, _ in edits):
+        site.reason = "nested in another hoisted allocation"
+        continue
+
+      prefix = text[max(lo, m.start() - 200): m.start()]
+      decl = re.search(r"\bconst\s+(\w+)\s*=\s*$", prefix)
+      assign = re.search(r"\.\s*(" + "|".join(COLOR_PROPS) + r")(\s*=\s*)$", prefix)
+
+      if assign and cls == "Color" and re.match(r"\s*;", text[close:]):
+        start = m.start() - len(assign.group(2))
+        edits.append((start, close, f".{reset_call(cls, raw_args)}"))
+        site.kind = "assign"
+        continue
+
+      if decl:
+        var = decl.group(1)
+        stmt_end = chain_end(text, close)
+        if not re.match(r"\s*[;\n]", text[stmt_end:]):
+          site.reason = f"'{var}' initializer continues past the allocation"
+          continue
+        if name_escapes(text, var, stmt_end, hi):
+          site.reason = f"'{var}' escapes the frame (stored, returned or passed on)"
+          continue
+        site.kind = "temp"
+      elif is_read_only_arg(text, lo, m.start(), chain_end(text, close)):
+        site.kind = "arg"
+      else:
+        site.reason = "value is kept (assigned, returned or passed to unknown code)"
+        continue
+
+      scratch = next_scratch_name(text, cls, taken)
+      decls.append(f"const {scratch} = new THREE.{cls}();")
+      chained = re.match(r"\s*\.\s*(\w+)\s*\(", text[close:])
+      if not split_args(raw_args) and chained and chained.group(1) in OVERWRITES:
+        edits.append((m.start(), close, scratch))
+      else:
+        edits.append((m.start(), close, f"{scratch}.{reset_call(cls, raw_args)}"))
+
+  if not edits:
+    return text, report
+  for start, end, repl in sorted(edits, reverse=True):
+    text = text[:start] + repl + text[end:]
+  if decls:
+    text = insert_declarations(text, decls)
+  return text, report
+
+
+def parse_args() -> argparse.Namespace:
+  p = argparse.ArgumentParser(description="Report per-frame THREE allocations that can be hoisted into scratch objects")
+  p.add_argument("--only", action="append", default=[], help="Only check specific effect file stems; can repeat")
+  p.add_argument("--verbose", action="store_true", help="List every site, including skipped ones")
+  return p.parse_args()
+
+
+def normalize_only(values: list[str]) -> set[str]:
+  out: set[str] = set()
+  for v in values:
+    v = v.strip()
+    if not v:
+      continue
+    if v.lower().endswith(".html"):
+      v = v[:-5]
+    out.add(v)
+  return out
+
+
+def main() -> int:
+  args = parse_args()
+  root = Path(__file__).resolve().parents[1]
+  only = normalize_only(args.only)
+
+  total_sites = total_frame = 0
+  for path in sorted((root / "effects").glob("*.html")):
+    if path.name.lower() == "gallery.html" or (only and path.stem not in only):
+      continue
+    _, report = hoist_text(path.read_text(encoding="utf-8", errors="replace").replace("\r\n", "\n"))
+    if not report.sites:
+      continue
+    per_frame, exact = report.per_frame()
+    if report.hoisted:
+      total_sites += len(report.hoisted)
+      total_frame += per_frame
+      print(f"{path.name}: {len(report.hoisted)} site(s), {'' if exact else '>= '}{per_frame} allocation(s)/frame removed")
+    for s in report.sites:
+      if s.kind == "skip":
+        print(f"  [SKIP] {path.name}:{s.line} THREE.{s.cls}: {s.reason}")
+      elif args.verbose:
+        loop = f" x{s.loop_bound}" if s.in_loop and s.loop_bound else (" (loop)" if s.in_loop else "")
+        print(f"  [{s.kind.upper()}] {path.name}:{s.line} THREE.{s.cls}{loop}")
+
+  print(f"Hoistable: {total_sites} site(s), >= {total_frame} allocation(s) per frame across effects.")
+  print("Apply with: python tools/codemod.py --rules hoist-allocations")
+  return 0
+
+
+if __name__ == "__main__":
+  raise SystemExit(main())
@@ -1,15 +1,19 @@
 from __future__ import annotations
 
 import argparse
+import re
 from pathlib import Path
 
+from effect_facts import PARTICLE_COUNT_DECL_RE, PARTICLE_COUNT_MIN, lf_text, restore_newlines, uses_quality_system
+
 
 UI_IMPORT = "import { attachEffectUI } from '../lib/engine/jazer-effect-ui-schema.js';"
 MARKER = "// --- JaZeR UI schema (injected) ---"
 
-
-def detect_newline(raw: bytes) -> str:
-  return "\r\n" if b"\r\n" in raw else "\n"
+QUALITY_MARKER = "// --- JaZeR quality overrides (injected) ---"
+PIXEL_RATIO_RE = re.compile(
+  r"^([ \t]*)([A-Za-z_$][\w$]*)\.setPixelRatio\(\s*Math\.min\(\s*(?:window\.)?devicePixelRatio\s*,\s*([\d.]+)\s*\)\s*\);?[ \t]*$"
+)
 
 
 def inject_into_html(text: str) -> str | None:
@@ -62,6 +66,57 @@ def inject_into_html(text: str) -> str | None:
   return "\n".join(lines)
 
 
+def wire_quality_overrides(text: str) -> str | None:
+  """
+  Route the operator Performance params into a standalone effect, in the module script
+  that imports attachEffectUI:
+  - after `<renderer>.setPixelRatio(Math.min(devicePixelRatio, N))`, bindRendererQuality()
+    keeps the pixel ratio under params.resolutionScale
+  - particle-like `const <name>Count = N;` (N >= PARTICLE_COUNT_MIN) becomes `particleBudget(N)`
+    (params.particleBudget)
+  Effects on the quality system (effect_facts.uses_quality_system) already honor them.
+  Returns None when already wired or there is nothing to wire.
+  """
+  if QUALITY_MARKER in text or uses_quality_system(text):
+    return None
+  lines = text.split("\n")
+  imp = next((i for i, l in enumerate(lines) if l.strip() == UI_IMPORT), None)
+  if imp is None:
+    return None
+  end = next((i for i in range(imp, len(lines)) if "</script>" in lines[i]), len(lines))
+
+  used: set[str] = set()
+
+  def budget(m: re.Match) -> str:
+    if int(m.group(2)) < PARTICLE_COUNT_MIN:
+      return m.group(0)
+    used.add("particleBudget")
+    return f"const {m.group(1)} = particleBudget({m.group(2)});"
+
+  out: list[str] = []
+  for i, line in enumerate(lines):
+    if imp < i < end:
+      line = PARTICLE_COUNT_DECL_RE.sub(budget, line)
+      m = PIXEL_RATIO_RE.match(line)
+      if m:
+        out.append(line)
+        line = f"{m.group(1)}bindRendererQuality({m.group(2)}, {{ maxPixelRatio: {m.group(3)} }});"
+        used.add("bindRendererQuality")
+    out.append(line)
+    if i == imp:
+      marker_at = len(out)
+  if not used:
+    return None
+
+  indent = lines[imp][: len(lines[imp]) - len(lines[imp].lstrip())]
+  names = ", ".join(n for n in ("bindRendererQuality", "particleBudget") if n in used)
+  out[marker_at:marker_at] = [
+    indent + QUALITY_MARKER,
+    indent + f"import {{ {names} }} from '../lib/engine/jazer-effect-ui-schema.js';",
+  ]
+  return "\n".join(out)
+
+
 def ensure_schema(effect_html: Path, schema_dir: Path) -> None:
   name = effect_html.stem
   schema_path = schema_dir / f"{name}.ui.json"
@@ -168,10 +223,13 @@ def main() -> int:
       continue
 
     raw = path.read_bytes()
-    nl = detect_newline(raw)
-    text = raw.decode("utf-8", errors="replace")
+    # Both rewrites work on LF lines; restore_newlines() puts CRLF files back as CRLF.
+    text = lf_text(raw)
 
     updated = inject_into_html(text)
+    wired = wire_quality_overrides(updated if updated is not None else text)
+    if wired is not None:
+      updated = wired
     if updated is None:
       skipped += 1
       continue
@@ -180,13 +238,7 @@ def main() -> int:
       print(f"[DRY] inject: {path}")
       changed += 1
     else:
-      out = nl.join(updated.split("\n"))
-      if raw.endswith(b"\r\n"):
-        out = out + "\r\n"
-      elif raw.endswith(b"\n"):
-        out = out + "\n"
-
-      path.write_text(out, encoding="utf-8", newline="")
+      path.write_text(restore_newlines(raw, updated), encoding="utf-8", newline="")
       changed += 1
 
   if args.dry_run:
@@ -0,0 +1,151 @@
+"""
+Inject (or strip) frame-timing instrumentation in effects/*.html.
+
+Each `requestAnimationFrame(cb)` with a named callback becomes
+`requestAnimationFrame(__jazerPerfFrame(cb))`, and the module imports wrapFrame
+from lib/runtime/jazer-perf.js under MARKER (which also makes injection
+idempotent). The page then exposes window.JAZER_PERF (p50/p95/p99, long frames).
+
+--strip is the exact inverse, for release builds (build_effects_dist.py
+--strip-perf does the same on the dist copy without touching sources).
+
+Usage:
+  python tools/inject_perf_timing.py --dry-run
+  python tools/inject_perf_timing.py --only jazer-neon-ocean
+  python tools/inject_perf_timing.py --strip
+"""
+
+from __future__ import annotations
+
+import argparse
+import re
+from pathlib import Path
+
+from effect_facts import restore_newlines
+
+
+MARKER = "// --- JaZeR perf timing (injected) ---"
+PERF_IMPORT = "import { wrapFrame as __jazerPerfFrame } from '../lib/runtime/jazer-perf.js';"
+
+RAF_RE = re.compile(r"\brequestAnimationFrame\(\s*([A-Za-z_$][\w$]*)\s*\)")
+IMPORT_END_RE = re.compile(r"""(?:;|['"])\s*$""")
+WRAPPED_RAF_RE = re.compile(r"\brequestAnimationFrame\(__jazerPerfFrame\(([A-Za-z_$][\w$]*)\)\)")
+
+
+def inject_text(text: str) -> tuple[str, int]:
+  """Returns (text, wrapped rAF call count); unchanged when already injected."""
+  if MARKER in text:
+    return text, 0
+
+  lines = text.split("\n")
+  script_idx = next((i for i, l in enumerate(lines) if "<script" in l and 'type="module"' in l), None)
+  if script_idx is None:
+    return text, 0
+
+  # Last line of the leading import block (imports may span lines: `import {\n a,\n} from '...';`).
+  last_import = None
+  in_import = False
+  for i in range(script_idx + 1, len(lines)):
+    s = lines[i].strip()
+    if s.startswith("import ") or in_import:
+      in_import = not IMPORT_END_RE.search(s)
+      if not in_import:
+        last_import = i
+    elif s and not s.startswith(("//", "/*", "*")):
+      break
+  if last_import is None:
+    return text, 0
+
+  body = "\n".join(lines[last_import + 1:])
+  body, n = RAF_RE.subn(lambda m: f"requestAnimationFrame(__jazerPerfFrame({m.group(1)}))", body)
+  if not n:
+    return text, 0
+
+  indent = lines[last_import][: len(lines[last_import]) - len(lines[last_import].lstrip())]
+  head = lines[: last_import + 1] + [indent + MARKER, indent + PERF_IMPORT]
+  return "\n".join(head) + "\n" + body, n
+
+
+def strip_text(text: str) -> tuple[str, int, bool]:
+  """
+  Inverse of inject_text(); returns (text, unwrapped rAF call count, changed). A page can be
+  changed with no calls unwrapped (gallery.html only imports the module for its side effects).
+  """
+  if MARKER not in text:
+    return text, 0, False
+  # MARKER and the import on the next line (PERF_IMPORT here; hand-written pages
+  # such as gallery.html import the module for its side effects instead).
+  lines = text.split("\n")
+  out: list[str] = []
+  i = 0
+  while i < len(lines):
+    if lines[i].strip() == MARKER:
+      i += 2 if i + 1 < len(lines) and lines[i + 1].lstrip().startswith("import ") else 1
+      continue
+    out.append(lines[i])
+    i += 1
+  text, n = WRAPPED_RAF_RE.subn(r"requestAnimationFrame(\1)", "\n".join(out))
+  return text, n, True
+
+
+def parse_args() -> argparse.Namespace:
+  p = argparse.ArgumentParser(description="Inject JaZeR frame-timing instrumentation into effects/*.html")
+  p.add_argument("--dry-run", action="store_true", help="Print actions without writing files")
+  p.add_argument("--only", action="append", default=[], help="Only target this effect (stem or filename); can repeat")
+  p.add_argument("--strip", action="store_true", help="Remove the instrumentation instead (release builds)")
+  return p.parse_args()
+
+
+def normalize_only(names: list[str]) -> set[str]:
+  out: set[str] = set()
+  for n in names:
+    n = n.strip()
+    if not n:
+      continue
+    if n.lower().endswith(".html"):
+      n = n[:-5]
+    out.add(n)
+  return out
+
+
+def main() -> int:
+  args = parse_args()
+  root = Path(__file__).resolve().parents[1]
+  only = normalize_only(args.only)
+
+  targets = sorted(p for p in (root / "effects").glob("*.html") if p.name.lower() != "gallery.html")
+  if only:
+    targets = [p for p in targets if p.stem in only]
+
+  verb = "strip" if args.strip else "instrument"
+  changed = calls = 0
+  untouched: list[str] = []
+
+  for path in targets:
+    raw = path.read_bytes()
+    text = raw.decode("utf-8", errors="replace").replace("\r\n", "\n").removesuffix("\n")
+    if args.strip:
+      updated, n, touched = strip_text(text)
+    else:
+      updated, n = inject_text(text)
+      touched = n > 0
+    if not touched:
+      if not args.strip and MARKER not in text:
+        untouched.append(path.stem)
+      continue
+    changed += 1
+    calls += n
+    if args.dry_run:
+      print(f"[DRY] {verb}: {path.name} ({n} rAF call(s))")
+    else:
+      path.write_text(restore_newlines(raw, updated), encoding="utf-8", newline="")
+
+  prefix = "Dry-run: would " if args.dry_run else ""
+  print(f"{prefix}{verb} {changed} file(s), {calls} rAF call(s).")
+  if untouched:
+    print(f"No named rAF callback (not instrumented): {', '.join(untouched)}")
+  return 0
+
+
+if __name__ == "__main__":
+  raise SystemExit(main())
@@ -1,16 +1,46 @@
 from __future__ import annotations
 
+import argparse
+import hashlib
 import json
+import os
 import re
+import subprocess
+from concurrent.futures import ProcessPoolExecutor
 from dataclasses import dataclass
 from pathlib import Path
 
+from effect_facts import (
+  is_arr,
+  is_obj,
+  performance_params,
+  schema_action_names,
+  schema_effect_roots,
+  schema_param_keys,
+)
+
 
 @dataclass(frozen=True)
 class Issue:
   level: str  # "ERROR" | "WARN" | "INFO"
   file: Path
   message: str
+  rule: str = ""  # key of RULES
+
+
+RULES = {
+  "invalid-json": "Schema file is not valid JSON",
+  "schema-not-object": "Schema root must be an object",
+  "missing-title": "Schema has no title",
+  "defaults-not-object": "`defaults` must be an object",
+  "missing-default": "A params.* bind has no default",
+  "no-hud": "Hotkeys without a `hud` block",
+  "missing-html": "Schema has no matching effect HTML",
+  "not-wired": "Effect HTML does not call attachEffectUI",
+  "dead-control": "Bound param is never read by the effect",
+  "missing-expose": "effect.* root is not exposed by the effect",
+  "missing-action": "Hotkey action is not exposed by the effect",
+}
 
 
 def read_text(path: Path) -> str:
@@ -21,177 +51,383 @@ def load_json(path: Path) -> object:
   return json.loads(read_text(path))
 
 
-def is_obj(v: object) -> bool:
-  return isinstance(v, dict)
+# Everything the checks need from an effect, collected in one pass per file.
+# The alternatives mirror what the UI runtime accepts:
+#   JAZER_UI?.params?.key  JAZER_UI.params.key  ui.params.key  ui?.params?.key  ui.params?.key
+READ_PARAM_RE = re.compile(
+  r"(?:(?:window\.)?JAZER_UI\s*(?:\?\.\s*params\s*\?\.|\.\s*params\s*\.)"
+  r"|\bui\s*(?:\.\s*params\s*\.|\?\.\s*params\s*\?\.|\.\s*params\s*\?\.))"
+  r"\s*([A-Za-z_$][\w$]*)"
+)
+# expose('root', ...) / window.JAZER_EXPOSE?.('root', ...)
+EXPOSED_ROOT_RE = re.compile(r"(?:expose|JAZER_EXPOSE\?\.)\(\s*(['\"])([^'\"\n]+)\1\s*,")
+# Actions are matched literally, without whitespace: expose('name' / JAZER_EXPOSE?.('name'
+EXPOSED_ACTION_RE = re.compile(r"(?:expose|JAZER_EXPOSE\?\.)\((['\"])([^'\"\n]*)\1")
 
 
-def is_arr(v: object) -> bool:
-  return isinstance(v, list)
+@dataclass(frozen=True)
+class EffectIndex:
+  attach_ui: bool
+  read_params: frozenset[str]
+  exposed_roots: frozenset[str]
+  exposed_actions: frozenset[str]
+
+
+def index_effect(effect_html: str) -> EffectIndex:
+  """Tokenize an effect once; every lint check is then a set lookup."""
+  read_params = {m.group(1) for m in READ_PARAM_RE.finditer(effect_html)}
+  # Read by QualityAutoTuner / bindRendererQuality() / particleBudget() on the effect's behalf.
+  read_params.update(performance_params(effect_html))
+  return EffectIndex(
+    attach_ui="attachEffectUI(" in effect_html,
+    read_params=frozenset(read_params),
+    exposed_roots=frozenset(m.group(2) for m in EXPOSED_ROOT_RE.finditer(effect_html)),
+    exposed_actions=frozenset(m.group(2) for m in EXPOSED_ACTION_RE.finditer(effect_html)),
+  )
 
 
-def schema_param_keys(schema: dict) -> set[str]:
-  keys: set[str] = set()
+def file_has_attach_ui(effect_html: str) -> bool:
+  return "attachEffectUI(" in effect_html
 
-  def add_bind(bind: object) -> None:
-    if not isinstance(bind, str):
-      return
-    if bind.startswith("params."):
-      rest = bind[len("params.") :]
-      key = rest.split(".", 1)[0].split("[", 1)[0]
-      if key:
-        keys.add(key)
 
-  for ctl in schema.get("controls", []) if is_arr(schema.get("controls")) else []:
-    if is_obj(ctl):
-      add_bind(ctl.get("bind"))
-  for hk in schema.get("hotkeys", []) if is_arr(schema.get("hotkeys")) else []:
-    if is_obj(hk):
-      add_bind(hk.get("bind"))
+def file_has_exposed_action(effect_html: str, name: str) -> bool:
+  return name in index_effect(effect_html).exposed_actions
 
-  return keys
 
+def file_reads_param(effect_html: str, key: str) -> bool:
+  # Conservative: only treat as read if it comes from JAZER_UI.params or ui.params.
+  return key in index_effect(effect_html).read_params
 
-def schema_effect_roots(schema: dict) -> set[str]:
-  roots: set[str] = set()
 
-  def add_bind(bind: object) -> None:
-    if not isinstance(bind, str):
-      return
-    if not bind.startswith("effect."):
-      return
-    rest = bind[len("effect.") :]
-    root = rest.split(".", 1)[0].split("[", 1)[0]
-    if root:
-      roots.add(root)
+def file_exposes_effect_root(effect_html: str, root: str) -> bool:
+  return root in index_effect(effect_html).exposed_roots
 
-  for ctl in schema.get("controls", []) if is_arr(schema.get("controls")) else []:
-    if is_obj(ctl):
-      add_bind(ctl.get("bind"))
-  for hk in schema.get("hotkeys", []) if is_arr(schema.get("hotkeys")) else []:
-    if is_obj(hk):
-      add_bind(hk.get("bind"))
 
-  return roots
+def lint_schema(
+  schema_path: Path,
+  raw: object,
+  effect_html_path: Path,
+  effect_html: str | None,
+  index: EffectIndex | None = None,
+) -> list[Issue]:
+  """Lint one parsed schema against its effect HTML (None when the HTML is missing)."""
+  issues: list[Issue] = []
+  if not is_obj(raw):
+    issues.append(Issue("ERROR", schema_path, "Schema root must be an object", "schema-not-object"))
+    return issues
+
+  schema = raw
+  title = schema.get("title")
+  if not isinstance(title, str) or not title.strip():
+    issues.append(Issue("WARN", schema_path, "Missing/empty `title`", "missing-title"))
+
+  defaults = schema.get("defaults")
+  if defaults is not None and not is_obj(defaults):
+    issues.append(Issue("ERROR", schema_path, "`defaults` must be an object when present", "defaults-not-object"))
+    defaults = {}
+  if defaults is None:
+    defaults = {}
+
+  params = schema_param_keys(schema)
+  for key in sorted(params):
+    if key not in defaults:
+      issues.append(Issue("WARN", schema_path, f"Missing default for `params.{key}` (referenced by bind)", "missing-default"))
+
+  if is_arr(schema.get("hotkeys")) and schema.get("hud") is None:
+    issues.append(Issue("INFO", schema_path, "No `hud` block (HUD still auto-creates; add hud.toggleKey/visible to customize)", "no-hud"))
+
+  if effect_html is None:
+    # Some effects might not have an HTML partner (or name mismatch)
+    issues.append(Issue("WARN", schema_path, f"Missing effect HTML: {effect_html_path.name}", "missing-html"))
+    return issues
+
+  fx = index or index_effect(effect_html)
+  wired = fx.attach_ui
+  if not wired:
+    issues.append(Issue("WARN", schema_path, f"Effect not wired for schemas (missing `attachEffectUI`): {effect_html_path.name}", "not-wired"))
+
+  if wired:
+    for key in sorted(params):
+      if key not in fx.read_params:
+        issues.append(Issue("WARN", schema_path, f"Dead control: `params.{key}` never read in {effect_html_path.name}", "dead-control"))
 
+    for root_name in sorted(schema_effect_roots(schema)):
+      if root_name not in fx.exposed_roots:
+        issues.append(Issue("WARN", schema_path, f"Missing expose: `effect.{root_name}.*` referenced but `{root_name}` not exposed in {effect_html_path.name}", "missing-expose"))
 
-def schema_action_names(schema: dict) -> set[str]:
-  out: set[str] = set()
-  for hk in schema.get("hotkeys", []) if is_arr(schema.get("hotkeys")) else []:
-    if is_obj(hk) and isinstance(hk.get("action"), str):
-      out.add(hk["action"])
-  return out
+  for action in sorted(schema_action_names(schema)):
+    if action in {"reset", "resetParams"}:
+      # Provided by `attachEffectUI` even if the effect doesn't expose it explicitly.
+      continue
+    if action not in fx.exposed_actions:
+      issues.append(Issue("WARN", schema_path, f"Hotkey action `{action}` not found via expose/JAZER_EXPOSE in {effect_html_path.name}", "missing-action"))
 
+  return issues
 
-def file_has_attach_ui(effect_html: str) -> bool:
-  return "attachEffectUI(" in effect_html
 
+def effect_html_for(schema_path: Path, effects_dir: Path) -> Path:
+  return effects_dir / f"{schema_path.stem.replace('.ui', '')}.html"
 
-def file_has_exposed_action(effect_html: str, name: str) -> bool:
-  # Covers: expose('reset', ...) or window.JAZER_EXPOSE?.('reset', ...)
-  return (f"expose('{name}'" in effect_html) or (f'expose("{name}"' in effect_html) or (f"JAZER_EXPOSE?.('{name}'" in effect_html) or (f'JAZER_EXPOSE?.("{name}"' in effect_html)
 
+def lint_contents(schema_path: Path, schema_bytes: bytes, effect_html_path: Path, html_bytes: bytes | None) -> list[Issue]:
+  try:
+    raw = json.loads(schema_bytes.decode("utf-8", errors="replace"))
+  except Exception as e:
+    return [Issue("ERROR", schema_path, f"Invalid JSON: {e}", "invalid-json")]
+  effect_html = html_bytes.decode("utf-8", errors="replace") if html_bytes is not None else None
+  return lint_schema(schema_path, raw, effect_html_path, effect_html)
 
-def file_reads_param(effect_html: str, key: str) -> bool:
-  # Conservative: only treat as read if it comes from JAZER_UI.params or ui.params.
-  patterns = [
-    rf"(?:window\.)?JAZER_UI\s*\?\.\s*params\s*\?\.\s*{re.escape(key)}\b",
-    rf"(?:window\.)?JAZER_UI\s*\.\s*params\s*\.\s*{re.escape(key)}\b",
-    rf"\bui\s*\.\s*params\s*\.\s*{re.escape(key)}\b",
-    rf"\bui\s*\?\.\s*params\s*\?\.\s*{re.escape(key)}\b",
-    rf"\bui\s*\.\s*params\s*\?\.\s*{re.escape(key)}\b"
-  ]
-  return any(re.search(p, effect_html) for p in patterns)
 
+def read_pair(schema_path: Path, effects_dir: Path) -> tuple[bytes, Path, bytes | None]:
+  html_path = effect_html_for(schema_path, effects_dir)
+  try:
+    html_bytes = html_path.read_bytes()
+  except OSError:
+    html_bytes = None
+  return schema_path.read_bytes(), html_path, html_bytes
 
-def file_exposes_effect_root(effect_html: str, root: str) -> bool:
-  patterns = [
-    rf"expose\(\s*['\"]{re.escape(root)}['\"]\s*,",
-    rf"(?:window\.)?JAZER_EXPOSE\?\.\(\s*['\"]{re.escape(root)}['\"]\s*,"
-  ]
-  return any(re.search(p, effect_html) for p in patterns)
 
+def lint_path(schema_path: Path, effects_dir: Path) -> list[Issue]:
+  schema_bytes, html_path, html_bytes = read_pair(schema_path, effects_dir)
+  return lint_contents(schema_path, schema_bytes, html_path, html_bytes)
 
-def main() -> int:
-  root = Path(__file__).resolve().parents[1]
-  schema_dir = root / "effects" / "ui-schema"
-  effects_dir = root / "effects"
 
-  issues: list[Issue] = []
+def lint_paths(schema_paths: list[Path], effects_dir: Path, jobs: int = 1) -> list[Issue]:
+  """Lint schemas in order; jobs > 1 spreads them over a process pool (0 = CPU count)."""
+  jobs = jobs if jobs > 0 else (os.cpu_count() or 1)
+  if jobs == 1 or len(schema_paths) < 2:
+    return [i for p in schema_paths for i in lint_path(p, effects_dir)]
 
-  if not schema_dir.exists():
-    print(f"Missing schema dir: {schema_dir}")
-    return 2
+  chunk = max(1, len(schema_paths) // (jobs * 8))
+  with ProcessPoolExecutor(max_workers=jobs) as pool:
+    results = pool.map(lint_path, schema_paths, [effects_dir] * len(schema_paths), chunksize=chunk)
+    return [i for issues in results for i in issues]
+
+
+# --- result cache -------------------------------------------------------------
+# One entry per schema, keyed on hash(linter source + schema bytes + effect HTML
+# bytes). A stat() fingerprint short-circuits hashing for untouched pairs.
+
+CACHE_VERSION = 1
+
+
+def linter_fingerprint() -> str:
+  h = hashlib.blake2b(digest_size=16)
+  for mod in (__file__, str(Path(__file__).with_name("effect_facts.py"))):
+    h.update(Path(mod).read_bytes())
+  return h.hexdigest()
 
-  schema_paths = sorted(schema_dir.glob("*.ui.json"))
-  if not schema_paths:
-    print(f"No schemas found in: {schema_dir}")
-    return 2
 
-  for schema_path in schema_paths:
+def stat_key(*paths: Path) -> list[int]:
+  out: list[int] = []
+  for p in paths:
     try:
-      raw = load_json(schema_path)
-    except Exception as e:
-      issues.append(Issue("ERROR", schema_path, f"Invalid JSON: {e}"))
-      continue
+      st = p.stat()
+      out += [st.st_mtime_ns, st.st_size]
+    except OSError:
+      out += [-1, -1]
+  return out
 
-    if not is_obj(raw):
-      issues.append(Issue("ERROR", schema_path, "Schema root must be an object"))
+
+def content_key(linter: str, schema_bytes: bytes, html_bytes: bytes | None) -> str:
+  h = hashlib.blake2b(digest_size=16)
+  h.update(linter.encode("ascii"))
+  h.update(len(schema_bytes).to_bytes(8, "little"))
+  h.update(schema_bytes)
+  h.update(html_bytes if html_bytes is not None else b"\0missing")
+  return h.hexdigest()
+
+
+def load_cache(path: Path, linter: str) -> dict[str, dict]:
+  try:
+    data = json.loads(path.read_text(encoding="utf-8"))
+  except (OSError, ValueError):
+    return {}
+  if not is_obj(data) or data.get("version") != CACHE_VERSION or data.get("linter") != linter:
+    return {}
+  entries = data.get("entries")
+  return entries if is_obj(entries) else {}
+
+
+def save_cache(path: Path, linter: str, entries: dict[str, dict]) -> None:
+  path.parent.mkdir(parents=True, exist_ok=True)
+  tmp = path.with_suffix(path.suffix + ".tmp")
+  tmp.write_text(json.dumps({"version": CACHE_VERSION, "linter": linter, "entries": entries}, separators=(",", ":")), encoding="utf-8")
+  os.replace(tmp, path)
+
+
+def _lint_job(job: tuple[Path, bytes, Path, bytes | None]) -> list[Issue]:
+  return lint_contents(*job)
+
+
+def lint_cached(
+  schema_paths: list[Path],
+  effects_dir: Path,
+  root: Path,
+  cache_path: Path | None,
+  jobs: int = 1,
+  prune: bool = False,
+) -> tuple[list[Issue], int]:
+  """Lint with the result cache; returns (issues in path order, number of pairs re-checked)."""
+  linter = linter_fingerprint()
+  entries = load_cache(cache_path, linter) if cache_path else {}
+
+  results: dict[Path, list[Issue]] = {}
+  pending: list[tuple[Path, str, list[int], tuple[Path, bytes, Path, bytes | None]]] = []
+  for sp in schema_paths:
+    rel = sp.relative_to(root).as_posix()
+    html_path = effect_html_for(sp, effects_dir)
+    stats = stat_key(sp, html_path)
+    entry = entries.get(rel)
+    if entry and entry.get("stat") == stats:
+      results[sp] = [Issue(lvl, sp, msg, rule) for lvl, rule, msg in entry["issues"]]
+      continue
+    schema_bytes, html_path, html_bytes = read_pair(sp, effects_dir)
+    key = content_key(linter, schema_bytes, html_bytes)
+    if entry and entry.get("key") == key:
+      entry["stat"] = stats
+      results[sp] = [Issue(lvl, sp, msg, rule) for lvl, rule, msg in entry["issues"]]
       continue
+    pending.append((sp, key, stats, (sp, schema_bytes, html_path, html_bytes)))
 
-    schema = raw
-    title = schema.get("title")
-    if not isinstance(title, str) or not title.strip():
-      issues.append(Issue("WARN", schema_path, "Missing/empty `title`"))
+  jobs = jobs if jobs > 0 else (os.cpu_count() or 1)
+  jobs_in = [job for *_, job in pending]
+  if jobs == 1 or len(pending) < 2:
+    fresh = [_lint_job(j) for j in jobs_in]
+  else:
+    with ProcessPoolExecutor(max_workers=jobs) as pool:
+      fresh = list(pool.map(_lint_job, jobs_in, chunksize=max(1, len(jobs_in) // (jobs * 8))))
 
-    defaults = schema.get("defaults")
-    if defaults is not None and not is_obj(defaults):
-      issues.append(Issue("ERROR", schema_path, "`defaults` must be an object when present"))
-      defaults = {}
-    if defaults is None:
-      defaults = {}
+  for (sp, key, stats, _), issues in zip(pending, fresh):
+    results[sp] = issues
+    entries[sp.relative_to(root).as_posix()] = {
+      "key": key,
+      "stat": stats,
+      "issues": [[i.level, i.rule, i.message] for i in issues],
+    }
 
-    params = schema_param_keys(schema)
-    for key in sorted(params):
-      if key not in defaults:
-        issues.append(Issue("WARN", schema_path, f"Missing default for `params.{key}` (referenced by bind)"))
+  if cache_path:
+    if prune:
+      keep = {sp.relative_to(root).as_posix() for sp in schema_paths}
+      entries = {k: v for k, v in entries.items() if k in keep}
+    save_cache(cache_path, linter, entries)
 
-    if is_arr(schema.get("hotkeys")) and schema.get("hud") is None:
-      issues.append(Issue("INFO", schema_path, "No `hud` block (HUD still auto-creates; add hud.toggleKey/visible to customize)"))
+  return [i for sp in schema_paths for i in results[sp]], len(pending)
 
-    effect_html_path = effects_dir / f"{schema_path.stem.replace('.ui', '')}.html"
-    if not effect_html_path.exists():
-      # Some effects might not have an HTML partner (or name mismatch)
-      issues.append(Issue("WARN", schema_path, f"Missing effect HTML: {effect_html_path.name}"))
-      continue
 
-    effect_html = read_text(effect_html_path)
-    wired = file_has_attach_ui(effect_html)
-    if not wired:
-      issues.append(Issue("WARN", schema_path, f"Effect not wired for schemas (missing `attachEffectUI`): {effect_html_path.name}"))
+# --- selection ----------------------------------------------------------------
+
+def changed_schema_paths(root: Path, schema_dir: Path, effects_dir: Path, ref: str) -> list[Path]:
+  """Schemas whose file or effect HTML changed since `ref` (committed, staged, unstaged or untracked)."""
+  def git(*argv: str) -> list[str]:
+    proc = subprocess.run(["git", *argv], cwd=root, capture_output=True, text=True)
+    if proc.returncode != 0:
+      raise SystemExit(f"git {' '.join(argv)} failed: {proc.stderr.strip()}")
+    return [ln for ln in proc.stdout.splitlines() if ln]
 
-    if wired:
-      for key in sorted(params):
-        if not file_reads_param(effect_html, key):
-          issues.append(Issue("WARN", schema_path, f"Dead control: `params.{key}` never read in {effect_html_path.name}"))
+  scope = effects_dir.relative_to(root).as_posix()
+  changed = git("diff", "--name-only", ref, "--", scope) + git("ls-files", "--others", "--exclude-standard", "--", scope)
 
-      for root_name in sorted(schema_effect_roots(schema)):
-        if not file_exposes_effect_root(effect_html, root_name):
-          issues.append(Issue("WARN", schema_path, f"Missing expose: `effect.{root_name}.*` referenced but `{root_name}` not exposed in {effect_html_path.name}"))
+  out: set[Path] = set()
+  for rel in changed:
+    p = root / rel
+    if p.name.endswith(".ui.json") and p.parent == schema_dir:
+      out.add(p)
+    elif p.suffix == ".html" and p.parent == effects_dir:
+      out.add(schema_dir / f"{p.stem}.ui.json")
+  return sorted(p for p in out if p.exists())
 
-    for action in sorted(schema_action_names(schema)):
-      if action in {"reset", "resetParams"}:
-        # Provided by `attachEffectUI` even if the effect doesn't expose it explicitly.
-        continue
-      if not file_has_exposed_action(effect_html, action):
-        issues.append(Issue("WARN", schema_path, f"Hotkey action `{action}` not found via expose/JAZER_EXPOSE in {effect_html_path.name}"))
 
+# --- output -------------------------------------------------------------------
+
+SARIF_LEVELS = {"ERROR": "error", "WARN": "warning", "INFO": "note"}
+
+
+def to_json(issues: list[Issue], root: Path, checked: int, relinted: int) -> dict:
   by_level = {"ERROR": 0, "WARN": 0, "INFO": 0}
   for i in issues:
     by_level[i.level] = by_level.get(i.level, 0) + 1
-    print(f"[{i.level}] {i.file.relative_to(root)}: {i.message}")
+  return {
+    "checked": checked,
+    "relinted": relinted,
+    "totals": by_level,
+    "issues": [
+      {"level": i.level, "rule": i.rule, "file": i.file.relative_to(root).as_posix(), "message": i.message}
+      for i in issues
+    ],
+  }
+
+
+def to_sarif(issues: list[Issue], root: Path) -> dict:
+  return {
+    "$schema": "https://json.schemastore.org/sarif-2.1.0.json",
+    "version": "2.1.0",
+    "runs": [{
+      "tool": {"driver": {
+        "name": "lint_ui_schemas",
+        "informationUri": "https://github.com/Main-Jazer/visual-background-index",
+        "rules": [{"id": rid, "shortDescription": {"text": text}} for rid, text in RULES.items()],
+      }},
+      "originalUriBaseIds": {"SRCROOT": {"uri": root.as_uri() + "/"}},
+      "results": [
+        {
+          "ruleId": i.rule or "lint",
+          "level": SARIF_LEVELS.get(i.level, "warning"),
+          "message": {"text": i.message},
+          "locations": [{"physicalLocation": {
+            "artifactLocation": {"uri": i.file.relative_to(root).as_posix(), "uriBaseId": "SRCROOT"},
+          }}],
+        }
+        for i in issues
+      ],
+    }],
+  }
+
+
+def parse_args() -> argparse.Namespace:
+  p = argparse.ArgumentParser(description="Lint effects/ui-schema/*.ui.json against their effect HTML")
+  p.add_argument("--jobs", type=int, default=1, help="Worker processes (0 = CPU count)")
+  p.add_argument("--format", choices=("text", "json", "sarif"), default="text", help="Output format")
+  p.add_argument("--cache", default=".cache/lint_ui_schemas.json", help="Result cache (relative to repo root)")
+  p.add_argument("--no-cache", action="store_true", help="Re-lint everything and leave the cache alone")
+  p.add_argument("--changed-since", metavar="REF", help="Only lint schemas whose schema or effect HTML changed since this git ref")
+  return p.parse_args()
+
+
+def main() -> int:
+  args = parse_args()
+  root = Path(__file__).resolve().parents[1]
+  schema_dir = root / "effects" / "ui-schema"
+  effects_dir = root / "effects"
+
+  if not schema_dir.exists():
+    print(f"Missing schema dir: {schema_dir}")
+    return 2
 
-  print(f"\nTotals: ERROR={by_level['ERROR']} WARN={by_level['WARN']} INFO={by_level['INFO']}")
-  return 1 if by_level["ERROR"] else 0
+  if args.changed_since:
+    schema_paths = changed_schema_paths(root, schema_dir, effects_dir, args.changed_since)
+  else:
+    schema_paths = sorted(schema_dir.glob("*.ui.json"))
+    if not schema_paths:
+      print(f"No schemas found in: {schema_dir}")
+      return 2
+
+  cache_path = None if args.no_cache else root / args.cache
+  issues, relinted = lint_cached(
+    schema_paths, effects_dir, root, cache_path, args.jobs, prune=not args.changed_since
+  )
+
+  report = to_json(issues, root, len(schema_paths), relinted)
+  if args.format == "json":
+    print(json.dumps(report, indent=2))
+  elif args.format == "sarif":
+    print(json.dumps(to_sarif(issues, root), indent=2))
+  else:
+    for i in issues:
+      print(f"[{i.level}] {i.file.relative_to(root)}: {i.message}")
+    by_level = report["totals"]
+    print(f"\nTotals: ERROR={by_level['ERROR']} WARN={by_level['WARN']} INFO={by_level['INFO']}")
+  return 1 if report["totals"]["ERROR"] else 0
 
 
 if __name__ == "__main__":
@@ -5,6 +5,8 @@ import json
 from pathlib import Path
 from typing import Any
 
+from effect_facts import is_arr, is_obj, schema_param_keys as extract_params
+
 
 def parse_args() -> argparse.Namespace:
   p = argparse.ArgumentParser(description="Normalize effects/ui-schema/*.ui.json files")
@@ -27,34 +29,6 @@ def normalize_only(values: list[str]) -> set[str]:
   return out
 
 
-def is_obj(v: Any) -> bool:
-  return isinstance(v, dict)
-
-
-def is_arr(v: Any) -> bool:
-  return isinstance(v, list)
-
-
-def extract_params(schema: dict) -> set[str]:
-  keys: set[str] = set()
-  def add(bind: Any) -> None:
-    if not isinstance(bind, str):
-      return
-    if not bind.startswith("params."):
-      return
-    rest = bind[len("params.") :]
-    key = rest.split(".", 1)[0].split("[", 1)[0]
-    if key:
-      keys.add(key)
-  for ctl in schema.get("controls", []) if is_arr(schema.get("controls")) else []:
-    if is_obj(ctl):
-      add(ctl.get("bind"))
-  for hk in schema.get("hotkeys", []) if is_arr(schema.get("hotkeys")) else []:
-    if is_obj(hk):
-      add(hk.get("bind"))
-  return keys
-
-
 def default_for_control(control: dict) -> Any:
   t = control.get("type")
   if t in {"checkbox"}:
@@ -0,0 +1,434 @@
+#!/usr/bin/env python3
+"""
+JaZeR Visual Effects Library — Frame-Timing Collector
+
+Local collector for the JAZER_PERF beacons (lib/runtime/jazer-perf.js). There are
+no external services: a stdlib HTTP server writes into one SQLite file.
+
+  serve     accept batched beacon POSTs (open a page with ?perfBeacon=http://host:8765/beacon)
+  report    p50/p95/p99 + long-frame rate per effect / tier / device class
+  compare   diff two builds and flag regressions (exit 1 if any)
+
+Storage is a binned histogram per (build, effect, tier, device, day): frame
+times fall into log-spaced bins (BIN_RATIO wide, ~2.5% error at any frame
+rate) stored as a little-endian uint32 BLOB. A kiosk running all day adds one
+~600-byte row per effect/tier instead of millions of samples. Percentiles are
+computed with NumPy from the summed histograms, interpolating inside a bin.
+
+Requires NumPy.
+
+Beacon body (JSON, any content type):
+  {"v": 1, "build": "...", "device": "...", "longFrameMs": 50,
+   "batches": [{"effect": "jazer-neon-ocean", "tier": "high", "frameMs": [16.6, 16.8, ...]}]}
+
+Usage:
+  python tools/perf_collector.py serve --port 8765
+  python tools/perf_collector.py report --build 2026-10-18 --by effect,tier
+  python tools/perf_collector.py compare 2026-10-01 2026-10-18 --metric p95 --threshold 0.1
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import sqlite3
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+
+import numpy as np
+
+
+SCHEMA_VERSION = 1
+DEFAULT_DB = ".cache/perf.sqlite"
+
+# Bin i (1..N) covers [MIN_MS * BIN_RATIO**(i-1), MIN_MS * BIN_RATIO**i); bin 0 is
+# everything below MIN_MS and bin N+1 everything at or above MAX_MS.
+MIN_MS = 1.0
+MAX_MS = 1000.0
+BIN_RATIO = 1.05
+N_BINS = int(np.ceil(np.log(MAX_MS / MIN_MS) / np.log(BIN_RATIO)))
+EDGES = MIN_MS * BIN_RATIO ** np.arange(N_BINS + 1, dtype=np.float64)   # N_BINS + 1 inner edges
+TOTAL_BINS = N_BINS + 2
+COUNT_DTYPE = np.dtype("<u4")
+
+LONG_FRAME_MS = 50.0
+MAX_BODY_BYTES = 2 * 1024 * 1024
+MAX_LABEL_LEN = 128
+DIMENSIONS = ("effect", "tier", "device")
+
+DDL = f"""
+CREATE TABLE IF NOT EXISTS meta (key TEXT PRIMARY KEY, value TEXT NOT NULL);
+CREATE TABLE IF NOT EXISTS frame_hist (
+    build       TEXT NOT NULL,
+    effect      TEXT NOT NULL,
+    tier        TEXT NOT NULL,
+    device      TEXT NOT NULL,
+    day         TEXT NOT NULL,          -- UTC date the frames were received
+    frames      INTEGER NOT NULL,
+    long_frames INTEGER NOT NULL,       -- frames > {LONG_FRAME_MS:g} ms
+    sum_ms      REAL NOT NULL,
+    counts      BLOB NOT NULL,          -- uint32 LE x {TOTAL_BINS}
+    PRIMARY KEY (build, effect, tier, device, day)
+) WITHOUT ROWID;
+CREATE TABLE IF NOT EXISTS beacons (
+    received REAL NOT NULL,
+    build    TEXT NOT NULL,
+    device   TEXT NOT NULL,
+    frames   INTEGER NOT NULL,
+    dropped  INTEGER NOT NULL
+);
+"""
+
+
+# ---------------------------------------------------------------------------
+# Histograms
+# ---------------------------------------------------------------------------
+
+def bin_frames(frame_ms: np.ndarray) -> np.ndarray:
+    """Histogram frame times into TOTAL_BINS counts (uint32)."""
+    idx = np.searchsorted(EDGES, frame_ms, side="right")   # 0 below MIN_MS, N_BINS + 1 at/above MAX_MS
+    return np.bincount(idx, minlength=TOTAL_BINS).astype(COUNT_DTYPE)
+
+
+def hist_percentiles(counts: np.ndarray, qs: tuple[float, ...] = (0.5, 0.95, 0.99)) -> list[float]:
+    """Percentiles from bin counts, log-interpolated inside the bin."""
+    total = int(counts.sum())
+    if total == 0:
+        return [float("nan")] * len(qs)
+    cum = np.cumsum(counts, dtype=np.float64)
+    targets = np.asarray(qs, dtype=np.float64) * total
+    bins = np.searchsorted(cum, targets, side="left")
+    prev = np.where(bins > 0, cum[np.maximum(bins - 1, 0)], 0.0)
+    frac = np.clip((targets - prev) / np.maximum(counts[bins], 1), 0.0, 1.0)
+
+    lo = np.where(bins == 0, 0.0, EDGES[np.clip(bins - 1, 0, N_BINS)])
+    hi = np.where(bins > N_BINS, EDGES[-1], EDGES[np.clip(bins, 0, N_BINS)])
+    log_interp = lo * (hi / np.maximum(lo, 1e-9)) ** frac
+    linear = lo + (hi - lo) * frac
+    out = np.where(bins == 0, linear, np.where(bins > N_BINS, EDGES[-1], log_interp))
+    return [float(v) for v in out]
+
+
+# ---------------------------------------------------------------------------
+# Storage
+# ---------------------------------------------------------------------------
+
+def connect(db_path: Path) -> sqlite3.Connection:
+    db_path.parent.mkdir(parents=True, exist_ok=True)
+    conn = sqlite3.connect(db_path, check_same_thread=False)
+    conn.execute("PRAGMA journal_mode=WAL")
+    conn.execute("PRAGMA synchronous=NORMAL")
+    conn.executescript(DDL)
+    row = conn.execute("SELECT value FROM meta WHERE key = 'bins'").fetchone()
+    layout = json.dumps({"v": SCHEMA_VERSION, "min": MIN_MS, "max": MAX_MS, "ratio": BIN_RATIO, "n": TOTAL_BINS})
+    if row is None:
+        conn.execute("INSERT INTO meta (key, value) VALUES ('bins', ?)", (layout,))
+        conn.commit()
+    elif row[0] != layout:
+        raise SystemExit(f"{db_path} uses a different bin layout ({row[0]}); use a new --db")
+    return conn
+
+
+def label(v: object, default: str = "unknown") -> str:
+    s = str(v).strip() if v is not None else ""
+    return (s or default)[:MAX_LABEL_LEN]
+
+
+def ingest(conn: sqlite3.Connection, payload: dict, received: float | None = None) -> int:
+    """Add one beacon to the histograms. Returns the number of frames stored."""
+    if not isinstance(payload, dict) or not isinstance(payload.get("batches"), list):
+        raise ValueError("payload must be an object with a 'batches' list")
+    received = time.time() if received is None else received
+    day = time.strftime("%Y-%m-%d", time.gmtime(received))
+    build = label(payload.get("build"), "dev")
+    device = label(payload.get("device"))
+
+    total = 0
+    with conn:
+        for batch in payload["batches"]:
+            if not isinstance(batch, dict):
+                raise ValueError("each batch must be an object")
+            frames = np.asarray(batch.get("frameMs") or [], dtype=np.float64)
+            frames = frames[np.isfinite(frames) & (frames >= 0)]
+            if frames.size == 0:
+                continue
+            key = (build, label(batch.get("effect")), label(batch.get("tier")), device, day)
+            counts = bin_frames(frames)
+            row = conn.execute(
+                "SELECT frames, long_frames, sum_ms, counts FROM frame_hist "
+                "WHERE build = ? AND effect = ? AND tier = ? AND device = ? AND day = ?",
+                key,
+            ).fetchone()
+            n, long_n, sum_ms = int(frames.size), int((frames > LONG_FRAME_MS).sum()), float(frames.sum())
+            if row is not None:
+                counts = counts + np.frombuffer(row[3], dtype=COUNT_DTYPE)
+                n, long_n, sum_ms = n + row[0], long_n + row[1], sum_ms + row[2]
+            conn.execute(
+                "INSERT OR REPLACE INTO frame_hist VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)",
+                (*key, n, long_n, sum_ms, counts.astype(COUNT_DTYPE).tobytes()),
+            )
+            total += int(frames.size)
+        conn.execute(
+            "INSERT INTO beacons VALUES (?, ?, ?, ?, ?)",
+            (received, build, device, total, int(payload.get("dropped") or 0)),
+        )
+    return total
+
+
+def load_groups(conn: sqlite3.Connection, build: str, by: tuple[str, ...], since: str | None = None) -> dict[tuple, dict]:
+    """Sum histograms for one build, grouped by the given dimensions."""
+    sql = "SELECT effect, tier, device, frames, long_frames, sum_ms, counts FROM frame_hist WHERE build = ?"
+    args: list[object] = [build]
+    if since:
+        sql += " AND day >= ?"
+        args.append(since)
+
+    groups: dict[tuple, dict] = {}
+    for effect, tier, device, frames, long_frames, sum_ms, blob in conn.execute(sql, args):
+        dims = {"effect": effect, "tier": tier, "device": device}
+        key = tuple(dims[d] for d in by)
+        g = groups.get(key)
+        if g is None:
+            g = groups[key] = {"frames": 0, "long_frames": 0, "sum_ms": 0.0, "counts": np.zeros(TOTAL_BINS, dtype=np.uint64)}
+        g["frames"] += frames
+        g["long_frames"] += long_frames
+        g["sum_ms"] += sum_ms
+        g["counts"] += np.frombuffer(blob, dtype=COUNT_DTYPE)
+    return groups
+
+
+def summarize(groups: dict[tuple, dict]) -> dict[tuple, dict]:
+    out = {}
+    for key, g in groups.items():
+        p50, p95, p99 = hist_percentiles(g["counts"])
+        out[key] = {
+            "frames": g["frames"],
+            "mean": g["sum_ms"] / g["frames"] if g["frames"] else float("nan"),
+            "p50": p50,
+            "p95": p95,
+            "p99": p99,
+            "long_rate": g["long_frames"] / g["frames"] if g["frames"] else 0.0,
+        }
+    return out
+
+
+# ---------------------------------------------------------------------------
+# HTTP
+# ---------------------------------------------------------------------------
+
+class BeaconHandler(BaseHTTPRequestHandler):
+    server_version = "JaZeRPerfCollector/1"
+    conn: sqlite3.Connection
+    lock: threading.Lock
+    quiet = False
+
+    def _cors(self) -> None:
+        self.send_header("Access-Control-Allow-Origin", "*")
+        self.send_header("Access-Control-Allow-Methods", "POST, GET, OPTIONS")
+        self.send_header("Access-Control-Allow-Headers", "Content-Type")
+
+    def _reply(self, status: int, body: dict | None = None) -> None:
+        data = json.dumps(body).encode("utf-8") if body is not None else b""
+        self.send_response(status)
+        self._cors()
+        if data:
+            self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(data)))
+        self.end_headers()
+        if data:
+            self.wfile.write(data)
+
+    def do_OPTIONS(self) -> None:
+        self._reply(204)
+
+    def do_GET(self) -> None:
+        if self.path.rstrip("/") != "/health":
+            self._reply(404, {"error": "not found"})
+            return
+        with self.lock:
+            rows, frames = self.conn.execute("SELECT COUNT(*), COALESCE(SUM(frames), 0) FROM frame_hist").fetchone()
+        self._reply(200, {"ok": True, "histograms": rows, "frames": frames})
+
+    def do_POST(self) -> None:
+        if self.path.split("?", 1)[0].rstrip("/") != "/beacon":
+            self._reply(404, {"error": "not found"})
+            return
+        length = int(self.headers.get("Content-Length") or 0)
+        if length <= 0 or length > MAX_BODY_BYTES:
+            self._reply(413 if length > MAX_BODY_BYTES else 400, {"error": "bad body size"})
+            return
+        try:
+            payload = json.loads(self.rfile.read(length))
+            with self.lock:
+                stored = ingest(self.conn, payload)
+        except (ValueError, TypeError) as e:
+            self._reply(400, {"error": str(e)})
+            return
+        self._reply(204)
+        if not self.quiet:
+            print(f"beacon {self.client_address[0]}: {stored} frame(s) from {label(payload.get('build'), 'dev')}")
+
+    def log_message(self, fmt: str, *args: object) -> None:
+        if not self.quiet:
+            super().log_message(fmt, *args)
+
+
+def serve(db_path: Path, host: str, port: int, quiet: bool) -> int:
+    conn = connect(db_path)
+    handler = type("Handler", (BeaconHandler,), {"conn": conn, "lock": threading.Lock(), "quiet": quiet})
+    httpd = ThreadingHTTPServer((host, port), handler)
+    print(f"Collecting frame timings at http://{host}:{port}/beacon -> {db_path}")
+    print(f"Open an effect with ?perfBeacon=http://{host}:{port}/beacon&build=<id>")
+    try:
+        httpd.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        httpd.server_close()
+        conn.close()
+    return 0
+
+
+# ---------------------------------------------------------------------------
+# Reports
+# ---------------------------------------------------------------------------
+
+def fmt_ms(v: float) -> str:
+    return "-" if v != v else f"{v:7.2f}"
+
+
+def print_table(rows: list[list[str]], header: list[str]) -> None:
+    widths = [max(len(str(r[i])) for r in rows + [header]) for i in range(len(header))]
+    print("  ".join(h.ljust(w) for h, w in zip(header, widths)))
+    print("  ".join("-" * w for w in widths))
+    for r in rows:
+        print("  ".join(str(c).ljust(w) for c, w in zip(r, widths)))
+
+
+def report(conn: sqlite3.Connection, build: str, by: tuple[str, ...], since: str | None, min_frames: int, as_json: bool) -> int:
+    stats = summarize(load_groups(conn, build, by, since))
+    stats = {k: v for k, v in stats.items() if v["frames"] >= min_frames}
+    if as_json:
+        print(json.dumps([{**dict(zip(by, k)), **v} for k, v in sorted(stats.items())], indent=2))
+        return 0
+    if not stats:
+        print(f"No frames for build {build!r} (>= {min_frames} frames per group).")
+        return 0
+    rows = [
+        [*k, v["frames"], fmt_ms(v["p50"]), fmt_ms(v["p95"]), fmt_ms(v["p99"]), f"{v['long_rate'] * 100:5.2f}%"]
+        for k, v in sorted(stats.items(), key=lambda kv: -kv[1]["p95"])
+    ]
+    print(f"Build {build}: frame time (ms), worst p95 first")
+    print_table(rows, [*by, "frames", "p50", "p95", "p99", "long"])
+    return 0
+
+
+def compare(
+    conn: sqlite3.Connection,
+    base: str,
+    head: str,
+    by: tuple[str, ...],
+    metric: str,
+    threshold: float,
+    min_delta_ms: float,
+    min_frames: int,
+    as_json: bool,
+) -> int:
+    a = summarize(load_groups(conn, base, by))
+    b = summarize(load_groups(conn, head, by))
+    rows, regressions = [], []
+    for key in sorted(set(a) & set(b)):
+        sa, sb = a[key], b[key]
+        if sa["frames"] < min_frames or sb["frames"] < min_frames:
+            continue
+        before, after = sa[metric], sb[metric]
+        delta = after - before
+        rel = delta / before if before > 0 else 0.0
+        long_delta = sb["long_rate"] - sa["long_rate"]
+        regressed = (rel > threshold and delta > min_delta_ms) or long_delta > max(threshold * sa["long_rate"], 0.01)
+        entry = {**dict(zip(by, key)), "before": before, "after": after, "delta_ms": delta, "delta_rel": rel,
+                 "long_before": sa["long_rate"], "long_after": sb["long_rate"], "regressed": regressed}
+        rows.append(entry)
+        if regressed:
+            regressions.append(entry)
+
+    only_base = sorted(set(a) - set(b))
+    only_head = sorted(set(b) - set(a))
+    if as_json:
+        print(json.dumps({"base": base, "head": head, "metric": metric, "rows": rows,
+                          "regressions": len(regressions), "only_base": only_base, "only_head": only_head}, indent=2))
+    else:
+        table = [
+            [*(r[d] for d in by), fmt_ms(r["before"]), fmt_ms(r["after"]), f"{r['delta_rel'] * 100:+6.1f}%",
+             f"{r['long_before'] * 100:5.2f}% -> {r['long_after'] * 100:5.2f}%", "REGRESSION" if r["regressed"] else ""]
+            for r in sorted(rows, key=lambda r: -r["delta_rel"])
+        ]
+        print(f"{metric} frame time: {base} -> {head} (threshold {threshold * 100:g}%, >= {min_delta_ms:g} ms)")
+        if table:
+            print_table(table, [*by, "before", "after", "change", "long frames", ""])
+        else:
+            print(f"No groups with >= {min_frames} frames in both builds.")
+        if only_base or only_head:
+            print(f"Not compared: {len(only_base)} group(s) only in {base}, {len(only_head)} only in {head}")
+        print(f"{len(regressions)} regression(s) in {len(rows)} compared group(s).")
+    return 1 if regressions else 0
+
+
+def parse_by(value: str) -> tuple[str, ...]:
+    dims = tuple(d.strip() for d in value.split(",") if d.strip())
+    bad = [d for d in dims if d not in DIMENSIONS]
+    if bad or not dims:
+        raise argparse.ArgumentTypeError(f"--by takes a comma list of {', '.join(DIMENSIONS)}")
+    return dims
+
+
+def main() -> int:
+    ap = argparse.ArgumentParser(description="Collect and report JAZER_PERF frame timings (SQLite, NumPy).")
+    ap.add_argument("--db", default=DEFAULT_DB, help="SQLite file (relative to the repo root)")
+    sub = ap.add_subparsers(dest="cmd", required=True)
+
+    sp = sub.add_parser("serve", help="Accept beacon POSTs at /beacon")
+    sp.add_argument("--host", default="127.0.0.1")
+    sp.add_argument("--port", type=int, default=8765)
+    sp.add_argument("--quiet", action="store_true")
+
+    rp = sub.add_parser("report", help="Percentiles per effect / tier / device class")
+    rp.add_argument("--build", default="dev")
+    rp.add_argument("--by", type=parse_by, default=DIMENSIONS, help="Group by (default: effect,tier,device)")
+    rp.add_argument("--since", help="Only days >= YYYY-MM-DD")
+    rp.add_argument("--min-frames", type=int, default=1)
+    rp.add_argument("--json", action="store_true")
+
+    cp = sub.add_parser("compare", help="Flag regressions between two builds (exit 1 if any)")
+    cp.add_argument("base")
+    cp.add_argument("head")
+    cp.add_argument("--by", type=parse_by, default=DIMENSIONS)
+    cp.add_argument("--metric", choices=("p50", "p95", "p99", "mean"), default="p95")
+    cp.add_argument("--threshold", type=float, default=0.10, help="Relative slowdown that counts (0.10 = 10%%)")
+    cp.add_argument("--min-delta-ms", type=float, default=0.5, help="Ignore smaller absolute slowdowns")
+    cp.add_argument("--min-frames", type=int, default=300, help="Skip groups with fewer frames in either build")
+    cp.add_argument("--json", action="store_true")
+
+    args = ap.parse_args()
+    root = Path(__file__).resolve().parents[1]
+    db_path = (root / args.db).resolve()
+
+    if args.cmd == "serve":
+        return serve(db_path, args.host, args.port, args.quiet)
+
+    if not db_path.exists():
+        raise SystemExit(f"No collector database at {db_path} (run `serve` first)")
+    conn = connect(db_path)
+    try:
+        if args.cmd == "report":
+            return report(conn, args.build, args.by, args.since, args.min_frames, args.json)
+        return compare(conn, args.base, args.head, args.by, args.metric, args.threshold,
+                       args.min_delta_ms, args.min_frames, args.json)
+    finally:
+        conn.close()
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
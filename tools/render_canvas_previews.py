@@ -0,0 +1,1068 @@
+#!/usr/bin/env python3
+"""
+JaZeR Visual Effects Library — Canvas Preview Renderer
+
+Renders previews and animated thumbnails of canvas effects on machines with no
+browser or GPU. The Canvas 2D subset the effects use is re-implemented on NumPy
+framebuffers (Canvas2D), and each supported effect is ported draw call for draw
+call on top of it (PORTS).
+
+Coverage is limited to the ported effects: jazer-plasma-storm, jazer-seed-of-life
+and jazer-sri-yantra (3 of the 36 canvas entries in the manifest). The other
+canvas pages draw with their own inline code, so each needs a port of its own;
+until then their thumbnails still come from a browser capture. --list shows the
+split, and --all renders only the ported effects.
+
+Canvas2D covers what lib/canvas/PlasmaStorm.js and the canvas effects draw with:
+- fillRect / arc / moveTo / lineTo / quadraticCurveTo / closePath, fill() and stroke()
+- solid colors ('#rrggbb', 'rgba(...)'), createRadialGradient / createLinearGradient
+  (stops interpolated premultiplied, like browsers)
+- save / restore / translate / rotate / scale / setTransform, globalAlpha
+- globalCompositeOperation 'source-over', 'lighter' (additive) and 'multiply'
+- trails: the framebuffer is rounded to 8 bits after every draw, so low-alpha
+  fades leave the same residue a browser canvas does
+Circles are analytic with 1 px anti-aliasing; strokes use round joins/caps.
+Text is not rasterized (counted under "skipped" in the report).
+
+--postfx PRESET applies the CanvasPostFX passes from lib/fx/canvas/jazer-canvas-fx.js
+(bloom, chromatic aberration, ACES tonemapping, vignette, grain) with the preset
+values read from lib/fx/post/jazer-post-fx.js.
+
+Time advances 1/60 s per simulated frame like the effects' rAF loops, and
+Math.random() is a seeded generator, so output is reproducible (--seed).
+
+Requires NumPy.
+
+Outputs (default .cache/previews/):
+  <id>/frame_0000.png ...   PNG sequence
+  <id>.png                  APNG with --apng (single PNG when --frames 1)
+
+Usage:
+  python tools/render_canvas_previews.py jazer-plasma-storm --frames 1
+  python tools/render_canvas_previews.py --all --frames 48 --fps 24 --apng --jobs 4
+  python tools/render_canvas_previews.py jazer-sri-yantra --size 1920x1080 --scale 0.25 --postfx neon
+"""
+
+
+from __future__ import annotations
+
+import argparse
+import json
+import math
+import re
+import struct
+import time as clock
+import zlib
+from collections import Counter
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+
+import numpy as np
+
+from bake_noise_textures import build_tables, noise2d
+
+
+ROOT = Path(__file__).resolve().parents[1]
+MANIFEST = ROOT / "docs" / "effects.manifest.json"
+POST_FX_JS = ROOT / "lib" / "fx" / "post" / "jazer-post-fx.js"
+DEFAULT_OUT = ".cache/previews"
+SIM_FPS = 60
+
+PERM, PERM_MOD12 = build_tables(0)   # SimplexNoise output does not depend on the seed (see bake_noise_textures.py)
+
+HEX_RE = re.compile(r"#?([0-9a-fA-F]{2})([0-9a-fA-F]{2})([0-9a-fA-F]{2})$")
+RGBA_RE = re.compile(r"rgba?\(\s*([-\d.e]+)\s*,\s*([-\d.e]+)\s*,\s*([-\d.e]+)\s*(?:,\s*([-\d.e]+)\s*)?\)")
+
+
+# ---------------------------------------------------------------------------
+# Canvas 2D on NumPy
+# ---------------------------------------------------------------------------
+
+def parse_color(value: str) -> tuple[float, float, float, float]:
+    """CSS color -> (r, g, b, a) in 0..1 (hex and rgb()/rgba() only)."""
+    m = HEX_RE.match(value)
+    if m:
+        r, g, b = (int(c, 16) / 255 for c in m.groups())
+        return r, g, b, 1.0
+    m = RGBA_RE.match(value)
+    if m:
+        r, g, b = (min(max(float(c), 0), 255) / 255 for c in m.groups()[:3])
+        a = float(m.group(4)) if m.group(4) is not None else 1.0
+        return r, g, b, min(max(a, 0.0), 1.0)
+    raise ValueError(f"Unsupported color {value!r}")
+
+
+def hex_to_rgb(value: str) -> dict[str, int]:
+    """hexToRgb() from jazer-palette.js."""
+    m = HEX_RE.match(value)
+    return dict(zip("rgb", (int(c, 16) for c in m.groups()))) if m else {"r": 0, "g": 0, "b": 0}
+
+
+def smoothstep(edge0: float, edge1: float, x: float) -> float:
+    t = min(max((x - edge0) / (edge1 - edge0), 0.0), 1.0)
+    return t * t * (3 - 2 * t)
+
+
+class Gradient:
+    """CanvasGradient: radial (concentric) or linear, evaluated in user space."""
+
+    def __init__(self, kind: str, *args: float):
+        self.kind = kind
+        self.args = args
+        self.stops: list[tuple[float, tuple[float, float, float, float]]] = []
+
+    def add_color_stop(self, offset: float, color: str) -> None:
+        self.stops.append((offset, parse_color(color)))
+
+    def table(self, size: int = 1024) -> np.ndarray:
+        """(size, 4) premultiplied rgba over t in [0, 1] (stops interpolate premultiplied, like browsers)."""
+        stops = sorted(self.stops, key=lambda s: s[0]) or [(0.0, (0.0, 0.0, 0.0, 0.0))]
+        offs = np.array([s[0] for s in stops])
+        cols = np.array([s[1] for s in stops])
+        premul = np.concatenate([cols[:, :3] * cols[:, 3:], cols[:, 3:]], axis=1)
+        t = np.linspace(0, 1, size)
+        return np.stack([np.interp(t, offs, premul[:, k]) for k in range(4)], -1).astype(np.float32)
+
+    def evaluate(self, ux: np.ndarray, uy: np.ndarray) -> np.ndarray:
+        """Premultiplied rgba at user-space points, looked up in table()."""
+        if self.kind == "radial":
+            x0, y0, r0, x1, y1, r1 = self.args
+            t = (np.hypot(ux - x1, uy - y1) - r0) / ((r1 - r0) or 1e-9)
+        else:
+            x0, y0, x1, y1 = self.args
+            dx, dy = x1 - x0, y1 - y0
+            t = ((ux - x0) * dx + (uy - y0) * dy) / ((dx * dx + dy * dy) or 1e-9)
+        lut = self.table()
+        return lut[(np.clip(t, 0, 1) * (len(lut) - 1) + 0.5).astype(np.intp)]
+
+
+class Canvas2D:
+    """The CanvasRenderingContext2D subset used by the ported effects (snake_case names)."""
+
+    def __init__(self, width: int, height: int):
+        self.width = width
+        self.height = height
+        self.buf = np.zeros((height, width, 3), dtype=np.float32)
+        self.transform = (1.0, 0.0, 0.0, 1.0, 0.0, 0.0)   # a, b, c, d, e, f
+        self.global_alpha = 1.0
+        self.global_composite_operation = "source-over"
+        self.line_width = 1.0
+        self._fill = (0.0, 0.0, 0.0, 1.0)
+        self._stroke = (0.0, 0.0, 0.0, 1.0)
+        self._stack: list[tuple] = []
+        self._subpaths: list[dict] = []
+        self.skipped: Counter[str] = Counter()
+        self._gradient_cache: dict[tuple, np.ndarray] = {}
+
+    # --- state -------------------------------------------------------------
+
+    @property
+    def fill_style(self):
+        return self._fill
+
+    @fill_style.setter
+    def fill_style(self, value) -> None:
+        self._fill = parse_color(value) if isinstance(value, str) else value
+
+    @property
+    def stroke_style(self):
+        return self._stroke
+
+    @stroke_style.setter
+    def stroke_style(self, value) -> None:
+        self._stroke = parse_color(value) if isinstance(value, str) else value
+
+    def save(self) -> None:
+        self._stack.append((self.transform, self.global_alpha, self.global_composite_operation,
+                            self.line_width, self._fill, self._stroke))
+
+    def restore(self) -> None:
+        if self._stack:
+            (self.transform, self.global_alpha, self.global_composite_operation,
+             self.line_width, self._fill, self._stroke) = self._stack.pop()
+
+    def set_transform(self, a: float, b: float, c: float, d: float, e: float, f: float) -> None:
+        self.transform = (a, b, c, d, e, f)
+
+    def _multiply(self, a2: float, b2: float, c2: float, d2: float, e2: float, f2: float) -> None:
+        a, b, c, d, e, f = self.transform
+        self.transform = (a * a2 + c * b2, b * a2 + d * b2, a * c2 + c * d2, b * c2 + d * d2,
+                          a * e2 + c * f2 + e, b * e2 + d * f2 + f)
+
+    def translate(self, x: float, y: float) -> None:
+        self._multiply(1, 0, 0, 1, x, y)
+
+    def rotate(self, angle: float) -> None:
+        cos, sin = math.cos(angle), math.sin(angle)
+        self._multiply(cos, sin, -sin, cos, 0, 0)
+
+    def scale(self, sx: float, sy: float) -> None:
+        self._multiply(sx, 0, 0, sy, 0, 0)
+
+    def create_radial_gradient(self, x0, y0, r0, x1, y1, r1) -> Gradient:
+        if (x0, y0) != (x1, y1):
+            self.skipped["non-concentric radial gradient (drawn concentric)"] += 1
+        return Gradient("radial", x0, y0, r0, x1, y1, r1)
+
+    def create_linear_gradient(self, x0, y0, x1, y1) -> Gradient:
+        return Gradient("linear", x0, y0, x1, y1)
+
+    def fill_text(self, *_args) -> None:
+        self.skipped["fillText"] += 1
+
+    # --- paths -------------------------------------------------------------
+
+    def _apply(self, x: float, y: float) -> tuple[float, float]:
+        a, b, c, d, e, f = self.transform
+        return a * x + c * y + e, b * x + d * y + f
+
+    def _scale_factor(self) -> float:
+        a, b, c, d, _, _ = self.transform
+        return math.sqrt(abs(a * d - b * c))
+
+    def _is_similarity(self) -> bool:
+        a, b, c, d, _, _ = self.transform
+        return abs(a - d) < 1e-9 and abs(b + c) < 1e-9
+
+    def _current(self) -> dict | None:
+        return self._subpaths[-1] if self._subpaths and self._subpaths[-1]["kind"] == "poly" else None
+
+    def begin_path(self) -> None:
+        self._subpaths = []
+
+    def move_to(self, x: float, y: float) -> None:
+        self._subpaths.append({"kind": "poly", "points": [self._apply(x, y)], "closed": False})
+
+    def line_to(self, x: float, y: float) -> None:
+        current = self._current()
+        if current is None:
+            self.move_to(x, y)
+        else:
+            current["points"].append(self._apply(x, y))
+
+    def quadratic_curve_to(self, cpx: float, cpy: float, x: float, y: float, steps: int = 16) -> None:
+        current = self._current()
+        if current is None:
+            self.move_to(cpx, cpy)
+            current = self._current()
+        p0 = np.array(current["points"][-1])
+        p1 = np.array(self._apply(cpx, cpy))
+        p2 = np.array(self._apply(x, y))
+        t = np.linspace(0, 1, steps + 1)[1:, None]
+        pts = (1 - t) ** 2 * p0 + 2 * (1 - t) * t * p1 + t * t * p2
+        current["points"].extend(map(tuple, pts))
+
+    def arc(self, x: float, y: float, radius: float, start: float, end: float) -> None:
+        full = abs(end - start) >= 2 * math.pi - 1e-9
+        current = self._current()
+        if full and self._is_similarity() and (current is None or len(current["points"]) == 0):
+            cx, cy = self._apply(x, y)
+            self._subpaths.append({"kind": "circle", "center": (cx, cy), "radius": radius * self._scale_factor()})
+            ex, ey = x + math.cos(end) * radius, y + math.sin(end) * radius
+            self._subpaths.append({"kind": "poly", "points": [], "closed": False})
+            self._subpaths[-1]["points"].append(self._apply(ex, ey))
+            return
+        steps = max(8, int(math.ceil(abs(end - start) * radius * self._scale_factor() / 2)))
+        angles = np.linspace(start, end, steps + 1)
+        for k, angle in enumerate(angles):
+            px, py = x + math.cos(angle) * radius, y + math.sin(angle) * radius
+            if k == 0 and current is None:
+                self.move_to(px, py)
+            else:
+                self.line_to(px, py)
+
+    def close_path(self) -> None:
+        current = self._current()
+        if current is not None and current["points"]:
+            current["closed"] = True
+            self._subpaths.append({"kind": "poly", "points": [current["points"][0]], "closed": False})
+
+    # --- rasterization -----------------------------------------------------
+
+    def _region(self, x0: float, y0: float, x1: float, y1: float) -> tuple[int, int, int, int] | None:
+        ix0, iy0 = max(int(math.floor(x0)), 0), max(int(math.floor(y0)), 0)
+        ix1, iy1 = min(int(math.ceil(x1)), self.width), min(int(math.ceil(y1)), self.height)
+        return (ix0, iy0, ix1, iy1) if ix1 > ix0 and iy1 > iy0 else None
+
+    def _composite(self, region: tuple[int, int, int, int], coverage: np.ndarray | None, paint) -> None:
+        x0, y0, x1, y1 = region
+        if isinstance(paint, Gradient):
+            rgba = self._gradient_pixels(region, paint)
+            color, alpha = rgba[..., :3], rgba[..., 3:]
+        else:
+            color = np.asarray(paint[:3], dtype=np.float32) * paint[3]
+            alpha = np.float32(paint[3])
+        weight = np.float32(self.global_alpha) if coverage is None else (coverage * self.global_alpha)[..., None]
+        color, alpha = color * weight, alpha * weight   # premultiplied source
+
+        dst = self.buf[y0:y1, x0:x1]
+        op = self.global_composite_operation
+        if op == "lighter":
+            out = np.minimum(dst + color, 1.0)
+        elif op == "multiply":
+            out = dst * (1 - alpha) + dst * color
+        else:
+            if op != "source-over":
+                self.skipped[f"globalCompositeOperation {op} (drawn source-over)"] += 1
+            out = dst * (1 - alpha) + color
+        self.buf[y0:y1, x0:x1] = np.round(out * 255) / 255
+
+    def _gradient_pixels(self, region: tuple[int, int, int, int], paint: Gradient) -> np.ndarray:
+        # Backgrounds, glows and vignettes repeat the same gradient every frame; evaluate each once.
+        key = (region, self.transform, paint.kind, paint.args, tuple(paint.stops))
+        cached = self._gradient_cache.get(key)
+        if cached is None:
+            x0, y0, x1, y1 = region
+            px, py = np.meshgrid(np.arange(x0, x1) + 0.5, np.arange(y0, y1) + 0.5)
+            a, b, c, d, e, f = self.transform
+            det = (a * d - b * c) or 1e-12
+            ux = (d * (px - e) - c * (py - f)) / det
+            uy = (a * (py - f) - b * (px - e)) / det
+            cached = paint.evaluate(ux, uy)
+            if len(self._gradient_cache) >= 64:
+                self._gradient_cache.pop(next(iter(self._gradient_cache)))
+            self._gradient_cache[key] = cached
+        return cached
+
+    def _pixel_centers(self, region: tuple[int, int, int, int]) -> tuple[np.ndarray, np.ndarray]:
+        x0, y0, x1, y1 = region
+        return np.arange(x0, x1)[None, :] + 0.5, np.arange(y0, y1)[:, None] + 0.5
+
+    def fill_rect(self, x: float, y: float, w: float, h: float) -> None:
+        a, b, c, d, e, f = self.transform
+        if abs(b) > 1e-12 or abs(c) > 1e-12:
+            self.begin_path()
+            self.move_to(x, y)
+            self.line_to(x + w, y)
+            self.line_to(x + w, y + h)
+            self.line_to(x, y + h)
+            self.close_path()
+            self.fill()
+            return
+        rx0, rx1 = sorted((a * x + e, a * (x + w) + e))
+        ry0, ry1 = sorted((d * y + f, d * (y + h) + f))
+        region = self._region(rx0, ry0, rx1, ry1)
+        if region is None:
+            return
+        px, py = self._pixel_centers(region)
+        cov_x = np.clip(np.minimum(px + 0.5, rx1) - np.maximum(px - 0.5, rx0), 0, 1)
+        cov_y = np.clip(np.minimum(py + 0.5, ry1) - np.maximum(py - 0.5, ry0), 0, 1)
+        coverage = (cov_y * cov_x).astype(np.float32)
+        self._composite(region, None if coverage.min() >= 1 else coverage, self._fill)
+
+    def fill(self) -> None:
+        shapes = [s for s in self._subpaths if s["kind"] == "circle" or len(s["points"]) >= 3]
+        if not shapes:
+            return
+        region = self._bounds(shapes, 1.0)
+        if region is None:
+            return
+        px, py = self._pixel_centers(region)
+        coverage = np.zeros((region[3] - region[1], region[2] - region[0]), dtype=np.float32)
+        polys = []
+        for s in shapes:
+            if s["kind"] == "circle":
+                (cx, cy), r = s["center"], s["radius"]
+                np.maximum(coverage, np.clip(r - np.hypot(px - cx, py - cy) + 0.5, 0, 1), out=coverage)
+            else:
+                polys.append(np.asarray(s["points"]))
+        if polys:
+            # nonzero winding, 2x2 supersampled
+            inside = np.zeros_like(coverage)
+            for ox, oy in ((-0.25, -0.25), (0.25, -0.25), (-0.25, 0.25), (0.25, 0.25)):
+                winding = np.zeros(coverage.shape, dtype=np.int32)
+                sx, sy = px + ox, py + oy
+                for pts in polys:
+                    for (xa, ya), (xb, yb) in zip(pts, np.roll(pts, -1, axis=0)):
+                        if ya == yb:
+                            continue
+                        crosses = (ya <= sy) != (yb <= sy)
+                        xi = xa + (sy - ya) * (xb - xa) / (yb - ya)
+                        winding += np.where(crosses & (sx < xi), 1 if yb > ya else -1, 0)
+                inside += (winding != 0) * 0.25
+            np.maximum(coverage, inside, out=coverage)
+        self._composite(region, coverage, self._fill)
+
+    def stroke(self) -> None:
+        hw = self.line_width * self._scale_factor() / 2
+        shapes = [s for s in self._subpaths if s["kind"] == "circle" or len(s["points"]) >= 2]
+        if not shapes:
+            return
+        region = self._bounds(shapes, hw + 1)
+        if region is None:
+            return
+        rx0, ry0 = region[0], region[1]
+        coverage = np.zeros((region[3] - region[1], region[2] - region[0]), dtype=np.float32)
+
+        def band(dist: np.ndarray) -> np.ndarray:
+            # overlap of [dist - hw, dist + hw] with the pixel's [-0.5, 0.5] footprint
+            return np.clip(np.minimum(dist + hw, 0.5) - np.maximum(dist - hw, -0.5), 0, 1)
+
+        for s in shapes:
+            if s["kind"] == "circle":
+                (cx, cy), r = s["center"], s["radius"]
+                sub = self._region(cx - r - hw - 1, cy - r - hw - 1, cx + r + hw + 1, cy + r + hw + 1)
+                if sub is None:
+                    continue
+                px, py = self._pixel_centers(sub)
+                view = coverage[sub[1] - ry0:sub[3] - ry0, sub[0] - rx0:sub[2] - rx0]
+                np.maximum(view, band(np.abs(np.hypot(px - cx, py - cy) - r)), out=view)
+                continue
+            pts = np.asarray(s["points"])
+            if s["closed"]:
+                pts = np.concatenate([pts, pts[:1]])
+            # runs of consecutive segments share a small bbox; the distance to the nearest
+            # segment of a run is computed with the segments along a third axis
+            for k in range(0, len(pts) - 1, 8):
+                run = pts[k:k + 9]
+                sub = self._region(run[:, 0].min() - hw - 1, run[:, 1].min() - hw - 1,
+                                   run[:, 0].max() + hw + 1, run[:, 1].max() + hw + 1)
+                if sub is None:
+                    continue
+                px, py = self._pixel_centers(sub)
+                px, py = px[..., None], py[..., None]
+                a, b = run[:-1], run[1:]
+                dx, dy = b[:, 0] - a[:, 0], b[:, 1] - a[:, 1]
+                t = np.clip(((px - a[:, 0]) * dx + (py - a[:, 1]) * dy) / np.maximum(dx * dx + dy * dy, 1e-12), 0, 1)
+                dist = np.hypot(px - (a[:, 0] + t * dx), py - (a[:, 1] + t * dy)).min(axis=-1)
+                view = coverage[sub[1] - ry0:sub[3] - ry0, sub[0] - rx0:sub[2] - rx0]
+                np.maximum(view, band(dist), out=view)
+        self._composite(region, coverage, self._stroke)
+
+    def _bounds(self, shapes: list[dict], pad: float) -> tuple[int, int, int, int] | None:
+        xs, ys = [], []
+        for s in shapes:
+            if s["kind"] == "circle":
+                (cx, cy), r = s["center"], s["radius"]
+                xs += [cx - r, cx + r]
+                ys += [cy - r, cy + r]
+            else:
+                pts = np.asarray(s["points"])
+                xs += [pts[:, 0].min(), pts[:, 0].max()]
+                ys += [pts[:, 1].min(), pts[:, 1].max()]
+        return self._region(min(xs) - pad, min(ys) - pad, max(xs) + pad, max(ys) + pad)
+
+    def to_bytes(self) -> np.ndarray:
+        return np.round(self.buf * 255).astype(np.uint8)
+
+
+# ---------------------------------------------------------------------------
+# CanvasPostFX passes (lib/fx/canvas/jazer-canvas-fx.js)
+# ---------------------------------------------------------------------------
+
+def load_fx_presets() -> dict:
+    """FX_PRESETS from jazer-post-fx.js (JS object literal -> JSON)."""
+    source = POST_FX_JS.read_text(encoding="utf-8")
+    start = source.index("export const FX_PRESETS = {") + len("export const FX_PRESETS = ")
+    depth = 0
+    for end in range(start, len(source)):
+        depth += {"{": 1, "}": -1}.get(source[end], 0)
+        if depth == 0:
+            break
+    literal = re.sub(r"//[^\n]*", "", source[start:end + 1])
+    literal = literal.replace("'", '"')
+    literal = re.sub(r"([{,]\s*)([A-Za-z_]\w*)\s*:", r'\1"\2":', literal)
+    literal = re.sub(r",(\s*[}\]])", r"\1", literal)
+    return json.loads(literal)
+
+
+def gaussian_blur(img: np.ndarray, sigma: float) -> np.ndarray:
+    """CSS blur(sigma px): separable Gaussian, edges clamped."""
+    if sigma <= 0:
+        return img
+    radius = int(math.ceil(sigma * 3))
+    k = np.exp(-0.5 * (np.arange(-radius, radius + 1) / sigma) ** 2)
+    k /= k.sum()
+    for axis in (0, 1):
+        pad = [(0, 0)] * img.ndim
+        pad[axis] = (radius, radius)
+        padded = np.pad(img, pad, mode="edge")
+        out = np.zeros_like(img)
+        n = img.shape[axis]
+        for i, w in enumerate(k):
+            out += w * np.take(padded, np.arange(i, i + n), axis=axis)
+        img = out
+    return img
+
+
+def apply_post_fx(frame: np.ndarray, config: dict, rng: np.random.Generator) -> np.ndarray:
+    """render(): bloom -> chromatic -> tonemapping -> vignette -> grain, on a 0..1 float frame."""
+    h, w = frame.shape[:2]
+    out = frame.copy()
+
+    bloom = config.get("bloom", {})
+    if bloom.get("enabled"):
+        bh, bw = h // 2, w // 2
+        small = out[:bh * 2, :bw * 2].reshape(bh, 2, bw, 2, 3).mean(axis=(1, 3)) * 255
+        thresh = bloom["threshold"] * 255
+        brightness = small @ np.array([0.299, 0.587, 0.114])
+        t = np.clip((brightness - thresh * 0.7) / (thresh * 0.3 or 1e-9), 0, 1)
+        factor = np.where(brightness < thresh, t * t * (3 - 2 * t), 1.0)
+        small = gaussian_blur(gaussian_blur(small * factor[..., None], math.floor(bloom["radius"] * min(bw, bh) * 0.1)),
+                              math.floor(bloom["radius"] * min(bw, bh) * 0.1))
+        up = np.repeat(np.repeat(small / 255, 2, axis=0), 2, axis=1)
+        out[:bh * 2, :bw * 2] = np.minimum(out[:bh * 2, :bw * 2] + up * bloom["intensity"], 1)
+
+    chromatic = config.get("chromatic", {})
+    if chromatic.get("enabled"):
+        cx, cy = w / 2, h / 2
+        y, x = np.mgrid[0:h, 0:w].astype(np.float64)
+        dx, dy = x - cx, y - cy
+        dist = np.hypot(dx, dy)
+        scale = chromatic["intensity"] * max(w, h) * 0.5
+        offset = scale * dist / math.hypot(cx, cy) if chromatic.get("radialFalloff") else scale
+        dirx = np.where(dist > 0, dx / np.maximum(dist, 1e-9), 0)
+        diry = np.where(dist > 0, dy / np.maximum(dist, 1e-9), 0)
+        src = out.copy()
+        for channel, sign in ((0, 1), (2, -1)):
+            sx = np.floor(x + sign * dirx * offset + 0.5).astype(np.int64)
+            sy = np.floor(y + sign * diry * offset + 0.5).astype(np.int64)
+            ok = (sx >= 0) & (sx < w) & (sy >= 0) & (sy < h)
+            out[..., channel] = np.where(ok, src[np.clip(sy, 0, h - 1), np.clip(sx, 0, w - 1), channel], src[..., channel])
+
+    tone = config.get("tonemapping", {})
+    if tone.get("enabled"):
+        v = out * tone["exposure"]
+        v = np.clip((v * (2.51 * v + 0.03)) / (v * (2.43 * v + 0.59) + 0.14), 0, 1)
+        out = np.round(v ** (1.0 / tone["gamma"]) * 255) / 255
+
+    vignette = config.get("vignette", {})
+    if vignette.get("enabled"):
+        ctx = Canvas2D(w, h)
+        ctx.buf = out.astype(np.float32)
+        intensity, smoothness, roundness = vignette["intensity"], vignette["smoothness"], vignette["roundness"]
+        max_r = max(w, h) * (0.5 + smoothness * 0.3)
+        grad = ctx.create_radial_gradient(w / 2, h / 2, max_r * (1 - intensity - smoothness * 0.5), w / 2, h / 2, max_r)
+        grad.add_color_stop(0, "rgba(0, 0, 0, 0)")
+        grad.add_color_stop(0.5, f"rgba(0, 0, 0, {intensity * 0.3})")
+        grad.add_color_stop(1, f"rgba(0, 0, 0, {intensity * 0.8})")
+        ctx.global_composite_operation = "multiply"
+        ctx.fill_style = grad
+        if roundness != 1:
+            ctx.translate(w / 2, h / 2)
+            ctx.scale(1, roundness)
+            ctx.translate(-w / 2, -h / 2 / roundness)
+        ctx.fill_rect(0, 0, w, h / (roundness or 1))
+        out = ctx.buf
+
+    grain = config.get("grain", {})
+    if grain.get("enabled"):
+        size = grain.get("size") or 1
+        gw, gh = max(int(w / size), 1), max(int(h / size), 1)
+        noise = (rng.random((gh, gw)) * 128 + 64) / 255
+        noise = noise[(np.arange(h) * gh // h)[:, None], (np.arange(w) * gw // w)[None, :]][..., None]
+        overlay = np.where(out < 0.5, 2 * out * noise, 1 - 2 * (1 - out) * (1 - noise))
+        a = min(grain["intensity"] * 2, 1)
+        out = np.round((out * (1 - a) + overlay * a) * 255) / 255
+    return out.astype(np.float32)
+
+
+# ---------------------------------------------------------------------------
+# Effect ports
+# ---------------------------------------------------------------------------
+
+class CanvasEffect:
+    """One effect's render() loop. W/H are CSS pixels; ctx draws at W * scale."""
+
+    ID = ""
+    SOURCE = ""
+
+    def __init__(self, ctx: Canvas2D, width: float, height: float, scale: float, rng: np.random.Generator,
+                 mouse: tuple[float, float]):
+        self.ctx = ctx
+        self.W, self.H = width, height
+        self.cx, self.cy = width / 2, height / 2
+        self.random = rng.random
+        self.mouse_x, self.mouse_y = mouse
+        self.mouse_centered_x, self.mouse_centered_y = mouse[0] * 2 - 1, mouse[1] * 2 - 1
+        self.time = 0.0
+        self.scale = scale
+        ctx.set_transform(scale, 0, 0, scale, 0, 0)   # resize(): ctx.setTransform(dpr, ...)
+        self.setup()
+
+    def setup(self) -> None:
+        pass
+
+    def frame(self) -> None:
+        raise NotImplementedError
+
+
+class PlasmaStorm(CanvasEffect):
+    """effects/jazer-plasma-storm.html (same scene as lib/canvas/PlasmaStorm.js)."""
+
+    ID = "jazer-plasma-storm"
+    SOURCE = "effects/jazer-plasma-storm.html"
+    COLORS = ["#ff0055", "#ff2aff", "#00f5ff", "#39ff14", "#ffd700", "#ff6b00"]
+
+    def setup(self) -> None:
+        self.orbs = [self._orb() for _ in range(8)]
+
+    def _orb(self) -> dict:
+        r = self.random
+        return {"x": r() * self.W, "y": r() * self.H, "size": 20 + r() * 60, "vx": (r() - 0.5) * 2,
+                "vy": (r() - 0.5) * 2, "color": self.COLORS[int(r() * len(self.COLORS))],
+                "pulse": 1 + r() * 2, "noise": r() * 1000}
+
+    def _update(self, o: dict) -> None:
+        mx, my = self.mouse_x * self.W, self.mouse_y * self.H
+        dx, dy = mx - o["x"], my - o["y"]
+        dist = math.sqrt(dx * dx + dy * dy)
+        if 10 < dist < 300:
+            o["vx"] += dx / dist * 0.5
+            o["vy"] += dy / dist * 0.5
+        n = noise2d(np.array([o["x"] * 0.003, o["y"] * 0.003]),
+                    np.array([self.time * 0.5 + o["noise"], self.time * 0.5 + o["noise"] + 100]), PERM, PERM_MOD12)
+        o["vx"] = (o["vx"] + n[0] * 0.3) * 0.98
+        o["vy"] = (o["vy"] + n[1] * 0.3) * 0.98
+        o["x"] += o["vx"]
+        o["y"] += o["vy"]
+        if o["x"] < -100: o["x"] = self.W + 100
+        if o["x"] > self.W + 100: o["x"] = -100
+        if o["y"] < -100: o["y"] = self.H + 100
+        if o["y"] > self.H + 100: o["y"] = -100
+
+    def _draw(self, o: dict) -> None:
+        ctx = self.ctx
+        size = o["size"] * (math.sin(self.time * o["pulse"]) * 0.3 + 1)
+        rgb = hex_to_rgb(o["color"])
+        for i in range(4, -1, -1):
+            layer = size * (1 + i * 0.5)
+            alpha = 0.15 / (i + 1)
+            grad = ctx.create_radial_gradient(o["x"], o["y"], 0, o["x"], o["y"], layer)
+            grad.add_color_stop(0, f"rgba({rgb['r']}, {rgb['g']}, {rgb['b']}, {alpha})")
+            grad.add_color_stop(0.5, f"rgba({rgb['r']}, {rgb['g']}, {rgb['b']}, {alpha * 0.5})")
+            grad.add_color_stop(1, "rgba(0, 0, 0, 0)")
+            ctx.fill_style = grad
+            ctx.begin_path()
+            ctx.arc(o["x"], o["y"], layer, 0, math.pi * 2)
+            ctx.fill()
+
+        k = np.arange(6)
+        lengths = size * (0.8 + noise2d(k + self.time, np.full(6, o["noise"]), PERM, PERM_MOD12) * 0.5)
+        for i in range(6):
+            angle = i / 6 * math.pi * 2 + self.time * 0.5
+            length = lengths[i]
+            ctx.stroke_style = f"rgba({rgb['r']}, {rgb['g']}, {rgb['b']}, 0.4)"
+            ctx.line_width = 3
+            ctx.begin_path()
+            ctx.move_to(o["x"], o["y"])
+            ctx.quadratic_curve_to(o["x"] + math.cos(angle + 0.3) * length * 0.5,
+                                   o["y"] + math.sin(angle + 0.3) * length * 0.5,
+                                   o["x"] + math.cos(angle) * length, o["y"] + math.sin(angle) * length)
+            ctx.stroke()
+
+    def _lightning(self, x1, y1, x2, y2, displacement, color, alpha) -> None:
+        points = [(x1, y1), (x2, y2)]
+
+        def subdivide(a: int, disp: float) -> int:
+            # points[a] -> points[a + 1]; returns how many points were inserted
+            if disp < 2:
+                return 0
+            (sx, sy), (ex, ey) = points[a], points[a + 1]
+            mid = ((sx + ex) / 2 + (self.random() - 0.5) * disp, (sy + ey) / 2 + (self.random() - 0.5) * disp)
+            points.insert(a + 1, mid)
+            left = subdivide(a, disp * 0.6)
+            return 1 + left + subdivide(a + 1 + left, disp * 0.6)
+
+        subdivide(0, displacement)
+        ctx = self.ctx
+        rgb = hex_to_rgb(color)
+        for style, width in ((f"rgba({rgb['r']}, {rgb['g']}, {rgb['b']}, {alpha * 0.3})", 8),
+                             (f"rgba({rgb['r']}, {rgb['g']}, {rgb['b']}, {alpha})", 2),
+                             (f"rgba(255, 255, 255, {alpha * 0.8})", 1)):
+            ctx.stroke_style = style
+            ctx.line_width = width
+            ctx.begin_path()
+            ctx.move_to(*points[0])
+            for p in points[1:]:
+                ctx.line_to(*p)
+            ctx.stroke()
+
+    def frame(self) -> None:
+        ctx, W, H = self.ctx, self.W, self.H
+        self.time += 1 / SIM_FPS
+        bg = ctx.create_radial_gradient(W / 2, H / 2, 0, W / 2, H / 2, max(W, H))
+        bg.add_color_stop(0, "#100010")
+        bg.add_color_stop(1, "#000005")
+        ctx.fill_style = bg
+        ctx.fill_rect(0, 0, W, H)
+        ctx.fill_style = "rgba(0, 0, 0, 0.15)"
+        ctx.fill_rect(0, 0, W, H)
+
+        ctx.save()
+        ctx.global_composite_operation = "lighter"
+        for orb in self.orbs:
+            self._update(orb)
+            self._draw(orb)
+        for i, a in enumerate(self.orbs):
+            for b in self.orbs[i + 1:]:
+                dist = math.hypot(b["x"] - a["x"], b["y"] - a["y"])
+                if dist < 400 and self.random() < 0.1:
+                    color = self.COLORS[int(math.floor(self.time * 2)) % len(self.COLORS)]
+                    self._lightning(a["x"], a["y"], b["x"], b["y"], 50, color, smoothstep(400, 100, dist) * 0.6)
+        mx, my = self.mouse_x * W, self.mouse_y * H
+        if mx > 0 and self.random() < 0.15:
+            nearest = min(self.orbs, key=lambda o: math.hypot(o["x"] - mx, o["y"] - my))
+            if math.hypot(nearest["x"] - mx, nearest["y"] - my) < 400:
+                self._lightning(nearest["x"], nearest["y"], mx, my, 60, "#00f5ff", 0.7)
+        ctx.restore()
+
+        ctx.fill_style = "rgba(0, 0, 0, 0.03)"
+        for y in range(0, int(math.ceil(H)), 3):
+            ctx.fill_rect(0, y, W, 1)
+
+        ctx.save()
+        ctx.global_composite_operation = "lighter"
+        ctx.fill_text("JaZeR", W / 2, H / 2)   # 0.02-0.06 alpha watermark; not rasterized
+        ctx.restore()
+
+
+class LayeredMandala(CanvasEffect):
+    """Shared loop of the sacred-geometry canvas effects: bg, trail, depth-sorted layers, glow, vignette."""
+
+    PALETTE: list[str] = []
+    LAYERS = 0
+    BG = ("#000000", "#000000")
+    TRAIL = 0.0
+    GLOW: tuple = ()
+    GLOW_RADIUS = 200
+    VIGNETTE = (0.4, 0.6)
+
+    def setup(self) -> None:
+        self.layers = [self.make_layer(i) for i in range(self.LAYERS)]
+
+    def frame(self) -> None:
+        ctx, W, H, cx, cy = self.ctx, self.W, self.H, self.cx, self.cy
+        self.time += 1 / SIM_FPS
+        bg = ctx.create_radial_gradient(cx, cy, 0, cx, cy, max(W, H) * 0.7)
+        bg.add_color_stop(0, self.BG[0])
+        bg.add_color_stop(1, self.BG[1])
+        ctx.fill_style = bg
+        ctx.fill_rect(0, 0, W, H)
+        ctx.fill_style = f"rgba(0, 0, 0, {self.TRAIL})"
+        ctx.fill_rect(0, 0, W, H)
+
+        self.layers.sort(key=lambda layer: -layer["z"])
+        for layer in self.layers:
+            self.update_layer(layer, 1 / SIM_FPS)
+            self.draw_layer(layer)
+
+        ctx.save()
+        ctx.global_composite_operation = "lighter"
+        glow = ctx.create_radial_gradient(cx, cy, 0, cx, cy, self.GLOW_RADIUS)
+        for offset, color in self.GLOW:
+            glow.add_color_stop(offset, color)
+        ctx.fill_style = glow
+        ctx.fill_rect(0, 0, W, H)
+        ctx.restore()
+
+        vig = ctx.create_radial_gradient(cx, cy, min(W, H) * self.VIGNETTE[0], cx, cy, max(W, H) * 0.7)
+        vig.add_color_stop(0, "rgba(0, 0, 0, 0)")
+        vig.add_color_stop(1, f"rgba(0, 0, 0, {self.VIGNETTE[1]})")
+        ctx.fill_style = vig
+        ctx.fill_rect(0, 0, W, H)
+
+
+class SeedOfLife(LayeredMandala):
+    """effects/jazer-seed-of-life.html"""
+
+    ID = "jazer-seed-of-life"
+    SOURCE = "effects/jazer-seed-of-life.html"
+    PALETTE = ["#00d4ff", "#00ff88", "#b37cff", "#00f5ff", "#7c3aed"]
+    LAYERS = 15
+    BG = ("#000815", "#000005")
+    TRAIL = 0.03
+    GLOW = ((0, "rgba(0, 212, 255, 0.08)"), (0.3, "rgba(124, 58, 237, 0.04)"), (1, "rgba(0, 0, 0, 0)"))
+    VIGNETTE = (0.4, 0.6)
+
+    def make_layer(self, i: int) -> dict:
+        return {"index": i, "z": i * 0.15, "dir": 1 if i % 3 == 0 else -0.5 if i % 3 == 1 else 0.3,
+                "color": i * 0.5, "pulse": i * 0.3}
+
+    def update_layer(self, layer: dict, dt: float) -> None:
+        layer["z"] += dt * 0.04
+        if layer["z"] > 2.2:
+            layer["z"] = 0
+            layer["color"] = self.random() * len(self.PALETTE)
+
+    def _glow_circle(self, x, y, radius, alpha, color) -> None:
+        ctx, rgb = self.ctx, hex_to_rgb(color)
+        for a, width in ((alpha * 0.3, 4), (alpha * 0.8, 1.5)):
+            ctx.stroke_style = f"rgba({rgb['r']}, {rgb['g']}, {rgb['b']}, {a})"
+            ctx.line_width = width
+            ctx.begin_path()
+            ctx.arc(x, y, radius, 0, math.pi * 2)
+            ctx.stroke()
+
+    def draw_layer(self, layer: dict) -> None:
+        z = layer["z"]
+        scale = 1 / (1 + z * 2)
+        alpha = smoothstep(0, 0.4, z) * smoothstep(2.2, 1.4, z)
+        if alpha < 0.01:
+            return
+        r = 70 * scale * (math.sin(self.time * 0.8 + layer["pulse"]) * 0.1 + 1)
+        rotation = self.time * 0.03 * layer["dir"] + layer["index"] * 0.2
+        parallax = z * 0.3
+        offset = layer["color"] + self.time * 0.2
+        n = len(self.PALETTE)
+
+        ctx = self.ctx
+        ctx.save()
+        ctx.translate(self.cx + self.mouse_centered_x * 50 * parallax, self.cy + self.mouse_centered_y * 50 * parallax)
+        ctx.rotate(rotation)
+        ctx.global_composite_operation = "lighter"
+        self._glow_circle(0, 0, r, alpha, self.PALETTE[int(math.floor(offset)) % n])
+        for i in range(6):
+            angle = i / 6 * math.pi * 2
+            self._glow_circle(math.cos(angle) * r, math.sin(angle) * r, r, alpha * 0.8,
+                              self.PALETTE[int(math.floor((offset + i * 0.5) % n))])
+        ctx.stroke_style = f"rgba(255, 255, 255, {alpha * 0.2})"
+        ctx.line_width = 0.5
+        for i in range(6):
+            mid = (i / 6 + (i + 1) / 6) / 2 * math.pi * 2
+            ctx.begin_path()
+            ctx.arc(math.cos(mid) * r * 0.5, math.sin(mid) * r * 0.5, r * 0.2, 0, math.pi * 2)
+            ctx.stroke()
+        ctx.restore()
+
+
+class SriYantra(LayeredMandala):
+    """effects/jazer-sri-yantra.html"""
+
+    ID = "jazer-sri-yantra"
+    SOURCE = "effects/jazer-sri-yantra.html"
+    PALETTE = ["#ff6b00", "#ff2a6d", "#d946ef", "#f97316", "#fbbf24"]
+    LAYERS = 8
+    BG = ("#150808", "#050002")
+    TRAIL = 0.04
+    GLOW = ((0, "rgba(255, 107, 0, 0.1)"), (0.4, "rgba(217, 70, 239, 0.05)"), (1, "rgba(0, 0, 0, 0)"))
+    GLOW_RADIUS = 180
+    VIGNETTE = (0.35, 0.7)
+    TRIANGLE_SIZES = [0.95, 0.8, 0.65, 0.5, 0.35, 0.22, 0.12]
+
+    def make_layer(self, i: int) -> dict:
+        return {"index": i, "z": i * 0.25, "dir": 1 if i % 2 == 0 else -1, "color": i * 0.6}
+
+    def update_layer(self, layer: dict, dt: float) -> None:
+        layer["z"] += dt * 0.05
+        if layer["z"] > 2:
+            layer["z"] = 0
+            layer["color"] = self.random() * len(self.PALETTE)
+
+    def draw_layer(self, layer: dict) -> None:
+        z = layer["z"]
+        scale = 1 / (1 + z * 1.8)
+        alpha = smoothstep(0, 0.5, z) * smoothstep(2, 1.2, z)
+        if alpha < 0.01:
+            return
+        radius = 150 * scale
+        parallax = z * 0.35
+        offset = layer["color"]
+        n = len(self.PALETTE)
+
+        ctx = self.ctx
+        ctx.save()
+        ctx.translate(self.cx + self.mouse_centered_x * 60 * parallax, self.cy + self.mouse_centered_y * 60 * parallax)
+        ctx.rotate(self.time * 0.05 * layer["dir"] + layer["index"] * 0.4)
+        ctx.global_composite_operation = "lighter"
+
+        rgb0 = hex_to_rgb(self.PALETTE[int(math.floor(offset)) % n])
+        ctx.stroke_style = f"rgba({rgb0['r']}, {rgb0['g']}, {rgb0['b']}, {alpha * 0.5})"
+        ctx.line_width = 2
+        ctx.begin_path()
+        ctx.arc(0, 0, radius, 0, math.pi * 2)
+        ctx.stroke()
+
+        for i, size in enumerate(self.TRIANGLE_SIZES):
+            r = radius * size
+            rgb = hex_to_rgb(self.PALETTE[int(math.floor((offset + i * 0.7) % n))])
+            tri_alpha = alpha * (0.9 - i * 0.08)
+            ctx.stroke_style = f"rgba({rgb['r']}, {rgb['g']}, {rgb['b']}, {tri_alpha})"
+            ctx.line_width = 1.5
+            ctx.begin_path()
+            for j in range(4):
+                angle = j / 3 * math.pi * 2 + (-math.pi / 2 if i % 2 == 0 else math.pi / 2)
+                (ctx.move_to if j == 0 else ctx.line_to)(math.cos(angle) * r, math.sin(angle) * r)
+            ctx.close_path()
+            ctx.stroke()
+            ctx.fill_style = f"rgba({rgb['r']}, {rgb['g']}, {rgb['b']}, {tri_alpha * 0.1})"
+            ctx.fill()
+
+        bindu = hex_to_rgb(self.PALETTE[int(math.floor((offset + self.time) % n))])
+        glow = ctx.create_radial_gradient(0, 0, 0, 0, 0, radius * 0.15)
+        glow.add_color_stop(0, f"rgba({bindu['r']}, {bindu['g']}, {bindu['b']}, {alpha})")
+        glow.add_color_stop(0.5, f"rgba({bindu['r']}, {bindu['g']}, {bindu['b']}, {alpha * 0.3})")
+        glow.add_color_stop(1, "rgba(0, 0, 0, 0)")
+        ctx.fill_style = glow
+        ctx.fill_rect(-radius * 0.15, -radius * 0.15, radius * 0.3, radius * 0.3)
+        ctx.restore()
+
+
+PORTS = {cls.ID: cls for cls in (PlasmaStorm, SeedOfLife, SriYantra)}
+
+
+# ---------------------------------------------------------------------------
+# PNG / APNG (stdlib zlib)
+# ---------------------------------------------------------------------------
+
+def png_chunk(tag: bytes, data: bytes) -> bytes:
+    return struct.pack(">I", len(data)) + tag + data + struct.pack(">I", zlib.crc32(tag + data) & 0xFFFFFFFF)
+
+
+def png_idat(frame: np.ndarray) -> bytes:
+    rows = np.concatenate([np.zeros((frame.shape[0], 1), dtype=np.uint8), frame.reshape(frame.shape[0], -1)], axis=1)
+    return zlib.compress(rows.tobytes(), 6)
+
+
+def png_header(frame: np.ndarray) -> bytes:
+    h, w = frame.shape[:2]
+    return b"\x89PNG\r\n\x1a\n" + png_chunk(b"IHDR", struct.pack(">IIBBBBB", w, h, 8, 2, 0, 0, 0))
+
+
+def write_png(path: Path, frame: np.ndarray) -> None:
+    path.write_bytes(png_header(frame) + png_chunk(b"IDAT", png_idat(frame)) + png_chunk(b"IEND", b""))
+
+
+def write_apng(path: Path, frames: list[np.ndarray], fps: float) -> None:
+    """Animated PNG, looping forever; frame delay 1/fps."""
+    h, w = frames[0].shape[:2]
+    parts = [png_header(frames[0]), png_chunk(b"acTL", struct.pack(">II", len(frames), 0))]
+    seq = 0
+    delay = (int(round(1000 / fps)), 1000)
+    for i, frame in enumerate(frames):
+        parts.append(png_chunk(b"fcTL", struct.pack(">IIIIIHHBB", seq, w, h, 0, 0, *delay, 0, 0)))
+        seq += 1
+        data = png_idat(frame)
+        if i == 0:
+            parts.append(png_chunk(b"IDAT", data))
+        else:
+            parts.append(png_chunk(b"fdAT", struct.pack(">I", seq) + data))
+            seq += 1
+    parts.append(png_chunk(b"IEND", b""))
+    path.write_bytes(b"".join(parts))
+
+
+# ---------------------------------------------------------------------------
+# Driver
+# ---------------------------------------------------------------------------
+
+def render_effect(job: dict) -> dict:
+    """Render one effect; runs in a worker process with --jobs."""
+    cls = PORTS[job["id"]]
+    width, height = job["size"]
+    scale = job["scale"]
+    ctx = Canvas2D(max(int(width * scale), 1), max(int(height * scale), 1))
+    rng = np.random.default_rng(job["seed"])
+    effect = cls(ctx, width, height, scale, rng, job["mouse"])
+    post = job["postfx"]
+
+    step = max(int(round(SIM_FPS / job["fps"])), 1)
+    warmup = int(round(job["warmup"] * SIM_FPS))
+    started = clock.perf_counter()
+    for _ in range(warmup):
+        effect.frame()
+    frames = []
+    for i in range(job["frames"]):
+        for _ in range(step if i else 1):
+            effect.frame()
+        image = apply_post_fx(ctx.buf, post, rng) if post else ctx.buf
+        frames.append(np.round(image * 255).astype(np.uint8))
+    simulated = warmup + 1 + (job["frames"] - 1) * step
+    elapsed = clock.perf_counter() - started
+
+    out = Path(job["out"])
+    if job["frames"] == 1:
+        files = [out / f"{cls.ID}.png"]
+        write_png(files[0], frames[0])
+    elif job["apng"]:
+        files = [out / f"{cls.ID}.png"]
+        write_apng(files[0], frames, SIM_FPS / step)
+    else:
+        (out / cls.ID).mkdir(parents=True, exist_ok=True)
+        files = [out / cls.ID / f"frame_{i:04d}.png" for i in range(len(frames))]
+        for path, frame in zip(files, frames):
+            write_png(path, frame)
+    return {"id": cls.ID, "files": [str(f) for f in files], "simulated": simulated,
+            "ms_per_frame": elapsed * 1000 / simulated, "skipped": dict(ctx.skipped)}
+
+
+def canvas_effect_ids() -> list[str]:
+    manifest = json.loads(MANIFEST.read_text(encoding="utf-8"))
+    return [e["id"] for e in manifest["effects"] if e.get("type") == "canvas"]
+
+
+def parse_size(value: str) -> tuple[int, int]:
+    w, _, h = value.lower().partition("x")
+    return int(w), int(h)
+
+
+def main() -> int:
+    ap = argparse.ArgumentParser(description="Render canvas effect previews with NumPy (no browser).")
+    ap.add_argument("effects", nargs="*", help="Effect ids (see --list)")
+    ap.add_argument("--all", action="store_true", help="Every ported canvas effect (not the whole canvas category; see --list)")
+    ap.add_argument("--list", action="store_true", help="List canvas effects and whether they have a port")
+    ap.add_argument("--frames", type=int, default=1, help="Frames to write (1 = still thumbnail)")
+    ap.add_argument("--fps", type=float, default=30, help="Output frame rate (simulation runs at 60)")
+    ap.add_argument("--warmup", type=float, default=2.0, help="Seconds simulated before the first frame")
+    ap.add_argument("--size", type=parse_size, default=(1280, 720), help="CSS viewport WxH the effect lays out in")
+    ap.add_argument("--scale", type=float, default=0.5, help="Pixels per CSS pixel (like devicePixelRatio)")
+    ap.add_argument("--mouse", type=float, nargs=2, default=(0.5, 0.5), metavar=("X", "Y"),
+                    help="Normalized mouse position (MouseTracker starts at 0.5, 0.5)")
+    ap.add_argument("--postfx", help="CanvasPostFX preset from jazer-post-fx.js (e.g. neon, subtle)")
+    ap.add_argument("--apng", action="store_true", help="Write one animated PNG per effect instead of a sequence")
+    ap.add_argument("--seed", type=int, default=1, help="Seed for Math.random()")
+    ap.add_argument("--jobs", type=int, default=1, help="Worker processes")
+    ap.add_argument("--out-dir", default=DEFAULT_OUT, help="Output directory (repo-relative)")
+    args = ap.parse_args()
+
+    canvas_ids = canvas_effect_ids()
+    if args.list:
+        for effect_id in canvas_ids:
+            print(f"{'port' if effect_id in PORTS else '-':>5}  {effect_id}")
+        print(f"{sum(i in PORTS for i in canvas_ids)}/{len(canvas_ids)} canvas effect(s) ported")
+        return 0
+
+    ids = [i for i in canvas_ids if i in PORTS] if args.all else args.effects
+    if not ids:
+        raise SystemExit("Name effect ids or pass --all (see --list)")
+    missing = [i for i in ids if i not in PORTS]
+    if missing:
+        raise SystemExit(f"No NumPy port for: {', '.join(missing)}; ported: {', '.join(PORTS)}")
+    if args.frames < 1:
+        raise SystemExit("--frames must be at least 1")
+
+    post = None
+    if args.postfx:
+        presets = load_fx_presets()
+        if args.postfx not in presets:
+            raise SystemExit(f"Unknown postfx preset {args.postfx!r}; available: {', '.join(presets)}")
+        post = presets[args.postfx]
+
+    out = ROOT / args.out_dir
+    out.mkdir(parents=True, exist_ok=True)
+    jobs = [{"id": i, "size": args.size, "scale": args.scale, "seed": args.seed, "mouse": tuple(args.mouse),
+             "postfx": post, "fps": args.fps, "warmup": args.warmup, "frames": args.frames,
+             "apng": args.apng, "out": str(out)} for i in ids]
+
+    started = clock.perf_counter()
+    if args.jobs > 1 and len(jobs) > 1:
+        with ProcessPoolExecutor(max_workers=args.jobs) as pool:
+            results = list(pool.map(render_effect, jobs))
+    else:
+        results = [render_effect(job) for job in jobs]
+
+    for r in results:
+        skipped = ", ".join(f"{k} x{v}" for k, v in r["skipped"].items())
+        print(f"{r['id']:<28} {r['simulated']:>5} frame(s) simulated  {r['ms_per_frame']:7.1f} ms/frame  "
+              f"-> {Path(r['files'][0]).relative_to(ROOT) if Path(r['files'][0]).is_relative_to(ROOT) else r['files'][0]}"
+              + (f" (+{len(r['files']) - 1})" if len(r["files"]) > 1 else "")
+              + (f"\n  skipped: {skipped}" if skipped else ""))
+    unported = [i for i in canvas_ids if i not in PORTS]
+    print(f"Rendered {len(results)} effect(s) in {clock.perf_counter() - started:.1f}s. "
+          f"Not covered: {len(unported)} of {len(canvas_ids)} canvas effect(s) have no port "
+          f"and need browser-captured thumbnails (--list).")
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,1327 @@
+#!/usr/bin/env python3
+"""
+JaZeR Visual Effects Library — Shader Preview Renderer
+
+Renders thumbnails and short previews of the effects' fragment shaders on the CPU.
+Every `fragmentShader` in effects/*.html (ShaderMaterial, RawShaderMaterial and
+pass objects) is extracted with its uniforms and interpreted over the whole pixel
+grid at once: each GLSL value is a NumPy array per component, so one statement
+shades every pixel.
+
+Supported GLSL subset:
+- float/int/bool, vec2-4 (ivec/bvec treated as vec), mat2-4, fixed-size arrays
+- swizzles (read and write), constructors, operators, ternaries, compound assignment
+- if/else, for/while (unrolled; divergent conditions, break, continue, return and
+  discard are handled with per-pixel masks), user functions
+- gl_FragCoord, gl_PointCoord (a point sprite fills the grid)
+- common builtins (trig, pow/exp/log, mod/fract/floor, mix/clamp/step/smoothstep,
+  length/distance/dot/cross/normalize/reflect, dFdx/dFdy/fwidth from the grid)
+- object-like #define, #ifdef/#ifndef/#else/#endif
+Anything else (texture sampling, #include, structs, out parameters, varyings not
+derived from `uv`, ...) stops that shader and is reported with the reason;
+the rest of the batch carries on.
+
+Inputs: gl_FragCoord covers the output grid and uv-derived varyings (vUv = uv)
+cover 0..1 across it. Time/resolution/mouse uniforms are recognized by name.
+Other uniforms use the literal defaults from their `{ value: ... }`, and a
+THREE.Color(hex) is converted from sRGB to linear as Three.js does. Unresolved
+uniforms are zero and noted.
+
+Requires NumPy.
+
+Outputs (default .cache/shader-previews/):
+  <id>.<n>.png              thumbnail of the n-th shader in the effect
+  <id>.<n>.png              APNG with --frames N --apng
+  <id>.<n>/frame_0000.png   PNG sequence with --frames N
+  report.json               status, reason and timing per shader
+
+Usage:
+  python tools/render_shader_previews.py --check
+  python tools/render_shader_previews.py jazer-void-bloom-portal --size 256x256 --time 3
+  python tools/render_shader_previews.py --frames 24 --fps 12 --apng
+"""
+
+
+from __future__ import annotations
+
+import argparse
+import json
+import math
+import re
+import time as clock
+from pathlib import Path
+
+import numpy as np
+
+from render_canvas_previews import write_apng, write_png
+
+
+ROOT = Path(__file__).resolve().parents[1]
+EFFECTS_DIR = ROOT / "effects"
+DEFAULT_OUT = ".cache/shader-previews"
+MAX_LOOP = 1024
+
+TIME_UNIFORMS = {"utime", "time", "itime", "u_time", "uglobaltime"}
+RESOLUTION_UNIFORMS = {"uresolution", "resolution", "iresolution", "u_resolution"}
+MOUSE_UNIFORMS = {"umouse", "mouse", "imouse", "u_mouse"}
+
+
+class Unsupported(Exception):
+    """The shader uses something outside the supported subset."""
+
+
+# ---------------------------------------------------------------------------
+# Preprocessor, lexer, parser
+# ---------------------------------------------------------------------------
+
+TOKEN_RE = re.compile(r"""
+    (?P<ws>\s+|//[^\n]*|/\*.*?\*/)
+  | (?P<num>0[xX][0-9a-fA-F]+|(?:\d+\.\d*|\.\d+|\d+)(?:[eE][+-]?\d+)?[fFuU]?)
+  | (?P<id>[A-Za-z_]\w*)
+  | (?P<op>\+\+|--|\+=|-=|\*=|/=|==|!=|<=|>=|&&|\|\||\^\^|[-+*/%<>=!?:;,.(){}\[\]])
+""", re.S | re.X)
+
+TYPES = {"void", "bool", "int", "float", "vec2", "vec3", "vec4", "ivec2", "ivec3", "ivec4",
+         "bvec2", "bvec3", "bvec4", "mat2", "mat3", "mat4", "sampler2D", "samplerCube"}
+QUALIFIERS = {"const", "uniform", "varying", "attribute", "in", "highp", "mediump", "lowp",
+              "invariant", "flat", "smooth"}
+SWIZZLE_SETS = ("xyzw", "rgba", "stpq")
+
+
+def normalize_type(name: str) -> str:
+    return name[1:] if name[:4] in ("ivec", "bvec") else name
+
+
+def preprocess(source: str) -> tuple[str, dict[str, str]]:
+    """#define (object-like) and #ifdef blocks; returns the code and the macro table."""
+    macros: dict[str, str] = {"GL_ES": "1"}
+    active = [True]
+    lines = []
+    for line in source.splitlines():
+        stripped = line.strip()
+        if not stripped.startswith("#"):
+            lines.append(line if all(active) else "")
+            continue
+        lines.append("")
+        directive, _, rest = stripped[1:].strip().partition(" ")
+        rest = rest.strip()
+        if directive in ("ifdef", "ifndef"):
+            active.append((rest in macros) == (directive == "ifdef"))
+        elif directive == "else":
+            active[-1] = not active[-1]
+        elif directive == "endif":
+            if len(active) > 1:
+                active.pop()
+        elif not all(active) or directive in ("version", "extension", "pragma", "line"):
+            continue
+        elif directive == "define":
+            m = re.match(r"([A-Za-z_]\w*)(\()?\s*(.*)", rest)
+            if m.group(2):
+                raise Unsupported(f"function-like macro {m.group(1)}()")
+            macros[m.group(1)] = re.sub(r"//.*", "", m.group(3)).strip()
+        elif directive == "undef":
+            macros.pop(rest, None)
+        else:
+            raise Unsupported(f"#{directive} {rest}".strip())
+    return "\n".join(lines), macros
+
+
+def tokenize(code: str, macros: dict[str, str]) -> list[str]:
+    def lex(text: str) -> list[str]:
+        tokens, pos = [], 0
+        while pos < len(text):
+            m = TOKEN_RE.match(text, pos)
+            if not m:
+                raise Unsupported(f"unexpected character {text[pos]!r}")
+            pos = m.end()
+            if m.lastgroup != "ws":
+                tokens.append(m.group())
+        return tokens
+
+    def expand(tokens: list[str], depth: int = 0) -> list[str]:
+        out = []
+        for tok in tokens:
+            if tok in macros and depth < 16:
+                out.extend(expand(lex(macros[tok]), depth + 1))
+            else:
+                out.append(tok)
+        return out
+
+    return expand(lex(code))
+
+
+class Parser:
+    """Recursive descent over the token list; produces tuples (see Evaluator for the node kinds)."""
+
+    def __init__(self, tokens: list[str]):
+        self.tokens = tokens
+        self.pos = 0
+
+    # --- helpers -----------------------------------------------------------
+
+    def peek(self, offset: int = 0) -> str | None:
+        i = self.pos + offset
+        return self.tokens[i] if i < len(self.tokens) else None
+
+    def take(self, expected: str | None = None) -> str:
+        tok = self.peek()
+        if tok is None or (expected is not None and tok != expected):
+            raise Unsupported(f"parse error: expected {expected or 'token'}, got {tok!r}")
+        self.pos += 1
+        return tok
+
+    def accept(self, tok: str) -> bool:
+        if self.peek() == tok:
+            self.pos += 1
+            return True
+        return False
+
+    def is_type(self, tok: str | None) -> bool:
+        return tok in TYPES
+
+    # --- top level ---------------------------------------------------------
+
+    def program(self) -> dict:
+        prog = {"globals": [], "functions": {}, "uniforms": {}, "varyings": {}, "outputs": []}
+        while self.peek() is not None:
+            tok = self.peek()
+            if tok == "precision":
+                while self.take() != ";":
+                    pass
+                continue
+            if tok == "struct":
+                raise Unsupported("struct")
+            if tok == "layout":
+                raise Unsupported("layout qualifier")
+            quals = set()
+            while self.peek() in QUALIFIERS or self.peek() == "out":
+                quals.add(self.take())
+            ctype = self.take()
+            if not self.is_type(ctype):
+                raise Unsupported(f"unknown type {ctype!r}")
+            ctype = normalize_type(ctype)
+            name = self.take()
+            if self.peek() == "(":
+                self.function(prog, ctype, name)
+                continue
+            decls = self.declarators(ctype, name)
+            if "uniform" in quals:
+                prog["uniforms"].update({n: ctype for n, _, _ in decls})
+            elif "varying" in quals or "in" in quals:
+                prog["varyings"].update({n: ctype for n, _, _ in decls})
+            elif "out" in quals:
+                prog["outputs"].extend(n for n, _, _ in decls)
+                prog["globals"].append(("decl", ctype, decls))
+            elif "attribute" not in quals:
+                prog["globals"].append(("decl", ctype, decls))
+        if "main" not in prog["functions"]:
+            raise Unsupported("no main()")
+        return prog
+
+    def function(self, prog: dict, ret_type: str, name: str) -> None:
+        self.take("(")
+        params = []
+        while not self.accept(")"):
+            quals = set()
+            while self.peek() in QUALIFIERS or self.peek() in ("out", "inout"):
+                quals.add(self.take())
+            if quals & {"out", "inout"}:
+                raise Unsupported(f"out parameter in {name}()")
+            ptype = self.take()
+            if ptype == "void":
+                continue
+            if not self.is_type(ptype):
+                raise Unsupported(f"unknown type {ptype!r}")
+            pname = self.take() if self.peek() not in (",", ")") else f"_{len(params)}"
+            if self.peek() == "[":
+                raise Unsupported(f"array parameter in {name}()")
+            params.append((normalize_type(ptype), pname))
+            self.accept(",")
+        if self.accept(";"):
+            return   # prototype
+        prog["functions"].setdefault(name, []).append((ret_type, params, self.block()))
+
+    def declarators(self, ctype: str, first: str) -> list[tuple]:
+        decls = []
+        name = first
+        while True:
+            size = None
+            if self.accept("["):
+                size = self.expression()
+                self.take("]")
+            init = self.assignment() if self.accept("=") else None
+            decls.append((name, size, init))
+            if self.accept(";"):
+                return decls
+            self.take(",")
+            name = self.take()
+
+    # --- statements --------------------------------------------------------
+
+    def block(self) -> tuple:
+        self.take("{")
+        body = []
+        while not self.accept("}"):
+            body.append(self.statement())
+        return ("block", body)
+
+    def statement(self) -> tuple:
+        tok = self.peek()
+        if tok == "{":
+            return self.block()
+        if tok == ";":
+            self.take()
+            return ("block", [])
+        if tok == "if":
+            self.take()
+            self.take("(")
+            cond = self.expression()
+            self.take(")")
+            then = self.statement()
+            other = self.statement() if self.accept("else") else None
+            return ("if", cond, then, other)
+        if tok == "for":
+            self.take()
+            self.take("(")
+            init = None if self.accept(";") else self.simple_statement()
+            cond = None if self.peek() == ";" else self.expression()
+            self.take(";")
+            step = None if self.peek() == ")" else self.expression()
+            self.take(")")
+            return ("for", init, cond, step, self.statement())
+        if tok == "while":
+            self.take()
+            self.take("(")
+            cond = self.expression()
+            self.take(")")
+            return ("for", None, cond, None, self.statement())
+        if tok == "do":
+            raise Unsupported("do/while")
+        if tok == "switch":
+            raise Unsupported("switch")
+        if tok == "return":
+            self.take()
+            value = None if self.peek() == ";" else self.expression()
+            self.take(";")
+            return ("return", value)
+        if tok in ("break", "continue", "discard"):
+            self.take()
+            self.take(";")
+            return (tok,)
+        return self.simple_statement()
+
+    def simple_statement(self) -> tuple:
+        while self.peek() in QUALIFIERS:
+            self.take()
+        if self.is_type(self.peek()) and self.peek(1) not in ("(",):
+            ctype = normalize_type(self.take())
+            return ("decl", ctype, self.declarators(ctype, self.take()))
+        expr = self.expression()
+        self.take(";")
+        return ("expr", expr)
+
+    # --- expressions -------------------------------------------------------
+
+    def expression(self) -> tuple:
+        expr = self.assignment()
+        while self.accept(","):
+            expr = ("comma", expr, self.assignment())
+        return expr
+
+    def assignment(self) -> tuple:
+        target = self.ternary()
+        if self.peek() in ("=", "+=", "-=", "*=", "/="):
+            op = self.take()
+            return ("assign", op, target, self.assignment())
+        return target
+
+    def ternary(self) -> tuple:
+        cond = self.binary(0)
+        if self.accept("?"):
+            a = self.assignment()
+            self.take(":")
+            return ("ternary", cond, a, self.assignment())
+        return cond
+
+    LEVELS = (("||",), ("^^",), ("&&",), ("==", "!="), ("<", ">", "<=", ">="), ("+", "-"), ("*", "/", "%"))
+
+    def binary(self, level: int) -> tuple:
+        if level == len(self.LEVELS):
+            return self.unary()
+        left = self.binary(level + 1)
+        while self.peek() in self.LEVELS[level]:
+            op = self.take()
+            left = ("binary", op, left, self.binary(level + 1))
+        return left
+
+    def unary(self) -> tuple:
+        tok = self.peek()
+        if tok in ("-", "+", "!"):
+            self.take()
+            return ("unary", tok, self.unary())
+        if tok in ("++", "--"):
+            self.take()
+            return ("incdec", tok, self.unary(), True)
+        return self.postfix()
+
+    def postfix(self) -> tuple:
+        expr = self.primary()
+        while True:
+            if self.accept("."):
+                expr = ("field", expr, self.take())
+            elif self.accept("["):
+                expr = ("index", expr, self.expression())
+                self.take("]")
+            elif self.peek() in ("++", "--"):
+                expr = ("incdec", self.take(), expr, False)
+            else:
+                return expr
+
+    def primary(self) -> tuple:
+        tok = self.take()
+        if tok == "(":
+            expr = self.expression()
+            self.take(")")
+            return expr
+        if tok[0].isdigit() or tok[0] == ".":
+            if tok[:2].lower() == "0x":
+                return ("num", float(int(tok, 16)), "int")
+            is_float = any(c in tok for c in ".eEfF") and not tok.lower().startswith("0x")
+            return ("num", float(tok.rstrip("fFuU")), "float" if is_float else "int")
+        if tok in ("true", "false"):
+            return ("bool", tok == "true")
+        if not re.match(r"[A-Za-z_]", tok):
+            raise Unsupported(f"parse error near {tok!r}")
+        if self.peek() == "[" and self.is_type(tok):
+            raise Unsupported("array constructor")
+        if self.accept("("):
+            args = []
+            while not self.accept(")"):
+                if self.peek() == "void":
+                    self.take()
+                    continue
+                args.append(self.assignment())
+                self.accept(",")
+            return ("call", tok, args)
+        return ("name", tok)
+
+
+# ---------------------------------------------------------------------------
+# Values: one NumPy array (or 0-d scalar) per component
+# ---------------------------------------------------------------------------
+
+F32 = np.float32
+
+
+class V:
+    """A GLSL value. Scalars hold one array; vecN a list of N; matN a list of N columns; arrays a list of V."""
+
+    __slots__ = ("type", "data")
+
+    def __init__(self, type_: str, data):
+        self.type = type_
+        self.data = data
+
+    def comps(self) -> list:
+        if self.type in ("float", "int", "bool"):
+            return [self.data]
+        if self.type.startswith("vec"):
+            return list(self.data)
+        if self.type.startswith("mat"):
+            return [c for col in self.data for c in col]
+        raise Unsupported(f"{self.type} used as a number")
+
+
+def size_of(type_: str) -> int:
+    if type_ in ("float", "int", "bool"):
+        return 1
+    if type_.startswith("vec"):
+        return int(type_[3])
+    if type_.startswith("mat"):
+        return int(type_[3]) ** 2
+    raise Unsupported(f"type {type_}")
+
+
+def vec_type(n: int) -> str:
+    return "float" if n == 1 else f"vec{n}"
+
+
+def zeros(type_: str) -> V:
+    if type_ in ("float", "int"):
+        return V(type_, F32(0))
+    if type_ == "bool":
+        return V(type_, np.False_)
+    if type_.startswith("vec"):
+        return V(type_, [F32(0)] * int(type_[3]))
+    if type_.startswith("mat"):
+        n = int(type_[3])
+        return V(type_, [[F32(0)] * n for _ in range(n)])
+    raise Unsupported(f"{type_} variable")
+
+
+def uniform(x) -> bool:
+    return np.ndim(x) == 0
+
+
+def select(mask, new: V, old: V) -> V:
+    """Per-pixel merge: new where mask, old elsewhere."""
+    if isinstance(new.data, list) and new.data and isinstance(new.data[0], V):
+        return V(new.type, [select(mask, n, o) for n, o in zip(new.data, old.data)])
+    if new.type.startswith("mat"):
+        return V(new.type, [[np.where(mask, a, b) for a, b in zip(ca, cb)] for ca, cb in zip(new.data, old.data)])
+    if isinstance(new.data, list):
+        return V(new.type, [np.where(mask, a, b) for a, b in zip(new.data, old.data)])
+    return V(new.type, np.where(mask, new.data, old.data))
+
+
+def mask_and(mask, cond):
+    if mask is False:
+        return False
+    if mask is None:
+        return cond
+    return np.logical_and(mask, cond)
+
+
+def mask_or(a, b):
+    if a is None or b is None:
+        return None
+    if a is False:
+        return b
+    if b is False:
+        return a
+    return np.logical_or(a, b)
+
+
+def mask_empty(mask) -> bool:
+    return mask is False or (mask is not None and not mask.any())
+
+
+def _glsl_mod(x, y):
+    return x - y * np.floor(x / y)
+
+
+def _smoothstep(e0, e1, x):
+    t = np.clip((x - e0) / (e1 - e0), 0, 1)
+    return t * t * (3 - 2 * t)
+
+
+COMPONENT_FUNCS = {
+    "sin": np.sin, "cos": np.cos, "tan": np.tan, "asin": np.arcsin, "acos": np.arccos,
+    "sinh": np.sinh, "cosh": np.cosh, "tanh": np.tanh,
+    "pow": np.power, "exp": np.exp, "log": np.log, "exp2": np.exp2, "log2": np.log2,
+    "sqrt": np.sqrt, "inversesqrt": lambda x: 1 / np.sqrt(x),
+    "abs": np.abs, "sign": np.sign, "floor": np.floor, "ceil": np.ceil, "trunc": np.trunc,
+    "round": lambda x: np.floor(x + F32(0.5)), "fract": lambda x: x - np.floor(x),
+    "mod": _glsl_mod, "min": np.minimum, "max": np.maximum,
+    "clamp": lambda x, a, b: np.minimum(np.maximum(x, a), b),
+    "mix": lambda x, y, a: x * (1 - a) + y * a,
+    "step": lambda edge, x: np.where(x < edge, F32(0), F32(1)),
+    "smoothstep": _smoothstep,
+    "radians": lambda x: x * F32(math.pi / 180), "degrees": lambda x: x * F32(180 / math.pi),
+}
+
+
+# ---------------------------------------------------------------------------
+# Evaluator
+# ---------------------------------------------------------------------------
+
+class Frame:
+    __slots__ = ("ret",)
+
+    def __init__(self):
+        self.ret: V | None = None
+
+
+class Loop:
+    __slots__ = ("broken", "cont")
+
+    def __init__(self):
+        self.broken = False
+        self.cont = False
+
+
+class Evaluator:
+    """Runs main() once for every pixel of a width x height grid."""
+
+    def __init__(self, prog: dict, width: int, height: int, uniforms: dict[str, V], varyings: dict[str, V]):
+        self.prog = prog
+        self.width, self.height = width, height
+        self.mask = None          # None: every pixel live; False: none; bool array otherwise
+        self.discarded = False
+        self.frame = Frame()
+        self.loops: list[Loop] = []
+        self.depth = 0
+
+        x, y = np.meshgrid(np.arange(width, dtype=F32) + F32(0.5),
+                           np.arange(height - 1, -1, -1, dtype=F32) + F32(0.5))
+        self.globals: dict[str, V] = {
+            "gl_FragCoord": V("vec4", [x, y, F32(0.5), F32(1)]),
+            "gl_FragColor": zeros("vec4"),
+            # a point sprite previewed as one sprite filling the grid
+            "gl_PointCoord": V("vec2", [x / F32(width), F32(1) - y / F32(height)]),
+        }
+        self.globals.update(uniforms)
+        self.globals.update(varyings)
+        for name in prog["varyings"]:
+            self.globals.setdefault(name, V("unavailable", f"varying set from geometry ({name})"))
+        self.scopes: list[dict[str, V]] = [self.globals]
+
+    def run(self) -> tuple[np.ndarray, np.ndarray | bool]:
+        for stmt in self.prog["globals"]:
+            self.exec(stmt)
+        self.call_user("main", [])
+        out = self.prog["outputs"][0] if self.prog["outputs"] else "gl_FragColor"
+        color = self.globals[out]
+        if color.type != "vec4":
+            raise Unsupported(f"output {out} is {color.type}")
+        shape = (self.height, self.width)
+        rgba = np.stack([np.broadcast_to(np.asarray(c, dtype=F32), shape) for c in color.data], -1)
+        return rgba, self.discarded
+
+    # --- variables ---------------------------------------------------------
+
+    def lookup(self, name: str) -> V:
+        for scope in reversed(self.scopes):
+            if name in scope:
+                value = scope[name]
+                if value.type == "unavailable":
+                    raise Unsupported(value.data)
+                return value
+        raise Unsupported(f"unknown identifier {name!r}")
+
+    def store(self, name: str, value: V) -> None:
+        for scope in reversed(self.scopes):
+            if name in scope:
+                old = scope[name]
+                value = self.convert(value, old.type)
+                scope[name] = value if self.mask is None else select(self.mask, value, old)
+                return
+        raise Unsupported(f"assignment to unknown identifier {name!r}")
+
+    def convert(self, value: V, type_: str) -> V:
+        if value.type == type_:
+            return value
+        if value.type in ("float", "int") and type_ in ("float", "int"):
+            return V(type_, np.trunc(value.data) if type_ == "int" else value.data)
+        if type_ == "array" or value.type == "array":
+            raise Unsupported("array assignment")
+        if size_of(value.type) == size_of(type_) and not (value.type.startswith("mat") ^ type_.startswith("mat")):
+            return value if type_ != "bool" else V("bool", value.data)
+        raise Unsupported(f"cannot convert {value.type} to {type_}")
+
+    # --- statements --------------------------------------------------------
+
+    def exec_block(self, stmts: list) -> None:
+        self.scopes.append({})
+        try:
+            for stmt in stmts:
+                if mask_empty(self.mask):
+                    break
+                self.exec(stmt)
+        finally:
+            self.scopes.pop()
+
+    def exec(self, stmt: tuple) -> None:
+        kind = stmt[0]
+        if kind == "block":
+            self.exec_block(stmt[1])
+        elif kind == "decl":
+            _, ctype, decls = stmt
+            for name, size, init in decls:
+                if size is not None:
+                    n = int(self.eval(size).data)
+                    self.scopes[-1][name] = V("array", [zeros(ctype) for _ in range(n)])
+                    continue
+                self.scopes[-1][name] = self.convert(self.eval(init), ctype) if init is not None else zeros(ctype)
+        elif kind == "expr":
+            self.eval(stmt[1])
+        elif kind == "if":
+            self.exec_if(stmt)
+        elif kind == "for":
+            self.exec_for(stmt)
+        elif kind == "return":
+            if stmt[1] is not None:
+                value = self.eval(stmt[1])
+                prev = self.frame.ret
+                self.frame.ret = value if self.mask is None or prev is None else select(self.mask, value, prev)
+            self.mask = False
+        elif kind in ("break", "continue"):
+            if not self.loops:
+                raise Unsupported(f"{kind} outside a loop")
+            loop = self.loops[-1]
+            if kind == "break":
+                loop.broken = mask_or(loop.broken, self.mask)
+            else:
+                loop.cont = mask_or(loop.cont, self.mask)
+            self.mask = False
+        elif kind == "discard":
+            self.discarded = mask_or(self.discarded, self.mask)
+            self.mask = False
+        else:
+            raise Unsupported(kind)
+
+    def exec_if(self, stmt: tuple) -> None:
+        _, cond, then, other = stmt
+        c = self.eval(cond).data
+        if uniform(c):
+            branch = then if bool(c) else other
+            if branch is not None:
+                self.exec(branch)
+            return
+        saved = self.mask
+        results = []
+        for branch, lanes in ((then, mask_and(saved, c)), (other, mask_and(saved, np.logical_not(c)))):
+            if branch is None or mask_empty(lanes):
+                results.append(lanes)
+                continue
+            self.mask = lanes
+            self.exec(branch)
+            results.append(self.mask)
+        self.mask = mask_or(*results)
+
+    def exec_for(self, stmt: tuple) -> None:
+        _, init, cond, step, body = stmt
+        self.scopes.append({})
+        loop = Loop()
+        self.loops.append(loop)
+        try:
+            if init is not None:
+                self.exec(init)
+            exited = False
+            for _ in range(MAX_LOOP + 1):
+                if cond is not None:
+                    c = self.eval(cond).data
+                    if uniform(c):
+                        if not c:
+                            exited = mask_or(exited, self.mask)
+                            self.mask = False
+                            break
+                    else:
+                        exited = mask_or(exited, mask_and(self.mask, np.logical_not(c)))
+                        self.mask = mask_and(self.mask, c)
+                        if mask_empty(self.mask):
+                            break
+                loop.cont = False
+                self.exec(body)
+                self.mask = mask_or(self.mask, loop.cont)
+                if mask_empty(self.mask):
+                    break
+                if step is not None:
+                    # loop counters stay uniform: lanes that left the loop no longer read them
+                    live, self.mask = self.mask, None
+                    self.eval(step)
+                    self.mask = live
+            else:
+                raise Unsupported(f"loop runs more than {MAX_LOOP} iterations")
+            self.mask = mask_or(mask_or(exited, loop.broken), self.mask if not mask_empty(self.mask) else False)
+        finally:
+            self.loops.pop()
+            self.scopes.pop()
+
+    # --- expressions -------------------------------------------------------
+
+    def eval(self, node: tuple) -> V:
+        kind = node[0]
+        if kind == "num":
+            return V(node[2], F32(node[1]))
+        if kind == "bool":
+            return V("bool", np.bool_(node[1]))
+        if kind == "name":
+            return self.lookup(node[1])
+        if kind == "binary":
+            _, op, a, b = node
+            return self.binary(op, self.eval(a), self.eval(b))
+        if kind == "unary":
+            _, op, a = node
+            value = self.eval(a)
+            if op == "!":
+                return V("bool", np.logical_not(value.data))
+            if op == "+":
+                return value
+            return self.map(value, np.negative)
+        if kind == "call":
+            return self.call(node[1], [self.eval(arg) for arg in node[2]])
+        if kind == "field":
+            return self.swizzle(self.eval(node[1]), node[2])
+        if kind == "index":
+            base = self.eval(node[1])
+            i = self.const_index(node[2], base)
+            item = base.data[i]
+            if base.type == "array":
+                return item
+            if base.type.startswith("mat"):
+                return V(vec_type(len(item)), list(item))
+            return V("float", item)
+        if kind == "assign":
+            _, op, target, rhs = node
+            value = self.eval(rhs)
+            if op != "=":
+                value = self.binary(op[0], self.eval(target), value)
+            self.assign(target, value)
+            return value
+        if kind == "incdec":
+            _, op, target, prefix = node
+            old = self.eval(target)
+            new = self.binary(op[0], old, V("int", F32(1)))
+            self.assign(target, new)
+            return new if prefix else old
+        if kind == "ternary":
+            _, cond, a, b = node
+            c = self.eval(cond).data
+            if uniform(c):
+                return self.eval(a if bool(c) else b)
+            return select(c, self.eval(a), self.eval(b))
+        if kind == "comma":
+            self.eval(node[1])
+            return self.eval(node[2])
+        raise Unsupported(kind)
+
+    def const_index(self, node: tuple, base: V) -> int:
+        i = self.eval(node).data
+        if not uniform(i):
+            raise Unsupported("index that varies per pixel")
+        i = int(i)
+        if not 0 <= i < len(base.data):
+            raise Unsupported(f"index {i} out of range")
+        return i
+
+    def assign(self, target: tuple, value: V) -> None:
+        kind = target[0]
+        if kind == "name":
+            self.store(target[1], value)
+        elif kind == "field":
+            base = self.eval(target[1])
+            idx = self.swizzle_indices(base, target[2])
+            comps = list(base.data)
+            vals = value.comps()
+            if len(vals) == 1 and len(idx) > 1:
+                vals = vals * len(idx)
+            for i, k in enumerate(idx):
+                comps[k] = vals[i]
+            self.assign(target[1], V(base.type, comps))
+        elif kind == "index":
+            base = self.eval(target[1])
+            i = self.const_index(target[2], base)
+            data = list(base.data)
+            if base.type == "array":
+                data[i] = self.convert(value, data[i].type)
+            elif base.type.startswith("mat"):
+                data[i] = value.comps()
+            else:
+                data[i] = value.comps()[0]
+            self.assign(target[1], V(base.type, data))
+        else:
+            raise Unsupported("assignment target")
+
+    def swizzle_indices(self, base: V, field: str) -> list[int]:
+        if not base.type.startswith("vec"):
+            raise Unsupported(f".{field} on {base.type}")
+        for letters in SWIZZLE_SETS:
+            if all(ch in letters for ch in field):
+                idx = [letters.index(ch) for ch in field]
+                if max(idx) >= len(base.data):
+                    break
+                return idx
+        raise Unsupported(f"swizzle .{field} on {base.type}")
+
+    def swizzle(self, base: V, field: str) -> V:
+        if base.type in ("float", "int") and set(field) <= {"x", "r", "s"}:
+            return V(vec_type(len(field)), [base.data] * len(field)) if len(field) > 1 else base
+        if base.type == "array" and field == "length":
+            raise Unsupported("array.length()")
+        idx = self.swizzle_indices(base, field)
+        if len(idx) == 1:
+            return V("float", base.data[idx[0]])
+        return V(vec_type(len(idx)), [base.data[i] for i in idx])
+
+    @staticmethod
+    def map(value: V, fn) -> V:
+        if value.type.startswith("mat"):
+            return V(value.type, [[fn(c) for c in col] for col in value.data])
+        if isinstance(value.data, list):
+            return V(value.type, [fn(c) for c in value.data])
+        return V(value.type, fn(value.data))
+
+    def binary(self, op: str, a: V, b: V) -> V:
+        if op in ("&&", "||", "^^"):
+            fn = {"&&": np.logical_and, "||": np.logical_or, "^^": np.logical_xor}[op]
+            return V("bool", fn(a.data, b.data))
+        if op in ("<", ">", "<=", ">="):
+            fn = {"<": np.less, ">": np.greater, "<=": np.less_equal, ">=": np.greater_equal}[op]
+            return V("bool", fn(a.data, b.data))
+        if op in ("==", "!="):
+            eq = np.logical_and.reduce([np.equal(x, y) for x, y in zip(a.comps(), b.comps())])
+            return V("bool", eq if op == "==" else np.logical_not(eq))
+        if a.type.startswith("mat") or b.type.startswith("mat"):
+            return self.matrix_op(op, a, b)
+        n = max(size_of(a.type), size_of(b.type))
+        ca, cb = a.comps(), b.comps()
+        if len(ca) != n:
+            ca = ca * n if len(ca) == 1 else None
+        if len(cb) != n:
+            cb = cb * n if len(cb) == 1 else None
+        if ca is None or cb is None:
+            raise Unsupported(f"{a.type} {op} {b.type}")
+        integer = a.type == "int" and b.type == "int"
+        with np.errstate(all="ignore"):
+            if op == "+":
+                out = [x + y for x, y in zip(ca, cb)]
+            elif op == "-":
+                out = [x - y for x, y in zip(ca, cb)]
+            elif op == "*":
+                out = [x * y for x, y in zip(ca, cb)]
+            elif op == "/":
+                out = [np.trunc(x / y) if integer else x / y for x, y in zip(ca, cb)]
+            elif op == "%":
+                out = [x - y * np.trunc(x / y) for x, y in zip(ca, cb)]
+            else:
+                raise Unsupported(f"operator {op}")
+        if n == 1:
+            return V("int" if integer else "float", out[0])
+        return V(vec_type(n), out)
+
+    def matrix_op(self, op: str, a: V, b: V) -> V:
+        am, bm = a.type.startswith("mat"), b.type.startswith("mat")
+        if op != "*" or not (am and bm or b.type.startswith("vec") or a.type.startswith("vec")):
+            if am and bm and op in "+-/":
+                fn = {"+": np.add, "-": np.subtract, "/": np.divide}[op]
+                return V(a.type, [[fn(x, y) for x, y in zip(ca, cb)] for ca, cb in zip(a.data, b.data)])
+            scalar, mat = (b, a) if am else (a, b)
+            if scalar.type not in ("float", "int"):
+                raise Unsupported(f"{a.type} {op} {b.type}")
+            s = scalar.data
+            fn = {"*": lambda x: x * s, "/": (lambda x: x / s) if am else (lambda x: s / x),
+                  "+": lambda x: x + s, "-": (lambda x: x - s) if am else (lambda x: s - x)}[op]
+            return self.map(mat, fn)
+        if am and bm:
+            return V(a.type, [self.mat_vec(a.data, col) for col in b.data])
+        if am:
+            return V(b.type, self.mat_vec(a.data, b.data))
+        return V(a.type, [sum(x * y for x, y in zip(a.data, col)) for col in b.data])
+
+    @staticmethod
+    def mat_vec(cols: list, vec: list) -> list:
+        n = len(cols)
+        if len(vec) != n:
+            raise Unsupported("matrix/vector size mismatch")
+        return [sum(cols[j][i] * vec[j] for j in range(n)) for i in range(n)]
+
+    # --- calls -------------------------------------------------------------
+
+    def call(self, name: str, args: list[V]) -> V:
+        if name in self.prog["functions"]:
+            return self.call_user(name, args)
+        if name in TYPES:
+            return self.construct(normalize_type(name), args)
+        if name in COMPONENT_FUNCS:
+            n = max(size_of(a.type) for a in args)
+            comps = []
+            for a in args:
+                c = a.comps()
+                if len(c) not in (1, n):
+                    raise Unsupported(f"{name}() argument sizes")
+                comps.append(c * n if len(c) == 1 else c)
+            fn = COMPONENT_FUNCS[name]
+            with np.errstate(all="ignore"):
+                out = [np.asarray(fn(*xs), dtype=F32) for xs in zip(*comps)]
+            return V(vec_type(n), out if n > 1 else out[0])
+        with np.errstate(all="ignore"):
+            if name == "atan":
+                if len(args) == 2:
+                    return V(vec_type(len(args[0].comps())),
+                             self._unpack([np.arctan2(y, x) for y, x in zip(args[0].comps(), args[1].comps())]))
+                return self.map(args[0], np.arctan)
+            if name in ("length", "distance", "dot", "normalize"):
+                if name == "distance":
+                    args = [self.binary("-", args[0], args[1])]
+                if name == "dot":
+                    return V("float", sum(x * y for x, y in zip(args[0].comps(), args[1].comps())))
+                length = np.sqrt(sum(c * c for c in args[0].comps()))
+                if name == "normalize":
+                    return V(args[0].type, self._unpack([c / length for c in args[0].comps()]))
+                return V("float", length)
+            if name == "cross":
+                (ax, ay, az), (bx, by, bz) = args[0].data, args[1].data
+                return V("vec3", [ay * bz - az * by, az * bx - ax * bz, ax * by - ay * bx])
+            if name == "reflect":
+                i, n = args
+                d = self.call("dot", [n, i])
+                return self.binary("-", i, self.binary("*", V("float", 2 * d.data), n))
+            if name in ("dFdx", "dFdy", "fwidth"):
+                return self.derivative(name, args[0])
+        if name in ("texture2D", "texture", "textureCube", "texture2DLodEXT", "textureLod"):
+            raise Unsupported("texture sampling")
+        raise Unsupported(f"function {name}()")
+
+    @staticmethod
+    def _unpack(comps: list):
+        return comps if len(comps) > 1 else comps[0]
+
+    def derivative(self, name: str, value: V) -> V:
+        shape = (self.height, self.width)
+
+        def grad(c, axis):
+            if uniform(c):
+                return F32(0)
+            g = np.gradient(np.broadcast_to(c, shape), axis=axis).astype(F32)
+            return -g if axis == 0 else g   # rows run top-down, window y runs bottom-up
+
+        if name == "dFdx":
+            return self.map(value, lambda c: grad(c, 1))
+        if name == "dFdy":
+            return self.map(value, lambda c: grad(c, 0))
+        return self.map(value, lambda c: np.abs(grad(c, 1)) + np.abs(grad(c, 0)))
+
+    def construct(self, type_: str, args: list[V]) -> V:
+        comps = [c for a in args for c in a.comps()]
+        if type_ in ("float", "int", "bool"):
+            c = comps[0]
+            if type_ == "int":
+                return V("int", np.trunc(np.asarray(c, dtype=F32)))
+            if type_ == "bool":
+                return V("bool", np.not_equal(c, 0))
+            return V("float", np.asarray(c, dtype=F32) if not uniform(c) else F32(c))
+        if type_.startswith("vec"):
+            n = int(type_[3])
+            if len(comps) == 1:
+                comps = comps * n
+            if len(comps) < n:
+                raise Unsupported(f"{type_}() with {len(comps)} components")
+            return V(type_, [np.asarray(c, dtype=F32) if not uniform(c) else F32(c) for c in comps[:n]])
+        if type_.startswith("mat"):
+            n = int(type_[3])
+            if len(args) == 1 and args[0].type in ("float", "int"):
+                s = comps[0]
+                return V(type_, [[s if i == j else F32(0) for i in range(n)] for j in range(n)])
+            if len(args) == 1 and args[0].type.startswith("mat"):
+                m = len(args[0].data)
+                return V(type_, [[args[0].data[j][i] if i < m and j < m else F32(i == j) for i in range(n)]
+                                 for j in range(n)])
+            if len(comps) != n * n:
+                raise Unsupported(f"{type_}() with {len(comps)} components")
+            return V(type_, [comps[j * n:(j + 1) * n] for j in range(n)])
+        raise Unsupported(f"{type_} constructor")
+
+    def call_user(self, name: str, args: list[V]) -> V:
+        overloads = self.prog["functions"][name]
+        matches = [f for f in overloads if len(f[1]) == len(args)]
+        exact = [f for f in matches if all(p[0] == a.type or {p[0], a.type} == {"float", "int"}
+                                            for p, a in zip(f[1], args))]
+        if not (exact or matches):
+            raise Unsupported(f"no overload of {name}() for {len(args)} argument(s)")
+        ret_type, params, body = (exact or matches)[0]
+        self.depth += 1
+        if self.depth > 64:
+            raise Unsupported("recursion")
+        saved = (self.scopes, self.mask, self.frame, self.loops)
+        self.scopes = [self.globals, {p: self.convert(a, t) for (t, p), a in zip(params, args)}]
+        self.mask, self.frame, self.loops = None, Frame(), []
+        try:
+            self.exec(body)
+            result = self.frame.ret
+        finally:
+            self.scopes, self.mask, self.frame, self.loops = saved
+            self.depth -= 1
+        if ret_type == "void":
+            return V("void", None)
+        return self.convert(result, ret_type) if result is not None else zeros(ret_type)
+
+
+# ---------------------------------------------------------------------------
+# Extraction from effect sources
+# ---------------------------------------------------------------------------
+
+def srgb_to_linear(c: float) -> float:
+    return c / 12.92 if c < 0.04045 else ((c + 0.055) / 1.055) ** 2.4
+
+
+def balanced(text: str, start: int, open_ch: str = "{", close_ch: str = "}") -> str:
+    """text[start] is open_ch; returns the substring through the matching close_ch."""
+    depth = 0
+    for i in range(start, len(text)):
+        if text[i] == open_ch:
+            depth += 1
+        elif text[i] == close_ch:
+            depth -= 1
+            if depth == 0:
+                return text[start:i + 1]
+    return text[start:]
+
+
+def enclosing_object(text: str, pos: int) -> tuple[int, str]:
+    depth = 0
+    for i in range(pos, -1, -1):
+        if text[i] == "}":
+            depth += 1
+        elif text[i] == "{":
+            if depth == 0:
+                return i, balanced(text, i)
+            depth -= 1
+    return 0, text
+
+
+def resolve_js_value(obj: str, key: str, source: str) -> str | None:
+    """Source text of `key: <value>` (or shorthand `key`) in an object literal, following const references."""
+    m = re.search(rf"(?<![\w.]){key}\s*(:\s*|(?=\s*[,}}]))", obj)
+    if not m:
+        return None
+    rest = obj[m.end():].lstrip()
+    if not m.group(1).startswith(":"):
+        rest = key
+    rest = re.sub(r"^/\*.*?\*/\s*", "", rest, flags=re.S)
+    if rest.startswith("`"):
+        return rest[:rest.index("`", 1) + 1]
+    if rest.startswith("{"):
+        return balanced(rest, 0)
+    ident = re.match(r"[A-Za-z_$][\w$.]*", rest)
+    if not ident:
+        return rest.split(",")[0]
+    ref = re.search(rf"(?:const|let|var)\s+{re.escape(ident.group())}\s*=\s*(?:/\*.*?\*/\s*)?", source, re.S)
+    if not ref:
+        return ident.group()
+    value = source[ref.end():]
+    if value.startswith("`"):
+        return value[:value.index("`", 1) + 1]
+    if value.startswith("{"):
+        return balanced(value, 0)
+    return ident.group()
+
+
+def glsl_text(value: str | None, what: str) -> str:
+    if value is None:
+        raise Unsupported(f"no {what}")
+    if not value.startswith("`"):
+        raise Unsupported(f"{what} is not an inline template literal ({value.strip()[:40]})")
+    if "${" in value:
+        raise Unsupported(f"{what} uses template interpolation")
+    return value[1:-1]
+
+
+def parse_number(text: str) -> float | None:
+    text = text.strip().replace("Math.PI", repr(math.pi))
+    if re.fullmatch(r"[-+*/().\deE\s]+", text):
+        try:
+            return float(eval(text, {"__builtins__": {}}))   # digits and operators only
+        except (SyntaxError, ZeroDivisionError, TypeError):
+            return None
+    return None
+
+
+def parse_uniform_default(text: str):
+    """A uniform's `value:` JS expression -> float, tuple, or None (unresolved)."""
+    text = text.strip()
+    number = parse_number(text)
+    if number is not None:
+        return number
+    if text in ("true", "false"):
+        return float(text == "true")
+    m = re.match(r"new\s+THREE\.Color\(\s*(.*?)\s*\)$", text, re.S)
+    if m:
+        arg = m.group(1)
+        hex_m = re.fullmatch(r"0x([0-9a-fA-F]{6})|['\"]#([0-9a-fA-F]{6})['\"]", arg)
+        if hex_m:
+            h = hex_m.group(1) or hex_m.group(2)
+            return tuple(srgb_to_linear(int(h[i:i + 2], 16) / 255) for i in (0, 2, 4))
+        parts = [parse_number(p) for p in arg.split(",")]
+        return tuple(parts) if len(parts) == 3 and None not in parts else None
+    m = re.match(r"new\s+THREE\.Vector([234])\(\s*(.*?)\s*\)$", text, re.S)
+    if m:
+        parts = [parse_number(p) for p in m.group(2).split(",")] if m.group(2) else [0.0] * int(m.group(1))
+        return tuple(parts) if None not in parts else None
+    return None
+
+
+def parse_uniforms(block: str | None) -> dict[str, object]:
+    if not block or not block.startswith("{"):
+        return {}
+    body = block[1:-1]
+    values = {}
+    for m in re.finditer(r"([A-Za-z_]\w*)\s*:\s*\{\s*value\s*:", body):
+        start = m.end()
+        depth, end = 0, start
+        for end in range(start, len(body)):
+            ch = body[end]
+            if ch in "([{":
+                depth += 1
+            elif ch in ")]}":
+                if depth == 0:
+                    break
+                depth -= 1
+            elif ch == "," and depth == 0:
+                break
+        values[m.group(1)] = parse_uniform_default(body[start:end])
+    return values
+
+
+def extract_shaders(path: Path) -> list[dict]:
+    """Every object literal with a fragmentShader key, in source order."""
+    source = path.read_text(encoding="utf-8", errors="replace")
+    shaders, seen = [], set()
+    for m in re.finditer(r"(?<![\w.])fragmentShader\b(?=\s*[:,}])", source):
+        start, obj = enclosing_object(source, m.start())
+        if start in seen:
+            continue
+        seen.add(start)
+        entry = {"line": source.count("\n", 0, m.start()) + 1, "transparent": bool(re.search(r"transparent\s*:\s*true", obj))}
+        try:
+            entry["fragment"] = glsl_text(resolve_js_value(obj, "fragmentShader", source), "fragmentShader")
+            vertex = resolve_js_value(obj, "vertexShader", source)
+            entry["vertex"] = vertex[1:-1] if vertex and vertex.startswith("`") else ""
+            entry["uniforms"] = parse_uniforms(resolve_js_value(obj, "uniforms", source))
+        except Unsupported as exc:
+            entry["error"] = str(exc)
+        shaders.append(entry)
+    return shaders
+
+
+def uv_varyings(vertex: str) -> set[str]:
+    """Varyings the vertex shader sets straight from `uv`."""
+    return set(re.findall(r"\b([A-Za-z_]\w*)\s*=\s*uv\s*;", vertex))
+
+
+def uniform_value(name: str, type_: str, default, width: int, height: int, time: float, notes: list[str]) -> V:
+    key = name.lower()
+    if key in TIME_UNIFORMS:
+        value = (time,)
+    elif key in RESOLUTION_UNIFORMS:
+        value = (width, height, 1.0)
+    elif key in MOUSE_UNIFORMS and default is None:
+        value = (0.5, 0.5, 0.0, 0.0)
+    elif default is None:
+        if type_.startswith("sampler"):
+            return V("unavailable", f"texture sampling ({name})")
+        notes.append(f"uniform {name} = 0")
+        value = (0.0,)
+    else:
+        value = default if isinstance(default, tuple) else (default,)
+    if type_.startswith("sampler"):
+        return V("unavailable", f"texture sampling ({name})")
+    n = size_of(type_) if not type_.startswith("mat") else 0
+    if n == 0:
+        if default is None:
+            return zeros(type_)
+        raise Unsupported(f"matrix uniform {name}")
+    comps = list(value)[:n] + [0.0] * max(0, n - len(value))
+    if len(value) == 1 and n > 1 and key not in RESOLUTION_UNIFORMS | MOUSE_UNIFORMS:
+        comps = [value[0]] * n
+    comps = [F32(c) for c in comps]
+    return V(type_, comps if n > 1 else comps[0])
+
+
+def compile_shader(fragment: str) -> dict:
+    code, macros = preprocess(fragment)
+    return Parser(tokenize(code, macros)).program()
+
+
+def render_shader(entry: dict, width: int, height: int, times: list[float]) -> tuple[list[np.ndarray], list[str]]:
+    """8-bit RGB frames of one extracted shader at each time."""
+    if "error" in entry:
+        raise Unsupported(entry["error"])
+    prog = compile_shader(entry["fragment"])
+    from_uv = uv_varyings(entry["vertex"])
+    x, y = np.meshgrid((np.arange(width, dtype=F32) + F32(0.5)) / F32(width),
+                       (np.arange(height - 1, -1, -1, dtype=F32) + F32(0.5)) / F32(height))
+    frames, notes = [], []
+    for t in times:
+        notes = []
+        uniforms = {n: uniform_value(n, ty, entry["uniforms"].get(n), width, height, t, notes)
+                    for n, ty in prog["uniforms"].items()}
+        varyings = {n: V("vec2", [x, y]) for n, ty in prog["varyings"].items() if n in from_uv and ty == "vec2"}
+        rgba, discarded = Evaluator(prog, width, height, uniforms, varyings).run()
+        alpha = np.clip(rgba[..., 3:], 0, 1)
+        if discarded is not False:
+            alpha = np.where(np.broadcast_to(discarded, alpha.shape[:2])[..., None], F32(0), alpha)
+        rgb = rgba[..., :3] * alpha if entry["transparent"] or discarded is not False else rgba[..., :3]
+        frames.append(np.round(np.clip(np.nan_to_num(rgb), 0, 1) * 255).astype(np.uint8))
+    return frames, notes
+
+
+def resolve_effects(names: list[str]) -> list[Path]:
+    if not names:
+        return sorted(p for p in EFFECTS_DIR.glob("*.html") if p.stem != "gallery")
+    paths = []
+    for name in names:
+        path = Path(name) if name.endswith((".html", ".js")) else EFFECTS_DIR / f"{name}.html"
+        if not path.is_absolute():
+            path = (Path.cwd() / path) if path.exists() else ROOT / path
+        if not path.exists():
+            raise SystemExit(f"Effect not found: {name}")
+        paths.append(path)
+    return paths
+
+
+def parse_size(value: str) -> tuple[int, int]:
+    w, _, h = value.lower().partition("x")
+    return int(w), int(h)
+
+
+def main() -> int:
+    ap = argparse.ArgumentParser(description="Render fragment shader previews on the CPU with NumPy.")
+    ap.add_argument("effects", nargs="*", help="Effect ids or .html/.js paths (default: every effect)")
+    ap.add_argument("--size", type=parse_size, default=(256, 256), help="Output WxH")
+    ap.add_argument("--time", type=float, default=2.0, help="uTime of the first frame (seconds)")
+    ap.add_argument("--frames", type=int, default=1, help="Frames per shader (1 = still thumbnail)")
+    ap.add_argument("--fps", type=float, default=24, help="Time step between frames is 1/fps")
+    ap.add_argument("--apng", action="store_true", help="Write one animated PNG per shader instead of a sequence")
+    ap.add_argument("--check", action="store_true", help="Evaluate on a 16x16 grid and report; write no images")
+    ap.add_argument("--out-dir", default=DEFAULT_OUT, help="Output directory (repo-relative)")
+    args = ap.parse_args()
+    if args.frames < 1:
+        raise SystemExit("--frames must be at least 1")
+
+    width, height = (16, 16) if args.check else args.size
+    times = [args.time + i / args.fps for i in range(1 if args.check else args.frames)]
+    out = ROOT / args.out_dir
+    if not args.check:
+        out.mkdir(parents=True, exist_ok=True)
+
+    report = []
+    started = clock.perf_counter()
+    for path in resolve_effects(args.effects):
+        effect_id = path.stem
+        for index, entry in enumerate(extract_shaders(path)):
+            record = {"effect": effect_id, "index": index, "line": entry["line"]}
+            t0 = clock.perf_counter()
+            try:
+                frames, notes = render_shader(entry, width, height, times)
+            except Unsupported as exc:
+                record.update(status="unsupported", reason=str(exc))
+                print(f"{effect_id}#{index} (line {entry['line']}): unsupported: {exc}")
+                report.append(record)
+                continue
+            ms = (clock.perf_counter() - t0) * 1000 / len(times)
+            record.update(status="rendered", ms_per_frame=round(ms, 1), notes=notes)
+            if not args.check:
+                stem = f"{effect_id}.{index}"
+                if len(frames) == 1:
+                    files = [out / f"{stem}.png"]
+                    write_png(files[0], frames[0])
+                elif args.apng:
+                    files = [out / f"{stem}.png"]
+                    write_apng(files[0], frames, args.fps)
+                else:
+                    (out / stem).mkdir(exist_ok=True)
+                    files = [out / stem / f"frame_{i:04d}.png" for i in range(len(frames))]
+                    for file, frame in zip(files, frames):
+                        write_png(file, frame)
+                record["files"] = [f.relative_to(ROOT).as_posix() if f.is_relative_to(ROOT) else str(f) for f in files]
+            print(f"{effect_id}#{index} (line {entry['line']}): rendered {ms:.1f} ms/frame"
+                  + (f"  [{'; '.join(notes)}]" if notes else ""))
+            report.append(record)
+
+    rendered = sum(r["status"] == "rendered" for r in report)
+    reasons: dict[str, int] = {}
+    for r in report:
+        if r["status"] == "unsupported":
+            key = re.sub(r"\s*\(.*", "", r["reason"])
+            reasons[key] = reasons.get(key, 0) + 1
+    print(f"\n{rendered}/{len(report)} shader(s) rendered in {clock.perf_counter() - started:.1f}s")
+    for reason, count in sorted(reasons.items(), key=lambda kv: -kv[1]):
+        print(f"  {count:>3}  {reason}")
+    if not args.check:
+        (out / "report.json").write_text(json.dumps(report, indent=2) + "\n", encoding="utf-8")
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,220 @@
+"""
+One-pass UI schema pipeline: generate -> inject -> enhance -> performance -> normalize -> lint.
+
+Replaces running batch_generate_schemas.py, inject_effect_ui_schema.py,
+enhance_ui_schemas.py, normalize_ui_schemas.py and lint_ui_schemas.py one after
+another. Each effect HTML and its schema are read once into an EffectFacts
+(tools/effect_facts.py); the selected stages transform it in memory, in the order
+above, and whatever changed is written back once at the end. Effects are
+independent, so they are processed across a worker pool.
+
+Stages:
+  generate   create a starter schema when none exists
+  inject     add the attachEffectUI loader to effects not wired yet, and route the
+             operator Performance params into them (pixel ratio, particle counts)
+  enhance    rebuild controls/hotkeys from what the effect reads (rewrites controls; opt-in)
+  performance  Performance controls for exactly the params the effect honors
+  normalize  stable key order, defaults for every params.* bind, HUD block
+  lint       report schema/effect mismatches on the final in-memory state
+
+Usage:
+  python tools/schema_pipeline.py
+  python tools/schema_pipeline.py --stages normalize,lint --dry-run
+  python tools/schema_pipeline.py --stages generate,inject --only jazer-neon-grid --jobs 1
+"""
+
+from __future__ import annotations
+
+import argparse
+import os
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass, field
+from pathlib import Path
+
+from batch_generate_schemas import generate_schema
+from effect_facts import EffectFacts, load_facts, save_facts
+from enhance_ui_schemas import SchemaEnhancer, apply_performance_section
+from inject_effect_ui_schema import inject_into_html, wire_quality_overrides
+from lint_ui_schemas import Issue, lint_schema
+from normalize_ui_schemas import normalize_schema
+
+
+STAGES = ("generate", "inject", "enhance", "performance", "normalize", "lint")
+DEFAULT_STAGES = ("generate", "inject", "performance", "normalize", "lint")
+
+
+@dataclass
+class Result:
+  name: str
+  changes: list[str] = field(default_factory=list)   # "<stage>: <what>"
+  issues: list[Issue] = field(default_factory=list)
+  written: list[Path] = field(default_factory=list)
+  error: str | None = None
+
+
+def parse_args() -> argparse.Namespace:
+  p = argparse.ArgumentParser(description="Run the UI schema stages over effects/*.html in one pass")
+  p.add_argument("--stages", default=",".join(DEFAULT_STAGES), help=f"Comma-separated subset of: {', '.join(STAGES)} (default: %(default)s)")
+  p.add_argument("--only", action="append", default=[], help="Only target this effect (stem or filename); can repeat")
+  p.add_argument("--dry-run", action="store_true", help="Report changes without writing")
+  p.add_argument("--jobs", type=int, default=0, help="Worker processes (0 = CPU count, 1 = in-process)")
+  return p.parse_args()
+
+
+def normalize_only(values: list[str]) -> set[str]:
+  out: set[str] = set()
+  for v in values:
+    v = v.strip()
+    for suffix in (".ui.json", ".json", ".html"):
+      if v.lower().endswith(suffix):
+        v = v[: -len(suffix)]
+    if v:
+      out.add(v)
+  return out
+
+
+def parse_stages(value: str) -> tuple[str, ...]:
+  wanted = {s.strip().lower() for s in value.split(",") if s.strip()}
+  unknown = wanted - set(STAGES)
+  if unknown:
+    raise SystemExit(f"Unknown stage(s): {', '.join(sorted(unknown))} (choose from {', '.join(STAGES)})")
+  # Stages always run in pipeline order, whatever order they were given in.
+  return tuple(s for s in STAGES if s in wanted)
+
+
+def stage_generate(facts: EffectFacts) -> str | None:
+  if facts.schema_raw is not None:
+    return None
+  facts.set_schema(generate_schema(facts.html_path, content=facts.html))
+  return "create schema"
+
+
+def stage_inject(facts: EffectFacts) -> str | None:
+  done = []
+  updated = inject_into_html(facts.html)
+  if updated is not None:
+    facts.set_html(updated)
+    done.append("inject loader")
+  wired = wire_quality_overrides(facts.html)
+  if wired is not None:
+    facts.set_html(wired)
+    done.append("wire quality overrides")
+  return ", ".join(done) or None
+
+
+def stage_enhance(facts: EffectFacts) -> str | None:
+  if facts.schema_error:
+    return None
+  # The enhancer and normalizer edit nested dicts in place, so compare serialized text.
+  before = facts.schema_text()
+  enhancer = SchemaEnhancer(facts.html_path, content=facts.html, existing=facts.schema or {})
+  facts.set_schema(enhancer.generate_enhanced_schema())
+  return "enhance schema" if facts.schema_text() != before else None
+
+
+def stage_performance(facts: EffectFacts) -> str | None:
+  if facts.schema is None or facts.schema_error:
+    return None
+  if not apply_performance_section(facts.schema, facts.html):
+    return None
+  facts.set_schema(facts.schema)
+  return "performance controls"
+
+
+def stage_normalize(facts: EffectFacts) -> str | None:
+  if facts.schema is None:
+    return None
+  before = facts.schema_text()
+  facts.set_schema(normalize_schema(facts.schema))
+  after = facts.schema_text()
+  return "normalize schema" if after != before or after != facts.disk_schema_text() else None
+
+
+def stage_lint(facts: EffectFacts) -> list[Issue]:
+  if facts.schema_raw is None and facts.schema is None:
+    return []
+  if facts.schema_error:
+    return [Issue("ERROR", facts.schema_path, facts.schema_error, "invalid-json")]
+  # None (not "") for a missing page, so lint reports it the way lint_ui_schemas.py does.
+  return lint_schema(facts.schema_path, facts.schema, facts.html_path, facts.html if facts.html_exists else None)
+
+
+TRANSFORMS = {
+  "generate": stage_generate,
+  "inject": stage_inject,
+  "enhance": stage_enhance,
+  "performance": stage_performance,
+  "normalize": stage_normalize,
+}
+
+
+def process_effect(name: str, effects_dir: Path, schema_dir: Path, stages: tuple[str, ...], dry_run: bool) -> Result:
+  result = Result(name)
+  try:
+    facts = load_facts(name, effects_dir, schema_dir)
+    for stage in stages:
+      if stage == "lint":
+        result.issues.extend(stage_lint(facts))
+        continue
+      change = TRANSFORMS[stage](facts)
+      if change:
+        result.changes.append(f"{stage}: {change}")
+    if not dry_run:
+      result.written = save_facts(facts)
+  except Exception as e:
+    result.error = f"{type(e).__name__}: {e}"
+  return result
+
+
+def run_pipeline(names: list[str], effects_dir: Path, schema_dir: Path, stages: tuple[str, ...], dry_run: bool, jobs: int) -> list[Result]:
+  jobs = jobs if jobs > 0 else (os.cpu_count() or 1)
+  if jobs == 1 or len(names) < 2:
+    return [process_effect(n, effects_dir, schema_dir, stages, dry_run) for n in names]
+
+  with ProcessPoolExecutor(max_workers=min(jobs, len(names))) as pool:
+    futures = [pool.submit(process_effect, n, effects_dir, schema_dir, stages, dry_run) for n in names]
+    return [f.result() for f in futures]
+
+
+def main() -> int:
+  args = parse_args()
+  stages = parse_stages(args.stages)
+  only = normalize_only(args.only)
+
+  root = Path(__file__).resolve().parents[1]
+  effects_dir = root / "effects"
+  schema_dir = effects_dir / "ui-schema"
+
+  names = sorted(p.stem for p in effects_dir.glob("*.html") if p.name.lower() != "gallery.html")
+  # Schemas without an effect are still linted (lint reports the missing HTML).
+  names = sorted(set(names) | {p.name[: -len(".ui.json")] for p in schema_dir.glob("*.ui.json")})
+  if only:
+    names = [n for n in names if n in only]
+
+  results = run_pipeline(names, effects_dir, schema_dir, stages, args.dry_run, args.jobs)
+
+  changed = 0
+  failed = 0
+  by_level = {"ERROR": 0, "WARN": 0, "INFO": 0}
+  for r in results:
+    if r.error:
+      failed += 1
+      print(f"[FAIL] {r.name}: {r.error}")
+      continue
+    if r.changes:
+      changed += 1
+      prefix = "[DRY] " if args.dry_run else ""
+      print(f"{prefix}{r.name}: {'; '.join(r.changes)}")
+    for i in r.issues:
+      by_level[i.level] = by_level.get(i.level, 0) + 1
+      print(f"[{i.level}] {i.file.relative_to(root)}: {i.message}")
+
+  verb = "would change" if args.dry_run else "changed"
+  print(f"\nStages: {', '.join(stages)}. {len(results)} effect(s); {verb} {changed}; failed {failed}.")
+  if "lint" in stages:
+    print(f"Totals: ERROR={by_level['ERROR']} WARN={by_level['WARN']} INFO={by_level['INFO']}")
+  return 1 if by_level["ERROR"] or failed else 0
+
+
+if __name__ == "__main__":
+  raise SystemExit(main())